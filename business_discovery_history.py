@@ -5,11 +5,13 @@
 - 트렌드 분석 및 인사이트 도출
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, JSON, Text, Boolean, Index
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Float, JSON, Text, Boolean, Index, insert, update, delete, select, func
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime, timedelta
-from database_setup import Base, Session, SCHEMA_NAME, engine, get_kst_now
+from database_setup import Base, Session, SCHEMA_NAME, engine, get_kst_now, BusinessPlan
+import hashlib
 import json
+import threading
 
 # 새로운 히스토리 테이블들
 class BusinessDiscoveryHistory(Base):
@@ -51,6 +53,7 @@ class BusinessDiscoveryHistory(Base):
     # 인덱스
     __table_args__ = (
         Index('idx_discovery_date_score', 'discovered_at', 'total_score'),
+        Index('idx_discovery_recent', 'discovered_at', 'id'),  # 목록 API 키셋 페이지네이션
         Index('idx_category_score', 'category', 'total_score'),
         Index('idx_batch_saved', 'discovery_batch', 'saved_to_db'),
         {'schema': SCHEMA_NAME, 'extend_existing': True}
@@ -195,16 +198,404 @@ class LowScoreBusiness(Base):
 
     __table_args__ = (
         Index('idx_low_score_date', 'created_at'),
+        Index('idx_low_score_recent', 'created_at', 'id'),  # 목록 API 키셋 페이지네이션
         Index('idx_low_score_reason', 'failure_reason'),
         Index('idx_low_score_category', 'category', 'total_score'),
         {'schema': SCHEMA_NAME, 'extend_existing': True}
     )
 
 
+class DiscoveredBusinessName(Base):
+    """분석된 적 있는 사업명 인덱스 (중복 방지용, 이름 해시당 1행)"""
+    __tablename__ = 'discovered_business_names'
+
+    name_hash = Column(BigInteger, primary_key=True, autoincrement=False)  # 정규화 이름의 64비트 해시
+    business_name = Column(String(300), nullable=False)
+    first_seen_at = Column(DateTime, default=get_kst_now, nullable=False)
+
+    __table_args__ = (
+        Index('idx_discovered_name_seen', 'first_seen_at'),
+        {'schema': SCHEMA_NAME, 'extend_existing': True}
+    )
+
+
+class BusinessLatest(Base):
+    """사업명별 최신 분석 (business_discovery_history의 사업명당 max(id) 1행)
+
+    record_analysis/배치 flush 시 갱신되며, 발굴 목록 API는 전체 히스토리 집계 대신
+    (discovered_at, history_id) 인덱스만 역순 스캔해 페이지를 구한다.
+    """
+    __tablename__ = 'business_latest'
+
+    business_name = Column(String(300), primary_key=True)
+    history_id = Column(Integer, nullable=False)  # 최신 business_discovery_history.id
+    discovered_at = Column(DateTime, nullable=False)
+    total_score = Column(Float)
+
+    __table_args__ = (
+        Index('idx_business_latest_recent', 'discovered_at', 'history_id'),
+        {'schema': SCHEMA_NAME, 'extend_existing': True}
+    )
+
+
+class BusinessDerivedView(Base):
+    """목록 API용 파생 뷰 (히스토리 1행당 1행, business_views.VIEW_VERSION으로 버전 관리)
+
+    기본 시장/수익 분석, 실행 계획, 시작 가이드, IT 유형 등 저장 필드만으로 계산되는 값을
+    기록 시점에 한 번 계산해 두고, 생성 로직 버전이 바뀌면 백그라운드에서 다시 계산한다.
+    """
+    __tablename__ = 'business_derived_views'
+
+    history_id = Column(Integer, primary_key=True, autoincrement=False)  # business_discovery_history.id
+    version = Column(Integer, nullable=False)
+    view = Column(JSON, nullable=False)
+    built_at = Column(DateTime, default=get_kst_now, nullable=False)
+
+    __table_args__ = (
+        Index('idx_derived_view_version', 'version'),
+        {'schema': SCHEMA_NAME, 'extend_existing': True}
+    )
+
+
+def upsert_business_latest(session, rows):
+    """사업명별 최신 분석 갱신 (history_id가 더 큰 경우에만 교체, 커밋은 호출자가 수행)
+
+    rows: business_name, history_id, discovered_at, total_score를 가진 dict 목록
+    """
+    latest = {}
+    for row in rows:
+        current = latest.get(row['business_name'])
+        if current is None or row['history_id'] > current['history_id']:
+            latest[row['business_name']] = row
+    if not latest:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        dialect_insert = None
+
+    if dialect_insert is not None:
+        stmt = dialect_insert(BusinessLatest).values(list(latest.values()))
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=['business_name'],
+            set_={
+                'history_id': stmt.excluded.history_id,
+                'discovered_at': stmt.excluded.discovered_at,
+                'total_score': stmt.excluded.total_score
+            },
+            where=BusinessLatest.history_id < stmt.excluded.history_id
+        ))
+    else:
+        existing = dict(session.execute(
+            select(BusinessLatest.business_name, BusinessLatest.history_id)
+            .where(BusinessLatest.business_name.in_(list(latest)))
+        ).all())
+        for name, row in latest.items():
+            if name not in existing:
+                session.execute(insert(BusinessLatest), [row])
+            elif existing[name] < row['history_id']:
+                session.execute(
+                    update(BusinessLatest).where(BusinessLatest.business_name == name).values(**row)
+                )
+    return len(latest)
+
+
+def backfill_business_latest(session, chunk_size=1000):
+    """business_latest가 비어 있으면 기존 히스토리로 채우기 (1회, 커밋 포함)"""
+    if session.execute(select(BusinessLatest.business_name).limit(1)).first() is not None:
+        return 0
+
+    latest_ids = select(func.max(BusinessDiscoveryHistory.id)).group_by(BusinessDiscoveryHistory.business_name)
+    rows = [
+        {'business_name': name, 'history_id': history_id, 'discovered_at': discovered_at, 'total_score': score}
+        for history_id, name, discovered_at, score in session.execute(
+            select(
+                BusinessDiscoveryHistory.id, BusinessDiscoveryHistory.business_name,
+                BusinessDiscoveryHistory.discovered_at, BusinessDiscoveryHistory.total_score
+            ).where(BusinessDiscoveryHistory.id.in_(latest_ids))
+        ).all()
+    ]
+    for start in range(0, len(rows), chunk_size):
+        upsert_business_latest(session, rows[start:start + chunk_size])
+    session.commit()
+    if rows:
+        print(f"   [INDEX] 사업별 최신 분석 백필: {len(rows)}개")
+    return len(rows)
+
+
+def normalize_business_name(name):
+    """사업명 정규화 (앞뒤/연속 공백 제거)"""
+    return ' '.join((name or '').split())
+
+
+def business_name_hash(name):
+    """정규화된 사업명의 64비트 해시 (BIGINT 범위)"""
+    digest = hashlib.blake2b(normalize_business_name(name).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def insert_business_names(session, names):
+    """사업명 인덱스에 추가 (이미 있는 이름은 무시, 커밋은 호출자가 수행)"""
+    now = get_kst_now()
+    rows = {}
+    for name in names:
+        normalized = normalize_business_name(name)
+        if normalized:
+            name_hash = business_name_hash(normalized)
+            rows[name_hash] = {
+                'name_hash': name_hash,
+                'business_name': normalized[:300],
+                'first_seen_at': now
+            }
+    if not rows:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        dialect_insert = None
+
+    if dialect_insert is not None:
+        session.execute(
+            dialect_insert(DiscoveredBusinessName)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(index_elements=['name_hash'])
+        )
+    else:
+        existing = set(session.execute(
+            select(DiscoveredBusinessName.name_hash).where(DiscoveredBusinessName.name_hash.in_(list(rows)))
+        ).scalars())
+        new_rows = [row for name_hash, row in rows.items() if name_hash not in existing]
+        if new_rows:
+            session.execute(insert(DiscoveredBusinessName), new_rows)
+    return len(rows)
+
+
+class BusinessNameIndex:
+    """전체 분석 이력 사업명 중복 검사 (메모리 해시 집합 + DB 영속)
+
+    `name in index`는 O(1). 최초 sync()에서 전체 해시를 한 번 읽고,
+    이후에는 마지막 동기화 시각 이후 추가된 행만 읽는다.
+    인덱스 테이블이 비어 있으면 기존 히스토리/사업계획 이름으로 백필한다.
+    """
+
+    # 다른 프로세스의 늦은 커밋을 놓치지 않도록 재조회하는 구간
+    SYNC_OVERLAP = timedelta(minutes=10)
+    BACKFILL_CHUNK = 1000
+
+    def __init__(self):
+        self._hashes = set()
+        self._synced_at = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, name):
+        return business_name_hash(name) in self._hashes
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def remember(self, names):
+        """커밋된 이름을 메모리 집합에 반영"""
+        hashes = {business_name_hash(name) for name in names if normalize_business_name(name)}
+        with self._lock:
+            self._hashes.update(hashes)
+
+    def sync(self, session):
+        """DB 인덱스와 동기화 (증분)"""
+        with self._lock:
+            synced_at = self._synced_at
+
+        query = select(DiscoveredBusinessName.name_hash, DiscoveredBusinessName.first_seen_at)
+        if synced_at is not None:
+            query = query.where(DiscoveredBusinessName.first_seen_at >= synced_at - self.SYNC_OVERLAP)
+        rows = session.execute(query).all()
+
+        if synced_at is None and not rows and self.backfill(session):
+            rows = session.execute(query).all()
+
+        with self._lock:
+            self._hashes.update(row[0] for row in rows)
+            latest = max((row[1] for row in rows), default=None)
+            if latest is not None and (self._synced_at is None or latest > self._synced_at):
+                self._synced_at = latest
+            elif self._synced_at is None:
+                self._synced_at = get_kst_now()
+        return len(self._hashes)
+
+    def backfill(self, session):
+        """기존 히스토리/사업계획 이름으로 인덱스 채우기 (1회)"""
+        names = set(session.execute(select(BusinessDiscoveryHistory.business_name).distinct()).scalars())
+        names.update(session.execute(select(BusinessPlan.plan_name).distinct()).scalars())
+        names = [name for name in names if name]
+        for start in range(0, len(names), self.BACKFILL_CHUNK):
+            insert_business_names(session, names[start:start + self.BACKFILL_CHUNK])
+        session.commit()
+        if names:
+            print(f"   [INDEX] 사업명 인덱스 백필: {len(names)}개")
+        return len(names)
+
+
+_business_name_index = None
+_business_name_index_lock = threading.Lock()
+
+
+def get_business_name_index():
+    """사업명 중복 인덱스 싱글톤"""
+    global _business_name_index
+    if _business_name_index is None:
+        with _business_name_index_lock:
+            if _business_name_index is None:
+                _business_name_index = BusinessNameIndex()
+    return _business_name_index
+
+
+def history_fields(history):
+    """히스토리 ORM 객체 -> 컬럼 dict"""
+    return {column.key: getattr(history, column.key) for column in BusinessDiscoveryHistory.__table__.columns}
+
+
+def save_history_views(session, rows):
+    """기록한 히스토리 행의 파생 뷰 저장 (business_views가 이 모듈을 import하므로 지연 import)"""
+    from business_views import build_business_views, save_business_views
+    return save_business_views(session, build_business_views(rows))
+
+
+def invalidate_dashboard_stats():
+    """대시보드 카운터 캐시 무효화 (discovery_stats가 이 모듈을 import하므로 지연 import)"""
+    from discovery_stats import invalidate_discovery_stats
+    invalidate_discovery_stats()
+
+
+# 배치 쓰기 버퍼
+class DiscoveryBatchWriter:
+    """discovery_batch 단위 쓰기 버퍼
+
+    히스토리/저점수/BusinessPlan 행을 메모리에 모았다가 flush()에서
+    단일 트랜잭션 + bulk insert로 기록한다. 병렬 워커가 공유할 수 있도록 스레드 안전.
+    - 커밋 전 프로세스가 죽으면 아무 행도 남지 않음 (부분 기록 없음)
+    - 같은 배치를 다시 flush하면 (배치, 사업명) 기준으로 기존 행을 교체하므로 중복 없음
+    """
+
+    def __init__(self, discovery_batch):
+        self.discovery_batch = discovery_batch
+        self.history_rows = []
+        self.low_score_rows = []
+        self.business_plans = {}  # plan_name -> 신규 저장용 필드
+        self._lock = threading.Lock()
+
+    def add_history(self, **fields):
+        fields.setdefault('discovered_at', get_kst_now())
+        fields['discovery_batch'] = self.discovery_batch
+        with self._lock:
+            self.history_rows.append(fields)
+
+    def add_low_score(self, **fields):
+        fields.setdefault('created_at', datetime.utcnow())
+        fields['discovery_batch'] = self.discovery_batch
+        with self._lock:
+            self.low_score_rows.append(fields)
+
+    def add_business_plan(self, **fields):
+        """BusinessPlan upsert 예약 (기존 사업은 feasibility_score만 갱신)"""
+        fields.setdefault('created_at', get_kst_now())
+        with self._lock:
+            self.business_plans[fields['plan_name']] = fields
+
+    def pending_count(self):
+        with self._lock:
+            return len(self.history_rows) + len(self.low_score_rows) + len(self.business_plans)
+
+    def history_names(self):
+        with self._lock:
+            return [row['business_name'] for row in self.history_rows]
+
+    def flush(self, session):
+        """버퍼 내용을 단일 트랜잭션으로 기록 (커밋은 호출자가 수행)"""
+        with self._lock:
+            history_rows = list(self.history_rows)
+            low_score_rows = list(self.low_score_rows)
+            plans = dict(self.business_plans)
+
+        if history_rows:
+            names = {row['business_name'] for row in history_rows}
+            replaced_ids = list(session.execute(select(BusinessDiscoveryHistory.id).where(
+                BusinessDiscoveryHistory.discovery_batch == self.discovery_batch,
+                BusinessDiscoveryHistory.business_name.in_(names)
+            )).scalars())
+            if replaced_ids:
+                # 재실행으로 교체되는 행을 가리키던 최신 분석/파생 뷰 행도 함께 제거 (아래에서 새 행으로 채움)
+                session.execute(delete(BusinessLatest).where(BusinessLatest.history_id.in_(replaced_ids)))
+                session.execute(delete(BusinessDerivedView).where(BusinessDerivedView.history_id.in_(replaced_ids)))
+                session.execute(delete(BusinessDiscoveryHistory).where(
+                    BusinessDiscoveryHistory.id.in_(replaced_ids)
+                ))
+            inserted = session.execute(
+                insert(BusinessDiscoveryHistory).returning(
+                    BusinessDiscoveryHistory.id, BusinessDiscoveryHistory.business_name,
+                    BusinessDiscoveryHistory.discovered_at, BusinessDiscoveryHistory.total_score,
+                    sort_by_parameter_order=True
+                ),
+                history_rows
+            ).all()
+            upsert_business_latest(session, [
+                {'business_name': name, 'history_id': history_id, 'discovered_at': discovered_at, 'total_score': score}
+                for history_id, name, discovered_at, score in inserted
+            ])
+            insert_business_names(session, names)
+            save_history_views(session, [
+                dict(row, id=history_id, discovered_at=discovered_at)
+                for row, (history_id, _, discovered_at, _) in zip(history_rows, inserted)
+            ])
+
+        if low_score_rows:
+            names = {row['business_name'] for row in low_score_rows}
+            session.execute(delete(LowScoreBusiness).where(
+                LowScoreBusiness.discovery_batch == self.discovery_batch,
+                LowScoreBusiness.business_name.in_(names)
+            ))
+            session.execute(insert(LowScoreBusiness), low_score_rows)
+
+        if plans:
+            existing = set(session.execute(
+                select(BusinessPlan.plan_name).where(BusinessPlan.plan_name.in_(list(plans)))
+            ).scalars())
+
+            for name in existing:
+                session.execute(
+                    update(BusinessPlan)
+                    .where(BusinessPlan.plan_name == name)
+                    .values(feasibility_score=plans[name]['feasibility_score'])
+                )
+
+            new_plans = [fields for name, fields in plans.items() if name not in existing]
+            if new_plans:
+                session.execute(insert(BusinessPlan), new_plans)
+
+        return {
+            'history': len(history_rows),
+            'low_score': len(low_score_rows),
+            'business_plans': len(plans)
+        }
+
+    def clear(self):
+        with self._lock:
+            self.history_rows.clear()
+            self.low_score_rows.clear()
+            self.business_plans.clear()
+
+
 # 히스토리 관리 클래스
 class BusinessHistoryTracker:
     def __init__(self):
         self.session = Session()
+        self.batch_writer = None  # begin_batch() 이후 쓰기를 버퍼링
 
     def refresh_session(self):
         """DB 세션 새로고침 (연결 오류 복구용)"""
@@ -232,12 +623,73 @@ class BusinessHistoryTracker:
                     return False
         return False
 
+    def begin_batch(self, discovery_batch, writer=None):
+        """배치 쓰기 시작 (이후 record_analysis/save_low_score_business는 버퍼링)"""
+        self.batch_writer = writer or DiscoveryBatchWriter(discovery_batch)
+        return self.batch_writer
+
+    def flush_batch(self, max_retries=3, on_flush=None):
+        """버퍼링된 배치를 단일 트랜잭션으로 기록
+
+        실패 시 롤백 후 버퍼 전체를 재시도하므로 부분 기록이 남지 않는다.
+        on_flush(session)는 커밋 직전 같은 트랜잭션에서 호출된다 (작업 큐 완료 표시 등).
+        """
+        import time
+        writer = self.batch_writer
+        if writer is None:
+            return None
+
+        for attempt in range(max_retries):
+            try:
+                counts = writer.flush(self.session)
+                if on_flush is not None:
+                    on_flush(self.session)
+                self.session.commit()
+                get_business_name_index().remember(writer.history_names())
+                invalidate_dashboard_stats()
+                writer.clear()
+                self.batch_writer = None
+                print(f"   [BATCH] 일괄 저장 완료: 히스토리 {counts['history']}건, "
+                      f"저점수 {counts['low_score']}건, 사업계획 {counts['business_plans']}건")
+                return counts
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    self.refresh_session()
+                    time.sleep(1)
+                else:
+                    print(f"   [DB_ERROR] 배치 저장 실패: {e}")
+                    try:
+                        self.session.rollback()
+                    except Exception:
+                        pass
+                    self.batch_writer = None
+                    return None
+        return None
+
     def record_analysis(self, business_name, business_type, category, keyword,
                        total_score, market_score, revenue_score,
                        market_analysis, revenue_analysis, action_plan,
                        discovery_batch, saved_to_db, analysis_duration_ms,
                        full_analysis):
-        """분석 결과를 히스토리에 기록"""
+        """분석 결과를 히스토리에 기록 (배치 모드에서는 버퍼에 추가 후 None 반환)"""
+
+        if self.batch_writer is not None:
+            self.batch_writer.add_history(
+                business_name=business_name,
+                business_type=business_type,
+                category=category,
+                keyword=keyword,
+                total_score=total_score,
+                market_score=market_score,
+                revenue_score=revenue_score,
+                market_analysis=market_analysis,
+                revenue_analysis=revenue_analysis,
+                action_plan=action_plan,
+                saved_to_db=saved_to_db,
+                analysis_duration_ms=analysis_duration_ms,
+                full_analysis=full_analysis
+            )
+            return None
 
         history = BusinessDiscoveryHistory(
             business_name=business_name,
@@ -257,7 +709,23 @@ class BusinessHistoryTracker:
         )
 
         self.session.add(history)
+        try:
+            self.session.flush()  # history.id 확보
+            upsert_business_latest(self.session, [{
+                'business_name': business_name,
+                'history_id': history.id,
+                'discovered_at': history.discovered_at,
+                'total_score': total_score
+            }])
+            insert_business_names(self.session, [business_name])
+            save_history_views(self.session, [history_fields(history)])
+        except Exception as e:
+            print(f"   [DB_ERROR] 히스토리 기록 실패: {e}")
+            self.session.rollback()
+            return None
         if self.safe_commit():
+            get_business_name_index().remember([business_name])
+            invalidate_dashboard_stats()
             return history.id
         else:
             return None
@@ -471,6 +939,24 @@ class BusinessHistoryTracker:
             failure_reason, market_score, revenue_score, category
         )
 
+        if self.batch_writer is not None:
+            self.batch_writer.add_low_score(
+                business_name=business_name,
+                business_type=business_type,
+                category=category,
+                keyword=keyword,
+                total_score=total_score,
+                market_score=market_score,
+                revenue_score=revenue_score,
+                failure_reason=failure_reason,
+                market_analysis=market_analysis,
+                revenue_analysis=revenue_analysis,
+                improvement_suggestions=improvement_suggestions,
+                analysis_duration_ms=analysis_duration_ms,
+                full_data=full_data
+            )
+            return None
+
         low_score = LowScoreBusiness(
             business_name=business_name,
             business_type=business_type,
@@ -490,6 +976,7 @@ class BusinessHistoryTracker:
 
         self.session.add(low_score)
         if self.safe_commit():
+            invalidate_dashboard_stats()
             return low_score.id
         else:
             return None
@@ -603,6 +1090,18 @@ class BusinessHistoryTracker:
 def initialize_history_tables():
     """히스토리 테이블 초기화"""
     Base.metadata.create_all(engine, checkfirst=True)
+    # create_all은 기존 테이블에 새 인덱스를 추가하지 않으므로 따로 생성
+    for table in (BusinessDiscoveryHistory.__table__, LowScoreBusiness.__table__):
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    session = Session()
+    try:
+        backfill_business_latest(session)
+    except Exception as e:
+        session.rollback()
+        print(f"   [WARN] 사업별 최신 분석 백필 실패: {e}")
+    finally:
+        session.close()
     print("비즈니스 히스토리 테이블 생성 완료")
 
 
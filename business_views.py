@@ -0,0 +1,271 @@
+"""
+사업 목록 파생 뷰 모듈
+- 발굴 목록 API 항목(기본 시장/수익 분석, 실행 계획, 시작 가이드, IT 유형)을 저장 필드로 한 번만 계산
+- 히스토리 기록 시 계산, 없거나 버전이 낮으면 조회 시 계산
+- 생성 로직이 바뀌면 VIEW_VERSION을 올림 -> 백그라운드 백필이 기존 뷰를 다시 계산
+"""
+
+from sqlalchemy import select, insert, delete, or_
+
+from business_discovery_history import (
+    BusinessDiscoveryHistory, BusinessLatest, BusinessDerivedView, history_fields
+)
+from database_setup import get_kst_now
+from keyword_matcher import KeywordMatcher
+from services.business_helpers import (
+    generate_default_action_plan, generate_startup_guide,
+    generate_default_market_analysis, generate_default_revenue_analysis
+)
+
+
+# 생성 로직(services/business_helpers.py 또는 아래 build_business_view) 변경 시 올림
+VIEW_VERSION = 1
+
+# business_type 키워드 기반 IT 유형 분류 (정의 순서가 우선순위)
+IT_TYPE_MATCHER = KeywordMatcher({
+    'platform': ['플랫폼', '커뮤니티', '네트워크'],
+    'marketplace': ['마켓', '매칭', '중개'],
+    'agency': ['대행', '컨설팅', '에이전시'],
+    'tools': ['도구', '툴', '봇', '자동화'],
+})
+
+IT_TYPE_LABELS = {
+    'platform': '플랫폼',
+    'marketplace': '마켓플레이스',
+    'agency': '에이전시',
+    'tools': '생산성 도구',
+    'saas': 'SaaS',
+}
+
+IT_TYPE_FEATURES = {
+    'saas': ['데이터 관리', '알림 시스템', '분석 대시보드'],
+    'marketplace': ['실시간 매칭', '리뷰 시스템', '간편 결제'],
+    'agency': ['프로젝트 관리', '1:1 맞춤 서비스', '품질 보장'],
+    'tools': ['간편한 UX', '빠른 처리', '다중 플랫폼'],
+    'platform': ['커뮤니티 기능', '콘텐츠 큐레이션', '개인화']
+}
+
+IT_TYPE_TECH = {
+    'saas': ['Bubble.io', 'Supabase'],
+    'marketplace': ['Sharetribe', 'Webflow'],
+    'agency': ['Notion', 'Figma'],
+    'tools': ['React', 'Chrome Extension'],
+    'platform': ['Firebase', 'Vercel']
+}
+
+IT_TYPE_REVENUE = {
+    'saas': ['월정액 구독', '프리미엄 요금제'],
+    'marketplace': ['거래 수수료', '프리미엄 리스팅'],
+    'agency': ['프로젝트 단가', '리테이너 계약'],
+    'tools': ['일회성 구매', '프리미엄 기능'],
+    'platform': ['멤버십', '광고']
+}
+
+
+def build_business_view(fields):
+    """히스토리 필드(dict) -> 발굴 목록 API 항목"""
+    name = fields['business_name']
+    business_type = fields.get('business_type')
+    total_score = fields['total_score']
+    market_score = fields.get('market_score')
+    revenue_score = fields.get('revenue_score')
+    discovered_at = fields.get('discovered_at')
+
+    monthly_revenue = total_score * 100000
+    annual_revenue = monthly_revenue * 12
+    investment = total_score * 50000
+
+    market_data = fields.get('market_analysis') if isinstance(fields.get('market_analysis'), dict) else {}
+    if not market_data or not market_data.get('market_info'):
+        default_market = generate_default_market_analysis(name, fields.get('keyword') or name)
+        if market_data:
+            default_market.update({k: v for k, v in market_data.items() if v})
+        market_data = default_market
+
+    revenue_data = fields.get('revenue_analysis') if isinstance(fields.get('revenue_analysis'), dict) else {}
+    if not revenue_data:
+        revenue_data = generate_default_revenue_analysis(name, total_score)
+
+    action_plan_data = fields.get('action_plan') if isinstance(fields.get('action_plan'), dict) else {}
+    if not action_plan_data:
+        action_plan_data = generate_default_action_plan(name, business_type)
+
+    startup_guide = generate_startup_guide(name, business_type, total_score)
+
+    # 원본 full_analysis는 건드리지 않도록 복사
+    full_analysis_data = dict(fields.get('full_analysis')) if isinstance(fields.get('full_analysis'), dict) else {}
+    business_info = full_analysis_data.get('business', {})
+
+    if not business_info.get('it_type_label'):
+        it_type = IT_TYPE_MATCHER.first_group(business_type) or 'saas'
+        business_info = {
+            'it_type': it_type,
+            'it_type_label': IT_TYPE_LABELS[it_type],
+            'core_features': IT_TYPE_FEATURES.get(it_type, []),
+            'differentiator': "기존 서비스 대비 50% 저렴한 가격",
+            'tech_stack': IT_TYPE_TECH.get(it_type, []),
+            'revenue_models': IT_TYPE_REVENUE.get(it_type, []),
+            'target_audience': '직장인'
+        }
+        full_analysis_data['business'] = business_info
+
+    if revenue_data:
+        scenarios = revenue_data.get('scenarios', {})
+        realistic = scenarios.get('realistic', scenarios.get('현실적', {}))
+        monthly_revenue = realistic.get('monthly_revenue', realistic.get('월_예상_수익', monthly_revenue))
+        annual_revenue = monthly_revenue * 12
+        investment = revenue_data.get('startup_cost', revenue_data.get('initial_investment', investment))
+
+    market_info = market_data.get('market_info', {})
+    trend = market_info.get('trend', market_data.get('trend', '안정'))
+    competition_level = market_info.get('competition_level', market_data.get('competition_level', 55))
+    market_size_raw = market_info.get('market_size', market_data.get('market_size', '중형'))
+
+    score_breakdown = market_data.get('score_breakdown', {})
+    if not score_breakdown:
+        score_breakdown = {
+            'base_score': int(total_score * 0.6),
+            'domain_bonus': int((market_score or 0) * 0.2),
+            'trend_bonus': 5 if trend in ['급상승', '상승'] else 0,
+            'target_bonus': 3,
+            'revenue_bonus': int((revenue_score or 0) * 0.15),
+            'competition_penalty': -5 if competition_level > 70 else 0
+        }
+
+    return {
+        'id': fields['id'],
+        'name': name,
+        'type': business_type,
+        'score': total_score,
+        'feasibility': total_score / 10,
+        'revenue_12m': annual_revenue,
+        'investment': investment,
+        'risk': 'low' if total_score >= 80 else 'medium' if total_score >= 70 else 'high',
+        'priority': 'high' if total_score >= 80 else 'medium',
+        'created_at': discovered_at.strftime('%Y-%m-%d %H:%M') if discovered_at else None,
+        'description': f"{name} - 시장성 {int(market_score)}점, 수익성 {int(revenue_score)}점",
+        'revenue_model': revenue_data.get('revenue_model', 'subscription'),
+        'trend': trend,
+        'competition_level': competition_level,
+        'market_size': market_size_raw,
+        'score_breakdown': score_breakdown,
+        'details': {
+            'analysis_score': total_score,
+            'market_score': market_score,
+            'revenue_score': revenue_score,
+            'category': fields.get('category'),
+            'keyword': fields.get('keyword'),
+            'market_analysis': market_data,
+            'revenue_analysis': revenue_data,
+            'action_plan': action_plan_data,
+            'startup_guide': startup_guide,
+            'full_analysis': full_analysis_data
+        }
+    }
+
+
+def save_business_views(session, views):
+    """파생 뷰 저장 (history_id당 1행 교체, 커밋은 호출자가 수행)
+
+    views: {history_id: view dict}
+    """
+    if not views:
+        return 0
+    now = get_kst_now()
+    rows = [
+        {'history_id': history_id, 'version': VIEW_VERSION, 'view': view, 'built_at': now}
+        for history_id, view in views.items()
+    ]
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        dialect_insert = None
+
+    if dialect_insert is not None:
+        stmt = dialect_insert(BusinessDerivedView).values(rows)
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=['history_id'],
+            set_={
+                'version': stmt.excluded.version,
+                'view': stmt.excluded.view,
+                'built_at': stmt.excluded.built_at
+            }
+        ))
+    else:
+        session.execute(delete(BusinessDerivedView).where(BusinessDerivedView.history_id.in_(list(views))))
+        session.execute(insert(BusinessDerivedView), rows)
+    return len(rows)
+
+
+def build_business_views(rows):
+    """필드 dict 목록 -> {history_id: view} (계산 실패 행은 건너뛰고 조회 시 다시 계산)"""
+    views = {}
+    for fields in rows:
+        try:
+            views[fields['id']] = build_business_view(fields)
+        except Exception as e:
+            print(f"   [WARN] 파생 뷰 계산 실패 ({fields.get('business_name')}): {e}")
+    return views
+
+
+def get_business_views(session, history_ids):
+    """history_id 순서대로 발굴 목록 항목 반환
+
+    현재 버전 뷰가 있으면 그대로 읽고, 없거나 오래된 행만 히스토리를 읽어 계산 후 저장한다.
+    """
+    if not history_ids:
+        return []
+
+    views = dict(session.execute(
+        select(BusinessDerivedView.history_id, BusinessDerivedView.view).where(
+            BusinessDerivedView.history_id.in_(history_ids),
+            BusinessDerivedView.version == VIEW_VERSION
+        )
+    ).all())
+
+    missing = [history_id for history_id in history_ids if history_id not in views]
+    if missing:
+        histories = session.query(BusinessDiscoveryHistory).filter(
+            BusinessDiscoveryHistory.id.in_(missing)
+        ).all()
+        built = {history.id: build_business_view(history_fields(history)) for history in histories}
+        views.update(built)
+        try:
+            save_business_views(session, built)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            print(f"   [WARN] 파생 뷰 저장 실패: {e}")
+
+    return [views[history_id] for history_id in history_ids if history_id in views]
+
+
+def backfill_business_views(session, chunk_size=200):
+    """사업별 최신 분석 중 뷰가 없거나 버전이 낮은 행을 최신순으로 다시 계산 (청크마다 커밋)"""
+    stale = or_(BusinessDerivedView.history_id.is_(None), BusinessDerivedView.version != VIEW_VERSION)
+    total = 0
+    last_id = None
+
+    while True:
+        query = session.query(BusinessDiscoveryHistory).join(
+            BusinessLatest, BusinessLatest.history_id == BusinessDiscoveryHistory.id
+        ).outerjoin(
+            BusinessDerivedView, BusinessDerivedView.history_id == BusinessDiscoveryHistory.id
+        ).filter(stale)
+        if last_id is not None:
+            query = query.filter(BusinessDiscoveryHistory.id < last_id)
+        histories = query.order_by(BusinessDiscoveryHistory.id.desc()).limit(chunk_size).all()
+        if not histories:
+            break
+
+        last_id = histories[-1].id
+        total += save_business_views(session, build_business_views(history_fields(h) for h in histories))
+        session.commit()
+
+    if total:
+        print(f"   [VIEW] 파생 뷰 백필: {total}개 (v{VIEW_VERSION})")
+    return total
@@ -0,0 +1,152 @@
+"""
+데이터 소스 회로 차단 모듈
+- 소스별 최근 호출의 오류율과 p95 지연 추적
+- 기준 초과 시 쿨다운 동안 소스를 건너뜀 (open)
+- 쿨다운 후 1건만 시험 호출 (half-open), 성공하면 복구 (closed)
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any
+
+from config import CircuitBreakerConfig
+
+
+class CircuitBreaker:
+    """단일 소스 회로 차단기 (스레드 안전)"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, error_rate: float, p95_ms: float, cooldown_seconds: float,
+                 window: int = CircuitBreakerConfig.WINDOW, min_calls: int = CircuitBreakerConfig.MIN_CALLS,
+                 clock=time.monotonic):
+        self.name = name
+        self.error_rate = error_rate
+        self.p95_ms = p95_ms
+        self.cooldown_seconds = cooldown_seconds
+        self.min_calls = min_calls
+        self.clock = clock
+        self.state = self.CLOSED
+        self.opened_at = None
+        self.skipped = 0
+        self._calls = deque(maxlen=window)  # (성공 여부, 지연 ms)
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 (half-open에서는 시험 호출 1건만 허용)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if self.clock() - self.opened_at < self.cooldown_seconds:
+                    self.skipped += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    self.skipped += 1
+                    return False
+                self._probing = True
+            return True
+
+    def record(self, success: bool, latency_ms: float):
+        """호출 결과 기록 후 상태 전이"""
+        slow = bool(self.p95_ms) and latency_ms > self.p95_ms
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probing = False
+                if success and not slow:
+                    self.state = self.CLOSED
+                    self._calls.clear()
+                else:
+                    self._open()
+                return
+
+            self._calls.append((success, latency_ms))
+            if len(self._calls) >= self.min_calls and self._tripped():
+                self._open()
+
+    def _tripped(self) -> bool:
+        errors = sum(1 for success, _ in self._calls if not success)
+        if errors / len(self._calls) >= self.error_rate:
+            return True
+        return bool(self.p95_ms) and self._p95() > self.p95_ms
+
+    def _p95(self) -> float:
+        latencies = sorted(latency for _, latency in self._calls)
+        return latencies[min(len(latencies) - 1, math.ceil(len(latencies) * 0.95) - 1)]
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = self.clock()
+        self._calls.clear()
+        print(f"   [CIRCUIT] {self.name} 차단 ({self.cooldown_seconds:g}초 동안 건너뜀)")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = list(self._calls)
+            return {
+                'state': self.state,
+                'calls': len(calls),
+                'errors': sum(1 for success, _ in calls if not success),
+                'p95_ms': round(self._p95()) if calls else None,
+                'skipped': self.skipped
+            }
+
+
+class CircuitBreakerRegistry:
+    """소스 이름별 회로 차단기 모음"""
+
+    def __init__(self, enabled: Optional[bool] = None, error_rate: Optional[float] = None,
+                 p95_ms: Optional[float] = None, cooldown_seconds: Optional[float] = None,
+                 clock=time.monotonic):
+        self.enabled = CircuitBreakerConfig.is_enabled() if enabled is None else enabled
+        self.error_rate = CircuitBreakerConfig.get_error_rate() if error_rate is None else error_rate
+        self.p95_ms = CircuitBreakerConfig.get_p95_ms() if p95_ms is None else p95_ms
+        self.cooldown_seconds = CircuitBreakerConfig.get_cooldown_seconds() if cooldown_seconds is None else cooldown_seconds
+        self.clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(name, self.error_rate, self.p95_ms, self.cooldown_seconds,
+                                             clock=self.clock)
+                    self._breakers[name] = breaker
+        return breaker
+
+    def allow(self, name: str) -> bool:
+        return not self.enabled or self.get(name).allow()
+
+    def record(self, name: str, success: bool, latency_ms: float):
+        if self.enabled:
+            self.get(name).record(success, latency_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        """소스별 상태"""
+        return {name: breaker.snapshot() for name, breaker in list(self._breakers.items())}
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_circuit_breakers: Optional[CircuitBreakerRegistry] = None
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """프로세스 공용 회로 차단기 모음 (분석기 인스턴스가 바뀌어도 상태 유지)"""
+    global _circuit_breakers
+    if _circuit_breakers is None:
+        with _circuit_breakers_lock:
+            if _circuit_breakers is None:
+                _circuit_breakers = CircuitBreakerRegistry()
+    return _circuit_breakers
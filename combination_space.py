@@ -0,0 +1,166 @@
+"""
+조합 공간 인덱스 모듈
+- 다차원 조합 공간을 정수 인덱스로 표현 (혼합 기수 인코딩)
+- 시드 기반 Feistel 순열로 지연 셔플 (전체 목록 생성 없음)
+- 사용 위치(커서)를 SQLite 파일에 저장해 실행/프로세스 간 미사용 조합만 O(1)로 반환 (BEGIN IMMEDIATE)
+"""
+
+import hashlib
+import logging
+import os
+import random
+import sqlite3
+import threading
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class FeistelPermutation:
+    """[0, size) 구간의 시드 기반 의사난수 순열
+
+    2^(2k) 크기의 Feistel 네트워크에 cycle-walking을 적용해
+    임의 크기 구간의 전단사 함수를 O(1) 메모리로 계산한다.
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, size: int, seed: int):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self.seed = seed
+        half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_bits = half_bits
+        self._mask = (1 << half_bits) - 1
+
+    def _round(self, value: int, round_index: int) -> int:
+        digest = hashlib.blake2b(
+            f"{self.seed}:{round_index}:{value}".encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'big') & self._mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self._half_bits, value & self._mask
+        for round_index in range(self.ROUNDS):
+            left, right = right, left ^ self._round(right, round_index)
+        return (left << self._half_bits) | right
+
+    def __getitem__(self, position: int) -> int:
+        if not 0 <= position < self.size:
+            raise IndexError(position)
+        value = self._encrypt(position)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+
+class CombinationSpace:
+    """셔플된 조합 인덱스 스트림 (사용 위치 영속화)
+
+    state_path가 주어지면 {seed, cursor, size}를 SQLite 파일에 두고 인덱스를 뽑을 때마다
+    BEGIN IMMEDIATE 트랜잭션으로 커서를 전진시키므로, 같은 파일을 쓰는 스레드/프로세스(큐 워커)가
+    동시에 뽑아도 같은 조합을 받지 않고 다음 실행은 이미 사용한 조합을 건너뛴다.
+    공간을 모두 소진하면 새 시드로 다음 순회를 시작한다.
+    """
+
+    def __init__(self, size: int, state_path: Optional[str] = None, seed: Optional[int] = None):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 32)
+        self.cursor = 0
+
+        if state_path:
+            try:
+                directory = os.path.dirname(state_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                # 트랜잭션은 직접 관리 (autocommit + BEGIN IMMEDIATE)
+                self._conn = sqlite3.connect(state_path, check_same_thread=False, timeout=30,
+                                             isolation_level=None)
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS combination_space (
+                        size INTEGER PRIMARY KEY,
+                        seed INTEGER,
+                        cursor INTEGER
+                    )
+                """)
+                row = self._conn.execute(
+                    "SELECT seed, cursor FROM combination_space WHERE size = ?", (size,)
+                ).fetchone()
+                if row:
+                    self.seed, self.cursor = row
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"조합 공간 상태 저장소 사용 불가, 프로세스 내부 커서 사용: {e}")
+                self._close_conn()
+        self._permutation = FeistelPermutation(size, self.seed)
+
+    def _close_conn(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def next_index(self) -> int:
+        """다음 미사용 조합 인덱스"""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._claim_shared()
+                except sqlite3.Error as e:
+                    logger.warning(f"조합 공간 커서 갱신 실패, 프로세스 내부 커서 사용: {e}")
+                    self._close_conn()
+                    self._claim_local()
+            else:
+                self._claim_local()
+            # 방금 점유한 위치 (커서는 이미 다음 위치)
+            return self._permutation[self.cursor - 1]
+
+    def _claim_shared(self):
+        """공유 커서에서 1칸 점유 (lock 보유 상태에서 호출)"""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT seed, cursor FROM combination_space WHERE size = ?", (self.size,)
+            ).fetchone()
+            seed, cursor = row if row else (self.seed, 0)
+            if cursor >= self.size:
+                seed, cursor = self._new_cycle()
+            conn.execute(
+                "INSERT OR REPLACE INTO combination_space (size, seed, cursor) VALUES (?, ?, ?)",
+                (self.size, seed, cursor + 1)
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        self._use(seed, cursor + 1)
+
+    def _claim_local(self):
+        seed, cursor = self.seed, self.cursor
+        if cursor >= self.size:
+            seed, cursor = self._new_cycle()
+        self._use(seed, cursor + 1)
+
+    def _new_cycle(self):
+        logger.info("조합 공간 소진 - 새 시드로 재순회")
+        return random.SystemRandom().randrange(2 ** 32), 0
+
+    def _use(self, seed, cursor):
+        if seed != self.seed:
+            self.seed = seed
+            self._permutation = FeistelPermutation(self.size, seed)
+        self.cursor = cursor
+
+    @property
+    def remaining(self) -> int:
+        return self.size - self.cursor
+
+    def close(self):
+        with self._lock:
+            self._close_conn()
@@ -27,11 +27,59 @@ class EnvKeys:
     MARKET_ANALYSIS_MODE = "MARKET_ANALYSIS_MODE"
     MARKET_API_TIMEOUT = "MARKET_API_TIMEOUT"
     MARKET_API_DELAY = "MARKET_API_DELAY"
+    MARKET_CONCURRENT = "MARKET_CONCURRENT"
+    MARKET_MAX_WORKERS = "MARKET_MAX_WORKERS"
+    MARKET_KEYWORD_CACHE_HOURS = "MARKET_KEYWORD_CACHE_HOURS"
+
+    # HTTP 클라이언트
+    HTTP_POOL_CONNECTIONS = "HTTP_POOL_CONNECTIONS"
+    HTTP_POOL_MAXSIZE = "HTTP_POOL_MAXSIZE"
+    HTTP_MAX_RETRIES = "HTTP_MAX_RETRIES"
+
+    # 응답 캐시
+    RESPONSE_CACHE_PATH = "RESPONSE_CACHE_PATH"
+    RESPONSE_CACHE_MAX_ENTRIES = "RESPONSE_CACHE_MAX_ENTRIES"
+    RESPONSE_CACHE_BYPASS = "RESPONSE_CACHE_BYPASS"
+
+    # 속도 제한
+    RATE_LIMIT_PATH = "RATE_LIMIT_PATH"
+    RATE_LIMIT_ENABLED = "RATE_LIMIT_ENABLED"
+
+    # 소스별 회로 차단
+    CIRCUIT_BREAKER_ENABLED = "CIRCUIT_BREAKER_ENABLED"
+    CIRCUIT_BREAKER_ERROR_RATE = "CIRCUIT_BREAKER_ERROR_RATE"
+    CIRCUIT_BREAKER_P95_MS = "CIRCUIT_BREAKER_P95_MS"
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS = "CIRCUIT_BREAKER_COOLDOWN_SECONDS"
+
+    # 트렌드 수집
+    TREND_ASYNC = "TREND_ASYNC"
+    TREND_ALL_SOURCES = "TREND_ALL_SOURCES"
+    TREND_SOURCE_TIMEOUT = "TREND_SOURCE_TIMEOUT"
+    TREND_MAX_CONCURRENCY = "TREND_MAX_CONCURRENCY"
+
+    # 대시보드 통계
+    DASHBOARD_STATS_TTL_SECONDS = "DASHBOARD_STATS_TTL_SECONDS"
 
     # 사업 발굴
     DISCOVERY_MIN_SCORE = "DISCOVERY_MIN_SCORE"
     DISCOVERY_SCHEDULE_HOURS = "DISCOVERY_SCHEDULE_HOURS"
     DISCOVERY_IDEAS_PER_RUN = "DISCOVERY_IDEAS_PER_RUN"
+    DISCOVERY_PARALLEL = "DISCOVERY_PARALLEL"
+    DISCOVERY_MAX_WORKERS = "DISCOVERY_MAX_WORKERS"
+    DISCOVERY_BATCH_WRITES = "DISCOVERY_BATCH_WRITES"
+    DISCOVERY_COMBINATION_STATE_PATH = "DISCOVERY_COMBINATION_STATE_PATH"
+    DISCOVERY_NEAR_DUPLICATE_MODE = "DISCOVERY_NEAR_DUPLICATE_MODE"
+    DISCOVERY_NEAR_DUPLICATE_THRESHOLD = "DISCOVERY_NEAR_DUPLICATE_THRESHOLD"
+    DISCOVERY_CASCADE = "DISCOVERY_CASCADE"
+    DISCOVERY_CASCADE_POOL_FACTOR = "DISCOVERY_CASCADE_POOL_FACTOR"
+    DISCOVERY_CASCADE_MARGIN = "DISCOVERY_CASCADE_MARGIN"
+    DISCOVERY_PROGRESS_PATH = "DISCOVERY_PROGRESS_PATH"
+    DISCOVERY_ROLLING_SNAPSHOT_EVERY = "DISCOVERY_ROLLING_SNAPSHOT_EVERY"
+    DISCOVERY_QUEUE_LEASE_MINUTES = "DISCOVERY_QUEUE_LEASE_MINUTES"
+    DISCOVERY_QUEUE_MAX_ATTEMPTS = "DISCOVERY_QUEUE_MAX_ATTEMPTS"
+    DISCOVERY_QUEUE_POLL_SECONDS = "DISCOVERY_QUEUE_POLL_SECONDS"
+    DISCOVERY_TIME_BUDGET_MINUTES = "DISCOVERY_TIME_BUDGET_MINUTES"
+    DISCOVERY_BUDGET_MAX_IDEAS = "DISCOVERY_BUDGET_MAX_IDEAS"
 
     # API 인증
     API_SECRET_KEY = "API_SECRET_KEY"
@@ -140,6 +188,9 @@ class MarketConfig:
     DEFAULT_MODE = MarketAnalysisMode.FULL
     DEFAULT_TIMEOUT = 10  # 초
     DEFAULT_DELAY = 2.0   # API 호출 간 대기 시간 (초)
+    DEFAULT_CONCURRENT = True  # 데이터 소스 병렬 수집 여부
+    DEFAULT_MAX_WORKERS = 4    # 병렬 수집 워커 수
+    DEFAULT_KEYWORD_CACHE_HOURS = 24.0  # 키워드별 시장 분석 재사용 기간 (0이면 미사용)
 
     @classmethod
     def get_mode(cls) -> MarketAnalysisMode:
@@ -178,6 +229,273 @@ class MarketConfig:
         except ValueError:
             return cls.DEFAULT_DELAY
 
+    @classmethod
+    def is_concurrent(cls) -> bool:
+        """데이터 소스 병렬 수집 여부"""
+        value = os.environ.get(EnvKeys.MARKET_CONCURRENT)
+        if value is None:
+            return cls.DEFAULT_CONCURRENT
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def get_max_workers(cls) -> int:
+        """병렬 수집 워커 수 (최소 1)"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.MARKET_MAX_WORKERS, cls.DEFAULT_MAX_WORKERS)))
+        except ValueError:
+            return cls.DEFAULT_MAX_WORKERS
+
+    @classmethod
+    def get_keyword_cache_hours(cls) -> float:
+        """키워드별 시장 분석 결과 재사용 기간 (시간, 0이면 미사용)"""
+        try:
+            return max(0.0, float(os.environ.get(EnvKeys.MARKET_KEYWORD_CACHE_HOURS, cls.DEFAULT_KEYWORD_CACHE_HOURS)))
+        except ValueError:
+            return cls.DEFAULT_KEYWORD_CACHE_HOURS
+
+
+# ============================================
+# HTTP 클라이언트 설정
+# ============================================
+class HttpConfig:
+    """공유 HTTP 세션 연결 풀 설정"""
+
+    DEFAULT_POOL_CONNECTIONS = 20  # 호스트별 풀 개수
+    DEFAULT_POOL_MAXSIZE = 10      # 호스트당 유지할 keep-alive 연결 수
+    DEFAULT_MAX_RETRIES = 2
+    # 연결 실패만 짧게 재시도, 읽기 타임아웃은 재시도하지 않음 (호출자 timeout이 실제 대기 상한)
+    CONNECT_RETRIES = 1
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    @classmethod
+    def get_pool_connections(cls) -> int:
+        """호스트별 풀 개수"""
+        try:
+            return int(os.environ.get(EnvKeys.HTTP_POOL_CONNECTIONS, cls.DEFAULT_POOL_CONNECTIONS))
+        except ValueError:
+            return cls.DEFAULT_POOL_CONNECTIONS
+
+    @classmethod
+    def get_pool_maxsize(cls) -> int:
+        """호스트당 최대 연결 수"""
+        try:
+            return int(os.environ.get(EnvKeys.HTTP_POOL_MAXSIZE, cls.DEFAULT_POOL_MAXSIZE))
+        except ValueError:
+            return cls.DEFAULT_POOL_MAXSIZE
+
+    @classmethod
+    def get_max_retries(cls) -> int:
+        """요청 재시도 횟수"""
+        try:
+            return int(os.environ.get(EnvKeys.HTTP_MAX_RETRIES, cls.DEFAULT_MAX_RETRIES))
+        except ValueError:
+            return cls.DEFAULT_MAX_RETRIES
+
+
+# ============================================
+# 응답 캐시 설정
+# ============================================
+class CacheConfig:
+    """스크래퍼 응답 캐시 설정"""
+
+    DEFAULT_PATH = os.path.join(".cache", "response_cache.sqlite3")
+    DEFAULT_MAX_ENTRIES = 5000
+    DEFAULT_TTL = 3600  # 초
+    # 적중 시 last_access 갱신 최소 간격 (초) - LRU 순서는 이 정도 오차면 충분, 매 적중 쓰기/커밋 방지
+    TOUCH_INTERVAL = 60
+
+    # 소스별 TTL (초) - 검색 결과는 길게, 실시간 트렌드는 짧게
+    SOURCE_TTLS = {
+        'naver': 6 * 3600,
+        'google': 12 * 3600,
+        'product_hunt': 3600,
+        'github_trending': 3600,
+        'hacker_news': 1800,
+        'reddit': 1800,
+        'naver_datalab': 6 * 3600,
+        'wadiz': 6 * 3600,
+        'tumblbug': 6 * 3600,
+        'saramin': 12 * 3600,
+        'jobkorea': 12 * 3600,
+        'coingecko': 900,
+        'defillama': 1800,
+        'blockchain_news': 1800,
+    }
+
+    @classmethod
+    def get_path(cls) -> str:
+        """캐시 파일 경로"""
+        return os.environ.get(EnvKeys.RESPONSE_CACHE_PATH, cls.DEFAULT_PATH)
+
+    @classmethod
+    def get_max_entries(cls) -> int:
+        """최대 캐시 항목 수 (LRU 상한)"""
+        try:
+            return int(os.environ.get(EnvKeys.RESPONSE_CACHE_MAX_ENTRIES, cls.DEFAULT_MAX_ENTRIES))
+        except ValueError:
+            return cls.DEFAULT_MAX_ENTRIES
+
+    @classmethod
+    def is_bypassed(cls) -> bool:
+        """캐시 우회 여부 (항상 네트워크 호출)"""
+        return os.environ.get(EnvKeys.RESPONSE_CACHE_BYPASS, "").lower() == "true"
+
+    @classmethod
+    def get_ttl(cls, source: str) -> int:
+        """소스별 TTL (초)"""
+        return cls.SOURCE_TTLS.get(source, cls.DEFAULT_TTL)
+
+
+# ============================================
+# 속도 제한 설정
+# ============================================
+class RateLimitConfig:
+    """스크래퍼 도메인별 토큰 버킷 설정"""
+
+    DEFAULT_PATH = os.path.join(".cache", "rate_limit.sqlite3")
+    DEFAULT_ENABLED = True
+    DEFAULT_BURST = 1
+
+    # 도메인별 (초당 요청 수, 버스트) - 미지정 도메인은 1 / MARKET_API_DELAY
+    DOMAIN_LIMITS = {
+        'naver.com': (1.0, 3),
+        'google.com': (0.5, 1),
+        'reddit.com': (1.0, 1),
+        'github.com': (1.0, 2),
+        'firebaseio.com': (10.0, 10),  # Hacker News API
+    }
+
+    @classmethod
+    def get_path(cls) -> str:
+        """버킷 상태 파일 경로 (프로세스 간 공유)"""
+        return os.environ.get(EnvKeys.RATE_LIMIT_PATH, cls.DEFAULT_PATH)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """속도 제한 사용 여부"""
+        value = os.environ.get(EnvKeys.RATE_LIMIT_ENABLED)
+        if value is None:
+            return cls.DEFAULT_ENABLED
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def get_limit(cls, domain: str):
+        """도메인별 (초당 요청 수, 버스트) - 초당 요청 수 0이면 제한 없음"""
+        if domain in cls.DOMAIN_LIMITS:
+            return cls.DOMAIN_LIMITS[domain]
+        delay = MarketConfig.get_api_delay()
+        return (1.0 / delay if delay > 0 else 0.0, cls.DEFAULT_BURST)
+
+
+# ============================================
+# 소스별 회로 차단 설정
+# ============================================
+class CircuitBreakerConfig:
+    """데이터 소스 회로 차단기 설정 (오류율/지연 초과 시 쿨다운 동안 건너뜀)"""
+
+    DEFAULT_ENABLED = True
+    DEFAULT_ERROR_RATE = 0.5         # 최근 호출 중 오류 비율 상한
+    DEFAULT_P95_MS = 8000            # 최근 호출 p95 지연 상한 (ms)
+    DEFAULT_COOLDOWN_SECONDS = 300   # 차단 후 재시도(half-open)까지 대기
+    WINDOW = 20                      # 소스별 최근 호출 표본 수
+    MIN_CALLS = 5                    # 판단에 필요한 최소 표본 수
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """회로 차단 사용 여부"""
+        value = os.environ.get(EnvKeys.CIRCUIT_BREAKER_ENABLED)
+        if value is None:
+            return cls.DEFAULT_ENABLED
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def get_error_rate(cls) -> float:
+        """차단 오류율 기준 (0~1)"""
+        try:
+            return min(1.0, max(0.0, float(os.environ.get(EnvKeys.CIRCUIT_BREAKER_ERROR_RATE, cls.DEFAULT_ERROR_RATE))))
+        except ValueError:
+            return cls.DEFAULT_ERROR_RATE
+
+    @classmethod
+    def get_p95_ms(cls) -> float:
+        """차단 p95 지연 기준 (ms, 0이면 지연 기준 미사용)"""
+        try:
+            return max(0.0, float(os.environ.get(EnvKeys.CIRCUIT_BREAKER_P95_MS, cls.DEFAULT_P95_MS)))
+        except ValueError:
+            return cls.DEFAULT_P95_MS
+
+    @classmethod
+    def get_cooldown_seconds(cls) -> float:
+        """차단 유지 시간 (초)"""
+        try:
+            return max(1.0, float(os.environ.get(EnvKeys.CIRCUIT_BREAKER_COOLDOWN_SECONDS, cls.DEFAULT_COOLDOWN_SECONDS)))
+        except ValueError:
+            return cls.DEFAULT_COOLDOWN_SECONDS
+
+
+# ============================================
+# 트렌드 수집 설정
+# ============================================
+class TrendConfig:
+    """다중 소스 트렌드 수집 설정"""
+
+    DEFAULT_ASYNC = True            # asyncio로 소스 동시 수집
+    DEFAULT_ALL_SOURCES = False     # False면 핵심 3개 소스만 수집
+    DEFAULT_SOURCE_TIMEOUT = 15.0   # 소스별 수집 시간 상한 (초, 비동기 모드)
+    DEFAULT_MAX_CONCURRENCY = 8     # 항목 단위 동시 요청 수 (Hacker News 등)
+
+    @classmethod
+    def is_async(cls) -> bool:
+        """비동기 수집 여부"""
+        value = os.environ.get(EnvKeys.TREND_ASYNC)
+        if value is None:
+            return cls.DEFAULT_ASYNC
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def is_all_sources(cls) -> bool:
+        """전체 소스 수집 여부"""
+        value = os.environ.get(EnvKeys.TREND_ALL_SOURCES)
+        if value is None:
+            return cls.DEFAULT_ALL_SOURCES
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def get_source_timeout(cls) -> float:
+        """소스별 수집 시간 상한 (초)"""
+        try:
+            return max(1.0, float(os.environ.get(EnvKeys.TREND_SOURCE_TIMEOUT, cls.DEFAULT_SOURCE_TIMEOUT)))
+        except ValueError:
+            return cls.DEFAULT_SOURCE_TIMEOUT
+
+    @classmethod
+    def get_max_concurrency(cls) -> int:
+        """항목 단위 동시 요청 수"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.TREND_MAX_CONCURRENCY, cls.DEFAULT_MAX_CONCURRENCY)))
+        except ValueError:
+            return cls.DEFAULT_MAX_CONCURRENCY
+
+
+# ============================================
+# 대시보드 통계 설정
+# ============================================
+class DashboardStatsConfig:
+    """대시보드 카운터 캐시 설정"""
+
+    DEFAULT_TTL_SECONDS = 30.0   # 발굴 배치 커밋 시 즉시 무효화, TTL은 다른 프로세스 쓰기 대비
+    HIGH_SCORE = 85              # high_score 카운터 기준 점수
+    MAX_CACHED_WINDOWS = 16      # days 파라미터별 캐시 항목 상한
+
+    @classmethod
+    def get_ttl_seconds(cls) -> float:
+        """캐시 TTL (초, 0이면 캐시 안 함)"""
+        try:
+            return max(0.0, float(os.environ.get(EnvKeys.DASHBOARD_STATS_TTL_SECONDS, cls.DEFAULT_TTL_SECONDS)))
+        except ValueError:
+            return cls.DEFAULT_TTL_SECONDS
+
 
 # ============================================
 # 사업 발굴 설정
@@ -196,6 +514,39 @@ class DiscoveryConfig:
     # 실행당 아이디어 수
     DEFAULT_IDEAS_PER_RUN = 3
 
+    # 병렬 분석 설정
+    DEFAULT_PARALLEL = False
+    DEFAULT_MAX_WORKERS = 3
+
+    # 배치 단위 일괄 저장 (배치당 커밋 1회)
+    DEFAULT_BATCH_WRITES = True
+
+    # 동적 조합 공간 사용 위치 저장 파일 (SQLite, 큐 워커 간 공유)
+    DEFAULT_COMBINATION_STATE_PATH = ".cache/combination_space.sqlite3"
+
+    # 스트리밍 발굴 (진행 상황 파일, 롤링 스냅샷 갱신 주기)
+    DEFAULT_PROGRESS_PATH = ".cache/discovery_progress.json"
+    DEFAULT_ROLLING_SNAPSHOT_EVERY = 10
+
+    # 작업 큐 (점유 기한이 지나면 다른 워커가 재개, 재시도 횟수, 워커 폴링 간격)
+    DEFAULT_QUEUE_LEASE_MINUTES = 30.0
+    DEFAULT_QUEUE_MAX_ATTEMPTS = 3
+    DEFAULT_QUEUE_POLL_SECONDS = 30
+
+    # 시간 예산 모드 (0이면 고정 개수 모드, 양수면 배치당 벽시계 예산 안에서 개수/분석 깊이 결정)
+    DEFAULT_TIME_BUDGET_MINUTES = 0.0
+    DEFAULT_BUDGET_MAX_IDEAS = 100
+
+    # 유사 아이디어 처리 (off: 검사 안 함, flag: 요약에 기록만, skip: 분석 제외, merge: 분석 제외 + 기존 기록에 병합)
+    NEAR_DUPLICATE_MODES = ("off", "flag", "skip", "merge")
+    DEFAULT_NEAR_DUPLICATE_MODE = "skip"
+    DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.75
+
+    # 단계별 분석 (quick_score로 후보 풀을 선별한 뒤 상위 아이디어만 전체 분석)
+    DEFAULT_CASCADE = True
+    DEFAULT_CASCADE_POOL_FACTOR = 3   # 후보 풀 = 실행당 아이디어 수 x 배수
+    DEFAULT_CASCADE_MARGIN = 10       # quick_score 통과 기준 = 최소 저장 점수 - 마진
+
     # 중복 방지 기간 (일)
     DUPLICATE_CHECK_DAYS = 7
 
@@ -226,6 +577,131 @@ class DiscoveryConfig:
         except ValueError:
             return cls.DEFAULT_IDEAS_PER_RUN
 
+    @classmethod
+    def is_parallel(cls) -> bool:
+        """아이디어 병렬 분석 여부"""
+        value = os.environ.get(EnvKeys.DISCOVERY_PARALLEL)
+        if value is None:
+            return cls.DEFAULT_PARALLEL
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def get_max_workers(cls) -> int:
+        """병렬 분석 동시 실행 수 (최소 1)"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.DISCOVERY_MAX_WORKERS, cls.DEFAULT_MAX_WORKERS)))
+        except ValueError:
+            return cls.DEFAULT_MAX_WORKERS
+
+    @classmethod
+    def is_batch_writes(cls) -> bool:
+        """배치 단위 일괄 저장 여부"""
+        value = os.environ.get(EnvKeys.DISCOVERY_BATCH_WRITES)
+        if value is None:
+            return cls.DEFAULT_BATCH_WRITES
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def get_combination_state_path(cls) -> str:
+        """동적 조합 공간 상태 파일 경로"""
+        return os.environ.get(EnvKeys.DISCOVERY_COMBINATION_STATE_PATH, cls.DEFAULT_COMBINATION_STATE_PATH)
+
+    @classmethod
+    def get_progress_path(cls) -> str:
+        """발굴 진행 상황 파일 경로 (빈 문자열이면 저장 안 함)"""
+        return os.environ.get(EnvKeys.DISCOVERY_PROGRESS_PATH, cls.DEFAULT_PROGRESS_PATH)
+
+    @classmethod
+    def get_rolling_snapshot_every(cls) -> int:
+        """롤링 스냅샷 갱신 주기 (분석 결과 개수, 최소 1)"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.DISCOVERY_ROLLING_SNAPSHOT_EVERY, cls.DEFAULT_ROLLING_SNAPSHOT_EVERY)))
+        except ValueError:
+            return cls.DEFAULT_ROLLING_SNAPSHOT_EVERY
+
+    @classmethod
+    def get_queue_lease_minutes(cls) -> float:
+        """작업 점유 기한 (분)"""
+        try:
+            return max(1.0, float(os.environ.get(EnvKeys.DISCOVERY_QUEUE_LEASE_MINUTES, cls.DEFAULT_QUEUE_LEASE_MINUTES)))
+        except ValueError:
+            return cls.DEFAULT_QUEUE_LEASE_MINUTES
+
+    @classmethod
+    def get_queue_max_attempts(cls) -> int:
+        """작업당 최대 시도 횟수 (최소 1)"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.DISCOVERY_QUEUE_MAX_ATTEMPTS, cls.DEFAULT_QUEUE_MAX_ATTEMPTS)))
+        except ValueError:
+            return cls.DEFAULT_QUEUE_MAX_ATTEMPTS
+
+    @classmethod
+    def get_queue_poll_seconds(cls) -> int:
+        """큐 워커 폴링 간격 (초)"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.DISCOVERY_QUEUE_POLL_SECONDS, cls.DEFAULT_QUEUE_POLL_SECONDS)))
+        except ValueError:
+            return cls.DEFAULT_QUEUE_POLL_SECONDS
+
+    @classmethod
+    def get_queue_claim_size(cls) -> int:
+        """큐 워커 1회 점유 작업 수 (병렬 분석이면 워커 수만큼)"""
+        return cls.get_max_workers() if cls.is_parallel() else 1
+
+    @classmethod
+    def get_time_budget_minutes(cls) -> float:
+        """배치 시간 예산 (분, 0이면 고정 개수 모드)"""
+        try:
+            return max(0.0, float(os.environ.get(EnvKeys.DISCOVERY_TIME_BUDGET_MINUTES, cls.DEFAULT_TIME_BUDGET_MINUTES)))
+        except ValueError:
+            return cls.DEFAULT_TIME_BUDGET_MINUTES
+
+    @classmethod
+    def get_budget_max_ideas(cls) -> int:
+        """시간 예산 모드 배치당 최대 아이디어 수"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.DISCOVERY_BUDGET_MAX_IDEAS, cls.DEFAULT_BUDGET_MAX_IDEAS)))
+        except ValueError:
+            return cls.DEFAULT_BUDGET_MAX_IDEAS
+
+    @classmethod
+    def get_near_duplicate_mode(cls) -> str:
+        """유사 아이디어 처리 모드"""
+        mode = os.environ.get(EnvKeys.DISCOVERY_NEAR_DUPLICATE_MODE, cls.DEFAULT_NEAR_DUPLICATE_MODE).lower()
+        return mode if mode in cls.NEAR_DUPLICATE_MODES else cls.DEFAULT_NEAR_DUPLICATE_MODE
+
+    @classmethod
+    def get_near_duplicate_threshold(cls) -> float:
+        """유사 아이디어 판정 임계값 (추정 Jaccard, 0~1)"""
+        try:
+            return float(os.environ.get(EnvKeys.DISCOVERY_NEAR_DUPLICATE_THRESHOLD, cls.DEFAULT_NEAR_DUPLICATE_THRESHOLD))
+        except ValueError:
+            return cls.DEFAULT_NEAR_DUPLICATE_THRESHOLD
+
+    @classmethod
+    def is_cascade(cls) -> bool:
+        """단계별 분석 (quick_score 선별) 사용 여부"""
+        value = os.environ.get(EnvKeys.DISCOVERY_CASCADE)
+        if value is None:
+            return cls.DEFAULT_CASCADE
+        return value.lower() in ("true", "1", "yes")
+
+    @classmethod
+    def get_cascade_pool_factor(cls) -> int:
+        """quick_score 후보 풀 배수 (최소 1)"""
+        try:
+            return max(1, int(os.environ.get(EnvKeys.DISCOVERY_CASCADE_POOL_FACTOR, cls.DEFAULT_CASCADE_POOL_FACTOR)))
+        except ValueError:
+            return cls.DEFAULT_CASCADE_POOL_FACTOR
+
+    @classmethod
+    def get_cascade_margin(cls) -> float:
+        """quick_score 통과 마진 (최소 저장 점수 대비)"""
+        try:
+            return float(os.environ.get(EnvKeys.DISCOVERY_CASCADE_MARGIN, cls.DEFAULT_CASCADE_MARGIN))
+        except ValueError:
+            return cls.DEFAULT_CASCADE_MARGIN
+
     @classmethod
     def get_priority(cls, score: float) -> str:
         """점수 기반 우선순위 반환"""
@@ -359,10 +835,17 @@ def print_config_status():
     # 시장 분석
     mode = MarketConfig.get_mode()
     print(f"[MARKET] Mode: {mode.value}")
+    print(f"[CACHE] Path: {CacheConfig.get_path()} (bypass: {CacheConfig.is_bypassed()})")
+    print(f"[RATE LIMIT] Enabled: {RateLimitConfig.is_enabled()} ({RateLimitConfig.get_path()})")
+    print(f"[CIRCUIT] Enabled: {CircuitBreakerConfig.is_enabled()} (error rate {CircuitBreakerConfig.get_error_rate()}, p95 {CircuitBreakerConfig.get_p95_ms():g}ms)")
+    print(f"[TREND] Async: {TrendConfig.is_async()} (all sources: {TrendConfig.is_all_sources()}, timeout {TrendConfig.get_source_timeout():g}s)")
+    print(f"[STATS] Dashboard cache TTL: {DashboardStatsConfig.get_ttl_seconds():g}s")
 
     # 사업 발굴
     print(f"[DISCOVERY] Min Score: {DiscoveryConfig.get_min_score()}")
     print(f"[DISCOVERY] Schedule: {DiscoveryConfig.get_schedule_hours()} (KST)")
+    print(f"[DISCOVERY] Parallel: {DiscoveryConfig.is_parallel()} (workers: {DiscoveryConfig.get_max_workers()})")
+    print(f"[DISCOVERY] Cascade: {DiscoveryConfig.is_cascade()} (pool x{DiscoveryConfig.get_cascade_pool_factor()}, margin {DiscoveryConfig.get_cascade_margin()})")
 
     # API 인증
     print(f"[API] Auth Enabled: {APIConfig.is_auth_enabled()}")
@@ -12,12 +12,21 @@ sys.path.append(os.path.dirname(__file__))
 from smart_business_system import SmartBusinessSystem
 from realistic_business_generator import RealisticBusinessGenerator
 from database_setup import Session, BusinessPlan, BusinessMeeting, Employee, get_kst_now
-from business_discovery_history import BusinessHistoryTracker, initialize_history_tables, BusinessDiscoveryHistory
+from business_discovery_history import (
+    BusinessHistoryTracker, BusinessDiscoveryHistory, initialize_history_tables,
+    get_business_name_index, insert_business_names
+)
+from near_duplicate import get_near_duplicate_index
+from discovery_consumers import ProgressFileConsumer, HighScoreNotifier, RollingSnapshotConsumer
+from discovery_queue import DiscoveryJobQueue
+from discovery_scheduler import Deadline, TimeBudgetScheduler
 from config import DiscoveryConfig
 from utils import DatabaseManager, clean_keyword, get_next_scheduled_time
 from notifications import notify_discovery_complete, notify_high_score_idea, notify_error
 from logging_config import get_discovery_logger
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
 import json
 import random
@@ -26,7 +35,10 @@ import random
 logger = get_discovery_logger()
 
 class ContinuousBusinessDiscovery:
-    def __init__(self):
+    def __init__(self, job_queue=None):
+        # 스레드별 DB 세션/히스토리 트래커 (병렬 워커는 각자 보유)
+        self._local = threading.local()
+
         self.smart_system = SmartBusinessSystem()
         self.idea_generator = RealisticBusinessGenerator()
         self.session = Session()
@@ -42,6 +54,20 @@ class ContinuousBusinessDiscovery:
         self.min_score = DiscoveryConfig.get_min_score()
         self.schedule_hours = DiscoveryConfig.get_schedule_hours()
         self.ideas_per_run = DiscoveryConfig.get_ideas_per_run()
+        self.parallel = DiscoveryConfig.is_parallel()
+        self.max_workers = DiscoveryConfig.get_max_workers()
+        self.batch_writes = DiscoveryConfig.is_batch_writes()
+        self.batch_writer = None  # 실행 중인 배치의 공유 쓰기 버퍼
+        self.near_duplicate_mode = DiscoveryConfig.get_near_duplicate_mode()
+        self.near_duplicates = []  # 최근 실행에서 유사 아이디어로 판정된 후보 (flag 모드는 분석은 진행)
+        self.last_summary = None  # 최근 스트리밍 실행 요약
+        self.job_queue = job_queue or DiscoveryJobQueue()
+        self.time_budget_minutes = DiscoveryConfig.get_time_budget_minutes()
+        self._deadline = None  # 시간 예산 모드 실행 중 마감 시각
+        self._deadline_cost_ms = 0
+        self._deferred = 0  # 마감으로 분석하지 못한 아이디어 수
+        self.cascade = DiscoveryConfig.is_cascade()
+        self.cascade_pool_factor = DiscoveryConfig.get_cascade_pool_factor()
 
         from config import MarketConfig
         mode_label = "경량 모드" if MarketConfig.is_lightweight() else "전체 모드"
@@ -50,11 +76,36 @@ class ContinuousBusinessDiscovery:
         print("="*80)
         print(f"스케줄: {self.schedule_hours} (KST)")
         print(f"최소 저장 점수: {self.min_score}점")
-        print(f"실행당 아이디어: {self.ideas_per_run}개")
+        if self.time_budget_minutes:
+            print(f"시간 예산 모드: 배치당 {self.time_budget_minutes:g}분 (최대 {DiscoveryConfig.get_budget_max_ideas()}개)")
+        else:
+            print(f"실행당 아이디어: {self.ideas_per_run}개")
+        if self.cascade:
+            print(f"단계별 분석: 후보 {self.ideas_per_run * self.cascade_pool_factor}개 중 quick_score 상위 선별")
+        if self.parallel:
+            print(f"병렬 분석: 워커 {self.max_workers}개")
         print("[OK] 템플릿 기반 아이디어 생성 (메모리 최적화)\n")
 
         logger.info(f"Discovery System Started - Schedule: {self.schedule_hours}, Min Score: {self.min_score}")
 
+    @property
+    def session(self):
+        """현재 스레드의 DB 세션"""
+        return self._local.session
+
+    @session.setter
+    def session(self, value):
+        self._local.session = value
+
+    @property
+    def history_tracker(self):
+        """현재 스레드의 히스토리 트래커"""
+        return self._local.history_tracker
+
+    @history_tracker.setter
+    def history_tracker(self, value):
+        self._local.history_tracker = value
+
     def refresh_session(self):
         """DB 세션 새로고침 (연결 오류 복구용)"""
         try:
@@ -81,26 +132,30 @@ class ContinuousBusinessDiscovery:
                     return False
         return False
 
-    def get_it_business_ideas(self):
-        """템플릿 기반 사업 아이디어 생성 (메모리 최적화 + 중복 방지 강화)"""
+    def get_it_business_ideas(self, count=None):
+        """템플릿 기반 사업 아이디어 생성 (메모리 최적화 + 중복 방지 강화)
+
+        Args:
+            count: 선택할 아이디어 수 (None이면 실행당 아이디어 설정)
+        """
         all_opportunities = []
-        recent_names = set()
+        count = self.ideas_per_run if count is None else count
 
-        # 최근 저장된 사업명 조회 (중복 방지)
+        # 전체 분석 이력 사업명 인덱스 (O(1) 중복 검사, 마지막 동기화 이후 분만 조회)
+        recent_names = get_business_name_index()
         try:
             self.refresh_session()
-            existing_plans = self.session.query(BusinessPlan.plan_name).limit(200).all()
-            recent_names = set([plan[0] for plan in existing_plans])
-
-            # 히스토리에서도 최근 이름 조회 (더 정확한 중복 방지, LIMIT 500으로 비용 최적화)
-            recent_history = self.session.query(BusinessDiscoveryHistory.business_name).filter(
-                BusinessDiscoveryHistory.discovered_at >= datetime.now() - timedelta(days=7)
-            ).limit(500).all()
-            recent_names.update([h[0] for h in recent_history])
-
-            print(f"   중복 방지 대상: {len(recent_names)}개")
+            recent_names.sync(self.session)
+            print(f"   중복 방지 대상: {len(recent_names)}개 (전체 이력)")
         except Exception as e:
-            print(f"   [WARN] DB 조회 실패: {e}")
+            print(f"   [WARN] 사업명 인덱스 동기화 실패: {e}")
+
+        self.near_duplicates = []
+        if self.near_duplicate_mode != 'off':
+            try:
+                self.sync_near_duplicate_index()
+            except Exception as e:
+                print(f"   [WARN] 유사 아이디어 인덱스 동기화 실패: {e}")
 
         print("\n[GENERATE] 다양한 아이디어 생성 중...")
 
@@ -114,8 +169,11 @@ class ContinuousBusinessDiscovery:
             selected_names = set()
 
             # 설정된 개수만큼 중복되지 않은 아이디어 선택
+            # (단계별 분석 시 배수만큼 후보 풀을 만든 뒤 quick_score로 선별)
             selected_count = 0
-            max_select = self.ideas_per_run
+            max_select = count
+            if self.cascade:
+                max_select *= self.cascade_pool_factor
 
             for opp in all_ideas:
                 if selected_count >= max_select:
@@ -124,11 +182,25 @@ class ContinuousBusinessDiscovery:
                 name = opp.get('business', {}).get('name', '')
                 # DB 중복 + 이번 실행 내 중복 모두 체크
                 if name and name not in recent_names and name not in selected_names:
+                    # 기존 기록(또는 이번 선택분)과 거의 같은 아이디어는 기록 (flag 외 모드는 분석 생략)
+                    domain = opp.get('business', {}).get('domain')
+                    match = self.find_near_duplicate(name, domain)
+                    if match is not None:
+                        self._record_near_duplicate(name, match)
+                        if self.near_duplicate_mode != 'flag':
+                            continue
+
                     all_opportunities.append(opp)
                     selected_names.add(name)
                     selected_count += 1
+                    self._register_near_duplicate_candidate(name, domain)
                     print(f"   [OK] 선택 {selected_count}: {name}")
 
+            self._merge_near_duplicates()
+
+            if self.cascade and all_opportunities:
+                all_opportunities = self._apply_quick_gate(all_opportunities, count)
+
         except Exception as e:
             print(f"   [ERROR] 아이디어 생성 실패: {e}")
             import traceback
@@ -137,6 +209,105 @@ class ContinuousBusinessDiscovery:
         print(f"\n   최종 아이디어: {len(all_opportunities)}개\n")
         return all_opportunities
 
+    def _apply_quick_gate(self, opportunities, count):
+        """1단계 quick_score 게이트: 통과한 아이디어만 시장/수익 분석 대상으로 반환"""
+        candidates = []
+        for opp in opportunities:
+            business = opp.get('business', {})
+            name = business.get('name', '')
+            candidates.append({
+                'business_idea': name,
+                'keyword': self.generate_keyword(name),
+                'config': {
+                    'type': business.get('it_type') or self.create_business_config(opp)['type'],
+                    'domain': business.get('domain')
+                },
+                'opportunity': opp
+            })
+
+        passed, pruned = self.smart_system.quick_gate(candidates, top_k=count)
+
+        # 탈락 후보는 이번 실행 선택분에서 제외 (다음 실행에서 다시 후보가 될 수 있음)
+        if self.near_duplicate_mode != 'off':
+            index = get_near_duplicate_index()
+            for candidate in pruned:
+                index.remove(candidate['business_idea'])
+
+        for candidate in passed:
+            candidate['opportunity']['quick_score'] = candidate['quick_score']
+        return [candidate['opportunity'] for candidate in passed]
+
+    def sync_near_duplicate_index(self):
+        """유사 아이디어 인덱스에 마지막 동기화 이후 히스토리만 추가"""
+        index = get_near_duplicate_index()
+        rows = self.session.query(
+            BusinessDiscoveryHistory.id,
+            BusinessDiscoveryHistory.business_name,
+            BusinessDiscoveryHistory.keyword,
+            BusinessDiscoveryHistory.total_score
+        ).filter(
+            BusinessDiscoveryHistory.id > index.last_synced_id
+        ).order_by(BusinessDiscoveryHistory.id).all()
+
+        domains = self._near_duplicate_domains()
+        for history_id, name, keyword, total_score in rows:
+            index.add(name, name, keyword, domain=self._find_domain(name, domains),
+                      history_id=history_id, total_score=total_score)
+        if rows:
+            index.last_synced_id = rows[-1][0]
+        return len(rows)
+
+    def _near_duplicate_domains(self):
+        """유사 검사 시 가중할 도메인 단어 (아이디어 생성기의 도메인 목록)"""
+        return set(getattr(self.idea_generator, 'business_domains', None) or ())
+
+    @staticmethod
+    def _find_domain(business_name, domains):
+        """이름에서 첫 도메인 단어 (없으면 None)"""
+        return next((token for token in (business_name or '').split() if token in domains), None)
+
+    def find_near_duplicate(self, business_name, domain=None):
+        """임계값 이상 유사한 기존 기록 중 가장 가까운 기록 (없거나 off 모드면 None)"""
+        if self.near_duplicate_mode == 'off':
+            return None
+        domain = domain or self._find_domain(business_name, self._near_duplicate_domains())
+        return get_near_duplicate_index().nearest(business_name, self.generate_keyword(business_name), domain)
+
+    def _register_near_duplicate_candidate(self, business_name, domain=None):
+        """이번 실행에서 선택한 후보 등록 (같은 실행 내 변형 아이디어 검출용)"""
+        if self.near_duplicate_mode != 'off':
+            get_near_duplicate_index().add(
+                business_name, business_name, self.generate_keyword(business_name),
+                domain=domain or self._find_domain(business_name, self._near_duplicate_domains()),
+                history_id=None, total_score=None
+            )
+
+    def _record_near_duplicate(self, business_name, match):
+        skipped = self.near_duplicate_mode != 'flag'
+        self.near_duplicates.append({
+            'name': business_name,
+            'nearest_name': match['name'],
+            'nearest_history_id': match.get('history_id'),
+            'nearest_score': match.get('total_score'),
+            'similarity': match['similarity'],
+            'skipped': skipped,
+            'merged': self.near_duplicate_mode == 'merge'
+        })
+        tag = "SKIP" if skipped else "FLAG"
+        print(f"   [{tag}] 유사 아이디어: {business_name} ≈ {match['name']} (유사도 {match['similarity']:.2f})")
+
+    def _merge_near_duplicates(self):
+        """merge 모드: 제외된 변형 이름을 사업명 인덱스에 기록해 이후 생성에서도 제외"""
+        if self.near_duplicate_mode != 'merge' or not self.near_duplicates:
+            return
+        names = [item['name'] for item in self.near_duplicates]
+        try:
+            insert_business_names(self.session, names)
+            if self.safe_commit():
+                get_business_name_index().remember(names)
+        except Exception as e:
+            logger.warning(f"Near-duplicate merge failed: {e}")
+
     def generate_keyword(self, business_name):
         """사업 이름에서 검색 키워드 생성 (utils.clean_keyword 사용)"""
         return clean_keyword(business_name)
@@ -214,6 +385,64 @@ class ContinuousBusinessDiscovery:
             'timeline_weeks': 4
         }
 
+    def _build_business_plan_fields(self, opportunity, config, keyword, total_score,
+                                    market_score, revenue_score, market_analysis,
+                                    revenue_analysis, action_plan):
+        """분석 결과로 BusinessPlan 신규 저장 필드 생성"""
+        business = opportunity['business']
+        name = business.get('name', '')
+        revenue_data = revenue_analysis or {}
+
+        # 실제 AI 분석 결과에서 매출 추정값 추출 (현실적 상한선 적용)
+        realistic_scenario = revenue_data.get('scenarios', {}).get('realistic', {})
+        monthly_profit = realistic_scenario.get('monthly_profit', 0)
+        monthly_revenue_estimate = realistic_scenario.get('monthly_revenue', 0)
+
+        # 현실적 상한선: 1인 창업 월매출 최대 1,000만원
+        monthly_revenue_estimate = min(monthly_revenue_estimate, 10000000)
+
+        if monthly_revenue_estimate > 0:
+            annual_revenue = monthly_revenue_estimate * 12
+        else:
+            # 폴백: 현실적인 기본값 (월 300만원 × 12개월)
+            annual_revenue = 3000000 * 12
+
+        # 연매출 상한선: 1억 2천만원 (1인 창업 현실적 상한)
+        annual_revenue = min(annual_revenue, 120000000)
+
+        return dict(
+            plan_name=name,
+            plan_type='IT Service',
+            description=business.get('description', f"{name} 사업"),
+            target_market=f"디지털 네이티브, IT 활용 고객",
+            revenue_model=config['revenue_model'],
+            projected_revenue_12m=annual_revenue,
+            investment_required=config['budget'],
+            risk_level=DiscoveryConfig.get_risk_level(total_score),
+            feasibility_score=total_score / 10,
+            priority=DiscoveryConfig.get_priority(total_score),
+            status='approved',
+            created_by='AI_Discovery_System',
+            details={
+                'discovery_date': get_kst_now().isoformat(),
+                'analysis_score': total_score,
+                'market_score': market_score,
+                'revenue_score': revenue_score,
+                'market_keyword': keyword,
+                'business_type': config['type'],
+                'startup_cost': config['budget'],
+                'estimated_monthly_revenue': monthly_revenue_estimate,
+                'estimated_monthly_profit': monthly_profit,
+                'opportunity_type': opportunity.get('type', 'AI_Discovery'),
+                'priority_reason': f"AI 분석 점수: {total_score:.1f}점",
+                'ai_analysis': {
+                    'market_analysis': market_analysis,
+                    'revenue_analysis': revenue_analysis,
+                    'action_plan': action_plan
+                }
+            }
+        )
+
     def analyze_and_save(self, opportunity, discovery_batch):
         """아이디어 분석 및 DB 저장 (히스토리 기록 포함)"""
         business = opportunity['business']
@@ -234,7 +463,10 @@ class ContinuousBusinessDiscovery:
 
             # 실제 AI 분석 수행 (SmartBusinessSystem 사용)
             print("   [AI] 실제 AI 분석 시작...")
-            analysis_result = self.smart_system.analyze_business_idea(name, keyword, config)
+            depth = opportunity.get('analysis_depth')
+            analysis_result = self.smart_system.analyze_business_idea(
+                name, keyword, config, lightweight=None if depth is None else depth == 'lightweight'
+            )
 
             # 분석 실패 시 처리
             if not analysis_result.get('passed'):
@@ -351,6 +583,24 @@ class ContinuousBusinessDiscovery:
             elif total_score >= low_score_threshold:
                 print(f"   [SAVE] 우수한 아이디어! DB에 저장 중...")
 
+                plan_fields = self._build_business_plan_fields(
+                    opportunity, config, keyword, total_score, market_score, revenue_score,
+                    market_analysis, revenue_analysis, action_plan
+                )
+
+                # 배치 모드: upsert 예약 후 배치 종료 시 일괄 커밋
+                if self.batch_writer is not None:
+                    self.batch_writer.add_business_plan(**plan_fields)
+                    print(f"   [BATCH] business_plans 저장 예약 (배치 종료 시 일괄 커밋)")
+                    logger.info(f"Queued business idea: {name} (Score: {total_score})")
+                    return {
+                        'saved': True,
+                        'name': name,
+                        'score': total_score,
+                        'market_score': market_score,
+                        'revenue_score': revenue_score
+                    }
+
                 # 사업 계획으로 DB에 저장
                 existing = self.session.query(BusinessPlan).filter_by(
                     plan_name=name
@@ -358,59 +608,9 @@ class ContinuousBusinessDiscovery:
 
                 if existing:
                     print(f"   [UPDATE] 이미 존재하는 사업. 점수 업데이트")
-                    existing.feasibility_score = total_score / 10
+                    existing.feasibility_score = plan_fields['feasibility_score']
                 else:
-                    # 실제 AI 분석 결과에서 매출 추정값 추출 (현실적 상한선 적용)
-                    realistic_scenario = revenue_data.get('scenarios', {}).get('realistic', {})
-                    monthly_profit = realistic_scenario.get('monthly_profit', 0)
-                    monthly_revenue_estimate = realistic_scenario.get('monthly_revenue', 0)
-
-                    # 현실적 상한선: 1인 창업 월매출 최대 1,000만원
-                    monthly_revenue_estimate = min(monthly_revenue_estimate, 10000000)
-
-                    if monthly_revenue_estimate > 0:
-                        annual_revenue = monthly_revenue_estimate * 12
-                    else:
-                        # 폴백: 현실적인 기본값 (월 300만원 × 12개월)
-                        annual_revenue = 3000000 * 12
-
-                    # 연매출 상한선: 1억 2천만원 (1인 창업 현실적 상한)
-                    annual_revenue = min(annual_revenue, 120000000)
-
-                    business_plan = BusinessPlan(
-                        plan_name=name,
-                        plan_type='IT Service',
-                        description=business.get('description', f"{name} 사업"),
-                        target_market=f"디지털 네이티브, IT 활용 고객",
-                        revenue_model=config['revenue_model'],
-                        projected_revenue_12m=annual_revenue,
-                        investment_required=config['budget'],
-                        risk_level=DiscoveryConfig.get_risk_level(total_score),
-                        feasibility_score=total_score / 10,
-                        priority=DiscoveryConfig.get_priority(total_score),
-                        status='approved',
-                        created_by='AI_Discovery_System',
-                        details={
-                            'discovery_date': get_kst_now().isoformat(),
-                            'analysis_score': total_score,
-                            'market_score': market_score,
-                            'revenue_score': revenue_score,
-                            'market_keyword': keyword,
-                            'business_type': config['type'],
-                            'startup_cost': config['budget'],
-                            'estimated_monthly_revenue': monthly_revenue_estimate,
-                            'estimated_monthly_profit': monthly_profit,
-                            'opportunity_type': opportunity.get('type', 'AI_Discovery'),
-                            'priority_reason': f"AI 분석 점수: {total_score:.1f}점",
-                            'ai_analysis': {
-                                'market_analysis': market_analysis,
-                                'revenue_analysis': revenue_analysis,
-                                'action_plan': action_plan
-                            }
-                        }
-                    )
-
-                    self.session.add(business_plan)
+                    self.session.add(BusinessPlan(**plan_fields))
 
                 if self.safe_commit():
                     print(f"   [OK] business_plans & history 테이블에 저장 완료!")
@@ -455,8 +655,124 @@ class ContinuousBusinessDiscovery:
                 'error': str(e)
             }
 
-    def run_hourly_discovery(self):
-        """매시간 사업 발굴 (히스토리 추적 및 인사이트 생성)"""
+    def _analyze_in_worker(self, opportunity, discovery_batch):
+        """워커 스레드에서 분석 (스레드 전용 세션 생성 후 정리)"""
+        name = opportunity.get('business', {}).get('name', '')
+        try:
+            self.session = Session()
+            self.history_tracker = BusinessHistoryTracker()
+            self.history_tracker.batch_writer = self.batch_writer
+            return self.analyze_and_save(opportunity, discovery_batch)
+        except Exception as e:
+            logger.error(f"Worker error analyzing {name}: {e}")
+            return {'saved': False, 'name': name, 'error': str(e)}
+        finally:
+            tracker = getattr(self._local, 'history_tracker', None)
+            sessions = [getattr(self._local, 'session', None), tracker.session if tracker else None]
+            for session in sessions:
+                if session is None:
+                    continue
+                try:
+                    session.close()
+                except Exception:
+                    pass
+            self._local.session = None
+            self._local.history_tracker = None
+
+    def _iter_parallel(self, ideas, discovery_batch):
+        """워커 풀로 병렬 분석 - 끝나는 순서대로 (입력 위치, 결과) 반환"""
+        workers = min(self.max_workers, len(ideas))
+        print(f"[PARALLEL] {len(ideas)}개 아이디어를 워커 {workers}개로 병렬 분석")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='discovery') as executor:
+            futures = {
+                executor.submit(self._analyze_before_deadline, idea, discovery_batch): index
+                for index, idea in enumerate(ideas)
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    self._deferred += 1
+                    continue
+                yield futures[future], result
+
+    def _analyze_before_deadline(self, opportunity, discovery_batch):
+        """마감 전에 끝낼 수 있을 때만 분석 (시간 예산 초과 시 None)"""
+        if not self._deadline_allows():
+            return None
+        return self._analyze_in_worker(opportunity, discovery_batch)
+
+    def _deadline_allows(self):
+        return self._deadline is None or self._deadline.allows(self._deadline_cost_ms)
+
+    def _iter_sequential(self, ideas, discovery_batch):
+        for index, idea in enumerate(ideas):
+            if not self._deadline_allows():
+                self._deferred += len(ideas) - index
+                print(f"\n[BUDGET] 시간 예산 마감 - 남은 {len(ideas) - index}개 아이디어는 다음 배치로")
+                return
+            print(f"\n[{index + 1}/{len(ideas)}]")
+            yield index, self.analyze_and_save(idea, discovery_batch)
+
+            # API 요청 간격 (실제 웹 스크래핑 시)
+            time.sleep(2)
+
+    def plan_time_budget(self, parallel=False):
+        """시간 예산 모드: 최근 분석 소요 시간으로 아이디어 수/분석 깊이 결정"""
+        from config import MarketConfig
+        scheduler = TimeBudgetScheduler(
+            budget_seconds=self.time_budget_minutes * 60,
+            max_ideas=DiscoveryConfig.get_budget_max_ideas(),
+            min_full_ideas=self.ideas_per_run,
+            workers=self.max_workers if parallel else 1,
+            overhead_ms=0 if parallel else 2000,  # 순차 모드 아이디어 간 대기
+            allow_full=not MarketConfig.is_lightweight()
+        )
+        try:
+            self.refresh_session()
+            costs = scheduler.estimate_costs(self.session)
+        except Exception as e:
+            print(f"   [WARN] 분석 소요 시간 추정 실패, 기본값 사용: {e}")
+            costs = dict(TimeBudgetScheduler.DEFAULT_COSTS_MS)
+        plan = scheduler.plan(costs)
+        print(f"[BUDGET] {self.time_budget_minutes:g}분 예산 -> {plan['depth']} 분석 {plan['ideas']}개 "
+              f"(아이디어당 약 {plan['cost_ms'] / 1000:.1f}초)")
+        return plan
+
+    def default_consumers(self):
+        """기본 스트림 소비자: 진행 상황 파일, 고득점 알림, 롤링 스냅샷"""
+        consumers = []
+        progress_path = DiscoveryConfig.get_progress_path()
+        if progress_path:
+            consumers.append(ProgressFileConsumer(progress_path))
+        consumers.append(HighScoreNotifier(notify_high_score_idea, DiscoveryConfig.DEFAULT_HIGH_SCORE_THRESHOLD))
+        consumers.append(RollingSnapshotConsumer(Session, every=DiscoveryConfig.get_rolling_snapshot_every()))
+        return consumers
+
+    @staticmethod
+    def _dispatch(consumers, hook, *args):
+        """소비자 훅 호출 (소비자 오류는 발굴을 중단시키지 않음)"""
+        for consumer in consumers:
+            try:
+                getattr(consumer, hook)(*args)
+            except Exception as e:
+                logger.warning(f"Discovery consumer {type(consumer).__name__}.{hook} failed: {e}")
+
+    def stream_discovery(self, parallel=None, consumers=None):
+        """사업 발굴 스트리밍 - 아이디어별 결과를 끝나는 즉시 반환하는 제너레이터
+
+        결과 목록을 보관하지 않으며, 소비자(DiscoveryConsumer)가 결과마다 부수 효과를 처리한다.
+        배치 요약은 종료 후 self.last_summary에 남는다.
+
+        Args:
+            parallel: 병렬 분석 여부 (None이면 DiscoveryConfig 설정 사용, 병렬 시 완료 순서)
+            consumers: 소비자 목록 (None이면 default_consumers())
+        """
+        for _, result in self._stream(parallel, consumers):
+            yield result
+
+    def _stream(self, parallel, consumers):
+        consumers = self.default_consumers() if consumers is None else consumers
         now = get_kst_now()
         discovery_batch = now.strftime('%Y-%m-%d-%H')  # 배치 ID
 
@@ -465,32 +781,83 @@ class ContinuousBusinessDiscovery:
         print(f"[BATCH] 배치 ID: {discovery_batch}")
         print(f"{'='*80}\n")
 
-        # IT 사업 아이디어 생성
-        it_ideas = self.get_it_business_ideas()
+        if parallel is None:
+            parallel = self.parallel
+
+        # 시간 예산 모드: 마감 시각은 배치 시작 시점 기준 (아이디어 생성 시간 포함)
+        plan = None
+        self._deferred = 0
+        if self.time_budget_minutes:
+            self._deadline = Deadline(self.time_budget_minutes * 60)
+            plan = self.plan_time_budget(parallel)
+            self._deadline_cost_ms = plan['cost_ms']
+
+        # IT 사업 아이디어 생성 (단계별 카운터는 실행 단위로 집계)
+        self.smart_system.reset_stage_counters()
+        it_ideas = self.get_it_business_ideas(count=plan['ideas'] if plan else None)
+        if plan:
+            for idea in it_ideas:
+                idea['analysis_depth'] = plan['depth']
         print(f"[IDEAS] 이번 시간 분석 대상: {len(it_ideas)}개\n")
 
-        results = []
-        saved_count = 0
+        # 배치 쓰기: 히스토리/저점수/사업계획을 모았다가 배치 종료 시 1회 커밋
+        if self.batch_writes:
+            self.batch_writer = self.history_tracker.begin_batch(discovery_batch)
 
-        for i, idea in enumerate(it_ideas, 1):
-            print(f"\n[{i}/{len(it_ideas)}]")
-            result = self.analyze_and_save(idea, discovery_batch)
-            results.append(result)
+        summary = {
+            'timestamp': now.isoformat(),
+            'batch_id': discovery_batch,
+            'analyzed': len(it_ideas),
+            'saved': 0
+        }
+        pending = []  # 배치 커밋 대기 중인 저장 결과 (커밋 후 확정)
+        self._dispatch(consumers, 'on_start', discovery_batch, len(it_ideas))
 
-            if result.get('saved'):
-                saved_count += 1
+        if parallel and len(it_ideas) > 1:
+            analysis = self._iter_parallel(it_ideas, discovery_batch)
+        else:
+            analysis = self._iter_sequential(it_ideas, discovery_batch)
 
-            # API 요청 간격 (실제 웹 스크래핑 시)
-            time.sleep(2)
+        try:
+            for index, result in analysis:
+                if result.get('saved'):
+                    summary['saved'] += 1
+                    if self.batch_writer is not None:
+                        result['pending_commit'] = True
+                        pending.append(result)
+                self._dispatch(consumers, 'on_result', result)
+                yield index, result
+        finally:
+            # 호출자가 스트림을 중간에 닫거나 마감에 도달해도 이미 분석한 결과는 커밋
+            self._deadline = None
+            self._commit_stream_batch(pending, summary, consumers)
+
+        if self._deferred:
+            summary['analyzed'] -= self._deferred
+        if plan:
+            summary['time_budget'] = dict(plan, deferred=self._deferred)
+
+        saved_count = summary['saved']
 
         # 결과 요약
         print(f"\n{'='*80}")
         print(f"[RESULT] 이번 시간 결과")
         print(f"{'='*80}")
-        print(f"분석: {len(it_ideas)}개")
+        print(f"분석: {summary['analyzed']}개")
         print(f"저장: {saved_count}개 (50점 이상)")
-        print(f"제외: {len(it_ideas) - saved_count}개 (50점 미만)\n")
+        print(f"제외: {summary['analyzed'] - saved_count}개 (50점 미만)\n")
+
+        self._post_batch_analysis()
+
+        logger.info(f"Hourly discovery completed: {saved_count}/{summary['analyzed']} saved")
 
+        summary['near_duplicates'] = self.near_duplicates
+        summary['stage_counters'] = self.smart_system.get_stage_counters()
+        self.last_summary = summary
+        self._dispatch(consumers, 'on_complete', summary)
+
+    def _post_batch_analysis(self):
+        """배치 종료 후 시간별 스냅샷 + 인사이트 생성"""
         # 시간별 스냅샷 생성
         print(f"[SNAPSHOT] 시간별 스냅샷 생성 중...")
         try:
@@ -511,30 +878,230 @@ class ContinuousBusinessDiscovery:
         except Exception as e:
             print(f"   [WARNING] 인사이트 생성 실패: {e}")
 
-        logger.info(f"Hourly discovery completed: {saved_count}/{len(it_ideas)} saved")
+    def _commit_stream_batch(self, pending, summary, consumers):
+        """배치 쓰기 모드: 모아 둔 결과 일괄 커밋 후 대기 중이던 결과 확정"""
+        if self.batch_writer is None:
+            return
+        self.batch_writer = None
+        committed = self.history_tracker.flush_batch() is not None
+        if not committed:
+            print(f"   [WARN] 배치 일괄 저장 실패 - 이번 배치 결과 미저장")
+        for result in pending:
+            result.pop('pending_commit', None)
+            if not committed:
+                result['saved'] = False
+                result['error'] = 'DB commit failed'
+                summary['saved'] -= 1
+        self._dispatch(consumers, 'on_commit', pending)
+
+    def run_hourly_discovery(self, parallel=None, consumers=None):
+        """매시간 사업 발굴 (히스토리 추적 및 인사이트 생성)
+
+        stream_discovery() 결과를 입력 순서로 모아 기존 형식의 요약을 반환한다.
+
+        Args:
+            parallel: 병렬 분석 여부 (None이면 DiscoveryConfig 설정 사용)
+            consumers: 스트림 소비자 목록 (None이면 default_consumers())
+        """
+        ordered = sorted(self._stream(parallel, consumers), key=lambda item: item[0])
+        results = [result for _, result in ordered]
 
         # 결과 객체 생성
-        discovery_results = {
-            'timestamp': now.isoformat(),
-            'batch_id': discovery_batch,
-            'analyzed': len(it_ideas),
-            'saved': saved_count,
-            'results': results
-        }
+        discovery_results = dict(self.last_summary, results=results)
 
-        # 알림 전송 (설정된 경우)
+        # 알림 전송 (설정된 경우, 고득점 개별 알림은 HighScoreNotifier가 결과마다 전송)
         try:
             notify_discovery_complete(discovery_results)
-
-            # 고득점 아이디어 개별 알림
-            for result in results:
-                if result.get('saved') and result.get('score', 0) >= DiscoveryConfig.DEFAULT_HIGH_SCORE_THRESHOLD:
-                    notify_high_score_idea(result)
         except Exception as e:
             logger.warning(f"Notification failed: {e}")
 
         return discovery_results
 
+    # ------------------------------------------------------------------
+    # 작업 큐 기반 발굴 (여러 워커 프로세스, 중단 후 재개)
+    # ------------------------------------------------------------------
+    def request_discovery(self, discovery_batch=None):
+        """배치 요청 등록 (같은 배치 ID는 한 번만) - (배치 ID, 새로 등록 여부)"""
+        discovery_batch = discovery_batch or get_kst_now().strftime('%Y-%m-%d-%H')
+        created = self.job_queue.request_batch(discovery_batch)
+        print(f"[QUEUE] 배치 요청 {discovery_batch}: {'등록' if created else '이미 등록됨'}")
+        return discovery_batch, created
+
+    def expand_requested_batches(self):
+        """요청된 배치를 점유해 아이디어 생성 후 작업으로 등록"""
+        expanded = []
+        while True:
+            discovery_batch = self.job_queue.claim_batch()
+            if discovery_batch is None:
+                return expanded
+            plan = self.plan_time_budget() if self.time_budget_minutes else None
+            ideas = self.get_it_business_ideas(count=plan['ideas'] if plan else None)
+            if plan:
+                for idea in ideas:
+                    idea['analysis_depth'] = plan['depth']
+            total = self.job_queue.add_jobs(discovery_batch, ideas)
+            print(f"[QUEUE] 배치 {discovery_batch}: 작업 {total}개 등록")
+            expanded.append(discovery_batch)
+
+    def work_queue(self, consumers=None, max_jobs=None, claimed=None):
+        """큐의 작업을 다른 워커와 나눠 처리
+
+        작업을 묶음(병렬 모드는 워커 수만큼)으로 점유해 워커 풀로 분석하고, 배치 쓰기 버퍼에 모은 결과와
+        작업 완료 표시를 한 트랜잭션으로 커밋한다 (커밋 전에 중단되면 작업은 기한 만료 후 재점유되고
+        결과는 남지 않으므로 중복 기록 없음). 오류 결과는 작업 실패로 기록해 재시도한다.
+        마지막 작업을 끝낸 워커 하나만 배치 후처리(스냅샷/인사이트/알림/회의록)를 수행한다.
+
+        Args:
+            consumers: 스트림 소비자 목록 (None이면 default_consumers())
+            max_jobs: 이번 호출에서 처리할 최대 작업 수 (None이면 남은 작업 모두)
+            claimed: 호출자가 이미 점유한 작업 목록 (DiscoveryJobQueue.claim_many() 결과)
+
+        Returns:
+            이 워커가 완료 처리한 배치 요약 목록
+        """
+        consumers = self.default_consumers() if consumers is None else consumers
+        claim_size = self.max_workers if self.parallel else 1
+        started = set()
+        requested = {}
+
+        processed = self._work_jobs(claimed or [], consumers, started)
+        self.expand_requested_batches()
+        while max_jobs is None or processed < max_jobs:
+            self._skip_overdue_batches(requested)
+            limit = claim_size if max_jobs is None else min(claim_size, max_jobs - processed)
+            jobs = self.job_queue.claim_many(limit)
+            if not jobs:
+                break
+            processed += self._work_jobs(jobs, consumers, started)
+
+        finished = []
+        for discovery_batch in self.job_queue.unfinished_batches():
+            self.job_queue.expire_stale_failures(discovery_batch)
+            if self.job_queue.finish_batch(discovery_batch):
+                finished.append(self._finalize_queued_batch(discovery_batch, consumers))
+        return finished
+
+    def _work_jobs(self, jobs, consumers, started):
+        """점유한 작업 묶음을 배치별로 분석 - 완료 처리한 작업 수"""
+        by_batch = {}
+        for job in jobs:
+            by_batch.setdefault(job[1], []).append(job)
+
+        completed = 0
+        for discovery_batch, batch_jobs in by_batch.items():
+            if discovery_batch not in started:
+                started.add(discovery_batch)
+                status = self.job_queue.batch_status(discovery_batch) or {}
+                self._dispatch(consumers, 'on_start', discovery_batch, status.get('total', 0))
+            completed += self._work_batch_jobs(discovery_batch, batch_jobs, consumers)
+        return completed
+
+    def _work_batch_jobs(self, discovery_batch, jobs, consumers):
+        """같은 배치 작업들을 분석 후 결과와 완료 표시를 1회 커밋 (오류 결과는 재시도 대기)"""
+        ideas = [opportunity for _, _, opportunity in jobs]
+        for job_id, _, opportunity in jobs:
+            print(f"\n[QUEUE] 작업 {job_id} ({discovery_batch}): {opportunity.get('business', {}).get('name', '')}")
+
+        self.batch_writer = self.history_tracker.begin_batch(discovery_batch)
+        if self.parallel and len(ideas) > 1:
+            analysis = self._iter_parallel(ideas, discovery_batch)
+        else:
+            analysis = ((index, self._analyze_queued(idea, discovery_batch)) for index, idea in enumerate(ideas))
+
+        done = {}
+        failed = {}
+        pending = []
+        for index, result in analysis:
+            job_id = jobs[index][0]
+            if result.get('error'):
+                failed[job_id] = result['error']
+                continue
+            done[job_id] = result
+            if result.get('saved'):
+                result['pending_commit'] = True
+                pending.append(result)
+            self._dispatch(consumers, 'on_result', result)
+
+        def complete_jobs(session):
+            for job_id, result in done.items():
+                checkpoint = {key: value for key, value in result.items() if key != 'pending_commit'}
+                self.job_queue.complete(job_id, checkpoint, session=session)
+
+        self.batch_writer = None
+        committed = self.history_tracker.flush_batch(on_flush=complete_jobs) is not None
+        if not committed:
+            print(f"   [WARN] 배치 일괄 저장 실패 - 작업 {len(done)}개 재시도 대기")
+            failed.update((job_id, 'DB commit failed') for job_id in done)
+        for result in pending:
+            result.pop('pending_commit', None)
+            if not committed:
+                result['saved'] = False
+                result['error'] = 'DB commit failed'
+        self._dispatch(consumers, 'on_commit', pending)
+
+        for job_id, error in failed.items():
+            logger.error(f"Queue job {job_id} failed: {error}")
+            self.job_queue.fail(job_id, error)
+        return len(done) if committed else 0
+
+    def _analyze_queued(self, opportunity, discovery_batch):
+        """큐 작업 순차 분석 (예상치 못한 예외도 오류 결과로 반환해 작업 실패로 기록)"""
+        try:
+            return self.analyze_and_save(opportunity, discovery_batch)
+        except Exception as e:
+            self.refresh_session()
+            return {'saved': False, 'name': opportunity.get('business', {}).get('name', ''), 'error': str(e)}
+
+    def _skip_overdue_batches(self, requested):
+        """시간 예산 모드: 요청 후 예산이 지난 배치의 대기 작업은 건너뜀 (완료분은 유지)"""
+        if not self.time_budget_minutes:
+            return
+        now = get_kst_now()
+        budget = timedelta(minutes=self.time_budget_minutes)
+        for discovery_batch in self.job_queue.unfinished_batches():
+            if discovery_batch not in requested:
+                requested[discovery_batch] = self.job_queue.requested_at(discovery_batch)
+            requested_at = requested[discovery_batch]
+            if requested_at is not None and now >= requested_at + budget:
+                skipped = self.job_queue.skip_pending(discovery_batch, 'time budget exceeded')
+                if skipped:
+                    print(f"[BUDGET] 배치 {discovery_batch} 시간 예산 마감 - 대기 작업 {skipped}개 건너뜀")
+
+    def _finalize_queued_batch(self, discovery_batch, consumers):
+        """완료된 큐 배치 후처리 (배치당 1회)"""
+        results = self.job_queue.batch_results(discovery_batch)
+        saved_count = sum(1 for result in results if result.get('saved'))
+        print(f"\n[QUEUE] 배치 {discovery_batch} 완료 - 분석 {len(results)}개, 저장 {saved_count}개")
+
+        self._post_batch_analysis()
+        logger.info(f"Queued discovery completed: {discovery_batch} {saved_count}/{len(results)} saved")
+
+        summary = {
+            'timestamp': get_kst_now().isoformat(),
+            'batch_id': discovery_batch,
+            'analyzed': len(results),
+            'saved': saved_count,
+            'skipped': (self.job_queue.batch_status(discovery_batch) or {}).get('jobs', {}).get('skipped', 0),
+            'results': results
+        }
+        self._dispatch(consumers, 'on_complete', summary)
+        try:
+            notify_discovery_complete(summary)
+        except Exception as e:
+            logger.warning(f"Notification failed: {e}")
+        if saved_count > 0:
+            self.generate_discovery_meeting(summary)
+        return summary
+
+    def run_queued_discovery(self, discovery_batch=None, consumers=None):
+        """배치 요청 후 큐 처리 (다른 워커가 처리 중이면 남은 작업만 함께 처리)"""
+        discovery_batch, _ = self.request_discovery(discovery_batch)
+        finished = self.work_queue(consumers=consumers)
+        for summary in finished:
+            if summary['batch_id'] == discovery_batch:
+                return summary
+        return self.job_queue.batch_status(discovery_batch)
+
     def generate_discovery_meeting(self, results):
         """발굴 결과 회의록 생성"""
         now = get_kst_now()
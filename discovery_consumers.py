@@ -0,0 +1,227 @@
+"""
+사업 발굴 스트리밍 결과 소비자
+- ContinuousBusinessDiscovery.stream_discovery()가 아이디어별 결과를 끝나는 즉시 전달
+- 진행 상황 저장, 고득점 알림, 롤링 스냅샷을 배치 종료를 기다리지 않고 처리
+- 모든 소비자는 결과 목록을 보관하지 않음 (대량 배치에서도 메모리 일정)
+"""
+
+import heapq
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from database_setup import get_kst_now
+
+
+logger = logging.getLogger(__name__)
+
+
+class DiscoveryConsumer:
+    """발굴 스트림 소비자 기본 클래스 (필요한 훅만 재정의)
+
+    호출 순서: on_start -> on_result (아이디어마다) -> on_commit (배치 쓰기 시) -> on_complete
+    """
+
+    def on_start(self, batch_id: str, total: int):
+        pass
+
+    def on_result(self, result: Dict[str, Any]):
+        pass
+
+    def on_commit(self, results: List[Dict[str, Any]]):
+        """배치 쓰기 모드에서 커밋 대기 중이던 저장 결과 (커밋 실패 시 saved=False)"""
+        pass
+
+    def on_complete(self, summary: Dict[str, Any]):
+        pass
+
+
+class ProgressFileConsumer(DiscoveryConsumer):
+    """진행 상황을 JSON 파일에 저장 (원자적 교체, 대시보드/재시작 시 확인용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.progress: Dict[str, Any] = {}
+
+    def on_start(self, batch_id, total):
+        self.progress = {
+            'batch_id': batch_id,
+            'status': 'running',
+            'total': total,
+            'processed': 0,
+            'saved': 0,
+            'errors': 0,
+            'last_name': None,
+            'started_at': get_kst_now().isoformat()
+        }
+        self._write()
+
+    def on_result(self, result):
+        self.progress['processed'] += 1
+        self.progress['saved'] += 1 if result.get('saved') else 0
+        self.progress['errors'] += 1 if result.get('error') else 0
+        self.progress['last_name'] = result.get('name')
+        self._write()
+
+    def on_commit(self, results):
+        failed = sum(1 for result in results if not result.get('saved'))
+        if failed:
+            self.progress['saved'] -= failed
+            self._write()
+
+    def on_complete(self, summary):
+        self.progress['status'] = 'completed'
+        self.progress['saved'] = summary.get('saved', self.progress['saved'])
+        self._write()
+
+    def _write(self):
+        state = dict(self.progress, updated_at=get_kst_now().isoformat())
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Discovery progress write failed: {e}")
+
+
+def read_discovery_progress(path: str) -> Optional[Dict[str, Any]]:
+    """저장된 진행 상황 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class HighScoreNotifier(DiscoveryConsumer):
+    """고득점 아이디어 개별 알림 (저장 확정 즉시)
+
+    배치 쓰기 모드의 결과는 커밋이 확정된 뒤(on_commit)에 알린다.
+    """
+
+    def __init__(self, notify: Callable[[Dict[str, Any]], Any], threshold: float):
+        self.notify = notify
+        self.threshold = threshold
+        self.sent = 0
+
+    def _maybe_notify(self, result):
+        if result.get('saved') and result.get('score', 0) >= self.threshold:
+            try:
+                self.notify(result)
+                self.sent += 1
+            except Exception as e:
+                logger.warning(f"Notification failed: {e}")
+
+    def on_result(self, result):
+        if not result.get('pending_commit'):
+            self._maybe_notify(result)
+
+    def on_commit(self, results):
+        for result in results:
+            self._maybe_notify(result)
+
+
+class RollingSnapshotConsumer(DiscoveryConsumer):
+    """배치 진행 중 누적 통계 (점수 합계/분포/상위 N개만 유지)
+
+    every개 결과마다 business_analysis_snapshots에 'rolling' 스냅샷 1행을 갱신한다.
+    session_factory가 없으면 메모리 통계만 유지한다.
+    """
+
+    SCORE_BUCKETS = (('0-60', 60), ('60-70', 70), ('70-80', 80), ('80-90', 90), ('90-100', None))
+
+    def __init__(self, session_factory=None, every: int = 10, top_n: int = 10):
+        self.session_factory = session_factory
+        self.every = max(1, every)
+        self.top_n = top_n
+        self.snapshot_id = None
+        self._reset()
+
+    def _reset(self):
+        self.analyzed = 0
+        self.saved = 0
+        self._sums = {'score': 0.0, 'market_score': 0.0, 'revenue_score': 0.0}
+        self._counts = {'score': 0, 'market_score': 0, 'revenue_score': 0}
+        self.score_distribution = {label: 0 for label, _ in self.SCORE_BUCKETS}
+        self._top: List[tuple] = []  # (score, seq, name) 최소 힙
+        self._seq = 0
+
+    def on_start(self, batch_id, total):
+        self._reset()
+        self.snapshot_id = None
+
+    def on_result(self, result):
+        self.analyzed += 1
+        self.saved += 1 if result.get('saved') else 0
+        for key in self._sums:
+            if result.get(key):
+                self._sums[key] += result[key]
+                self._counts[key] += 1
+
+        if 'score' in result:
+            score = result['score'] or 0
+            for label, upper in self.SCORE_BUCKETS:
+                if upper is None or score < upper:
+                    self.score_distribution[label] += 1
+                    break
+            self._seq += 1
+            entry = (score, self._seq, result.get('name'))
+            if len(self._top) < self.top_n:
+                heapq.heappush(self._top, entry)
+            elif entry > self._top[0]:
+                heapq.heapreplace(self._top, entry)
+
+        if self.analyzed % self.every == 0:
+            self._persist()
+
+    def on_commit(self, results):
+        self.saved -= sum(1 for result in results if not result.get('saved'))
+
+    def on_complete(self, summary):
+        self._persist()
+
+    def _average(self, key):
+        return self._sums[key] / self._counts[key] if self._counts[key] else 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지의 누적 통계"""
+        return {
+            'total_analyzed': self.analyzed,
+            'total_saved': self.saved,
+            'avg_total_score': round(self._average('score'), 2),
+            'avg_market_score': round(self._average('market_score'), 2),
+            'avg_revenue_score': round(self._average('revenue_score'), 2),
+            'score_distribution': dict(self.score_distribution),
+            'top_businesses': [
+                {'name': name, 'score': score}
+                for score, _, name in sorted(self._top, reverse=True)
+            ]
+        }
+
+    def _persist(self):
+        if self.session_factory is None or not self.analyzed:
+            return
+        from business_discovery_history import BusinessAnalysisSnapshot
+
+        data = self.snapshot()
+        session = self.session_factory()
+        try:
+            row = session.get(BusinessAnalysisSnapshot, self.snapshot_id) if self.snapshot_id else None
+            if row is None:
+                row = BusinessAnalysisSnapshot(snapshot_type='rolling')
+                session.add(row)
+            row.snapshot_time = get_kst_now()
+            for key, value in data.items():
+                setattr(row, key, value)
+            session.commit()
+            self.snapshot_id = row.id
+        except Exception as e:
+            logger.warning(f"Rolling snapshot save failed: {e}")
+            session.rollback()
+        finally:
+            session.close()
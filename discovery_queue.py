@@ -0,0 +1,441 @@
+"""
+사업 발굴 작업 큐 (DB 기반)
+- 배치(discovery_batch) 요청 1행 + 아이디어별 작업 1행
+- 작업 점유는 SELECT ... FOR UPDATE SKIP LOCKED (여러 워커 프로세스가 같은 큐를 나눠 처리)
+- 점유 기한(lease)이 지난 작업은 다시 점유 가능 (중단된 배치 재개)
+- 같은 배치 ID 요청/아이디어 등록은 중복 무시 (재실행해도 같은 작업을 두 번 만들지 않음)
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import weakref
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Text, Index, and_, func, insert, or_, select, update
+
+from database_setup import Base, Session, SCHEMA_NAME, get_kst_now
+from config import DiscoveryConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class DiscoveryBatchRun(Base):
+    """발굴 배치 요청 (배치 ID당 1행)"""
+    __tablename__ = 'discovery_batch_runs'
+    __table_args__ = (
+        Index('idx_discovery_batch_status', 'status', 'claimed_at'),
+        {'schema': SCHEMA_NAME, 'extend_existing': True}
+    )
+
+    discovery_batch = Column(String(50), primary_key=True)
+    status = Column(String(20), nullable=False, default='requested')  # requested, expanding, queued, completed
+    requested_at = Column(DateTime, default=get_kst_now, nullable=False)
+    claimed_at = Column(DateTime)
+    worker_id = Column(String(100))
+    total_jobs = Column(Integer, default=0)
+    completed_at = Column(DateTime)
+
+
+class DiscoveryJob(Base):
+    """아이디어별 분석 작업"""
+    __tablename__ = 'discovery_jobs'
+    __table_args__ = (
+        Index('idx_discovery_job_batch_name', 'discovery_batch', 'business_name', unique=True),
+        Index('idx_discovery_job_claim', 'status', 'claimed_at', 'id'),
+        {'schema': SCHEMA_NAME, 'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True)
+    discovery_batch = Column(String(50), nullable=False)
+    business_name = Column(String(300), nullable=False)
+    opportunity = Column(JSON)  # 생성된 아이디어 (analyze_and_save 입력)
+    status = Column(String(20), nullable=False, default='pending')  # pending, running, done, failed, skipped
+    attempts = Column(Integer, default=0, nullable=False)
+    worker_id = Column(String(100))
+    claimed_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    result = Column(JSON)
+    error = Column(Text)
+    created_at = Column(DateTime, default=get_kst_now, nullable=False)
+
+
+def default_worker_id():
+    """호스트:PID:스레드 식별자"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"[:100]
+
+
+_tables_ready = weakref.WeakSet()
+_tables_lock = threading.Lock()
+
+
+def ensure_queue_tables(bind):
+    """작업 큐 테이블 생성 (엔진당 1회)"""
+    engine = getattr(bind, 'engine', bind)
+    if engine in _tables_ready:
+        return
+    with _tables_lock:
+        if engine not in _tables_ready:
+            for model in (DiscoveryBatchRun, DiscoveryJob):
+                model.__table__.create(engine, checkfirst=True)
+            _tables_ready.add(engine)
+
+
+def _dialect_insert(session):
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        return dialect_insert
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        return dialect_insert
+    return None
+
+
+class DiscoveryJobQueue:
+    """발굴 배치/작업 큐
+
+    배치 흐름: request_batch() -> claim_batch() (아이디어 생성 워커 1개) -> add_jobs()
+    작업 흐름: claim()/claim_many() -> complete() / fail() -> 마지막 작업을 끝낸 워커가 finish_batch() 성공
+    """
+
+    def __init__(self, session_factory=None, worker_id: Optional[str] = None,
+                 lease_minutes: Optional[float] = None, max_attempts: Optional[int] = None):
+        self.session_factory = session_factory or Session
+        self.worker_id = worker_id or default_worker_id()
+        minutes = DiscoveryConfig.get_queue_lease_minutes() if lease_minutes is None else lease_minutes
+        self.lease = timedelta(minutes=minutes)
+        self.max_attempts = DiscoveryConfig.get_queue_max_attempts() if max_attempts is None else max_attempts
+
+    # ------------------------------------------------------------------
+    # 배치
+    # ------------------------------------------------------------------
+    def request_batch(self, discovery_batch: str) -> bool:
+        """배치 요청 등록 (이미 있으면 무시) - 새로 등록했으면 True"""
+        session = self.session_factory()
+        try:
+            ensure_queue_tables(session.get_bind())
+            values = {'discovery_batch': discovery_batch, 'status': 'requested', 'requested_at': get_kst_now()}
+            dialect_insert = _dialect_insert(session)
+            if dialect_insert is not None:
+                created = session.execute(
+                    dialect_insert(DiscoveryBatchRun).values(**values)
+                    .on_conflict_do_nothing(index_elements=['discovery_batch'])
+                ).rowcount == 1
+            else:
+                created = session.get(DiscoveryBatchRun, discovery_batch) is None
+                if created:
+                    session.execute(insert(DiscoveryBatchRun).values(**values))
+            session.commit()
+            return created
+        finally:
+            session.close()
+
+    def claim_batch(self) -> Optional[str]:
+        """아이디어 생성이 필요한 배치 1개 점유 (요청됨 또는 생성 중 기한 만료)"""
+        now = get_kst_now()
+        session = self.session_factory()
+        try:
+            row = session.execute(
+                select(DiscoveryBatchRun.discovery_batch).where(or_(
+                    DiscoveryBatchRun.status == 'requested',
+                    and_(DiscoveryBatchRun.status == 'expanding', DiscoveryBatchRun.claimed_at < now - self.lease)
+                )).order_by(DiscoveryBatchRun.requested_at).limit(1).with_for_update(skip_locked=True)
+            ).first()
+            if row is None:
+                session.rollback()
+                return None
+            session.execute(
+                update(DiscoveryBatchRun).where(DiscoveryBatchRun.discovery_batch == row[0])
+                .values(status='expanding', claimed_at=now, worker_id=self.worker_id)
+            )
+            session.commit()
+            return row[0]
+        finally:
+            session.close()
+
+    def add_jobs(self, discovery_batch: str, opportunities: List[Dict[str, Any]]) -> int:
+        """점유한 배치에 아이디어 작업 등록 후 대기 상태로 전환 (같은 이름은 무시)"""
+        now = get_kst_now()
+        rows = {}
+        for opportunity in opportunities:
+            name = (opportunity.get('business', {}).get('name') or '')[:300]
+            if name:
+                rows[name] = {
+                    'discovery_batch': discovery_batch,
+                    'business_name': name,
+                    'opportunity': json.loads(json.dumps(opportunity, ensure_ascii=False, default=str)),
+                    'status': 'pending',
+                    'attempts': 0,
+                    'created_at': now
+                }
+
+        session = self.session_factory()
+        try:
+            if rows:
+                dialect_insert = _dialect_insert(session)
+                if dialect_insert is not None:
+                    session.execute(
+                        dialect_insert(DiscoveryJob).values(list(rows.values()))
+                        .on_conflict_do_nothing(index_elements=['discovery_batch', 'business_name'])
+                    )
+                else:
+                    existing = set(session.execute(
+                        select(DiscoveryJob.business_name).where(DiscoveryJob.discovery_batch == discovery_batch)
+                    ).scalars())
+                    new_rows = [row for name, row in rows.items() if name not in existing]
+                    if new_rows:
+                        session.execute(insert(DiscoveryJob), new_rows)
+
+            total = session.execute(
+                select(func.count(DiscoveryJob.id)).where(DiscoveryJob.discovery_batch == discovery_batch)
+            ).scalar()
+            session.execute(
+                update(DiscoveryBatchRun).where(DiscoveryBatchRun.discovery_batch == discovery_batch)
+                .values(status='queued', total_jobs=total)
+            )
+            session.commit()
+            return total
+        finally:
+            session.close()
+
+    def finish_batch(self, discovery_batch: str) -> bool:
+        """남은 작업이 없으면 배치 완료 처리 - 완료 처리한 워커만 True (후처리 1회 보장)"""
+        session = self.session_factory()
+        try:
+            remaining = session.execute(
+                select(func.count(DiscoveryJob.id)).where(
+                    DiscoveryJob.discovery_batch == discovery_batch,
+                    DiscoveryJob.status.in_(('pending', 'running'))
+                )
+            ).scalar()
+            if remaining:
+                session.rollback()
+                return False
+            finished = session.execute(
+                update(DiscoveryBatchRun).where(
+                    DiscoveryBatchRun.discovery_batch == discovery_batch,
+                    DiscoveryBatchRun.status == 'queued'
+                ).values(status='completed', completed_at=get_kst_now())
+            ).rowcount == 1
+            session.commit()
+            return finished
+        finally:
+            session.close()
+
+    def batch_status(self, discovery_batch: str) -> Optional[Dict[str, Any]]:
+        """배치 상태와 작업 상태별 개수 (없으면 None)"""
+        session = self.session_factory()
+        try:
+            batch = session.get(DiscoveryBatchRun, discovery_batch)
+            if batch is None:
+                return None
+            counts = dict(session.execute(
+                select(DiscoveryJob.status, func.count(DiscoveryJob.id))
+                .where(DiscoveryJob.discovery_batch == discovery_batch)
+                .group_by(DiscoveryJob.status)
+            ).all())
+            return {
+                'batch_id': discovery_batch,
+                'status': batch.status,
+                'total': batch.total_jobs or 0,
+                'jobs': {status: counts.get(status, 0) for status in ('pending', 'running', 'done', 'failed', 'skipped')},
+                'requested_at': batch.requested_at.isoformat() if batch.requested_at else None,
+                'completed_at': batch.completed_at.isoformat() if batch.completed_at else None
+            }
+        finally:
+            session.close()
+
+    def batch_results(self, discovery_batch: str) -> List[Dict[str, Any]]:
+        """배치 작업 결과 (등록 순서, 건너뛴 작업 제외)"""
+        session = self.session_factory()
+        try:
+            rows = session.execute(
+                select(DiscoveryJob.business_name, DiscoveryJob.status, DiscoveryJob.result, DiscoveryJob.error)
+                .where(DiscoveryJob.discovery_batch == discovery_batch, DiscoveryJob.status != 'skipped')
+                .order_by(DiscoveryJob.id)
+            ).all()
+            return [
+                result if result else {'saved': False, 'name': name, 'error': error or status}
+                for name, status, result, error in rows
+            ]
+        finally:
+            session.close()
+
+    def has_work(self) -> bool:
+        """이 워커가 지금 맡을 일이 있는지 (다른 워커가 점유 중인 작업만 남았으면 False)
+
+        아이디어 생성이 필요한 배치 요청, 점유 가능한 작업, 남은 작업 없이 완료 처리만 기다리는 배치
+        """
+        now = get_kst_now()
+        session = self.session_factory()
+        try:
+            ensure_queue_tables(session.get_bind())
+            batch = session.execute(
+                select(DiscoveryBatchRun.discovery_batch).where(or_(
+                    DiscoveryBatchRun.status == 'requested',
+                    and_(DiscoveryBatchRun.status == 'expanding', DiscoveryBatchRun.claimed_at < now - self.lease)
+                )).limit(1)
+            ).first()
+            if batch is not None:
+                return True
+            job = session.execute(
+                select(DiscoveryJob.id).where(self._claimable(now), DiscoveryJob.attempts < self.max_attempts).limit(1)
+            ).first()
+            if job is not None:
+                return True
+            # 기한 내 실행 중이거나 재시도 가능한 작업이 하나도 없는 배치 (후처리 워커가 중단된 경우)
+            live_job = select(DiscoveryJob.id).where(
+                DiscoveryJob.discovery_batch == DiscoveryBatchRun.discovery_batch,
+                or_(
+                    DiscoveryJob.status == 'pending',
+                    and_(DiscoveryJob.status == 'running', or_(
+                        DiscoveryJob.claimed_at >= now - self.lease, DiscoveryJob.attempts < self.max_attempts
+                    ))
+                )
+            ).exists()
+            ready = session.execute(
+                select(DiscoveryBatchRun.discovery_batch).where(DiscoveryBatchRun.status == 'queued', ~live_job).limit(1)
+            ).first()
+            return ready is not None
+        finally:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # 작업
+    # ------------------------------------------------------------------
+    def _claimable(self, now):
+        return or_(
+            DiscoveryJob.status == 'pending',
+            and_(DiscoveryJob.status == 'running', DiscoveryJob.claimed_at < now - self.lease)
+        )
+
+    def claim(self, discovery_batch: Optional[str] = None) -> Optional[Tuple[int, str, Dict[str, Any]]]:
+        """대기 작업(또는 기한 만료된 실행 중 작업) 1개 점유 - (job_id, discovery_batch, opportunity)"""
+        jobs = self.claim_many(1, discovery_batch)
+        return jobs[0] if jobs else None
+
+    def claim_many(self, limit: int, discovery_batch: Optional[str] = None) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """대기 작업을 최대 limit개 점유 (병렬 분석 워커 수만큼 한 번에) - 등록 순서"""
+        now = get_kst_now()
+        claimable = self._claimable(now)
+        query = select(DiscoveryJob.id, DiscoveryJob.discovery_batch, DiscoveryJob.opportunity).where(
+            claimable, DiscoveryJob.attempts < self.max_attempts
+        )
+        if discovery_batch is not None:
+            query = query.where(DiscoveryJob.discovery_batch == discovery_batch)
+
+        session = self.session_factory()
+        try:
+            rows = session.execute(
+                query.order_by(DiscoveryJob.id).limit(max(1, limit)).with_for_update(skip_locked=True)
+            ).all()
+            claimed = []
+            for job_id, batch, opportunity in rows:
+                if session.execute(
+                    update(DiscoveryJob).where(DiscoveryJob.id == job_id, claimable).values(
+                        status='running', claimed_at=now, worker_id=self.worker_id,
+                        attempts=DiscoveryJob.attempts + 1
+                    )
+                ).rowcount == 1:
+                    claimed.append((job_id, batch, opportunity))
+            session.commit()
+            return claimed
+        finally:
+            session.close()
+
+    def complete(self, job_id: int, result: Dict[str, Any], session=None):
+        """작업 완료 기록 (분석 결과 체크포인트)
+
+        session을 주면 그 트랜잭션 안에서만 기록하고 커밋은 호출자가 수행한다
+        (분석 결과와 완료 표시를 함께 커밋해 재점유로 인한 중복 기록 방지).
+        """
+        self._finish(job_id, status='done', result=json.loads(json.dumps(result, ensure_ascii=False, default=str)),
+                     session=session)
+
+    def fail(self, job_id: int, error: str):
+        """작업 실패 기록 - 재시도 횟수가 남았으면 다시 대기 상태"""
+        session = self.session_factory()
+        try:
+            attempts = session.execute(select(DiscoveryJob.attempts).where(DiscoveryJob.id == job_id)).scalar() or 0
+        finally:
+            session.close()
+        status = 'failed' if attempts >= self.max_attempts else 'pending'
+        self._finish(job_id, status=status, error=str(error)[:2000])
+
+    def _finish(self, job_id, status, result=None, error=None, session=None):
+        statement = update(DiscoveryJob).where(
+            DiscoveryJob.id == job_id, DiscoveryJob.worker_id == self.worker_id
+        ).values(
+            status=status, result=result, error=error,
+            finished_at=get_kst_now() if status in ('done', 'failed') else None
+        )
+        if session is not None:
+            session.execute(statement)
+            return
+        session = self.session_factory()
+        try:
+            session.execute(statement)
+            session.commit()
+        finally:
+            session.close()
+
+    def expire_stale_failures(self, discovery_batch: str) -> int:
+        """기한 만료 + 재시도 소진 작업을 실패로 확정 (배치가 완료될 수 있도록)"""
+        now = get_kst_now()
+        session = self.session_factory()
+        try:
+            count = session.execute(
+                update(DiscoveryJob).where(
+                    DiscoveryJob.discovery_batch == discovery_batch,
+                    DiscoveryJob.status == 'running',
+                    DiscoveryJob.claimed_at < now - self.lease,
+                    DiscoveryJob.attempts >= self.max_attempts
+                ).values(status='failed', error='lease expired', finished_at=now)
+            ).rowcount
+            session.commit()
+            return count
+        finally:
+            session.close()
+
+    def skip_pending(self, discovery_batch: str, reason: str) -> int:
+        """배치의 대기 작업을 건너뜀 처리 (시간 예산 마감 등)"""
+        session = self.session_factory()
+        try:
+            count = session.execute(
+                update(DiscoveryJob).where(
+                    DiscoveryJob.discovery_batch == discovery_batch,
+                    DiscoveryJob.status == 'pending'
+                ).values(status='skipped', error=reason, finished_at=get_kst_now())
+            ).rowcount
+            session.commit()
+            return count
+        finally:
+            session.close()
+
+    def requested_at(self, discovery_batch: str):
+        """배치 요청 시각 (없으면 None)"""
+        session = self.session_factory()
+        try:
+            return session.execute(
+                select(DiscoveryBatchRun.requested_at).where(DiscoveryBatchRun.discovery_batch == discovery_batch)
+            ).scalar()
+        finally:
+            session.close()
+
+    def unfinished_batches(self) -> List[str]:
+        """작업 등록이 끝났지만 아직 완료되지 않은 배치"""
+        session = self.session_factory()
+        try:
+            return list(session.execute(
+                select(DiscoveryBatchRun.discovery_batch)
+                .where(DiscoveryBatchRun.status == 'queued')
+                .order_by(DiscoveryBatchRun.requested_at)
+            ).scalars())
+        finally:
+            session.close()
+
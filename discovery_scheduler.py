@@ -0,0 +1,116 @@
+"""
+시간 예산 기반 발굴 스케줄러
+- 최근 analysis_duration_ms 히스토리로 분석 깊이별 아이디어당 소요 시간 추정
+- 배치 시간 예산 안에 들어가는 아이디어 수와 분석 깊이(full/lightweight) 결정
+- 마감 시각 이후에는 새 아이디어 분석을 시작하지 않음 (완료분은 그대로 저장)
+"""
+
+import math
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import select
+
+
+class Deadline:
+    """단조 시계 기반 마감 시각"""
+
+    def __init__(self, budget_seconds: float, clock=time.monotonic):
+        self.clock = clock
+        self.expires_at = clock() + budget_seconds
+
+    def remaining_ms(self) -> float:
+        return max(0.0, (self.expires_at - self.clock()) * 1000)
+
+    def allows(self, cost_ms: float = 0) -> bool:
+        """지금 시작해도 cost_ms 안에 마감 전에 끝나는지"""
+        return self.remaining_ms() > cost_ms
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining_ms() <= 0
+
+
+class TimeBudgetScheduler:
+    """배치 시간 예산 -> (분석 깊이, 아이디어 수) 계획
+
+    전체 분석으로 최소 min_full_ideas개 이상 들어가면 full, 아니면 lightweight.
+    추정치는 깊이별 최근 소요 시간의 75 백분위수 (표본이 적으면 기본값).
+    """
+
+    SAFETY_FACTOR = 0.9          # 예산의 90%만 계획 (마감 여유)
+    HISTORY_WINDOW = 200         # 깊이별 최근 표본 수
+    MIN_SAMPLES = 5
+    COST_PERCENTILE = 75
+    DEFAULT_COSTS_MS = {'full': 60000, 'lightweight': 500}
+
+    def __init__(self, budget_seconds: float, max_ideas: int, min_full_ideas: int = 1,
+                 workers: int = 1, overhead_ms: float = 0, allow_full: bool = True):
+        self.budget_seconds = budget_seconds
+        self.max_ideas = max(1, max_ideas)
+        self.min_full_ideas = max(1, min_full_ideas)
+        self.workers = max(1, workers)
+        self.overhead_ms = overhead_ms
+        self.allow_full = allow_full
+
+    @staticmethod
+    def _depth_of(mode: Optional[str]) -> Optional[str]:
+        if not mode:
+            return None
+        return 'lightweight' if mode.startswith('lightweight') else 'full'
+
+    def estimate_costs(self, session) -> Dict[str, float]:
+        """깊이별 아이디어당 예상 소요 시간 (ms)"""
+        from business_discovery_history import BusinessDiscoveryHistory
+
+        samples = {'full': [], 'lightweight': []}
+        try:
+            rows = session.execute(
+                select(
+                    BusinessDiscoveryHistory.analysis_duration_ms,
+                    BusinessDiscoveryHistory.market_analysis['mode'].as_string()
+                ).where(
+                    BusinessDiscoveryHistory.analysis_duration_ms.isnot(None)
+                ).order_by(BusinessDiscoveryHistory.id.desc()).limit(self.HISTORY_WINDOW * 2)
+            ).all()
+        except Exception as e:
+            print(f"   [WARN] 분석 소요 시간 조회 실패, 기본값 사용: {e}")
+            rows = []
+
+        for duration_ms, mode in rows:
+            depth = self._depth_of(mode)
+            if depth and duration_ms > 0 and len(samples[depth]) < self.HISTORY_WINDOW:
+                samples[depth].append(duration_ms)
+
+        return {
+            depth: self._percentile(values) if len(values) >= self.MIN_SAMPLES else self.DEFAULT_COSTS_MS[depth]
+            for depth, values in samples.items()
+        }
+
+    def _percentile(self, values) -> float:
+        ordered = sorted(values)
+        position = (len(ordered) - 1) * self.COST_PERCENTILE / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    def capacity(self, cost_ms: float) -> int:
+        """예산 안에 분석 가능한 아이디어 수 (워커 병렬도 반영)"""
+        budget_ms = self.budget_seconds * 1000 * self.SAFETY_FACTOR
+        per_idea = max(1.0, cost_ms + self.overhead_ms)
+        return int(budget_ms // per_idea) * self.workers
+
+    def plan(self, costs: Dict[str, float]) -> Dict[str, object]:
+        """분석 깊이와 아이디어 수 결정"""
+        full_capacity = self.capacity(costs['full'])
+        if self.allow_full and full_capacity >= self.min_full_ideas:
+            depth, capacity = 'full', full_capacity
+        else:
+            depth, capacity = 'lightweight', self.capacity(costs['lightweight'])
+
+        return {
+            'depth': depth,
+            'ideas': min(self.max_ideas, capacity),
+            'cost_ms': round(costs[depth]),
+            'budget_seconds': self.budget_seconds
+        }
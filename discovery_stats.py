@@ -0,0 +1,152 @@
+"""
+대시보드 통계 모듈
+- 발굴 목록/히스토리/저점수 API 카운터를 집계 쿼리 1회로 계산 (FILTER (WHERE ...))
+- 프로세스 내부 캐시, 발굴 배치 커밋 시 무효화
+- 다른 프로세스의 쓰기는 짧은 TTL로 반영
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Tuple
+
+from sqlalchemy import select, func, case, distinct
+
+from config import DashboardStatsConfig
+from database_setup import get_kst_now
+from business_discovery_history import BusinessDiscoveryHistory, BusinessLatest, LowScoreBusiness
+
+
+# 집계 함수 FILTER 절을 지원하는 DB (그 외는 CASE 식으로 대체)
+_FILTER_DIALECTS = {'postgresql', 'sqlite'}
+
+
+def _where(aggregate, column, condition, use_filter):
+    """aggregate(column) FILTER (WHERE condition)"""
+    if use_filter:
+        return aggregate(column).filter(condition)
+    return aggregate(case((condition, column)))
+
+
+def compute_dashboard_stats(session, days: int = 7) -> Dict[str, Any]:
+    """대시보드 카운터 전체를 단일 SELECT로 계산
+
+    - total/today/this_week/high_score: 전체 히스토리 기준
+    - distinct: 사업명 수 (business_latest 행 수)
+    - window_*: 최근 days일 히스토리 기준 (히스토리 통계 API)
+    - low_score_*: 저점수 사업 테이블 기준
+    """
+    now = get_kst_now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_ago = today - timedelta(days=7)
+    window_start = now - timedelta(days=days)
+    low_score_today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    h = BusinessDiscoveryHistory
+    use_filter = session.get_bind().dialect.name in _FILTER_DIALECTS
+    in_window = h.discovered_at >= window_start
+
+    query = select(
+        func.count(h.id).label('total'),
+        _where(func.count, h.id, h.discovered_at >= today, use_filter).label('today'),
+        _where(func.count, h.id, h.discovered_at >= week_ago, use_filter).label('this_week'),
+        _where(func.count, h.id, h.total_score >= DashboardStatsConfig.HIGH_SCORE, use_filter).label('high_score'),
+        _where(func.count, h.id, in_window, use_filter).label('window_analyzed'),
+        _where(func.count, h.id, in_window & h.saved_to_db.is_(True), use_filter).label('window_saved'),
+        _where(func.avg, h.total_score, in_window, use_filter).label('window_avg_score'),
+        _where(lambda column: func.count(distinct(column)), h.category, in_window, use_filter).label('window_categories'),
+        select(func.count()).select_from(BusinessLatest).scalar_subquery().label('distinct_names'),
+        select(func.count()).select_from(LowScoreBusiness).scalar_subquery().label('low_score_total'),
+        select(func.count()).select_from(LowScoreBusiness).where(
+            LowScoreBusiness.created_at >= low_score_today
+        ).scalar_subquery().label('low_score_today'),
+    ).select_from(h)
+
+    row = session.execute(query).one()
+    return {
+        'total': row.total or 0,
+        'today': row.today or 0,
+        'this_week': row.this_week or 0,
+        'high_score': row.high_score or 0,
+        'distinct': row.distinct_names or 0,
+        'window_days': days,
+        'window_start': window_start,
+        'window_analyzed': row.window_analyzed or 0,
+        'window_saved': row.window_saved or 0,
+        'window_avg_score': round(row.window_avg_score, 2) if row.window_avg_score else 0,
+        'window_categories': row.window_categories or 0,
+        'low_score_total': row.low_score_total or 0,
+        'low_score_today': row.low_score_today or 0,
+    }
+
+
+class DiscoveryStatsService:
+    """대시보드 카운터 캐시 (days 파라미터별 항목, 스레드 안전)"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, clock=time.monotonic):
+        self.ttl_seconds = DashboardStatsConfig.get_ttl_seconds() if ttl_seconds is None else ttl_seconds
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, session, days: int = 7) -> Dict[str, Any]:
+        """캐시된 카운터 (만료/무효화 시 재계산)"""
+        with self._lock:
+            entry = self._cache.get(days)
+            if entry is not None and entry[0] > self.clock():
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+            generation = self._generation
+
+        stats = compute_dashboard_stats(session, days)
+
+        if self.ttl_seconds > 0:
+            with self._lock:
+                # 계산 도중 무효화됐다면 이전 상태일 수 있으므로 저장하지 않음
+                if generation == self._generation:
+                    if len(self._cache) >= DashboardStatsConfig.MAX_CACHED_WINDOWS:
+                        self._cache.clear()
+                    self._cache[days] = (self.clock() + self.ttl_seconds, stats)
+        return dict(stats)
+
+    def invalidate(self):
+        """캐시 전체 무효화 (발굴 배치 커밋 후 호출)"""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {
+            'ttl_seconds': self.ttl_seconds,
+            'entries': len(self._cache),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_discovery_stats: Optional[DiscoveryStatsService] = None
+_discovery_stats_lock = threading.Lock()
+
+
+def get_discovery_stats() -> DiscoveryStatsService:
+    """대시보드 통계 서비스 싱글톤"""
+    global _discovery_stats
+    if _discovery_stats is None:
+        with _discovery_stats_lock:
+            if _discovery_stats is None:
+                _discovery_stats = DiscoveryStatsService()
+    return _discovery_stats
+
+
+def invalidate_discovery_stats():
+    """발굴 결과 커밋 후 캐시 무효화 (싱글톤이 아직 없으면 아무것도 하지 않음)"""
+    if _discovery_stats is not None:
+        _discovery_stats.invalidate()
@@ -0,0 +1,67 @@
+"""
+사업 발굴 큐 워커
+여러 프로세스로 실행하면 같은 작업 큐를 나눠 처리 (SKIP LOCKED 점유)
+
+사용법:
+    python discovery_worker.py            # 큐를 계속 폴링하며 처리
+    python discovery_worker.py --request  # 현재 시간 배치를 요청한 뒤 폴링
+    python discovery_worker.py --once     # 남은 작업만 처리하고 종료
+"""
+import sys
+import time
+import argparse
+
+from dotenv import load_dotenv
+load_dotenv()
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+from config import DiscoveryConfig
+from discovery_queue import DiscoveryJobQueue
+
+
+def work_once(queue, jobs):
+    """점유한 작업으로 발굴 시스템을 만들어 큐 처리"""
+    from continuous_business_discovery import ContinuousBusinessDiscovery
+
+    discovery = ContinuousBusinessDiscovery(job_queue=queue)
+    try:
+        finished = discovery.work_queue(claimed=jobs)
+        for summary in finished:
+            print(f"[WORKER] 배치 완료: {summary['batch_id']} (분석 {summary['analyzed']}, 저장 {summary['saved']})")
+        return finished
+    finally:
+        discovery.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='사업 발굴 큐 워커')
+    parser.add_argument('--request', action='store_true', help='현재 시간 배치 요청 후 처리')
+    parser.add_argument('--once', action='store_true', help='남은 작업만 처리하고 종료')
+    args = parser.parse_args(argv)
+
+    queue = DiscoveryJobQueue()
+    if args.request:
+        from database_setup import get_kst_now
+        batch = get_kst_now().strftime('%Y-%m-%d-%H')
+        created = queue.request_batch(batch)
+        print(f"[WORKER] 배치 요청 {batch}: {'등록' if created else '이미 등록됨'}")
+
+    poll_seconds = DiscoveryConfig.get_queue_poll_seconds()
+    while True:
+        try:
+            # 작업을 실제로 점유했거나 배치 요청/후처리가 남았을 때만 발굴 시스템 생성
+            jobs = queue.claim_many(DiscoveryConfig.get_queue_claim_size())
+            if jobs or queue.has_work():
+                work_once(queue, jobs)
+        except Exception as e:
+            print(f"[WORKER ERROR] {e}")
+        if args.once:
+            return 0
+        time.sleep(poll_seconds)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+공유 HTTP 클라이언트 모듈
+- 호스트별 keep-alive 연결 풀 (requests.Session + HTTPAdapter)
+- 설정 기반 풀 크기 및 재시도
+- 연결 재사용 통계
+"""
+
+import logging
+import threading
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import HttpConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    """스크래퍼/알림 공용 HTTP 클라이언트"""
+
+    def __init__(self, pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 max_retries: Optional[int] = None):
+        self.pool_connections = pool_connections or HttpConfig.get_pool_connections()
+        self.pool_maxsize = pool_maxsize or HttpConfig.get_pool_maxsize()
+        self.max_retries = HttpConfig.get_max_retries() if max_retries is None else max_retries
+
+        # 재시도는 429/5xx 응답과 연결 실패에만 - 읽기 타임아웃까지 재시도하면 timeout이 배로 늘어남
+        retry = Retry(
+            total=self.max_retries,
+            connect=min(self.max_retries, HttpConfig.CONNECT_RETRIES),
+            read=0,
+            backoff_factor=HttpConfig.RETRY_BACKOFF_FACTOR,
+            status_forcelist=HttpConfig.RETRY_STATUS_CODES,
+            raise_on_status=False
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+        self._lock = threading.Lock()
+        self.total_requests = 0
+        self.failed_requests = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """공유 세션으로 요청 (연결 풀 재사용)"""
+        with self._lock:
+            self.total_requests += 1
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self.failed_requests += 1
+            raise
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """연결 재사용 통계 (현재 유지 중인 호스트 풀 기준)"""
+        hosts = {}
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_made = pool.num_requests
+            connections = pool.num_connections
+            hosts[pool.host] = {
+                'requests': requests_made,
+                'connections': connections,
+                'reused': max(requests_made - connections, 0)
+            }
+
+        pool_requests = sum(h['requests'] for h in hosts.values())
+        pool_reused = sum(h['reused'] for h in hosts.values())
+        return {
+            'total_requests': self.total_requests,
+            'failed_requests': self.failed_requests,
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'reuse_rate': round(pool_reused / pool_requests * 100, 1) if pool_requests else 0,
+            'hosts': hosts
+        }
+
+    def close(self):
+        self.session.close()
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """공유 HTTP 클라이언트 싱글톤"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClient()
+    return _http_client
+
+
+# ============================================
+# 편의 함수
+# ============================================
+def http_get(url: str, **kwargs) -> requests.Response:
+    """공유 세션 GET"""
+    return get_http_client().get(url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """공유 세션 POST"""
+    return get_http_client().post(url, **kwargs)
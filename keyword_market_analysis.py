@@ -0,0 +1,186 @@
+"""
+키워드별 시장 분석 결과 저장소
+- 서로 다른 사업 아이디어가 같은 검색 키워드로 수렴하면 시장 분석(크롤링)을 재사용
+- (정규화 키워드, 분석 모드)당 1행 DB 테이블 + 프로세스 내 캐시
+- 재사용 기간(MARKET_KEYWORD_CACHE_HOURS)이 지나면 다시 분석
+"""
+
+import copy
+import json
+import logging
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, insert, select, update
+
+from database_setup import Base, Session, SCHEMA_NAME, get_kst_now
+from config import MarketConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordMarketAnalysis(Base):
+    """키워드별 시장 분석 결과 (정규화 키워드 + 분석 모드당 1행)"""
+    __tablename__ = 'keyword_market_analysis'
+
+    id = Column(Integer, primary_key=True)
+    keyword_key = Column(String(200), nullable=False)  # normalize_keyword 결과
+    mode = Column(String(20), nullable=False)          # 'full' / 'lightweight'
+    keyword = Column(String(200))                      # 최초 분석 시 원본 키워드
+    result = Column(JSON)                              # 키워드 단위 분석 결과
+    analyzed_at = Column(DateTime, default=get_kst_now, nullable=False)
+
+    __table_args__ = (
+        Index('idx_keyword_market_key_mode', 'keyword_key', 'mode', unique=True),
+        {'schema': SCHEMA_NAME, 'extend_existing': True}
+    )
+
+
+def normalize_keyword(keyword):
+    """키워드 정규화 (소문자, 앞뒤/연속 공백 제거)"""
+    return ' '.join((keyword or '').lower().split())[:200]
+
+
+class KeywordAnalysisStore:
+    """키워드별 시장 분석 결과 재사용 (메모리 캐시 + DB)
+
+    get()은 메모리에서 먼저 찾고, 없거나 만료되었으면 DB에서 읽는다.
+    DB 오류 시에는 메모리 캐시만 사용한다 (분석 자체는 실패하지 않음).
+    """
+
+    def __init__(self, max_age_hours: Optional[float] = None, session_factory=None):
+        hours = MarketConfig.get_keyword_cache_hours() if max_age_hours is None else max_age_hours
+        self.max_age = timedelta(hours=hours)
+        self.session_factory = session_factory or Session
+        self._memory: Dict[tuple, tuple] = {}  # (keyword_key, mode) -> (analyzed_at, result)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age > timedelta(0)
+
+    def _is_fresh(self, analyzed_at) -> bool:
+        return analyzed_at is not None and get_kst_now() - analyzed_at < self.max_age
+
+    def get(self, keyword, mode) -> Optional[Dict[str, Any]]:
+        """재사용 기간 내 분석 결과 사본 (없으면 None)"""
+        key = (normalize_keyword(keyword), mode)
+        if not self.enabled or not key[0]:
+            return None
+
+        with self._lock:
+            cached = self._memory.get(key)
+        if cached is None or not self._is_fresh(cached[0]):
+            cached = self._load(key)
+
+        if cached is None or not self._is_fresh(cached[0]):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self._memory[key] = cached
+            self.hits += 1
+        result = copy.deepcopy(cached[1])
+        result['keyword_cached_at'] = cached[0].isoformat()
+        return result
+
+    def put(self, keyword, mode, result: Dict[str, Any]):
+        """분석 결과 저장 (같은 키는 갱신)"""
+        key = (normalize_keyword(keyword), mode)
+        if not self.enabled or not key[0]:
+            return
+        # JSON 컬럼에 그대로 들어가도록 직렬화 가능한 값으로 정리
+        stored = json.loads(json.dumps(result, ensure_ascii=False, default=str))
+        analyzed_at = get_kst_now()
+        with self._lock:
+            self._memory[key] = (analyzed_at, stored)
+        self._save(key, keyword, stored, analyzed_at)
+
+    def invalidate(self, keyword=None, mode=None):
+        """메모리 캐시 비우기 (keyword 지정 시 해당 키만)"""
+        with self._lock:
+            if keyword is None:
+                self._memory.clear()
+                return
+            key_text = normalize_keyword(keyword)
+            for key in [k for k in self._memory if k[0] == key_text and (mode is None or k[1] == mode)]:
+                del self._memory[key]
+
+    def _load(self, key):
+        session = self.session_factory()
+        try:
+            row = session.execute(
+                select(KeywordMarketAnalysis.analyzed_at, KeywordMarketAnalysis.result).where(
+                    KeywordMarketAnalysis.keyword_key == key[0],
+                    KeywordMarketAnalysis.mode == key[1]
+                )
+            ).first()
+            return (row[0], row[1]) if row is not None else None
+        except Exception as e:
+            logger.warning(f"Keyword analysis load failed: {e}")
+            session.rollback()
+            return None
+        finally:
+            session.close()
+
+    def _save(self, key, keyword, result, analyzed_at):
+        values = {
+            'keyword_key': key[0],
+            'mode': key[1],
+            'keyword': (keyword or '')[:200],
+            'result': result,
+            'analyzed_at': analyzed_at
+        }
+        session = self.session_factory()
+        try:
+            dialect = session.get_bind().dialect.name
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            elif dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                dialect_insert = None
+
+            if dialect_insert is not None:
+                statement = dialect_insert(KeywordMarketAnalysis).values(**values)
+                session.execute(statement.on_conflict_do_update(
+                    index_elements=['keyword_key', 'mode'],
+                    set_={'result': statement.excluded.result, 'analyzed_at': statement.excluded.analyzed_at}
+                ))
+            else:
+                updated = session.execute(
+                    update(KeywordMarketAnalysis).where(
+                        KeywordMarketAnalysis.keyword_key == key[0],
+                        KeywordMarketAnalysis.mode == key[1]
+                    ).values(result=result, analyzed_at=analyzed_at)
+                ).rowcount
+                if not updated:
+                    session.execute(insert(KeywordMarketAnalysis).values(**values))
+            session.commit()
+        except Exception as e:
+            logger.warning(f"Keyword analysis save failed: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_keyword_analysis_store: Optional[KeywordAnalysisStore] = None
+_keyword_analysis_store_lock = threading.Lock()
+
+
+def get_keyword_analysis_store() -> KeywordAnalysisStore:
+    """키워드별 시장 분석 저장소 싱글톤 (재사용 기간은 MarketConfig)"""
+    global _keyword_analysis_store
+    if _keyword_analysis_store is None:
+        with _keyword_analysis_store_lock:
+            if _keyword_analysis_store is None:
+                _keyword_analysis_store = KeywordAnalysisStore()
+    return _keyword_analysis_store
@@ -0,0 +1,136 @@
+"""
+다중 키워드 매칭 모듈
+- 키워드 테이블로 Aho-Corasick 오토마톤을 한 번만 구성
+- 텍스트 1회 스캔으로 모든 키워드(겹치는 매칭 포함) 검출
+- 트렌드 점수, 도메인/타겟 유사 매칭, IT 유형 분류에 공용 사용
+"""
+
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class KeywordMatcher:
+    """그룹별 키워드 매칭기
+
+    기존 `keyword.lower() in text.lower()` 반복 검사와 동일한 결과를
+    키워드 수와 무관하게 텍스트 길이에 비례하는 비용으로 계산한다.
+    case_sensitive=True면 대소문자를 구분 (`keyword in text`와 동일).
+    """
+
+    _SEPARATOR = '\x00'
+
+    def __init__(self, groups: Dict[str, Iterable[str]], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        # (그룹, 원본 키워드) 항목 - 정의 순서 유지
+        self.entries: List[Tuple[str, str]] = [
+            (group, keyword) for group, keywords in groups.items() for keyword in keywords
+        ]
+        self.group_order: List[str] = list(groups)
+
+        # 소문자 키워드 -> 항목 인덱스 목록
+        self._keyword_entries: Dict[str, List[int]] = {}
+        for index, (_, keyword) in enumerate(self.entries):
+            self._keyword_entries.setdefault(self._normalize(keyword), []).append(index)
+
+        self._build_automaton(list(self._keyword_entries))
+        self._build_reverse_index(list(self._keyword_entries))
+
+    def _normalize(self, text: Optional[str]) -> str:
+        text = text or ''
+        return text if self.case_sensitive else text.lower()
+
+    def _build_automaton(self, keywords: List[str]):
+        """트라이 + 실패 링크 구성"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for keyword in keywords:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(keyword)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _build_reverse_index(self, keywords: List[str]):
+        """텍스트가 키워드에 포함되는지 (역방향) 검사용 연결 문자열"""
+        self._reverse_keywords = keywords
+        self._joined = self._SEPARATOR.join(keywords)
+        self._offsets = []
+        position = 0
+        for keyword in keywords:
+            self._offsets.append(position)
+            position += len(keyword) + 1
+
+    def matched_keywords(self, text: str) -> Set[str]:
+        """텍스트에 포함된 키워드 집합 (정규화된 키워드) - 1회 스캔"""
+        found = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in self._normalize(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        if '' in self._keyword_entries:
+            found.add('')
+        return found
+
+    def keywords_containing(self, text: str) -> Set[str]:
+        """텍스트를 포함하는 키워드 집합 (정규화된 키워드) - `text in keyword` 검사"""
+        text = self._normalize(text)
+        if self._SEPARATOR in text:
+            return set()
+        found = set()
+        start = self._joined.find(text)
+        while start != -1:
+            index = bisect_right(self._offsets, start) - 1
+            keyword = self._reverse_keywords[index]
+            if start + len(text) <= self._offsets[index] + len(keyword):
+                found.add(keyword)
+            start = self._joined.find(text, start + 1)
+        return found
+
+    def find_all(self, text: str) -> List[Tuple[str, str]]:
+        """매칭된 (그룹, 키워드) 목록 - 테이블 정의 순서"""
+        indices = self._entry_indices(self.matched_keywords(text))
+        return [self.entries[i] for i in indices]
+
+    def groups_in(self, text: str) -> Set[str]:
+        """매칭된 그룹 집합"""
+        return {group for group, _ in self.find_all(text)}
+
+    def first_group(self, text: str) -> Optional[str]:
+        """정의 순서상 첫 매칭 그룹 (if/elif 분류 대체)"""
+        matches = self.find_all(text)
+        return matches[0][0] if matches else None
+
+    def first_related(self, text: str) -> Optional[str]:
+        """`keyword in text or text in keyword`를 만족하는 정의 순서상 첫 키워드 (원본)"""
+        related = self.matched_keywords(text) | self.keywords_containing(text)
+        indices = self._entry_indices(related)
+        return self.entries[indices[0]][1] if indices else None
+
+    def _entry_indices(self, keywords: Set[str]) -> List[int]:
+        return sorted(i for keyword in keywords for i in self._keyword_entries.get(keyword, []))
@@ -9,6 +9,14 @@ import random
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from keyword_matcher import KeywordMatcher
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class LightweightMarketAnalyzer:
     def __init__(self):
@@ -384,6 +392,11 @@ class LightweightMarketAnalyzer:
             "매우 높음": {"score_bonus": -5, "description": "레드오션, 진입 어려움"}
         }
 
+        # 키워드 매칭기 (테이블 기반 1회 구성)
+        self.trend_matcher = KeywordMatcher(self.trending_keywords)
+        self.domain_matcher = KeywordMatcher({'domain': self.domain_market_data}, case_sensitive=True)
+        self.target_matcher = KeywordMatcher({'target': self.target_audience_data}, case_sensitive=True)
+
     def analyze(self, business_data: Dict) -> Dict:
         """
         사업 아이디어 종합 분석
@@ -443,6 +456,26 @@ class LightweightMarketAnalyzer:
             synergy_bonus * 0.8          # 시너지 보너스 (신규)
         )
 
+        return self._build_result(
+            business_data, raw_score, base_score, domain_analysis, target_analysis,
+            trend_score, revenue_analysis, competition, synergy_bonus
+        )
+
+    def _build_result(self, business_data: Dict, raw_score: float, base_score: int,
+                      domain_analysis: Dict, target_analysis: Dict, trend_score: int,
+                      revenue_analysis: Dict, competition: Dict, synergy_bonus: int) -> Dict:
+        """가중 점수로 최종 분석 결과 생성 (analyze/analyze_batch 공용)"""
+        name = business_data.get('name', '')
+        it_type = business_data.get('it_type', 'saas')
+        domain = business_data.get('domain', '')
+        target = business_data.get('target_audience', '')
+        description = business_data.get('description', '')
+
+        domain_score = domain_analysis['score_bonus']
+        target_score = target_analysis['score_bonus']
+        revenue_score = revenue_analysis['total_score']
+        competition_score = competition['score_bonus']
+
         # 점수 정규화 (50-95 범위)
         final_score = max(50, min(95, int(raw_score)))
 
@@ -497,6 +530,142 @@ class LightweightMarketAnalyzer:
             }
         }
 
+    def _resolve_batch_components(self, business_list: List[Dict]) -> Dict:
+        """배치 분석용 구성 요소 계산
+
+        IT 유형/도메인/타겟은 테이블 인덱스로 인코딩해 배열에서 일괄 조회하고,
+        수익 모델/경쟁/시너지는 고유 조합별로 한 번만 계산한다.
+        """
+        it_types = list(self.it_type_scores)
+        domains = list(self.domain_market_data)
+        targets = list(self.target_audience_data)
+        it_type_index = {key: i for i, key in enumerate(it_types)}
+        domain_index = {key: i for i, key in enumerate(domains)}
+        target_index = {key: i for i, key in enumerate(targets)}
+
+        # 마지막 칸은 테이블에 없는 경우의 기본값
+        base_table = np.array([self.it_type_scores[k]['base_score'] for k in it_types] + [70])
+        domain_table = np.array([self.domain_market_data[k]['score_bonus'] for k in domains] + [5])
+        target_table = np.array([self.target_audience_data[k]['score_bonus'] for k in targets] + [5])
+
+        domain_cache, target_cache, revenue_cache = {}, {}, {}
+        competition_cache, synergy_cache = {}, {}
+
+        size = len(business_list)
+        it_idx = np.empty(size, dtype=np.int64)
+        domain_idx = np.empty(size, dtype=np.int64)
+        target_idx = np.empty(size, dtype=np.int64)
+        trend = np.empty(size, dtype=np.int64)
+        revenue = np.empty(size, dtype=np.int64)
+        competition = np.empty(size, dtype=np.int64)
+        synergy = np.empty(size, dtype=np.int64)
+        details = []
+
+        for i, business_data in enumerate(business_list):
+            name = business_data.get('name', '')
+            it_type = business_data.get('it_type', 'saas')
+            domain = business_data.get('domain', '')
+            target = business_data.get('target_audience', '')
+            revenue_models = tuple(business_data.get('revenue_models', []))
+            description = business_data.get('description', '')
+
+            if domain not in domain_cache:
+                domain_cache[domain] = self._analyze_domain(domain)
+            if target not in target_cache:
+                target_cache[target] = self._analyze_target(target)
+            if revenue_models not in revenue_cache:
+                revenue_cache[revenue_models] = self._analyze_revenue_models(list(revenue_models))
+            if (domain, it_type) not in competition_cache:
+                competition_cache[(domain, it_type)] = self._estimate_competition(domain, it_type)
+            if (domain, target, it_type) not in synergy_cache:
+                synergy_cache[(domain, target, it_type)] = self._calculate_synergy_bonus(domain, target, it_type)
+
+            domain_analysis = domain_cache[domain]
+            target_analysis = target_cache[target]
+            it_idx[i] = it_type_index.get(it_type, len(it_types))
+            domain_idx[i] = domain_index.get(domain_analysis['domain'], len(domains))
+            target_idx[i] = target_index.get(target_analysis['target'], len(targets))
+            trend[i] = self._analyze_trends(name, description)
+            revenue[i] = revenue_cache[revenue_models]['total_score']
+            competition[i] = competition_cache[(domain, it_type)]['score_bonus']
+            synergy[i] = synergy_cache[(domain, target, it_type)]
+            details.append((
+                domain_analysis, target_analysis,
+                revenue_cache[revenue_models], competition_cache[(domain, it_type)]
+            ))
+
+        base = base_table[it_idx]
+        raw_scores = (
+            base * 0.25 +
+            domain_table[domain_idx] * 1.5 +
+            target_table[target_idx] * 1.2 +
+            trend * 0.8 +
+            revenue * 0.5 +
+            competition * 0.5 +
+            synergy * 0.8
+        )
+
+        return {
+            'raw_scores': raw_scores,
+            'base_scores': base,
+            'trend_scores': trend,
+            'synergy_bonuses': synergy,
+            'details': details
+        }
+
+    def score_batch(self, business_list: List[Dict]):
+        """가중 raw_score 일괄 계산 (변동성 미적용, 후보 풀 사전 선별용)
+
+        Returns:
+            numpy 배열 (NumPy 미설치 시 리스트)
+        """
+        if not business_list:
+            return np.array([]) if NUMPY_AVAILABLE else []
+        if not NUMPY_AVAILABLE:
+            return [self._raw_score(business_data) for business_data in business_list]
+        return self._resolve_batch_components(business_list)['raw_scores']
+
+    def analyze_batch(self, business_list: List[Dict]) -> List[Dict]:
+        """사업 아이디어 일괄 분석 (아이디어별 결과는 analyze와 동일)"""
+        if not business_list:
+            return []
+        if not NUMPY_AVAILABLE:
+            return [self.analyze(business_data) for business_data in business_list]
+
+        components = self._resolve_batch_components(business_list)
+        results = []
+        for i, business_data in enumerate(business_list):
+            # 고유 조합별로 공유되는 dict는 아이디어마다 복사해 결과를 독립시킴
+            domain_analysis, target_analysis, revenue_analysis, competition = components['details'][i]
+            revenue_analysis = {**revenue_analysis, 'models': [dict(m) for m in revenue_analysis['models']]}
+            results.append(self._build_result(
+                business_data,
+                float(components['raw_scores'][i]),
+                int(components['base_scores'][i]),
+                dict(domain_analysis),
+                dict(target_analysis),
+                int(components['trend_scores'][i]),
+                revenue_analysis,
+                dict(competition),
+                int(components['synergy_bonuses'][i])
+            ))
+        return results
+
+    def _raw_score(self, business_data: Dict) -> float:
+        """단건 가중 raw_score (NumPy 미설치 시 score_batch 폴백)"""
+        domain = business_data.get('domain', '')
+        target = business_data.get('target_audience', '')
+        it_type = business_data.get('it_type', 'saas')
+        return (
+            self._get_base_score(it_type) * 0.25 +
+            self._analyze_domain(domain)['score_bonus'] * 1.5 +
+            self._analyze_target(target)['score_bonus'] * 1.2 +
+            self._analyze_trends(business_data.get('name', ''), business_data.get('description', '')) * 0.8 +
+            self._analyze_revenue_models(business_data.get('revenue_models', []))['total_score'] * 0.5 +
+            self._estimate_competition(domain, it_type)['score_bonus'] * 0.5 +
+            self._calculate_synergy_bonus(domain, target, it_type) * 0.8
+        )
+
     def _get_base_score(self, it_type: str) -> int:
         """IT 유형별 기본 점수"""
         if it_type in self.it_type_scores:
@@ -516,16 +685,16 @@ class LightweightMarketAnalyzer:
             }
 
         # 도메인이 없으면 유사 도메인 찾기
-        for key in self.domain_market_data:
-            if key in domain or domain in key:
-                data = self.domain_market_data[key]
-                return {
-                    'domain': key,
-                    'market_size': data['market_size'],
-                    'growth_rate': f"{data['growth_rate']}%",
-                    'trend': data['trend'],
-                    'score_bonus': data['score_bonus']
-                }
+        key = self.domain_matcher.first_related(domain)
+        if key is not None:
+            data = self.domain_market_data[key]
+            return {
+                'domain': key,
+                'market_size': data['market_size'],
+                'growth_rate': f"{data['growth_rate']}%",
+                'trend': data['trend'],
+                'score_bonus': data['score_bonus']
+            }
 
         # 기본값
         return {
@@ -549,16 +718,16 @@ class LightweightMarketAnalyzer:
             }
 
         # 유사 타겟 찾기
-        for key in self.target_audience_data:
-            if key in target or target in key:
-                data = self.target_audience_data[key]
-                return {
-                    'target': key,
-                    'population_millions': data['population'],
-                    'digital_affinity': data['digital_affinity'],
-                    'spending_power': data['spending_power'],
-                    'score_bonus': data['score_bonus']
-                }
+        key = self.target_matcher.first_related(target)
+        if key is not None:
+            data = self.target_audience_data[key]
+            return {
+                'target': key,
+                'population_millions': data['population'],
+                'digital_affinity': data['digital_affinity'],
+                'spending_power': data['spending_power'],
+                'score_bonus': data['score_bonus']
+            }
 
         # 기본값
         return {
@@ -571,9 +740,7 @@ class LightweightMarketAnalyzer:
 
     def _analyze_trends(self, name: str, description: str) -> int:
         """트렌드 키워드 분석 (2025 업데이트)"""
-        text = f"{name} {description}".lower()
-        score = 0
-        matched_categories = set()
+        text = f"{name} {description}"
 
         # 각 카테고리별 점수 (중복 방지를 위해 카테고리당 최대 1회)
         keyword_scores = {
@@ -584,16 +751,8 @@ class LightweightMarketAnalyzer:
             'declining': -5
         }
 
-        for category, keywords in self.trending_keywords.items():
-            if category in matched_categories:
-                continue
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    score += keyword_scores.get(category, 0)
-                    matched_categories.add(category)
-                    break
-
-        return score
+        matched_categories = self.trend_matcher.groups_in(text)
+        return sum(keyword_scores.get(category, 0) for category in matched_categories)
 
     def _calculate_synergy_bonus(self, domain: str, target: str, it_type: str) -> int:
         """도메인-타겟-IT유형 시너지 보너스 계산"""
@@ -621,15 +780,8 @@ class LightweightMarketAnalyzer:
 
     def _find_trend_keywords(self, name: str, description: str) -> List[str]:
         """발견된 트렌드 키워드 목록"""
-        text = f"{name} {description}".lower()
-        found = []
-
-        for category, keywords in self.trending_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    found.append(f"{keyword} ({category})")
-
-        return found
+        text = f"{name} {description}"
+        return [f"{keyword} ({category})" for category, keyword in self.trend_matcher.find_all(text)]
 
     def _analyze_revenue_models(self, revenue_models: List[str]) -> Dict:
         """수익 모델 분석"""
@@ -5,13 +5,27 @@
 - AI 기반 아이디어 생성
 """
 
-import requests
+import asyncio
 from bs4 import BeautifulSoup
 from datetime import datetime
 import random
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from response_cache import cached_get
+from circuit_breaker import get_circuit_breakers
+from config import TrendConfig
+
+
+class FallbackTrends(list):
+    """수집 실패 시 반환하는 대체 트렌드 목록 (error: 실패 원인, 회로 차단기에는 실패로 기록)"""
+
+    def __init__(self, trends, error):
+        super().__init__(trends)
+        self.error = str(error)
+
 
 class MultiSourceTrendAnalyzer:
     def __init__(self):
@@ -19,6 +33,8 @@ class MultiSourceTrendAnalyzer:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         self.all_trends = []
+        self.skipped_sources = []  # 직전 수집에서 회로 차단으로 건너뛴 소스
+        self.circuit_breakers = get_circuit_breakers()
 
     # ============================================
     # 1. 글로벌 트렌드 소스
@@ -30,7 +46,7 @@ class MultiSourceTrendAnalyzer:
         try:
             # Product Hunt 인기 제품 페이지
             url = "https://www.producthunt.com"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='product_hunt', headers=self.headers, timeout=5)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             # 제품명 추출 시도
@@ -49,11 +65,11 @@ class MultiSourceTrendAnalyzer:
         except Exception as e:
             print(f"[WARNING] Product Hunt 수집 실패: {e}")
             # 대체 데이터
-            trends = [
+            trends = FallbackTrends([
                 {'source': 'Product Hunt', 'keyword': 'AI 코드 리뷰 도구', 'category': 'global_startup', 'type': 'product'},
                 {'source': 'Product Hunt', 'keyword': 'No-code 앱 빌더', 'category': 'global_startup', 'type': 'product'},
                 {'source': 'Product Hunt', 'keyword': 'AI 영상 생성 플랫폼', 'category': 'global_startup', 'type': 'product'},
-            ]
+            ], e)
         return trends
 
     def fetch_github_trending(self):
@@ -61,7 +77,7 @@ class MultiSourceTrendAnalyzer:
         trends = []
         try:
             url = "https://github.com/trending"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='github_trending', headers=self.headers, timeout=5)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             # 저장소명 추출
@@ -84,52 +100,87 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] GitHub Trending: {len(trends)}개 트렌드 수집")
         except Exception as e:
             print(f"[WARNING] GitHub Trending 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': 'GitHub Trending', 'keyword': 'LLM Framework', 'category': 'tech', 'type': 'repository'},
                 {'source': 'GitHub Trending', 'keyword': 'AI Agent', 'category': 'tech', 'type': 'repository'},
                 {'source': 'GitHub Trending', 'keyword': 'Vector Database', 'category': 'tech', 'type': 'repository'},
-            ]
+            ], e)
         return trends
 
+    HACKER_NEWS_TOP_URL = "https://hacker-news.firebaseio.com/v0/topstories.json"
+    HACKER_NEWS_ITEM_URL = "https://hacker-news.firebaseio.com/v0/item/{}.json"
+    HACKER_NEWS_LIMIT = 10
+
     def fetch_hacker_news(self):
         """Hacker News에서 기술 커뮤니티 트렌드 수집"""
-        trends = []
         try:
             # HN API 사용
-            url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-            response = requests.get(url, timeout=5)
-            story_ids = response.json()[:10]
-
-            for story_id in story_ids:
-                story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                story = requests.get(story_url, timeout=5).json()
-                if story and story.get('title'):
-                    trends.append({
-                        'source': 'Hacker News',
-                        'keyword': story['title'],
-                        'score': story.get('score', 0),
-                        'category': 'tech_community',
-                        'type': 'discussion'
-                    })
+            response = cached_get(self.HACKER_NEWS_TOP_URL, source='hacker_news', timeout=5)
+            story_ids = response.json()[:self.HACKER_NEWS_LIMIT]
 
-            print(f"[OK] Hacker News: {len(trends)}개 트렌드 수집")
-        except Exception as e:
-            print(f"[WARNING] Hacker News 수집 실패: {e}")
-            trends = [
-                {'source': 'Hacker News', 'keyword': 'AI Startup Trends', 'category': 'tech_community', 'type': 'discussion'},
-                {'source': 'Hacker News', 'keyword': 'Open Source AI', 'category': 'tech_community', 'type': 'discussion'},
+            stories = [
+                cached_get(self.HACKER_NEWS_ITEM_URL.format(story_id), source='hacker_news', timeout=5).json()
+                for story_id in story_ids
             ]
+            return self._hacker_news_trends(stories)
+        except Exception as e:
+            return self._hacker_news_fallback(e)
+
+    async def fetch_hacker_news_async(self, semaphore, executor):
+        """Hacker News 수집 (비동기) - 스토리 항목을 semaphore 한도 내에서 동시 요청
+
+        요청은 호출자의 전용 풀(executor)에서 실행 - 기본 풀은 asyncio.run 종료 시 join되어 시간 상한이 무의미해짐
+        """
+        loop = asyncio.get_running_loop()
+
+        def get(url):
+            return cached_get(url, source='hacker_news', timeout=5)
+
+        async def fetch_story(story_id):
+            async with semaphore:
+                response = await loop.run_in_executor(executor, get, self.HACKER_NEWS_ITEM_URL.format(story_id))
+            return response.json()
+
+        try:
+            response = await loop.run_in_executor(executor, get, self.HACKER_NEWS_TOP_URL)
+            story_ids = response.json()[:self.HACKER_NEWS_LIMIT]
+            stories = await asyncio.gather(*(fetch_story(story_id) for story_id in story_ids))
+            return self._hacker_news_trends(stories)
+        except Exception as e:
+            return self._hacker_news_fallback(e)
+
+    def _hacker_news_trends(self, stories):
+        trends = []
+        for story in stories:
+            if story and story.get('title'):
+                trends.append({
+                    'source': 'Hacker News',
+                    'keyword': story['title'],
+                    'score': story.get('score', 0),
+                    'category': 'tech_community',
+                    'type': 'discussion'
+                })
+
+        print(f"[OK] Hacker News: {len(trends)}개 트렌드 수집")
         return trends
 
+    def _hacker_news_fallback(self, error):
+        print(f"[WARNING] Hacker News 수집 실패: {error}")
+        return FallbackTrends([
+            {'source': 'Hacker News', 'keyword': 'AI Startup Trends', 'category': 'tech_community', 'type': 'discussion'},
+            {'source': 'Hacker News', 'keyword': 'Open Source AI', 'category': 'tech_community', 'type': 'discussion'},
+        ], error)
+
     def fetch_reddit(self):
         """Reddit에서 스타트업/사이드프로젝트 트렌드 수집"""
         trends = []
+        error = None
         subreddits = ['startups', 'SideProject', 'entrepreneur', 'webdev']
 
         for subreddit in subreddits:
             try:
                 url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=5"
-                response = requests.get(url, headers={
+                response = cached_get(url, source='reddit', headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }, timeout=5)
 
@@ -151,21 +202,20 @@ class MultiSourceTrendAnalyzer:
                                 'type': 'discussion'
                             })
 
-                time.sleep(1)  # Rate limiting
-
             except Exception as e:
+                error = e
                 continue
 
         if trends:
             print(f"[OK] Reddit: {len(trends)}개 트렌드 수집")
         else:
             print(f"[WARNING] Reddit 수집 실패, 대체 데이터 사용")
-            trends = [
+            trends = FallbackTrends([
                 {'source': 'Reddit r/startups', 'keyword': 'AI SaaS for SMBs', 'category': 'community', 'type': 'discussion'},
                 {'source': 'Reddit r/SideProject', 'keyword': 'Micro-SaaS Ideas', 'category': 'community', 'type': 'discussion'},
                 {'source': 'Reddit r/entrepreneur', 'keyword': 'No-code Business', 'category': 'community', 'type': 'discussion'},
                 {'source': 'Reddit r/webdev', 'keyword': 'AI Development Tools', 'category': 'community', 'type': 'discussion'},
-            ]
+            ], error or '수집된 게시글 없음')
         return trends
 
     # ============================================
@@ -179,7 +229,7 @@ class MultiSourceTrendAnalyzer:
             # 네이버 트렌드 관련 키워드 (API 없이 시뮬레이션)
             # 실제로는 네이버 API 사용 권장
             url = "https://datalab.naver.com/keyword/realtimeList.naver"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='naver_datalab', headers=self.headers, timeout=5)
 
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -196,12 +246,12 @@ class MultiSourceTrendAnalyzer:
         except Exception as e:
             print(f"[WARNING] 네이버 데이터랩 수집 실패: {e}")
             # 대체 데이터 - 최신 IT 트렌드
-            trends = [
+            trends = FallbackTrends([
                 {'source': '네이버 데이터랩', 'keyword': 'ChatGPT 활용', 'category': 'korea_search', 'type': 'search_trend'},
                 {'source': '네이버 데이터랩', 'keyword': '1인 창업', 'category': 'korea_search', 'type': 'search_trend'},
                 {'source': '네이버 데이터랩', 'keyword': '자동화 툴', 'category': 'korea_search', 'type': 'search_trend'},
                 {'source': '네이버 데이터랩', 'keyword': 'AI 부업', 'category': 'korea_search', 'type': 'search_trend'},
-            ]
+            ], e)
         return trends
 
     def fetch_wadiz(self):
@@ -209,7 +259,7 @@ class MultiSourceTrendAnalyzer:
         trends = []
         try:
             url = "https://www.wadiz.kr/web/wreward/category/308"  # 테크/가전 카테고리
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='wadiz', headers=self.headers, timeout=5)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             projects = soup.find_all('div', class_='ProjectCardList_item', limit=10)
@@ -226,11 +276,11 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] 와디즈: {len(trends)}개 트렌드 수집")
         except Exception as e:
             print(f"[WARNING] 와디즈 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': '와디즈', 'keyword': '스마트 홈 디바이스', 'category': 'crowdfunding', 'type': 'project'},
                 {'source': '와디즈', 'keyword': 'AI 학습 기기', 'category': 'crowdfunding', 'type': 'project'},
                 {'source': '와디즈', 'keyword': '헬스케어 웨어러블', 'category': 'crowdfunding', 'type': 'project'},
-            ]
+            ], e)
         return trends
 
     def fetch_tumblbug(self):
@@ -238,7 +288,7 @@ class MultiSourceTrendAnalyzer:
         trends = []
         try:
             url = "https://tumblbug.com/discover"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='tumblbug', headers=self.headers, timeout=5)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             projects = soup.find_all('div', class_='project-card', limit=10)
@@ -255,12 +305,12 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] 텀블벅: {len(trends)}개 트렌드 수집")
         except Exception as e:
             print(f"[WARNING] 텀블벅 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': '텀블벅', 'keyword': '크리에이터 툴킷', 'category': 'crowdfunding', 'type': 'project'},
                 {'source': '텀블벅', 'keyword': '디지털 아트 프로젝트', 'category': 'crowdfunding', 'type': 'project'},
                 {'source': '텀블벅', 'keyword': '인디 게임 개발', 'category': 'crowdfunding', 'type': 'project'},
                 {'source': '텀블벅', 'keyword': '교육 콘텐츠 제작', 'category': 'crowdfunding', 'type': 'project'},
-            ]
+            ], e)
         return trends
 
     def fetch_saramin_trends(self):
@@ -268,7 +318,7 @@ class MultiSourceTrendAnalyzer:
         trends = []
         try:
             url = "https://www.saramin.co.kr/zf_user/jobs/list/job-category?cat_kewd=84"  # IT개발 카테고리
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='saramin', headers=self.headers, timeout=5)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             jobs = soup.find_all('h2', class_='job_tit', limit=10)
@@ -283,11 +333,11 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] 사람인: {len(trends)}개 트렌드 수집")
         except Exception as e:
             print(f"[WARNING] 사람인 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': '사람인', 'keyword': 'AI/ML 엔지니어', 'category': 'job_market', 'type': 'job_posting'},
                 {'source': '사람인', 'keyword': '블록체인 개발자', 'category': 'job_market', 'type': 'job_posting'},
                 {'source': '사람인', 'keyword': '클라우드 아키텍트', 'category': 'job_market', 'type': 'job_posting'},
-            ]
+            ], e)
         return trends
 
     def fetch_jobkorea_trends(self):
@@ -295,7 +345,7 @@ class MultiSourceTrendAnalyzer:
         trends = []
         try:
             url = "https://www.jobkorea.co.kr/recruit/joblist?menucode=duty"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='jobkorea', headers=self.headers, timeout=5)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             jobs = soup.find_all('a', class_='title', limit=10)
@@ -312,12 +362,12 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] 잡코리아: {len(trends)}개 트렌드 수집")
         except Exception as e:
             print(f"[WARNING] 잡코리아 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': '잡코리아', 'keyword': 'React/Next.js 개발자', 'category': 'job_market', 'type': 'job_posting'},
                 {'source': '잡코리아', 'keyword': 'DevOps 엔지니어', 'category': 'job_market', 'type': 'job_posting'},
                 {'source': '잡코리아', 'keyword': 'AI 서비스 기획자', 'category': 'job_market', 'type': 'job_posting'},
                 {'source': '잡코리아', 'keyword': '데이터 엔지니어', 'category': 'job_market', 'type': 'job_posting'},
-            ]
+            ], e)
         return trends
 
     def fetch_public_data_portal(self):
@@ -363,7 +413,7 @@ class MultiSourceTrendAnalyzer:
         trends = []
         try:
             url = "https://api.coingecko.com/api/v3/search/trending"
-            response = requests.get(url, timeout=5)
+            response = cached_get(url, source='coingecko', timeout=5)
             data = response.json()
 
             for coin in data.get('coins', [])[:7]:
@@ -380,11 +430,11 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] CoinGecko: {len(trends)}개 트렌드 수집")
         except Exception as e:
             print(f"[WARNING] CoinGecko 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': 'CoinGecko', 'keyword': 'Bitcoin', 'category': 'blockchain', 'type': 'cryptocurrency'},
                 {'source': 'CoinGecko', 'keyword': 'Ethereum', 'category': 'blockchain', 'type': 'cryptocurrency'},
                 {'source': 'CoinGecko', 'keyword': 'Solana', 'category': 'blockchain', 'type': 'cryptocurrency'},
-            ]
+            ], e)
         return trends
 
     def fetch_defillama(self):
@@ -392,7 +442,7 @@ class MultiSourceTrendAnalyzer:
         trends = []
         try:
             url = "https://api.llama.fi/protocols"
-            response = requests.get(url, timeout=5)
+            response = cached_get(url, source='defillama', timeout=5)
             protocols = response.json()[:10]
 
             for protocol in protocols:
@@ -408,11 +458,11 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] DeFi Llama: {len(trends)}개 트렌드 수집")
         except Exception as e:
             print(f"[WARNING] DeFi Llama 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': 'DeFi Llama', 'keyword': 'Lido', 'category': 'defi', 'type': 'protocol'},
                 {'source': 'DeFi Llama', 'keyword': 'Aave', 'category': 'defi', 'type': 'protocol'},
                 {'source': 'DeFi Llama', 'keyword': 'Uniswap', 'category': 'defi', 'type': 'protocol'},
-            ]
+            ], e)
         return trends
 
     def fetch_nft_trends(self):
@@ -471,7 +521,7 @@ class MultiSourceTrendAnalyzer:
         try:
             # CoinDesk RSS 또는 API
             url = "https://www.coindesk.com/arc/outboundfeeds/rss/"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = cached_get(url, source='blockchain_news', headers=self.headers, timeout=5)
             soup = BeautifulSoup(response.content, 'xml')
 
             items = soup.find_all('item', limit=10)
@@ -488,11 +538,11 @@ class MultiSourceTrendAnalyzer:
             print(f"[OK] 블록체인 뉴스: {len(trends)}개 수집")
         except Exception as e:
             print(f"[WARNING] 블록체인 뉴스 수집 실패: {e}")
-            trends = [
+            trends = FallbackTrends([
                 {'source': 'CoinDesk', 'keyword': 'Bitcoin ETF 승인', 'category': 'blockchain_news', 'type': 'news'},
                 {'source': 'CoinDesk', 'keyword': 'Ethereum 업그레이드', 'category': 'blockchain_news', 'type': 'news'},
                 {'source': 'CoinDesk', 'keyword': '기관 투자 확대', 'category': 'blockchain_news', 'type': 'news'},
-            ]
+            ], e)
         return trends
 
     # ============================================
@@ -502,12 +552,11 @@ class MultiSourceTrendAnalyzer:
     def fetch_gpt_trend_analysis(self):
         """GPT API 기반 트렌드 분석 및 아이디어 생성"""
         # OpenAI API 키가 있으면 실제 분석, 없으면 시뮬레이션 데이터
+        import os
         trends = []
+        api_key = os.environ.get('OPENAI_API_KEY')
 
         try:
-            import os
-            api_key = os.environ.get('OPENAI_API_KEY')
-
             if api_key:
                 import openai
                 openai.api_key = api_key
@@ -558,6 +607,8 @@ class MultiSourceTrendAnalyzer:
                 {'source': 'GPT Analysis', 'keyword': 'AI 고객 서비스 자동화 솔루션', 'category': 'ai_analysis', 'type': 'ai_generated',
                  'description': '24/7 고객 지원 비용 절감'},
             ]
+            if api_key:
+                trends = FallbackTrends(trends, e)  # 키 미설정은 실패가 아님
             print(f"[OK] GPT 분석 (시뮬레이션): {len(trends)}개 아이디어 생성")
 
         return trends
@@ -566,30 +617,79 @@ class MultiSourceTrendAnalyzer:
     # 6. 트렌드 통합 및 아이디어 생성
     # ============================================
 
-    def collect_all_trends(self):
-        """경량화된 트렌드 수집 (Koyeb free tier 최적화)"""
+    # (표시명, 키, 수집 메서드) - 키는 응답 캐시 source/회로 차단기 이름
+    TREND_SOURCES = [
+        ('Product Hunt', 'product_hunt', 'fetch_product_hunt'),
+        ('GitHub Trending', 'github_trending', 'fetch_github_trending'),
+        ('Hacker News', 'hacker_news', 'fetch_hacker_news'),
+        ('Reddit', 'reddit', 'fetch_reddit'),
+        ('네이버', 'naver_datalab', 'fetch_naver_datalab'),
+        ('와디즈', 'wadiz', 'fetch_wadiz'),
+        ('텀블벅', 'tumblbug', 'fetch_tumblbug'),
+        ('사람인', 'saramin', 'fetch_saramin_trends'),
+        ('잡코리아', 'jobkorea', 'fetch_jobkorea_trends'),
+        ('공공데이터포털', 'public_data_portal', 'fetch_public_data_portal'),
+        ('앱 마켓', 'app_store', 'fetch_app_store_trends'),
+        ('CoinGecko', 'coingecko', 'fetch_coingecko_trends'),
+        ('DeFi Llama', 'defillama', 'fetch_defillama'),
+        ('NFT', 'nft', 'fetch_nft_trends'),
+        ('Web3', 'web3', 'fetch_web3_trends'),
+        ('블록체인 뉴스', 'blockchain_news', 'fetch_blockchain_news'),
+        ('GPT 분석', 'gpt_analysis', 'fetch_gpt_trend_analysis'),
+    ]
+
+    # 경량 모드 핵심 소스 (Koyeb free tier 최적화)
+    CORE_SOURCES = ('github_trending', 'hacker_news', 'naver_datalab')
+
+    # 비동기 모드에서 항목 단위로 동시 요청하는 소스
+    ASYNC_FETCHERS = {'hacker_news': 'fetch_hacker_news_async'}
+
+    def collect_all_trends(self, use_async=None, all_sources=None):
+        """트렌드 수집
+
+        Args:
+            use_async: 소스 동시 수집 여부 (None이면 TrendConfig 설정, 결과 순서는 동일)
+            all_sources: 전체 소스 수집 여부 (None이면 TrendConfig 설정, False면 핵심 3개)
+        """
+        if use_async is None:
+            use_async = TrendConfig.is_async()
+        if all_sources is None:
+            all_sources = TrendConfig.is_all_sources()
+
+        sources = [
+            source for source in self.TREND_SOURCES
+            if all_sources or source[1] in self.CORE_SOURCES
+        ]
+
         print("\n" + "="*60)
-        print("[MULTI-SOURCE] 경량 트렌드 수집 시작 (3개 소스)")
+        print(f"[MULTI-SOURCE] {'전체' if all_sources else '경량'} 트렌드 수집 시작 ({len(sources)}개 소스)")
         print("="*60 + "\n")
 
-        all_trends = []
+        self.skipped_sources = []
+        allowed = []
+        for name, key, method_name in sources:
+            if not self.circuit_breakers.allow(f"trend.{key}"):
+                print(f"[FETCH] {name} [SKIP] 회로 차단 중")
+                self.skipped_sources.append(name)
+                continue
+            allowed.append((name, key, method_name))
 
-        # 핵심 소스만 사용 (3개)
-        sources = [
-            ('GitHub Trending', self.fetch_github_trending),
-            ('Hacker News', self.fetch_hacker_news),
-            ('네이버', self.fetch_naver_datalab),
-        ]
+        if use_async and len(allowed) > 1 and not self._in_event_loop():
+            outcomes = asyncio.run(self._collect_async(allowed))
+        else:
+            outcomes = [self._fetch_source(*source) for source in allowed]
 
-        for name, fetch_func in sources:
-            try:
-                print(f"[FETCH] {name} 수집 중...")
-                trends = fetch_func()
-                all_trends.extend(trends)
-                print(f"   [OK] {len(trends)}개 수집")
-            except Exception as e:
-                print(f"   [SKIP] {name} 실패: {e}")
-            time.sleep(0.5)
+        # 수집 실패 시 대체 데이터(FallbackTrends)는 사용하되 예외/시간 초과와 같이 실패로 기록
+        all_trends = []
+        for (name, key, _), (trends, error, elapsed_ms) in zip(allowed, outcomes):
+            self.circuit_breakers.record(f"trend.{key}", error is None, elapsed_ms)
+            all_trends.extend(trends)
+            if error is None:
+                print(f"   [OK] {name} {len(trends)}개 수집")
+            elif trends:
+                print(f"   [FALLBACK] {name} 대체 데이터 {len(trends)}개 사용 (실패: {error})")
+            else:
+                print(f"   [SKIP] {name} 실패: {error}")
 
         # 최소 트렌드 보장 (폴백 데이터)
         if len(all_trends) < 3:
@@ -608,6 +708,57 @@ class MultiSourceTrendAnalyzer:
 
         return all_trends
 
+    @staticmethod
+    def _in_event_loop():
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    def _fetch_source(self, name, key, method_name):
+        """단일 소스 수집 -> (트렌드 목록, 오류, 소요 ms) - 대체 데이터를 반환했으면 오류는 실패 원인"""
+        print(f"[FETCH] {name} 수집 중...")
+        started = time.time()
+        try:
+            trends = getattr(self, method_name)()
+            return trends, getattr(trends, 'error', None), (time.time() - started) * 1000
+        except Exception as e:
+            return [], str(e), (time.time() - started) * 1000
+
+    async def _collect_async(self, sources):
+        """소스 동시 수집 (소스별 시간 상한, 결과는 sources 순서)"""
+        semaphore = asyncio.Semaphore(TrendConfig.get_max_concurrency())
+        timeout = TrendConfig.get_source_timeout()
+        loop = asyncio.get_running_loop()
+        # 시간 초과된 수집 스레드를 기다리지 않도록 전용 풀 사용 (기본 풀은 asyncio.run 종료 시 join)
+        # 소스별 1개 + 비동기 수집기의 동시 요청 한도
+        executor = ThreadPoolExecutor(max_workers=len(sources) + TrendConfig.get_max_concurrency())
+
+        async def run(name, key, method_name):
+            if key not in self.ASYNC_FETCHERS:
+                try:
+                    return await asyncio.wait_for(
+                        loop.run_in_executor(executor, self._fetch_source, name, key, method_name), timeout
+                    )
+                except asyncio.TimeoutError:
+                    return [], f"{timeout:g}초 시간 초과", timeout * 1000
+
+            print(f"[FETCH] {name} 수집 중...")
+            started = time.time()
+            try:
+                trends = await asyncio.wait_for(getattr(self, self.ASYNC_FETCHERS[key])(semaphore, executor), timeout)
+                return trends, getattr(trends, 'error', None), (time.time() - started) * 1000
+            except asyncio.TimeoutError:
+                return [], f"{timeout:g}초 시간 초과", timeout * 1000
+            except Exception as e:
+                return [], str(e), (time.time() - started) * 1000
+
+        try:
+            return await asyncio.gather(*(run(*source) for source in sources))
+        finally:
+            executor.shutdown(wait=False)
+
     def generate_business_ideas(self, num_ideas=1):
         """수집된 트렌드 기반으로 사업 아이디어 생성"""
         if not self.all_trends:
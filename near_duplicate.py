@@ -0,0 +1,205 @@
+"""
+유사 사업 아이디어 검출 모듈
+- 문자 n-gram MinHash 시그니처 (단어 순서와 무관, 템플릿 단어 제외, 도메인 가중)
+- LSH 밴드 버킷으로 후보만 비교 (전체 이력 선형 비교 없음)
+- 임계값 이상 유사한 기존 기록과 가장 가까운 기록 반환
+"""
+
+import hashlib
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# 범용 해시 (a * x + b) mod p 용 메르센 소수 (32비트 x 31비트 곱이 int64 범위 내)
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+# 이름 템플릿에서 반복되는 유형/수식어/버전 단어 (아이디어를 구분하지 못하므로 시그니처에서 제외)
+STOP_TOKENS = frozenset({
+    'ai', 'saas', 'for', 'pro', 'lite', 'plus', '2.0',
+    '앱', '서비스', '플랫폼', '솔루션', '시스템', '어시스턴트', '도구',
+    '전용', '올인원', '넥스트젠', '스마트', '맞춤', '맞춤형', '프리미엄', '간편', '초간편', '전문', '초고속', '통합',
+    '자동', '실시간', '무료', '구독형', '온디맨드', '하이브리드', '미니', '마이크로', '로컬', '글로벌', '모바일', '클라우드'
+})
+
+# 도메인 n-gram 반복 횟수 (같은 템플릿이라도 도메인이 다르면 유사도가 크게 떨어지도록)
+DOMAIN_WEIGHT = 2
+
+
+def content_tokens(text: str) -> List[str]:
+    """템플릿 단어를 뺀 단어 목록 (소문자, 모두 템플릿 단어면 원래 단어 유지)"""
+    tokens = (text or '').lower().split()
+    return [token for token in tokens if token not in STOP_TOKENS] or tokens
+
+
+def char_ngrams(text: str, n: int = 2) -> Set[str]:
+    """단어별 문자 n-gram 집합 (소문자, 템플릿 단어 제외, n보다 짧은 단어는 그대로)"""
+    grams = set()
+    for token in content_tokens(text):
+        if len(token) <= n:
+            grams.add(token)
+        else:
+            grams.update(token[i:i + n] for i in range(len(token) - n + 1))
+    return grams
+
+
+def _base_hash(gram: str) -> int:
+    return int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=4).digest(), 'big')
+
+
+class NearDuplicateIndex:
+    """MinHash + LSH 유사 이름 인덱스
+
+    num_perm = bands * rows. 후보 검출 임계값은 약 (1/bands)^(1/rows)
+    (기본 20 x 3 → 0.37) 이며, 후보는 시그니처 일치율(추정 Jaccard)로 최종 판정한다.
+    """
+
+    def __init__(self, threshold: float = 0.75, bands: int = 20, rows: int = 3,
+                 ngram: int = 2, seed: int = 1):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.num_perm = bands * rows
+        self.ngram = ngram
+        self.last_synced_id = 0  # DB 증분 동기화 위치
+
+        params = [
+            int.from_bytes(hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=8).digest(), 'big')
+            for i in range(self.num_perm * 2)
+        ]
+        self._a = [(p % (_MERSENNE_PRIME - 1)) + 1 for p in params[:self.num_perm]]
+        self._b = [p % _MERSENNE_PRIME for p in params[self.num_perm:]]
+        if NUMPY_AVAILABLE:
+            self._a_array = np.array(self._a, dtype=np.int64)
+            self._b_array = np.array(self._b, dtype=np.int64)
+
+        self._records: Dict[Any, Dict[str, Any]] = {}
+        self._buckets: List[Dict[tuple, Set[Any]]] = [defaultdict(set) for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, key):
+        return key in self._records
+
+    def signature(self, text: str, keyword: Optional[str] = None,
+                  domain: Optional[str] = None) -> Optional[List[int]]:
+        """이름(+키워드)의 MinHash 시그니처 (n-gram이 없으면 None)
+
+        domain이 주어지면 도메인 n-gram을 DOMAIN_WEIGHT배로 반영한다.
+        """
+        grams = char_ngrams(text, self.ngram)
+        if keyword:
+            grams |= char_ngrams(keyword, self.ngram)
+        if domain:
+            domain_grams = char_ngrams(domain, self.ngram)
+            grams |= domain_grams
+            grams.update(f"{gram}#{copy}" for gram in domain_grams for copy in range(1, DOMAIN_WEIGHT))
+        if not grams:
+            return None
+        hashes = [_base_hash(gram) for gram in grams]
+        if NUMPY_AVAILABLE:
+            values = (self._a_array[:, None] * np.array(hashes, dtype=np.int64)[None, :]
+                      + self._b_array[:, None]) % _MERSENNE_PRIME
+            return values.min(axis=1).tolist()
+        return [
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in zip(self._a, self._b)
+        ]
+
+    def _band_keys(self, signature: List[int]) -> Iterable[tuple]:
+        for band in range(self.bands):
+            start = band * self.rows
+            yield tuple(signature[start:start + self.rows])
+
+    @staticmethod
+    def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        """시그니처 일치율 (Jaccard 유사도 추정치)"""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    def add(self, key, name: str, keyword: Optional[str] = None, domain: Optional[str] = None,
+            **payload) -> bool:
+        """기록 추가 (같은 key는 덮어씀)"""
+        signature = self.signature(name, keyword, domain)
+        if signature is None:
+            return False
+        with self._lock:
+            self._remove_locked(key)
+            self._records[key] = {
+                'name': name, 'keyword': keyword, 'domain': domain, 'signature': signature, **payload
+            }
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self._buckets[band][band_key].add(key)
+        return True
+
+    def remove(self, key):
+        with self._lock:
+            self._remove_locked(key)
+
+    def _remove_locked(self, key):
+        record = self._records.pop(key, None)
+        if record is None:
+            return
+        for band, band_key in enumerate(self._band_keys(record['signature'])):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def nearest(self, name: str, keyword: Optional[str] = None, domain: Optional[str] = None,
+                threshold: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """임계값 이상 유사한 기록 중 가장 가까운 기록 (없으면 None)
+
+        반환: {'key', 'name', 'keyword', 'domain', 'similarity', ...payload}
+        """
+        threshold = self.threshold if threshold is None else threshold
+        signature = self.signature(name, keyword, domain)
+        if signature is None:
+            return None
+
+        best_key, best_score = None, -1.0
+        with self._lock:
+            candidates = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(band_key, ()))
+            for key in candidates:
+                score = self.similarity(signature, self._records[key]['signature'])
+                if score > best_score:
+                    best_key, best_score = key, score
+            if best_key is None or best_score < threshold:
+                return None
+            record = dict(self._records[best_key])
+
+        record.pop('signature')
+        record['key'] = best_key
+        record['similarity'] = round(best_score, 3)
+        return record
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_near_duplicate_index: Optional[NearDuplicateIndex] = None
+_near_duplicate_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """유사 아이디어 인덱스 싱글톤 (임계값은 DiscoveryConfig)"""
+    global _near_duplicate_index
+    if _near_duplicate_index is None:
+        with _near_duplicate_index_lock:
+            if _near_duplicate_index is None:
+                from config import DiscoveryConfig
+                _near_duplicate_index = NearDuplicateIndex(
+                    threshold=DiscoveryConfig.get_near_duplicate_threshold()
+                )
+    return _near_duplicate_index
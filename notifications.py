@@ -14,7 +14,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 try:
-    import requests
+    from http_client import http_post
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -92,7 +92,7 @@ class NotificationService:
             payload["attachments"][0]["fields"] = fields
 
         try:
-            response = requests.post(
+            response = http_post(
                 webhook_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
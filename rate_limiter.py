@@ -0,0 +1,174 @@
+"""
+도메인별 토큰 버킷 속도 제한 모듈
+- 도메인마다 버킷 1개 (초당 충전 속도 + 버스트 용량)
+- SQLite 파일로 스레드/프로세스 간 버킷 상태 공유 (BEGIN IMMEDIATE)
+- 고정 sleep 대신 버킷이 비었을 때만 다음 토큰까지 대기
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit
+
+from config import RateLimitConfig
+from http_client import http_get
+
+
+logger = logging.getLogger(__name__)
+
+# 국가 도메인 2단계 (co.kr, go.kr, com.au ...)
+_SECOND_LEVEL_LABELS = {'co', 'or', 'go', 'ac', 'ne', 're', 'pe', 'com', 'net', 'org'}
+
+
+def domain_of(target: str) -> str:
+    """URL 또는 호스트에서 버킷 도메인 추출 (www.reddit.com -> reddit.com)"""
+    host = urlsplit(target).hostname if '://' in target else target.split(':')[0]
+    labels = (host or '').lower().rstrip('.').split('.')
+    if len(labels) >= 3 and labels[-2] in _SECOND_LEVEL_LABELS and len(labels[-1]) == 2:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def _take_token(tokens: float, updated_at: float, now: float,
+                rate: float, burst: float) -> Tuple[float, float]:
+    """충전 후 토큰 1개 차감 -> (남은 토큰, 대기 초)
+
+    토큰이 음수가 되면 미래 토큰을 예약한 것으로, 그만큼 기다린 뒤 요청한다.
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated_at) * rate) - 1
+    return tokens, (-tokens / rate if tokens < 0 else 0.0)
+
+
+class TokenBucketLimiter:
+    """프로세스 간 공유 토큰 버킷 (DB 오류 시 프로세스 내부 버킷으로 대체)"""
+
+    def __init__(self, path: Optional[str] = None, enabled: Optional[bool] = None,
+                 clock=time.time, sleep=time.sleep):
+        self.path = path or RateLimitConfig.get_path()
+        self.enabled = RateLimitConfig.is_enabled() if enabled is None else enabled
+        self.clock = clock
+        self.sleep = sleep
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self._local: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if not self.enabled:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 트랜잭션은 직접 관리 (autocommit + BEGIN IMMEDIATE)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30,
+                                         isolation_level=None)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                    domain TEXT PRIMARY KEY,
+                    tokens REAL,
+                    updated_at REAL
+                )
+            """)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"속도 제한 공유 저장소 사용 불가, 프로세스 내부 버킷 사용: {e}")
+            self._conn = None
+
+    def reserve(self, target: str) -> float:
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환 (대기는 호출자 몫)"""
+        if not self.enabled:
+            return 0.0
+        domain = domain_of(target)
+        rate, burst = RateLimitConfig.get_limit(domain)
+        if rate <= 0:
+            return 0.0
+
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    return self._reserve_shared(domain, rate, burst)
+                except sqlite3.Error as e:
+                    logger.warning(f"속도 제한 버킷 갱신 실패, 프로세스 내부 버킷 사용: {e}")
+            return self._reserve_local(domain, rate, burst)
+
+    def _reserve_shared(self, domain, rate, burst):
+        """다른 프로세스와 공유하는 버킷에서 예약 (lock 보유 상태에서 호출)"""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = self.clock()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE domain = ?", (domain,)
+            ).fetchone()
+            tokens, updated_at = row if row else (burst, now)
+            tokens, wait = _take_token(tokens, updated_at, now, rate, burst)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (domain, tokens, updated_at) VALUES (?, ?, ?)",
+                (domain, tokens, now)
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+    def _reserve_local(self, domain, rate, burst):
+        now = self.clock()
+        tokens, updated_at = self._local.get(domain, (burst, now))
+        tokens, wait = _take_token(tokens, updated_at, now, rate, burst)
+        self._local[domain] = (tokens, now)
+        return wait
+
+    def acquire(self, target: str) -> float:
+        """도메인 토큰을 얻을 때까지 대기 -> 실제 대기 초"""
+        wait = self.reserve(target)
+        if wait > 0:
+            self.sleep(wait)
+        with self._lock:
+            self.acquired += 1
+            self.waited_seconds += wait
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """속도 제한 통계"""
+        return {
+            'enabled': self.enabled,
+            'shared': self._conn is not None,
+            'acquired': self.acquired,
+            'waited_seconds': round(self.waited_seconds, 2)
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_rate_limiter: Optional[TokenBucketLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucketLimiter:
+    """속도 제한기 싱글톤"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = TokenBucketLimiter()
+    return _rate_limiter
+
+
+# ============================================
+# 편의 함수
+# ============================================
+def limited_get(url: str, **kwargs):
+    """도메인 토큰을 얻은 뒤 공유 세션 GET"""
+    get_rate_limiter().acquire(url)
+    return http_get(url, **kwargs)
@@ -5,13 +5,17 @@
 - 경쟁사 및 수요 자동 파악
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 from datetime import datetime
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote
 from market_config import MarketConfig
+from response_cache import cached_get
+from rate_limiter import limited_get
+from circuit_breaker import get_circuit_breakers
+
 
 class RealMarketAnalyzer:
     def __init__(self):
@@ -24,6 +28,8 @@ class RealMarketAnalyzer:
         }
         self.api_delay = MarketConfig.get_api_delay()
         self.api_timeout = MarketConfig.get_timeout()
+        self.max_workers = MarketConfig.get_max_workers()
+        self.circuit_breakers = get_circuit_breakers()
 
     # 키워드 카테고리별 시장 가격 참고 테이블 (크몽/숨고 크롤링 불가 시 사용)
     CATEGORY_PRICE_MAP = {
@@ -90,7 +96,7 @@ class RealMarketAnalyzer:
 
             # 방법 1: 자동완성 API
             ac_url = f"https://ac.search.naver.com/nx/ac?q={quote(keyword)}&con=1&frm=nv&ans=2&r_format=json&r_enc=UTF-8&r_unicode=0&t_koreng=1&run=2&rev=4&q_enc=UTF-8&st=100"
-            ac_response = requests.get(ac_url, headers=self.headers, timeout=self.api_timeout)
+            ac_response = cached_get(ac_url, source='naver', headers=self.headers, timeout=self.api_timeout)
 
             if ac_response.status_code == 200:
                 try:
@@ -105,7 +111,7 @@ class RealMarketAnalyzer:
             # 방법 2: 연관검색어 페이지 파싱
             if not suggestions:
                 search_url = f"https://search.naver.com/search.naver?query={quote(keyword)}"
-                search_response = requests.get(search_url, headers=self.headers, timeout=self.api_timeout)
+                search_response = cached_get(search_url, source='naver', headers=self.headers, timeout=self.api_timeout)
                 soup = BeautifulSoup(search_response.content, 'html.parser')
 
                 # 연관검색어 추출
@@ -146,7 +152,7 @@ class RealMarketAnalyzer:
                 **self.headers,
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             }
-            response = requests.get(url, headers=headers, timeout=self.api_timeout)
+            response = cached_get(url, source='google', headers=headers, timeout=self.api_timeout)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             # 검색 결과 개수 파악 (다중 셀렉터)
@@ -190,7 +196,7 @@ class RealMarketAnalyzer:
                 **self.headers,
                 'Accept-Language': 'ko-KR,ko;q=0.9',
             }
-            response = requests.get(url, headers=headers, timeout=self.api_timeout)
+            response = limited_get(url, headers=headers, timeout=self.api_timeout)
             content = response.text
 
             # 영상 개수 추정 (JSON 데이터에서 videoId 카운트)
@@ -228,7 +234,7 @@ class RealMarketAnalyzer:
                 **self.headers,
                 'Referer': 'https://www.wishket.com/',
             }
-            response = requests.get(url, headers=headers, timeout=self.api_timeout)
+            response = limited_get(url, headers=headers, timeout=self.api_timeout)
             soup = BeautifulSoup(response.content, 'html.parser')
             import re
 
@@ -303,7 +309,7 @@ class RealMarketAnalyzer:
                 **self.headers,
                 'Referer': 'https://taling.me/',
             }
-            response = requests.get(taling_url, headers=headers, timeout=self.api_timeout)
+            response = limited_get(taling_url, headers=headers, timeout=self.api_timeout)
             soup = BeautifulSoup(response.content, 'html.parser')
             content = response.text
 
@@ -347,7 +353,7 @@ class RealMarketAnalyzer:
                 **self.headers,
                 'Referer': 'https://www.coupang.com/',
             }
-            response = requests.get(url, headers=headers, timeout=self.api_timeout)
+            response = limited_get(url, headers=headers, timeout=self.api_timeout)
             soup = BeautifulSoup(response.content, 'html.parser')
             content = response.text
 
@@ -416,7 +422,7 @@ class RealMarketAnalyzer:
                 **self.headers,
                 'Referer': 'https://blog.naver.com/',
             }
-            response = requests.get(url, headers=headers, timeout=self.api_timeout)
+            response = limited_get(url, headers=headers, timeout=self.api_timeout)
             soup = BeautifulSoup(response.content, 'html.parser')
             content = response.text
 
@@ -458,7 +464,7 @@ class RealMarketAnalyzer:
             # 인스타그램은 로그인 필요하므로 간접 지표 사용
             # 네이버에서 "keyword 인스타그램" 검색
             url = f"https://search.naver.com/search.naver?query={quote(keyword + ' 인스타그램')}"
-            response = requests.get(url, headers=self.headers, timeout=self.api_timeout)
+            response = limited_get(url, headers=self.headers, timeout=self.api_timeout)
 
             content_length = len(response.content)
 
@@ -539,7 +545,7 @@ class RealMarketAnalyzer:
         try:
             # 업비트 API로 거래량 확인 (공개 API)
             url = "https://api.upbit.com/v1/market/all"
-            response = requests.get(url, timeout=self.api_timeout)
+            response = limited_get(url, timeout=self.api_timeout)
 
             if response.status_code == 200:
                 markets = response.json()
@@ -593,7 +599,7 @@ class RealMarketAnalyzer:
             search_query = f"{keyword} blockchain OR web3 OR crypto"
             url = f"https://api.github.com/search/repositories?q={quote(search_query)}&sort=stars&per_page=10"
 
-            response = requests.get(url, headers=self.headers, timeout=self.api_timeout)
+            response = limited_get(url, headers=self.headers, timeout=self.api_timeout)
 
             if response.status_code == 200:
                 data = response.json()
@@ -624,7 +630,7 @@ class RealMarketAnalyzer:
             search_term = keyword if any(t in keyword for t in blockchain_terms) else f"블록체인 {keyword}"
 
             url = f"https://www.saramin.co.kr/zf_user/search?searchword={quote(search_term)}&searchType=search"
-            response = requests.get(url, headers=self.headers, timeout=self.api_timeout)
+            response = limited_get(url, headers=self.headers, timeout=self.api_timeout)
 
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -658,8 +664,56 @@ class RealMarketAnalyzer:
         ]
         return any(kw.lower() in keyword.lower() for kw in blockchain_keywords)
 
-    def comprehensive_analysis(self, business_idea, keyword):
-        """종합 시장 분석"""
+    # 데이터 소스 정의: (결과 키, 표시명, 분석 메서드) - 네트워크 호출은 limited_get이 도메인별로 속도 제한
+    DATA_SOURCES = [
+        ('kmong', '크몽 시장', 'analyze_kmong_market'),
+        ('naver', '네이버 검색량', 'analyze_naver_search_volume'),
+        ('google', '구글 경쟁사', 'analyze_competitors_google'),
+        ('youtube', '유튜브 관심도', 'analyze_youtube_interest'),
+        ('wishket', '위시켓 프리랜서 시장', 'analyze_wishket_market'),
+        ('soomgo', '숨고 서비스 시장', 'analyze_soomgo_market'),
+        ('brokerage', '탈잉 플랫폼', 'analyze_brokerage_platforms'),
+        ('coupang', '쿠팡 마켓플레이스', 'analyze_coupang_marketplace'),
+        ('blog', '네이버 블로그 트렌드', 'analyze_blog_trend'),
+        ('instagram', '인스타그램 비즈니스 활성도', 'analyze_instagram_business'),
+    ]
+
+    BLOCKCHAIN_SOURCES = [
+        ('coinmarketcap', 'CoinMarketCap 트렌드', 'analyze_coinmarketcap'),
+        ('upbit', '업비트 시장', 'analyze_upbit_market'),
+        ('opensea', 'OpenSea NFT 시장', 'analyze_opensea_nft'),
+        ('github_blockchain', 'GitHub 블록체인 프로젝트', 'analyze_github_blockchain'),
+        ('blockchain_jobs', '블록체인 채용시장', 'analyze_blockchain_jobs'),
+    ]
+
+    def _run_source(self, key, label, method_name, keyword, index):
+        """단일 데이터 소스 실행 (소요시간 측정, 회로 차단 중이면 건너뜀)"""
+        breaker_name = f"market.{key}"
+        if not self.circuit_breakers.allow(breaker_name):
+            print(f"{index}. {label} [SKIP] 회로 차단 중")
+            return key, {'source': key, 'error': 'circuit open', 'skipped': True}, 0
+
+        print(f"{index}. {label} 분석 중...")
+        started = time.time()
+        try:
+            data = getattr(self, method_name)(keyword)
+        except Exception as e:
+            data = {'source': key, 'error': str(e)}
+        elapsed_ms = int((time.time() - started) * 1000)
+        self.circuit_breakers.record(breaker_name, success=not data.get('error'), latency_ms=elapsed_ms)
+        return key, data, elapsed_ms
+
+    def comprehensive_analysis(self, business_idea, keyword, concurrent=None):
+        """종합 시장 분석
+
+        Args:
+            business_idea: 사업 아이디어명
+            keyword: 검색 키워드
+            concurrent: 병렬 수집 여부 (None이면 MarketConfig 설정 사용)
+        """
+        if concurrent is None:
+            concurrent = MarketConfig.is_concurrent()
+
         print(f"\n{'='*60}")
         print(f"시장 분석 시작: {business_idea}")
         print(f"키워드: {keyword}")
@@ -669,100 +723,44 @@ class RealMarketAnalyzer:
             'business_idea': business_idea,
             'keyword': keyword,
             'analysis_date': datetime.now().isoformat(),
-            'data_sources': {}
+            'data_sources': {},
+            'source_timings': {}
         }
 
-        # 크몽 분석
-        print("1. 크몽 시장 분석 중...")
-        kmong_data = self.analyze_kmong_market(keyword)
-        results['data_sources']['kmong'] = kmong_data
-        time.sleep(self.api_delay)
-
-        # 네이버 검색량
-        print("2. 네이버 검색량 분석 중...")
-        naver_data = self.analyze_naver_search_volume(keyword)
-        results['data_sources']['naver'] = naver_data
-        time.sleep(self.api_delay)
-
-        # 구글 경쟁사
-        print("3. 구글 경쟁사 분석 중...")
-        google_data = self.analyze_competitors_google(keyword)
-        results['data_sources']['google'] = google_data
-        time.sleep(self.api_delay)
-
-        # 유튜브 관심도
-        print("4. 유튜브 관심도 분석 중...")
-        youtube_data = self.analyze_youtube_interest(keyword)
-        results['data_sources']['youtube'] = youtube_data
-        time.sleep(self.api_delay)
-
-        # 위시켓 프리랜서 시장
-        print("5. 위시켓 프리랜서 시장 분석 중...")
-        wishket_data = self.analyze_wishket_market(keyword)
-        results['data_sources']['wishket'] = wishket_data
-        time.sleep(self.api_delay)
-
-        # 숨고 서비스 시장
-        print("6. 숨고 서비스 시장 분석 중...")
-        soomgo_data = self.analyze_soomgo_market(keyword)
-        results['data_sources']['soomgo'] = soomgo_data
-        time.sleep(self.api_delay)
-
-        # 탈잉 교육/재능 플랫폼
-        print("7. 탈잉 플랫폼 분석 중...")
-        brokerage_data = self.analyze_brokerage_platforms(keyword)
-        results['data_sources']['brokerage'] = brokerage_data
-        time.sleep(self.api_delay)
-
-        # 쿠팡 마켓플레이스
-        print("8. 쿠팡 마켓플레이스 분석 중...")
-        coupang_data = self.analyze_coupang_marketplace(keyword)
-        results['data_sources']['coupang'] = coupang_data
-        time.sleep(self.api_delay)
-
-        # 네이버 블로그 트렌드
-        print("9. 네이버 블로그 트렌드 분석 중...")
-        blog_data = self.analyze_blog_trend(keyword)
-        results['data_sources']['blog'] = blog_data
-        time.sleep(self.api_delay)
-
-        # 인스타그램 비즈니스
-        print("10. 인스타그램 비즈니스 활성도 분석 중...")
-        instagram_data = self.analyze_instagram_business(keyword)
-        results['data_sources']['instagram'] = instagram_data
-
-        # 블록체인/Web3 관련 키워드면 추가 분석
-        if self._is_blockchain_keyword(keyword):
-            print("\n[BLOCKCHAIN] 블록체인/Web3 추가 분석 시작...")
-
-            print("11. CoinMarketCap 트렌드 분석 중...")
-            coinmarketcap_data = self.analyze_coinmarketcap(keyword)
-            results['data_sources']['coinmarketcap'] = coinmarketcap_data
-            time.sleep(self.api_delay / 2)
-
-            print("12. 업비트 시장 분석 중...")
-            upbit_data = self.analyze_upbit_market(keyword)
-            results['data_sources']['upbit'] = upbit_data
-            time.sleep(self.api_delay / 2)
-
-            print("13. OpenSea NFT 시장 분석 중...")
-            opensea_data = self.analyze_opensea_nft(keyword)
-            results['data_sources']['opensea'] = opensea_data
-            time.sleep(self.api_delay / 2)
-
-            print("14. GitHub 블록체인 프로젝트 분석 중...")
-            github_data = self.analyze_github_blockchain(keyword)
-            results['data_sources']['github_blockchain'] = github_data
-            time.sleep(self.api_delay / 2)
-
-            print("15. 블록체인 채용시장 분석 중...")
-            jobs_data = self.analyze_blockchain_jobs(keyword)
-            results['data_sources']['blockchain_jobs'] = jobs_data
-
-            results['is_blockchain'] = True
-            print("[BLOCKCHAIN] 블록체인 추가 분석 완료!\n")
+        is_blockchain = self._is_blockchain_keyword(keyword)
+        sources = list(self.DATA_SOURCES)
+        if is_blockchain:
+            print("[BLOCKCHAIN] 블록체인/Web3 추가 분석 포함")
+            sources += self.BLOCKCHAIN_SOURCES
+
+        tasks = [
+            (key, label, method_name, keyword, index)
+            for index, (key, label, method_name) in enumerate(sources, 1)
+        ]
+
+        collected = {}
+        started = time.time()
+        if concurrent and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self._run_source, *task) for task in tasks]
+                for future in as_completed(futures):
+                    key, data, elapsed_ms = future.result()
+                    collected[key] = (data, elapsed_ms)
         else:
-            results['is_blockchain'] = False
+            for task in tasks:
+                key, data, elapsed_ms = self._run_source(*task)
+                collected[key] = (data, elapsed_ms)
+
+        # 결과 키 순서는 순차 실행과 동일하게 유지
+        for key, _, _ in sources:
+            data, elapsed_ms = collected[key]
+            results['data_sources'][key] = data
+            results['source_timings'][key] = elapsed_ms
+        results['skipped_sources'] = [
+            key for key, data in results['data_sources'].items() if data.get('skipped')
+        ]
+        results['total_duration_ms'] = int((time.time() - started) * 1000)
+        results['is_blockchain'] = is_blockchain
 
         # 종합 점수 계산
         results['market_score'] = self._calculate_market_score(results['data_sources'])
@@ -1058,8 +1056,6 @@ if __name__ == "__main__":
         print(f"   우선순위: {result['recommendation']['priority']}")
         print("-" * 60)
 
-        time.sleep(analyzer.api_delay * 2.5)  # 전체 분석 사이클 간 대기
-
     # 상위 3개 추천
     all_results.sort(key=lambda x: x['market_score'], reverse=True)
 
@@ -7,8 +7,14 @@ import random
 from datetime import datetime
 import json
 
+from combination_space import CombinationSpace
+from config import DiscoveryConfig
+
 class RealisticBusinessGenerator:
-    def __init__(self):
+    # 동적 조합 이름이 기존 이름과 겹칠 때 표기 요소를 다시 고르는 횟수
+    NAME_ATTEMPTS = 5
+
+    def __init__(self, combination_state_path=None, combination_seed=None):
         # 현실적이고 즉시 시작 가능한 사업 분야들
         self.immediate_businesses = [
             {
@@ -461,6 +467,47 @@ class RealisticBusinessGenerator:
             "신혼부부", "싱글족", "맞벌이", "워킹맘", "워킹대디"
         ]
 
+        self.name_modifiers = ["", "스마트", "초고속", "맞춤", "프리미엄", "간편", "전문", "AI"]
+        self.version_tags = ["", " 2.0", " Pro", " Lite", " Plus"]
+
+        # 동적 조합 이름 패턴: (템플릿, 업종이 이름에 없을 때의 IT 유형)
+        self.name_patterns = [
+            ("{prefix} {domain} {biz_type}", None),
+            ("{target} 전용 {domain} {biz_type}", None),
+            ("{prefix} {target} {domain} 앱", "saas"),
+            ("{domain} {biz_type} for {target}", None),
+            ("{prefix} {domain} 자동화", "tools"),
+            ("{target} {domain} 매칭 서비스", "marketplace"),
+            ("{modifier} {domain} {biz_type}", None),
+            ("{prefix} {modifier} {domain} 서비스", "saas"),
+            ("{target} {domain} 솔루션{version}", "saas"),
+            ("{domain} AI {biz_type}", None),
+            ("올인원 {domain} {biz_type}", None),
+            ("넥스트젠 {domain} for {target}", "platform")
+        ]
+
+        # 동적 조합 IT 사업 유형 (업종 -> _classify_it_type)
+        self.it_types = ["saas", "marketplace", "agency", "tools", "platform"]
+
+        # 도메인별 핵심 기능 (첫 기능 위치가 조합 공간의 한 차원 - 목록 길이는 모두 같게 유지)
+        self.core_features_by_domain = {
+            "헬스케어": ["건강 기록 추적", "전문가 상담 연결", "맞춤 건강 리포트", "알림 시스템"],
+            "피트니스": ["운동 루틴 관리", "진행 상황 추적", "영상 가이드", "커뮤니티 챌린지"],
+            "교육": ["진도 관리", "퀴즈/테스트", "1:1 튜터링", "학습 분석"],
+            "재테크": ["자산 관리", "투자 분석", "리스크 평가", "자동 리밸런싱"],
+            "반려동물": ["건강 기록", "예약 시스템", "커뮤니티", "위치 추적"],
+            "부동산": ["매물 검색", "시세 분석", "가상 투어", "계약 관리"],
+            "여행": ["일정 계획", "실시간 정보", "예약 통합", "여행 기록"],
+            "default": ["데이터 관리", "알림 시스템", "분석 대시보드", "사용자 맞춤화"]
+        }
+
+        # 조합 공간: 의미 차원(도메인 x IT 유형 x 대상 x 핵심 기능)의 곱집합
+        # 이름 패턴/접두어/수식어/버전 등 표기 요소는 뽑을 때마다 고름
+        self.combination_state_path = combination_state_path
+        self.combination_seed = combination_seed
+        self.combination_space = None
+        self._build_combination_table()
+
         # 추가: 마이크로 사업 아이디어 풀
         self.micro_business_ideas = [
             {
@@ -535,14 +582,85 @@ class RealisticBusinessGenerator:
             }
         ]
 
-    def generate_dynamic_combination_ideas(self, exclude_names=None):
-        """동적 조합으로 새로운 사업 아이디어 생성 (품질 향상 버전)"""
+    def _build_combination_table(self):
+        """의미 차원 테이블과 IT 유형별 이름 패턴/업종 구성 (혼합 기수 인덱스용)"""
+        feature_slots = min(len(features) for features in self.core_features_by_domain.values())
+        self._combination_dimensions = [
+            ("domain", self.business_domains),
+            ("it_type", self.it_types),
+            ("target", self.target_audiences),
+            ("feature_slot", list(range(feature_slots)))
+        ]
+        self.combination_size = 1
+        for _, options in self._combination_dimensions:
+            self.combination_size *= len(options)
+
+        # IT 유형별로 이름에 쓸 수 있는 업종과 패턴 (업종이 없는 패턴은 패턴 기본 유형에만 사용)
+        self._biz_types_by_it_type = {it_type: [] for it_type in self.it_types}
+        for biz_type in self.business_types:
+            self._biz_types_by_it_type[self._classify_it_type(biz_type)].append(biz_type)
+        self._name_patterns_by_it_type = {
+            it_type: [
+                template for template, pattern_it_type in self.name_patterns
+                if pattern_it_type == it_type or (pattern_it_type is None and self._biz_types_by_it_type[it_type])
+            ]
+            for it_type in self.it_types
+        }
+
+    def _decode_combination(self, index):
+        """조합 인덱스 -> 의미 차원 값 {domain, it_type, target, feature_slot}"""
+        values = {}
+        for field, options in reversed(self._combination_dimensions):
+            index, position = divmod(index, len(options))
+            values[field] = options[position]
+        return values
+
+    def _compose_name(self, values):
+        """의미 조합에 맞는 이름 (패턴/업종/접두어 등 표기 요소는 무작위)"""
+        it_type = values['it_type']
+        template = random.choice(self._name_patterns_by_it_type[it_type])
+        return template.format(
+            domain=values['domain'],
+            target=values['target'],
+            biz_type=random.choice(self._biz_types_by_it_type[it_type] or [""]),
+            prefix=random.choice(self.business_prefixes),
+            modifier=random.choice(self.name_modifiers),
+            version=random.choice(self.version_tags)
+        ).strip()
+
+    @staticmethod
+    def _classify_it_type(biz_type):
+        """업종 -> IT 사업 유형"""
+        if biz_type in ["플랫폼", "커뮤니티", "네트워크", "허브"]:
+            return "platform"
+        elif biz_type in ["마켓플레이스", "매칭", "중개"]:
+            return "marketplace"
+        elif biz_type in ["대행", "컨설팅", "코칭", "멘토링"]:
+            return "agency"
+        elif biz_type in ["도구", "봇", "트래커", "어시스턴트", "분석"]:
+            return "tools"
+        return "saas"
+
+    def get_combination_space(self):
+        """셔플된 조합 공간 (첫 사용 시 저장된 사용 위치 로드)"""
+        if self.combination_space is None:
+            state_path = self.combination_state_path or DiscoveryConfig.get_combination_state_path()
+            self.combination_space = CombinationSpace(
+                self.combination_size, state_path=state_path, seed=self.combination_seed
+            )
+        return self.combination_space
+
+    def generate_dynamic_combination_ideas(self, exclude_names=None, count=30):
+        """동적 조합으로 새로운 사업 아이디어 생성 (품질 향상 버전)
+
+        조합 공간을 시드 순열 순서로 소비하므로 이미 사용한 조합은 다시 나오지 않고,
+        exclude_names 크기와 무관하게 아이디어당 O(1)로 생성된다.
+        exclude_names는 `in` 검사만 하므로 set 또는 BusinessNameIndex 모두 가능 (변경하지 않음).
+        """
         if exclude_names is None:
             exclude_names = set()
 
         ideas = []
-        attempts = 0
-        max_attempts = 500
 
         # IT 사업 유형 정의 (카테고리화)
         it_business_types = {
@@ -583,18 +701,6 @@ class RealisticBusinessGenerator:
             }
         }
 
-        # 핵심 기능 템플릿
-        core_features_by_domain = {
-            "헬스케어": ["건강 기록 추적", "전문가 상담 연결", "맞춤 건강 리포트", "알림 시스템"],
-            "피트니스": ["운동 루틴 관리", "진행 상황 추적", "영상 가이드", "커뮤니티 챌린지"],
-            "교육": ["진도 관리", "퀴즈/테스트", "1:1 튜터링", "학습 분석"],
-            "재테크": ["자산 관리", "투자 분석", "리스크 평가", "자동 리밸런싱"],
-            "반려동물": ["건강 기록", "예약 시스템", "커뮤니티", "위치 추적"],
-            "부동산": ["매물 검색", "시세 분석", "가상 투어", "계약 관리"],
-            "여행": ["일정 계획", "실시간 정보", "예약 통합", "여행 기록"],
-            "default": ["데이터 관리", "알림 시스템", "분석 대시보드", "사용자 맞춤화"]
-        }
-
         # 차별화 포인트 템플릿
         differentiator_templates = [
             "기존 서비스 대비 {percent}% 저렴한 가격",
@@ -607,57 +713,35 @@ class RealisticBusinessGenerator:
             "모바일 앱 + 웹 동시 지원"
         ]
 
-        modifiers = ["", "스마트", "초고속", "맞춤", "프리미엄", "간편", "전문", "AI"]
-        version_tags = ["", " 2.0", " Pro", " Lite", " Plus"]
-
-        while len(ideas) < 30 and attempts < max_attempts:
-            attempts += 1
-
-            prefix = random.choice(self.business_prefixes)
-            domain = random.choice(self.business_domains)
-            biz_type = random.choice(self.business_types)
-            target = random.choice(self.target_audiences)
-            modifier = random.choice(modifiers)
-            version = random.choice(version_tags)
-
-            # IT 사업 유형 결정
-            if biz_type in ["플랫폼", "커뮤니티", "네트워크", "허브"]:
-                it_type = "platform"
-            elif biz_type in ["마켓플레이스", "매칭", "중개"]:
-                it_type = "marketplace"
-            elif biz_type in ["대행", "컨설팅", "코칭", "멘토링"]:
-                it_type = "agency"
-            elif biz_type in ["도구", "봇", "트래커", "어시스턴트", "분석"]:
-                it_type = "tools"
+        space = self.get_combination_space()
+        generated_names = set()
+
+        # 뽑을 때마다 조합 1개를 소비하므로 전체 조합 수만큼 뽑고도 못 채우면 중단 (모든 조합의 이름이 겹침)
+        for _ in range(space.size):
+            if len(ideas) >= count:
+                break
+
+            # 미사용 의미 조합 1개 (O(1)) - 이름이 겹치면 표기 요소만 바꿔 다시 고르고,
+            # 모두 겹치면 이미 쓰인 조합으로 보고 건너뜀 (커서는 뽑을 때 전진 - 워커 간 같은 조합 방지)
+            values = self._decode_combination(space.next_index())
+            for _ in range(self.NAME_ATTEMPTS):
+                name = self._compose_name(values)
+                if name not in exclude_names and name not in generated_names:
+                    break
             else:
-                it_type = "saas"
+                continue
+            generated_names.add(name)
 
+            domain = values['domain']
+            target = values['target']
+            it_type = values['it_type']
             it_info = it_business_types[it_type]
 
-            name_patterns = [
-                f"{prefix} {domain} {biz_type}",
-                f"{target} 전용 {domain} {biz_type}",
-                f"{prefix} {target} {domain} 앱",
-                f"{domain} {biz_type} for {target}",
-                f"{prefix} {domain} 자동화",
-                f"{target} {domain} 매칭 서비스",
-                f"{modifier} {domain} {biz_type}",
-                f"{prefix} {modifier} {domain} 서비스",
-                f"{target} {domain} 솔루션{version}",
-                f"{domain} AI {biz_type}",
-                f"올인원 {domain} {biz_type}",
-                f"넥스트젠 {domain} for {target}"
-            ]
-
-            name = random.choice(name_patterns).strip()
-
-            if name in exclude_names:
-                continue
-            exclude_names.add(name)
-
-            # 핵심 기능 선택
-            domain_key = domain if domain in core_features_by_domain else "default"
-            core_features = random.sample(core_features_by_domain[domain_key], min(3, len(core_features_by_domain[domain_key])))
+            # 핵심 기능 선택 (조합의 기능을 첫 번째로)
+            domain_features = self.core_features_by_domain.get(domain, self.core_features_by_domain["default"])
+            lead_feature = domain_features[values['feature_slot']]
+            others = [feature for feature in domain_features if feature != lead_feature]
+            core_features = [lead_feature] + random.sample(others, min(2, len(others)))
 
             # 차별화 포인트 생성
             diff_template = random.choice(differentiator_templates)
@@ -826,9 +910,8 @@ class RealisticBusinessGenerator:
                 "priority": "높음"
             })
 
-        # 동적 조합 아이디어 - exclude_names + added_names 모두 제외
-        all_exclude = added_names.union(exclude_names)
-        dynamic_ideas = self.generate_dynamic_combination_ideas(exclude_names=all_exclude)
+        # 동적 조합 아이디어 - exclude_names는 복사 없이 전달, added_names는 add_if_not_duplicate에서 제외
+        dynamic_ideas = self.generate_dynamic_combination_ideas(exclude_names=exclude_names)
         for idea in dynamic_ideas:
             add_if_not_duplicate(idea)
 
@@ -0,0 +1,234 @@
+"""
+스크래퍼 응답 캐시 모듈
+- URL + 정규화된 파라미터 기반 키
+- 소스별 TTL, LRU 크기 제한 (SQLite 디스크 저장)
+- 적중/미스 통계 및 캐시 우회 플래그
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from config import CacheConfig
+from http_client import http_get
+from rate_limiter import get_rate_limiter
+
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """URL 정규화 (스킴/호스트 소문자, 쿼리 파라미터 정렬 및 병합)"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), str(v)) for k, v in params.items() if v is not None)
+    query.sort()
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or '/',
+        urlencode(query),
+        ''
+    ))
+
+
+def make_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """캐시 키 생성"""
+    return hashlib.sha256(normalize_url(url, params).encode('utf-8')).hexdigest()
+
+
+class CachedResponse:
+    """캐시된 HTTP 응답 (requests.Response 호환 최소 인터페이스)"""
+
+    def __init__(self, url: str, status_code: int, content: bytes,
+                 encoding: Optional[str] = None, from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.text)
+
+    @classmethod
+    def from_response(cls, response) -> 'CachedResponse':
+        encoding = response.encoding or getattr(response, 'apparent_encoding', None)
+        return cls(response.url, response.status_code, response.content, encoding)
+
+
+class ResponseCache:
+    """디스크 기반 TTL + LRU 응답 캐시"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None,
+                 bypass: Optional[bool] = None):
+        self.path = path or CacheConfig.get_path()
+        self.max_entries = max_entries if max_entries is not None else CacheConfig.get_max_entries()
+        self.bypass = CacheConfig.is_bypassed() if bypass is None else bypass
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS response_cache (
+                cache_key TEXT PRIMARY KEY,
+                source TEXT,
+                url TEXT,
+                status_code INTEGER,
+                encoding TEXT,
+                content BLOB,
+                expires_at REAL,
+                last_access REAL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_response_cache_access ON response_cache(last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[CachedResponse]:
+        """캐시 조회 (만료 항목은 삭제 후 None)"""
+        if self.bypass:
+            return None
+
+        key = make_cache_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, encoding, content, expires_at, last_access FROM response_cache "
+                "WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or row[4] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM response_cache WHERE cache_key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            # LRU 갱신은 TOUCH_INTERVAL마다 한 번만 (적중마다 쓰기/커밋하지 않음)
+            if now - (row[5] or 0) >= CacheConfig.TOUCH_INTERVAL:
+                self._conn.execute(
+                    "UPDATE response_cache SET last_access = ? WHERE cache_key = ?", (now, key)
+                )
+                self._conn.commit()
+            self.hits += 1
+
+        return CachedResponse(row[0], row[1], row[3], row[2], from_cache=True)
+
+    def set(self, url: str, response: CachedResponse, source: str = 'default',
+            params: Optional[Dict[str, Any]] = None, ttl: Optional[int] = None):
+        """응답 저장 후 LRU 상한 초과분 제거"""
+        if self.bypass:
+            return
+
+        ttl = CacheConfig.get_ttl(source) if ttl is None else ttl
+        key = make_cache_key(url, params)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO response_cache
+                   (cache_key, source, url, status_code, encoding, content, expires_at, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key, source, response.url, response.status_code, response.encoding,
+                 response.content, now + ttl, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """최근 사용이 가장 오래된 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        count = self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                """DELETE FROM response_cache WHERE cache_key IN (
+                       SELECT cache_key FROM response_cache ORDER BY last_access ASC LIMIT ?
+                   )""",
+                (overflow,)
+            )
+
+    def clear(self, source: Optional[str] = None):
+        """캐시 삭제 (source 지정 시 해당 소스만)"""
+        with self._lock:
+            if source:
+                self._conn.execute("DELETE FROM response_cache WHERE source = ?", (source,))
+            else:
+                self._conn.execute("DELETE FROM response_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total * 100, 1) if total else 0,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'bypass': self.bypass
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================
+# 싱글톤 인스턴스
+# ============================================
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """응답 캐시 싱글톤"""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
+
+
+def cached_get(url: str, source: str = 'default', params: Optional[Dict[str, Any]] = None,
+               bypass: bool = False, ttl: Optional[int] = None, **kwargs):
+    """캐시 우선 GET 요청
+
+    캐시 미스 시 도메인 토큰을 얻어 네트워크 호출 후 200 응답만 저장한다.
+    bypass=True면 캐시를 읽지 않고 새로 받아 저장한다.
+    """
+    try:
+        cache = get_response_cache()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"응답 캐시 사용 불가, 직접 요청: {e}")
+        cache = None
+
+    if cache is not None and not bypass:
+        cached = cache.get(url, params)
+        if cached is not None:
+            return cached
+
+    get_rate_limiter().acquire(url)
+    response = CachedResponse.from_response(http_get(url, params=params, **kwargs))
+    if cache is not None and response.status_code == 200:
+        cache.set(url, response, source=source, params=params, ttl=ttl)
+    return response
@@ -7,9 +7,39 @@
 """
 
 from datetime import datetime, timedelta
+import contextlib
+import io
 import json
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
 class RevenueValidator:
+    # 호스팅 등급 (고객 수 상한 미만, 등급) - 마지막 등급은 상한 없음
+    HOSTING_TIERS = [(100, 'cloud_small'), (1000, 'cloud_medium'), (None, 'cloud_large')]
+    SUPPORT_COST_PER_CUSTOMER = 1000  # 고객당 월 지원 비용
+
+    # 몬테카를로 기본 분포 (triangular: 최소, 최빈, 최대 또는 고정값 / lognormal: 시그마)
+    MONTE_CARLO_DISTRIBUTIONS = {
+        'conversion_rate': (0.01, 0.03, 0.05),   # 기존 보수적/현실적/낙관적 전환율
+        'price_sigma': 0.15,                     # 실제 판매가 변동 (할인, 요금제 믹스)
+        'churn_rate': (0.02, 0.05, 0.12),        # 월 이탈률
+        'monthly_cost_factor': (0.9, 1.0, 1.3),  # 월 비용 초과 가능성 (우측 꼬리)
+        'startup_cost_factor': (0.9, 1.0, 1.5)   # 초기 비용 초과 가능성
+    }
+    MONTE_CARLO_PERCENTILES = (5, 25, 50, 75, 95)
+
+    # 시나리오별 전환율 가정
+    SCENARIO_CONVERSION_RATES = {
+        'conservative': 0.01,  # 1%
+        'realistic': 0.03,     # 3%
+        'optimistic': 0.05     # 5%
+    }
+
     def __init__(self):
         # IT 사업 표준 비용
         self.standard_costs = {
@@ -117,12 +147,10 @@ class RevenueValidator:
         }
 
         # 호스팅 (고객 수에 따라 증가)
-        if customer_count < 100:
-            costs['hosting'] = self.standard_costs['hosting']['cloud_small']
-        elif customer_count < 1000:
-            costs['hosting'] = self.standard_costs['hosting']['cloud_medium']
-        else:
-            costs['hosting'] = self.standard_costs['hosting']['cloud_large']
+        for limit, tier in self.HOSTING_TIERS:
+            if limit is None or customer_count < limit:
+                costs['hosting'] = self.standard_costs['hosting'][tier]
+                break
 
         # SaaS 도구
         if scale == 'small':
@@ -139,7 +167,7 @@ class RevenueValidator:
             costs['marketing'] = 300000 if scale == 'small' else 1000000
 
         # 고객 지원
-        costs['support'] = customer_count * 1000  # 고객당 월 1000원
+        costs['support'] = customer_count * self.SUPPORT_COST_PER_CUSTOMER
 
         costs['total'] = sum(costs.values())
         return costs
@@ -153,11 +181,7 @@ class RevenueValidator:
         }
 
         # 전환율 가정
-        conversion_rates = {
-            'conservative': 0.01,  # 1%
-            'realistic': 0.03,     # 3%
-            'optimistic': 0.05     # 5%
-        }
+        conversion_rates = self.SCENARIO_CONVERSION_RATES
 
         for scenario, conversion_rate in conversion_rates.items():
             monthly_customers = int(target_market_size * conversion_rate)
@@ -189,6 +213,105 @@ class RevenueValidator:
 
         return scenarios
 
+    def _monthly_revenue_array(self, business_model, pricing, customers, price_factor):
+        """simulate_revenue의 모델별 월 매출 식을 배열에 적용"""
+        if business_model == 'subscription':
+            return customers * pricing['monthly'] * price_factor
+        elif business_model == 'one_time':
+            return customers * pricing['one_time'] * price_factor
+        elif business_model == 'commission':
+            transactions_per_customer = pricing.get('transactions_per_month', 5)
+            return (customers * transactions_per_customer * pricing['avg_transaction']
+                    * price_factor * pricing['commission_rate'])
+        return np.zeros_like(customers, dtype=float)
+
+    def _monthly_costs_array(self, business_type, scale, customers):
+        """calculate_monthly_costs를 고객 수 배열에 적용 (고정비 + 호스팅 등급 + 고객 지원)"""
+        fixed = self.calculate_monthly_costs(business_type, scale, 0)
+        base = fixed['total'] - fixed['hosting'] - fixed['support']
+
+        conditions, choices = [], []
+        for limit, tier in self.HOSTING_TIERS:
+            if limit is not None:
+                conditions.append(customers < limit)
+                choices.append(self.standard_costs['hosting'][tier])
+        hosting = np.select(conditions, choices, default=self.standard_costs['hosting'][self.HOSTING_TIERS[-1][1]])
+
+        return base + hosting + customers * self.SUPPORT_COST_PER_CUSTOMER
+
+    @staticmethod
+    def _break_even_months_array(startup_costs, monthly_costs, monthly_revenue):
+        """calculate_break_even의 개월 수를 배열에 적용 (불가능하면 inf)"""
+        monthly_profit = monthly_revenue - monthly_costs
+        with np.errstate(divide='ignore', invalid='ignore'):
+            months = startup_costs / monthly_profit
+        return np.where(monthly_profit > 0, months, np.inf)
+
+    @staticmethod
+    def _sample_triangular(rng, spec, size):
+        """(최소, 최빈, 최대) 삼각분포 샘플 (숫자 하나면 고정값)"""
+        if isinstance(spec, (int, float)):
+            return np.full(size, float(spec))
+        return rng.triangular(*spec, size=size)
+
+    def _percentile_band(self, values, percentiles):
+        """백분위 구간 (무한대는 None)"""
+        with np.errstate(invalid='ignore'):
+            points = np.percentile(values, percentiles)
+        band = {}
+        for p, value in zip(percentiles, points):
+            band[f'p{p}'] = round(float(value), 1) if np.isfinite(value) else None
+        finite = values[np.isfinite(values)]
+        band['mean'] = round(float(finite.mean()), 1) if finite.size else None
+        return band
+
+    def simulate_revenue_monte_carlo(self, business_type, business_model, pricing, target_market_size,
+                                     scale='small', samples=20000, seed=None, distributions=None,
+                                     percentiles=None):
+        """몬테카를로 매출/손익 시뮬레이션 (NumPy 벡터화)
+
+        전환율, 판매가, 이탈률, 비용 초과율을 샘플링해 월 매출/월 순이익/
+        손익분기 개월/ROI의 백분위 구간을 반환한다. numpy 미설치 시 None.
+        """
+        if not NUMPY_AVAILABLE:
+            print("[WARN] numpy 미설치 - 몬테카를로 시뮬레이션 생략")
+            return None
+
+        dist = dict(self.MONTE_CARLO_DISTRIBUTIONS)
+        dist.update(distributions or {})
+        percentiles = percentiles or self.MONTE_CARLO_PERCENTILES
+        rng = np.random.default_rng(seed)
+
+        conversion = self._sample_triangular(rng, dist['conversion_rate'], samples)
+        price_factor = rng.lognormal(mean=0.0, sigma=dist['price_sigma'], size=samples)
+        churn = self._sample_triangular(rng, dist['churn_rate'], samples)
+        monthly_cost_factor = self._sample_triangular(rng, dist['monthly_cost_factor'], samples)
+        startup_cost_factor = self._sample_triangular(rng, dist['startup_cost_factor'], samples)
+
+        # 전환 고객 중 이탈 후 남는 유료 고객 (simulate_revenue와 같이 정수 고객 수)
+        customers = np.floor(np.floor(target_market_size * conversion) * (1 - churn))
+
+        monthly_revenue = self._monthly_revenue_array(business_model, pricing, customers, price_factor)
+        monthly_costs = self._monthly_costs_array(business_type, scale, customers) * monthly_cost_factor
+        startup_costs = self.calculate_startup_costs(business_type, scale)['total'] * startup_cost_factor
+
+        monthly_profit = monthly_revenue - monthly_costs
+        break_even_months = self._break_even_months_array(startup_costs, monthly_costs, monthly_revenue)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roi = np.where(startup_costs > 0, monthly_profit * 12 / startup_costs * 100, 0.0)
+
+        return {
+            'samples': samples,
+            'monthly_customers': self._percentile_band(customers, percentiles),
+            'monthly_revenue': self._percentile_band(monthly_revenue, percentiles),
+            'monthly_profit': self._percentile_band(monthly_profit, percentiles),
+            'break_even_months': self._percentile_band(break_even_months, percentiles),
+            'roi_percentage': self._percentile_band(roi, percentiles),
+            'probability_of_profit': round(float((monthly_profit > 0).mean()), 3),
+            'probability_break_even_12m': round(float((break_even_months <= 12).mean()), 3),
+            'assumptions': {key: list(value) if isinstance(value, tuple) else value for key, value in dist.items()}
+        }
+
     def calculate_break_even(self, startup_costs, monthly_costs, monthly_revenue):
         """손익분기점 계산"""
         if monthly_revenue <= monthly_costs:
@@ -233,8 +356,11 @@ class RevenueValidator:
         else:
             return '미흡'
 
-    def comprehensive_validation(self, business_config):
-        """종합 수익성 검증"""
+    def comprehensive_validation(self, business_config, monte_carlo_samples=0, seed=None):
+        """종합 수익성 검증
+
+        monte_carlo_samples > 0이면 몬테카를로 백분위 구간을 'monte_carlo'에 추가한다.
+        """
         print(f"\n{'='*60}")
         print(f"수익성 검증: {business_config['name']}")
         print(f"{'='*60}\n")
@@ -325,7 +451,7 @@ class RevenueValidator:
         print(f"   권장사항: {verdict['recommendation']}")
         print(f"\n{'='*60}\n")
 
-        return {
+        validation = {
             'business_name': business_config['name'],
             'startup_costs': startup_costs_detail,
             'scenarios': results,
@@ -333,6 +459,147 @@ class RevenueValidator:
             'analysis_date': datetime.now().isoformat()
         }
 
+        if monte_carlo_samples:
+            validation['monte_carlo'] = self.simulate_revenue_monte_carlo(
+                business_config['type'],
+                business_config['revenue_model'],
+                business_config['pricing'],
+                business_config['target_market_size'],
+                scale=business_config.get('scale', 'small'),
+                samples=monte_carlo_samples,
+                seed=seed
+            )
+
+        return validation
+
+    def comprehensive_validation_batch(self, business_configs):
+        """여러 사업 설정 일괄 검증 (comprehensive_validation과 같은 결과, 출력 없음)
+
+        (business_type, scale) 그룹별로 초기/월 비용 테이블을 한 번만 계산하고
+        시나리오 매출, 손익분기, ROI는 그룹 내 (설정 x 시나리오) 배열로 계산한다.
+        초기 비용이 0인 설정은 단일 호출이 ZeroDivisionError를 내므로 'error' 결과로 반환.
+        numpy 미설치 시 단일 호출을 반복한다.
+        """
+        if not NUMPY_AVAILABLE:
+            return [self._validate_quietly(config) for config in business_configs]
+
+        results = [None] * len(business_configs)
+        groups = {}
+        for index, config in enumerate(business_configs):
+            groups.setdefault((config['type'], config.get('scale', 'small')), []).append(index)
+
+        scenario_names = list(self.SCENARIO_CONVERSION_RATES)
+        conversion_rates = np.array([self.SCENARIO_CONVERSION_RATES[name] for name in scenario_names])
+        analysis_date = datetime.now().isoformat()
+
+        for (business_type, scale), indices in groups.items():
+            startup_costs_detail = self.calculate_startup_costs(business_type, scale)
+            startup_costs = startup_costs_detail['total']
+            if startup_costs == 0:
+                for index in indices:
+                    results[index] = {
+                        'business_name': business_configs[index]['name'],
+                        'startup_costs': dict(startup_costs_detail),
+                        'error': '초기 비용이 0인 사업 유형 (ROI 계산 불가)'
+                    }
+                continue
+
+            configs = [business_configs[index] for index in indices]
+            # 설정별 매출 계수: 고객 x 거래수 x 단가 x 수수료율 (simulate_revenue와 같은 곱셈 순서)
+            market_size = np.array([c['target_market_size'] for c in configs], dtype=float)
+            transactions, unit_price, rate = (np.array(column, dtype=float) for column in zip(
+                *(self._revenue_terms(c['revenue_model'], c['pricing']) for c in configs)
+            ))
+
+            customers = np.trunc(market_size[:, None] * conversion_rates[None, :])
+            raw_revenue = customers * transactions[:, None] * unit_price[:, None] * rate[:, None]
+            monthly_revenue = np.trunc(raw_revenue)
+            annual_revenue = np.trunc(raw_revenue * 12)
+
+            monthly_costs = self._monthly_costs_array(business_type, scale, customers)
+            monthly_profit = monthly_revenue - monthly_costs
+            break_even_months = self._break_even_months_array(startup_costs, monthly_costs, monthly_revenue)
+            annual_costs = monthly_costs * 12
+            annual_profit = annual_revenue - annual_costs
+            roi_percentage = (annual_profit / startup_costs) * 100
+
+            for row, index in enumerate(indices):
+                scenarios = {}
+                for col, scenario_name in enumerate(scenario_names):
+                    scenarios[scenario_name] = {
+                        'customers': int(customers[row, col]),
+                        'monthly_revenue': int(monthly_revenue[row, col]),
+                        'monthly_costs': int(monthly_costs[row, col]),
+                        'monthly_profit': int(monthly_profit[row, col]),
+                        'annual_revenue': int(annual_revenue[row, col]),
+                        'annual_costs': int(annual_costs[row, col]),
+                        'break_even': self._break_even_result(
+                            float(break_even_months[row, col]), float(monthly_profit[row, col])
+                        ),
+                        'roi': self._roi_result(
+                            startup_costs, float(annual_profit[row, col]), float(roi_percentage[row, col])
+                        )
+                    }
+                results[index] = {
+                    'business_name': business_configs[index]['name'],
+                    'startup_costs': dict(startup_costs_detail),
+                    'scenarios': scenarios,
+                    'verdict': self._generate_verdict(scenarios['realistic']),
+                    'analysis_date': analysis_date
+                }
+
+        return results
+
+    def _validate_quietly(self, business_config):
+        """출력 없이 단일 검증 (초기 비용 0이면 'error' 결과)"""
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                return self.comprehensive_validation(business_config)
+        except ZeroDivisionError:
+            return {
+                'business_name': business_config['name'],
+                'startup_costs': self.calculate_startup_costs(
+                    business_config['type'], business_config.get('scale', 'small')
+                ),
+                'error': '초기 비용이 0인 사업 유형 (ROI 계산 불가)'
+            }
+
+    @staticmethod
+    def _revenue_terms(business_model, pricing):
+        """월 매출 = 고객 x 거래수 x 단가 x 수수료율 계수 (모델별)"""
+        if business_model == 'subscription':
+            return 1, pricing['monthly'], 1
+        elif business_model == 'one_time':
+            return 1, pricing['one_time'], 1
+        elif business_model == 'commission':
+            return pricing.get('transactions_per_month', 5), pricing['avg_transaction'], pricing['commission_rate']
+        raise ValueError(f"지원하지 않는 수익 모델: {business_model}")
+
+    @staticmethod
+    def _break_even_result(months, monthly_profit):
+        """calculate_break_even과 같은 형식 (개월 수는 미리 계산된 값)"""
+        if months == float('inf'):
+            return {
+                'break_even_possible': False,
+                'message': '월 매출이 월 비용보다 낮음. 가격이나 고객 수 조정 필요'
+            }
+        return {
+            'break_even_possible': True,
+            'months': round(months, 1),
+            'date': (datetime.now() + timedelta(days=30 * months)).strftime('%Y-%m-%d'),
+            'monthly_profit': int(monthly_profit),
+            'annual_profit': int(monthly_profit * 12)
+        }
+
+    def _roi_result(self, startup_costs, annual_profit, roi_percentage):
+        """calculate_roi와 같은 형식 (ROI는 미리 계산된 값)"""
+        return {
+            'annual_profit': int(annual_profit),
+            'roi_percentage': round(roi_percentage, 2),
+            'payback_period_years': round(startup_costs / annual_profit, 2) if annual_profit > 0 else None,
+            'rating': self._rate_roi(roi_percentage)
+        }
+
     def _generate_verdict(self, realistic_scenario):
         """최종 판정"""
         roi = realistic_scenario['roi']['roi_percentage']
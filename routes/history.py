@@ -3,6 +3,10 @@ from datetime import datetime, timedelta
 from sqlalchemy import func, cast, Date, Integer
 
 from services.db import Session
+from services.pagination import keyset_page
+from services.projection import history_summary, parse_include
+from database_setup import get_kst_now
+from discovery_stats import get_discovery_stats
 from business_discovery_history import (
     BusinessDiscoveryHistory, BusinessAnalysisSnapshot,
     BusinessInsight, BusinessHistoryTracker, LowScoreBusiness
@@ -17,9 +21,17 @@ def api_business_history_stats():
     session = Session()
     try:
         days = int(request.args.get('days', 7))
-        tracker = BusinessHistoryTracker()
-        stats = tracker.get_history_stats(days=days)
-        return jsonify(stats)
+        stats = get_discovery_stats().get(session, days=days)
+        return jsonify({
+            'total_analyzed': stats['window_analyzed'],
+            'total_saved': stats['window_saved'],
+            'avg_score': stats['window_avg_score'],
+            'categories': stats['window_categories'],
+            'date_range': {
+                'start': stats['window_start'].strftime('%Y-%m-%d'),
+                'end': get_kst_now().strftime('%Y-%m-%d')
+            }
+        })
     finally:
         session.close()
 
@@ -45,7 +57,8 @@ def api_business_history_list():
         else:
             start_date = None
 
-        query = session.query(BusinessDiscoveryHistory)
+        include = parse_include(request.args.get('include'))
+        query = session.query(BusinessDiscoveryHistory).options(history_summary(*include))
 
         if start_date:
             query = query.filter(BusinessDiscoveryHistory.discovered_at >= start_date)
@@ -71,11 +84,14 @@ def api_business_history_list():
         if search:
             query = query.filter(BusinessDiscoveryHistory.business_name.ilike(f'%{search}%'))
 
-        histories = query.order_by(BusinessDiscoveryHistory.discovered_at.desc()).limit(limit).all()
+        histories, next_cursor = keyset_page(
+            query, BusinessDiscoveryHistory.discovered_at, BusinessDiscoveryHistory.id,
+            cursor=request.args.get('cursor'), limit=limit
+        )
 
         result = []
         for h in histories:
-            result.append({
+            item = {
                 'id': h.id,
                 'discovered_at': h.discovered_at.isoformat() if h.discovered_at else None,
                 'business_name': h.business_name,
@@ -88,9 +104,18 @@ def api_business_history_list():
                 'saved_to_db': h.saved_to_db,
                 'discovery_batch': h.discovery_batch,
                 'analysis_duration_ms': h.analysis_duration_ms
-            })
-
-        return jsonify(result)
+            }
+            for name in include:
+                item[name] = getattr(h, name)
+            result.append(item)
+
+        # 응답 본문(배열) 호환을 위해 다음 페이지 커서는 헤더로 전달
+        response = jsonify(result)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     finally:
         session.close()
 
@@ -139,14 +164,16 @@ def api_business_history_categories():
         days = int(request.args.get('days', 7))
         start_date = datetime.utcnow() - timedelta(days=days)
 
-        histories = session.query(BusinessDiscoveryHistory).filter(
+        rows = session.query(
+            BusinessDiscoveryHistory.category, func.count(BusinessDiscoveryHistory.id)
+        ).filter(
             BusinessDiscoveryHistory.discovered_at >= start_date
-        ).all()
+        ).group_by(BusinessDiscoveryHistory.category).all()
 
         categories = {}
-        for h in histories:
-            cat = h.category or 'Unknown'
-            categories[cat] = categories.get(cat, 0) + 1
+        for category, count in rows:
+            cat = category or 'Unknown'
+            categories[cat] = categories.get(cat, 0) + count
 
         return jsonify(categories)
     finally:
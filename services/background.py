@@ -48,16 +48,23 @@ def background_meeting_generator():
 
 
 def background_business_discovery():
-    """백그라운드에서 8시간마다 사업 발굴 (설정 기반 스케줄)"""
+    """백그라운드 사업 발굴 큐 워커 (설정 기반 스케줄)
+
+    예정 시각에는 배치 요청만 등록하고 (배치 ID당 1회, 여러 인스턴스여도 중복 없음),
+    분석은 DB 작업 큐에서 점유해 처리한다. 재시작 시 중단된 배치를 이어서 처리한다.
+    """
     from continuous_business_discovery import ContinuousBusinessDiscovery
+    from discovery_queue import DiscoveryJobQueue
+    from database_setup import get_kst_now
     from services.db import engine
 
     scheduled_hours = DiscoveryConfig.get_schedule_hours()
+    poll_seconds = DiscoveryConfig.get_queue_poll_seconds()
 
-    logging.info(f"[BACKGROUND] Starting business discovery (schedule: {scheduled_hours})...")
-    print(f"[BACKGROUND] Starting business discovery (schedule: {scheduled_hours})...")
+    logging.info(f"[BACKGROUND] Starting business discovery worker (schedule: {scheduled_hours})...")
+    print(f"[BACKGROUND] Starting business discovery worker (schedule: {scheduled_hours})...")
 
-    discovery = None
+    queue = DiscoveryJobQueue()
     last_run_hour = -1
     error_count = 0
 
@@ -68,50 +75,60 @@ def background_business_discovery():
             current_minute = now.minute
 
             if current_hour in scheduled_hours and current_minute <= 2 and current_hour != last_run_hour:
-                logging.info(f"[DISCOVERY] Running scheduled discovery at {now}")
-                print(f"\n" + "="*80)
-                print(f"[DISCOVERY] Running discovery at {now.strftime('%Y-%m-%d %H:%M:%S')}")
-                print("="*80)
-
-                try:
-                    discovery = ContinuousBusinessDiscovery()
-                    results = discovery.run_hourly_discovery()
-
-                    logging.info(f"[DISCOVERY] Results: analyzed={results.get('analyzed', 0)}, saved={results.get('saved', 0)}")
-                    print(f"\n[RESULTS] Analyzed: {results.get('analyzed', 0)}, Saved: {results.get('saved', 0)}")
-
-                    if results['saved'] > 0:
-                        discovery.generate_discovery_meeting(results)
-
-                    error_count = 0
-                except Exception as inner_e:
-                    print(f"[DISCOVERY] Inner error: {inner_e}")
-                    error_count += 1
-                    try:
-                        engine.dispose()
-                    except:
-                        pass
-
+                batch = get_kst_now().strftime('%Y-%m-%d-%H')
+                created = queue.request_batch(batch)
+                logging.info(f"[DISCOVERY] Scheduled batch {batch} requested (new={created})")
+                print(f"[DISCOVERY] Batch {batch} requested at {now.strftime('%Y-%m-%d %H:%M:%S')} (new={created})")
                 last_run_hour = current_hour
 
                 next_hours = [h for h in scheduled_hours if h > current_hour]
                 next_hour = next_hours[0] if next_hours else scheduled_hours[0]
                 print(f"[NEXT] Next discovery at {next_hour:02d}:00")
-                print("="*80 + "\n")
 
-                time.sleep(180)
-            else:
-                time.sleep(30)
+            # 발굴 시스템은 작업을 실제로 점유했거나 배치 요청/후처리가 남았을 때만 생성
+            jobs = queue.claim_many(DiscoveryConfig.get_queue_claim_size())
+            if jobs or queue.has_work():
+                discovery = ContinuousBusinessDiscovery(job_queue=queue)
+                try:
+                    for results in discovery.work_queue(claimed=jobs):
+                        logging.info(f"[DISCOVERY] Batch {results['batch_id']}: analyzed={results['analyzed']}, saved={results['saved']}")
+                        print(f"\n[RESULTS] Batch {results['batch_id']} - Analyzed: {results['analyzed']}, Saved: {results['saved']}")
+                finally:
+                    discovery.close()
+
+            error_count = 0
+            time.sleep(poll_seconds)
 
         except Exception as e:
             logging.error(f"Discovery error: {e}")
             print(f"\n[ERROR] Discovery error: {e}\n")
             error_count += 1
+            try:
+                engine.dispose()
+            except Exception:
+                pass
             wait_time = min(300, 60 * error_count)
             print(f"[WAIT] Waiting {wait_time}s before retry (error count: {error_count})")
             time.sleep(wait_time)
 
 
+def background_view_backfill():
+    """사업 목록 파생 뷰 백필 (뷰가 없거나 생성 로직 버전이 바뀐 행만, 시작 시 1회)"""
+    from business_views import backfill_business_views, VIEW_VERSION
+    from services.db import Session
+
+    session = Session()
+    try:
+        count = backfill_business_views(session)
+        logging.info(f"[BACKGROUND] Derived view backfill done: {count} rows (v{VIEW_VERSION})")
+    except Exception as e:
+        session.rollback()
+        logging.error(f"Derived view backfill error: {e}")
+        print(f"[BACKGROUND] Derived view backfill error: {e}")
+    finally:
+        session.close()
+
+
 def start_background_threads():
     """백그라운드 스레드 시작"""
     print("[STARTUP] Waiting 30 seconds...")
@@ -126,6 +143,10 @@ def start_background_threads():
     meeting_thread.start()
     print("[STARTUP] Background meeting generator started")
 
+    view_thread = Thread(target=background_view_backfill, daemon=True)
+    view_thread.start()
+    print("[STARTUP] Background derived view backfill started")
+
     discovery_thread = Thread(target=background_business_discovery, daemon=True)
     discovery_thread.start()
     schedule = DiscoveryConfig.get_schedule_hours()
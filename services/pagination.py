@@ -0,0 +1,52 @@
+"""
+키셋(커서) 페이지네이션 헬퍼
+- (정렬 시각, id) 내림차순으로 커서 이후 행만 인덱스 범위 스캔 (깊은 페이지도 OFFSET 없이 같은 비용)
+- next_cursor는 페이지 마지막 행의 (시각, id)를 담은 불투명 토큰
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(sort_value, row_id):
+    """(시각, id) -> URL 안전 토큰"""
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """토큰 -> (시각, id), 잘못된 토큰은 ValueError"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid cursor: {token}") from e
+
+
+def keyset_page(query, sort_column, id_column, cursor=None, limit=20, offset=0):
+    """최신순 페이지 조회 -> (행 목록, next_cursor)
+
+    cursor가 있으면 그 이후 행부터, 없으면 기존 page 파라미터 호환을 위해 offset부터 조회한다.
+    행은 ORM 객체나 컬럼 Row 모두 가능 (정렬/id 컬럼 이름으로 값을 읽음).
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, id_column < row_id)
+        ))
+    query = query.order_by(sort_column.desc(), id_column.desc())
+    if offset and not cursor:
+        query = query.offset(offset)
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
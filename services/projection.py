@@ -0,0 +1,35 @@
+"""
+목록 API 컬럼 프로젝션
+- 목록은 스칼라 요약 컬럼만 로드 (대용량 JSON 컬럼 제외)
+- JSON 컬럼은 include 파라미터로 명시 요청한 것만 로드
+"""
+
+from sqlalchemy.orm import load_only
+
+from business_discovery_history import BusinessDiscoveryHistory
+
+
+# 목록 응답에 쓰이는 스칼라 컬럼
+HISTORY_SUMMARY_COLUMNS = (
+    'id', 'discovered_at', 'business_name', 'business_type', 'category', 'keyword',
+    'total_score', 'market_score', 'revenue_score', 'saved_to_db', 'discovery_batch',
+    'analysis_duration_ms',
+)
+
+# 상세 API 또는 include 요청 시에만 로드하는 JSON 컬럼
+HISTORY_JSON_COLUMNS = ('market_analysis', 'revenue_analysis', 'action_plan', 'full_analysis')
+
+
+def parse_include(value, allowed=HISTORY_JSON_COLUMNS):
+    """include 파라미터('market_analysis,full_analysis' 또는 'all') -> 허용된 JSON 컬럼 (정의 순서)"""
+    names = {name.strip() for name in (value or '').split(',') if name.strip()}
+    if 'all' in names:
+        return tuple(allowed)
+    return tuple(name for name in allowed if name in names)
+
+
+def history_summary(*json_columns):
+    """요약 컬럼 + 지정한 JSON 컬럼만 로드하는 쿼리 옵션"""
+    return load_only(*(
+        getattr(BusinessDiscoveryHistory, name) for name in HISTORY_SUMMARY_COLUMNS + tuple(json_columns)
+    ))
@@ -16,9 +16,12 @@ from action_plan_generator import ActionPlanGenerator
 from realistic_business_generator import RealisticBusinessGenerator
 from lightweight_market_analyzer import LightweightMarketAnalyzer
 from market_config import MarketConfig
+from config import DiscoveryConfig
+from keyword_market_analysis import get_keyword_analysis_store
 
 import json
 import random
+import threading
 from datetime import datetime
 import time
 
@@ -40,6 +43,11 @@ class SmartBusinessSystem:
         self.revenue_validator = RevenueValidator()
         self.action_planner = ActionPlanGenerator()
         self.idea_generator = RealisticBusinessGenerator()
+        self.keyword_store = get_keyword_analysis_store()
+
+        # 단계별 처리/탈락 카운터 (quick_score -> 시장/수익 분석 -> 실행 계획)
+        self._counter_lock = threading.Lock()
+        self.reset_stage_counters()
 
         # Windows 콘솔 호환성을 위해 이모지 제거
         print("="*80)
@@ -53,18 +61,106 @@ class SmartBusinessSystem:
             print("전환 방법: 환경변수 MARKET_ANALYSIS_MODE=lightweight 설정 (또는 삭제)")
         print("시장 분석 -> 수익성 검증 -> 실행 계획 자동 생성\n")
 
-    def analyze_business_idea(self, business_idea, keyword, business_config):
-        """단일 사업 아이디어 종합 분석 (경량 모드 지원)"""
+    def reset_stage_counters(self):
+        """단계별 카운터 초기화"""
+        with self._counter_lock:
+            self.stage_counters = {
+                'quick_score': {'evaluated': 0, 'pruned': 0},
+                'market_analysis': {'evaluated': 0, 'pruned': 0, 'duration_ms': 0},
+                'action_plan': {'evaluated': 0}
+            }
+
+    def get_stage_counters(self):
+        """단계별 카운터 사본"""
+        with self._counter_lock:
+            return {stage: dict(counts) for stage, counts in self.stage_counters.items()}
+
+    def _count_stage(self, stage, **increments):
+        with self._counter_lock:
+            for key, value in increments.items():
+                self.stage_counters[stage][key] += value
+
+    def quick_gate(self, candidates, top_k=None, margin=None, min_score=None):
+        """1단계: quick_score로 후보를 선별 (전체 분석 전 저비용 게이트)
+
+        quick_score >= min_score - margin 인 후보 중 점수 상위 top_k만 통과시킨다.
+
+        Args:
+            candidates: [{'business_idea', 'keyword', 'config', ...}] (config의 type/domain 사용)
+            top_k: 통과 최대 개수 (None이면 제한 없음)
+            margin: 최소 점수 대비 허용 마진 (None이면 DiscoveryConfig)
+            min_score: 최소 저장 점수 (None이면 DiscoveryConfig)
+
+        Returns:
+            (통과 후보 목록, 탈락 후보 목록) - 각 후보에 'quick_score' 추가, 통과 목록은 점수 내림차순
+        """
+        margin = DiscoveryConfig.get_cascade_margin() if margin is None else margin
+        min_score = DiscoveryConfig.get_min_score() if min_score is None else min_score
+        gate = min_score - margin
+
+        scored = []
+        for candidate in candidates:
+            config = candidate.get('config', {})
+            name = candidate['business_idea']
+            domain = config.get('domain') or self._extract_domain(name, candidate.get('keyword', ''))
+            candidate['quick_score'] = self.lightweight_analyzer.quick_score(
+                name, config.get('type', 'saas'), domain
+            )
+            scored.append(candidate)
+
+        scored.sort(key=lambda c: c['quick_score'], reverse=True)
+        passed = [c for c in scored if c['quick_score'] >= gate]
+        if top_k is not None:
+            passed = passed[:top_k]
+        passed_ids = {id(c) for c in passed}
+        pruned = [c for c in scored if id(c) not in passed_ids]
+
+        self._count_stage('quick_score', evaluated=len(scored), pruned=len(pruned))
+        print(f"[CASCADE] quick_score 선별: {len(scored)}개 중 {len(passed)}개 통과 "
+              f"(기준 {gate:.0f}점, 상위 {top_k if top_k is not None else '전체'})")
+        return passed, pruned
+
+    def analyze_business_idea(self, business_idea, keyword, business_config, lightweight=None):
+        """단일 사업 아이디어 종합 분석 (경량 모드 지원)
+
+        Args:
+            lightweight: 이 아이디어의 분석 깊이 (None이면 use_lightweight 설정)
+        """
         print(f"\n{'='*80}")
         print(f"[ANALYSIS] 사업 아이디어 분석: {business_idea}")
         print(f"{'='*80}\n")
 
-        # 경량 분석기 사용
-        if self.use_lightweight:
-            return self._analyze_with_lightweight(business_idea, keyword, business_config)
-
-        # 기존 방식 (외부 API 사용) - 필요시 폴백
-        return self._analyze_with_external_api(business_idea, keyword, business_config)
+        start = time.time()
+        try:
+            # 경량 분석기 사용
+            if self.use_lightweight if lightweight is None else lightweight:
+                result = self._analyze_with_lightweight(business_idea, keyword, business_config)
+            else:
+                # 기존 방식 (외부 API 사용) - 필요시 폴백
+                result = self._analyze_with_external_api(business_idea, keyword, business_config)
+        finally:
+            self._count_stage('market_analysis', evaluated=1, duration_ms=int((time.time() - start) * 1000))
+
+        if result.get('total_score', 0) < DiscoveryConfig.get_min_score():
+            self._count_stage('market_analysis', pruned=1)
+        return result
+
+    def analyze_cascade(self, ideas_list, top_k=None, margin=None):
+        """단계별 일괄 분석: quick_score 게이트 통과분만 전체 분석
+
+        Returns:
+            {'results': 전체 분석 결과, 'pruned': quick_score 탈락 후보, 'stage_counters': 누적 카운터}
+        """
+        passed, pruned = self.quick_gate(ideas_list, top_k=top_k, margin=margin)
+        results = [
+            self.analyze_business_idea(idea['business_idea'], idea['keyword'], idea['config'])
+            for idea in passed
+        ]
+        return {
+            'results': results,
+            'pruned': pruned,
+            'stage_counters': self.get_stage_counters()
+        }
 
     def _analyze_with_lightweight(self, business_idea, keyword, business_config):
         """경량 분석기를 사용한 분석"""
@@ -198,16 +294,7 @@ class SmartBusinessSystem:
         lightweight_score = lightweight_result['market_score']
         print(f"   경량 분석 하한선: {lightweight_score}/100")
 
-        # comprehensive_analysis()로 10+ 플랫폼 종합 분석
-        try:
-            comp_results = self.market_analyzer.comprehensive_analysis(business_idea, search_keyword)
-        except Exception as e:
-            print(f"   [WARN] 종합 분석 실패, 경량 분석 사용: {e}")
-            comp_results = {
-                'data_sources': {},
-                'market_score': lightweight_score,
-                'recommendation': {'verdict': '크롤링 실패 - 경량 분석 사용'}
-            }
+        comp_results = self._keyword_market_analysis(business_idea, search_keyword, lightweight_score)
 
         data_sources = comp_results.get('data_sources', {})
         crawled_score = comp_results.get('market_score', 65)
@@ -229,6 +316,10 @@ class SmartBusinessSystem:
             'recommendation': comp_results.get('recommendation', {}),
             'is_blockchain': comp_results.get('is_blockchain', False)
         }
+        if comp_results.get('keyword_cached_at'):
+            market_data['keyword_cached_at'] = comp_results['keyword_cached_at']
+        if comp_results.get('skipped_sources'):
+            market_data['skipped_sources'] = comp_results['skipped_sources']
 
         print(f"\n   시장 점수: {market_score}/100 (종합 분석, {platform_count}개 플랫폼)")
 
@@ -296,6 +387,33 @@ class SmartBusinessSystem:
             business_idea, total_score, market_data, revenue_data, business_config
         )
 
+    def _keyword_market_analysis(self, business_idea, search_keyword, lightweight_score):
+        """키워드 단위 종합 분석 (재사용 기간 내 같은 키워드 결과가 있으면 크롤링 생략)
+
+        크롤링 결과는 키워드로만 결정되므로 저장소에 공유하고,
+        경량 분석 하한선/수익 추정 등 아이디어별 계산은 호출자가 매번 수행한다.
+        """
+        cached = self.keyword_store.get(search_keyword, 'full')
+        if cached is not None:
+            print(f"   [CACHE] 키워드 시장 분석 재사용: {search_keyword} ({cached['keyword_cached_at']})")
+            return cached
+
+        # comprehensive_analysis()로 10+ 플랫폼 종합 분석
+        try:
+            comp_results = self.market_analyzer.comprehensive_analysis(business_idea, search_keyword)
+        except Exception as e:
+            print(f"   [WARN] 종합 분석 실패, 경량 분석 사용: {e}")
+            return {
+                'data_sources': {},
+                'market_score': lightweight_score,
+                'recommendation': {'verdict': '크롤링 실패 - 경량 분석 사용'}
+            }
+
+        # 회로 차단으로 빠진 소스가 있으면 재사용하지 않음 (복구 후 다시 수집)
+        if not comp_results.get('skipped_sources'):
+            self.keyword_store.put(search_keyword, 'full', comp_results)
+        return comp_results
+
     def _extract_domain(self, business_idea, keyword):
         """사업명/키워드에서 도메인 추출"""
         domains = [
@@ -334,6 +452,7 @@ class SmartBusinessSystem:
         action_plan = None
         if total_score >= 50:
             print(f"\n[3] 4주 실행 계획 생성 중...")
+            self._count_stage('action_plan', evaluated=1)
             try:
                 action_plan = self.action_planner.generate_comprehensive_plan(business_config)
                 print(f"   [OK] 실행 계획 완성!")
@@ -25,6 +25,47 @@ def mock_db_session():
     return session
 
 
+@pytest.fixture
+def sqlite_engine():
+    """qhyx_growth 스키마를 attach한 인메모리 SQLite 엔진 (모든 연결이 같은 DB 공유)"""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import StaticPool
+
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+
+    @event.listens_for(engine, 'connect')
+    def attach_schema(dbapi_conn, _):
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS qhyx_growth")
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(sqlite_engine):
+    """인메모리 SQLite 세션 팩토리 (테이블은 사용하는 쪽에서 생성)"""
+    from sqlalchemy.orm import sessionmaker
+    return sessionmaker(bind=sqlite_engine)
+
+
+@pytest.fixture
+def sqlite_session(sqlite_engine, session_factory):
+    """발굴 히스토리 관련 테이블을 만든 인메모리 SQLite 세션"""
+    from database_setup import BusinessPlan
+    from business_discovery_history import (
+        BusinessDiscoveryHistory, LowScoreBusiness, DiscoveredBusinessName, BusinessLatest,
+        BusinessDerivedView
+    )
+
+    for model in (BusinessPlan, BusinessDiscoveryHistory, LowScoreBusiness, DiscoveredBusinessName, BusinessLatest,
+                  BusinessDerivedView):
+        model.__table__.create(sqlite_engine)
+
+    session = session_factory()
+    yield session
+    session.close()
+
+
 @pytest.fixture
 def app():
     """Flask 테스트 앱 (DB Mock 처리)"""
@@ -540,6 +540,165 @@ class TestBusinessHistoryTracker:
             assert rate == 0
 
 
+class TestRevenueMonteCarlo:
+    """RevenueValidator 몬테카를로 시뮬레이션 테스트"""
+
+    # 고정값 분포 (현실적 시나리오 재현용)
+    FIXED = {
+        'conversion_rate': 0.03,
+        'price_sigma': 0.0,
+        'churn_rate': 0.0,
+        'monthly_cost_factor': 1.0,
+        'startup_cost_factor': 1.0
+    }
+
+    @pytest.fixture(autouse=True)
+    def require_numpy(self):
+        import revenue_validator
+        if not revenue_validator.NUMPY_AVAILABLE:
+            pytest.skip('numpy not installed')
+
+    def test_monthly_costs_array_matches_scalar(self):
+        """배열 월 비용 = calculate_monthly_costs (호스팅 등급 경계 포함)"""
+        import numpy as np
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        customers = np.array([0, 99, 100, 999, 1000, 5000])
+        for business_type, scale in [('saas', 'small'), ('agency', 'medium'), ('marketplace', 'large')]:
+            costs = validator._monthly_costs_array(business_type, scale, customers)
+            expected = [validator.calculate_monthly_costs(business_type, scale, int(c))['total'] for c in customers]
+            assert costs.tolist() == expected
+
+    def test_break_even_array_matches_scalar(self):
+        """배열 손익분기 = calculate_break_even (불가능하면 inf)"""
+        import numpy as np
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        revenue = np.array([500000.0, 1000000.0, 3000000.0])
+        months = validator._break_even_months_array(2800000, 1000000, revenue)
+
+        assert np.isinf(months[0]) and np.isinf(months[1])
+        assert round(months[2], 1) == validator.calculate_break_even(2800000, 1000000, 3000000)['months']
+
+    def test_fixed_distribution_matches_realistic_scenario(self):
+        """고정 분포면 comprehensive_validation 현실적 시나리오와 일치"""
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        config = {
+            'name': 'test', 'type': 'saas', 'scale': 'small', 'revenue_model': 'subscription',
+            'pricing': {'monthly': 29000}, 'target_market_size': 10000
+        }
+        realistic = validator.comprehensive_validation(config)['scenarios']['realistic']
+        result = validator.simulate_revenue_monte_carlo(
+            'saas', 'subscription', {'monthly': 29000}, 10000,
+            samples=1000, seed=1, distributions=self.FIXED
+        )
+
+        assert result['monthly_revenue']['p5'] == result['monthly_revenue']['p95'] == realistic['monthly_revenue']
+        assert result['monthly_profit']['p50'] == realistic['monthly_profit']
+        assert result['roi_percentage']['p50'] == pytest.approx(realistic['roi']['roi_percentage'], abs=0.1)
+        assert result['break_even_months']['p50'] == realistic['break_even']['months']
+
+    def test_percentile_bands_ordered_and_seeded(self):
+        """백분위 구간은 단조 증가, 같은 시드는 같은 결과"""
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        args = ('marketplace', 'commission',
+                {'avg_transaction': 500000, 'commission_rate': 0.15, 'transactions_per_month': 3}, 5000)
+        first = validator.simulate_revenue_monte_carlo(*args, samples=5000, seed=42)
+        second = validator.simulate_revenue_monte_carlo(*args, samples=5000, seed=42)
+
+        assert first == second
+        band = first['monthly_revenue']
+        assert band['p5'] <= band['p25'] <= band['p50'] <= band['p75'] <= band['p95']
+        assert 0 <= first['probability_of_profit'] <= 1
+
+    def test_unprofitable_break_even_is_none(self):
+        """손익분기 불가능 구간은 None"""
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        result = validator.simulate_revenue_monte_carlo(
+            'saas', 'subscription', {'monthly': 1000}, 100, samples=1000, seed=1
+        )
+        assert result['probability_of_profit'] == 0
+        assert result['break_even_months']['p50'] is None
+        assert result['break_even_months']['mean'] is None
+
+    def test_comprehensive_validation_optional_monte_carlo(self):
+        """monte_carlo_samples 지정 시에만 결과 포함"""
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        config = {
+            'name': 'test', 'type': 'agency', 'scale': 'small', 'revenue_model': 'one_time',
+            'pricing': {'one_time': 3000000}, 'target_market_size': 100
+        }
+        assert 'monte_carlo' not in validator.comprehensive_validation(config)
+        result = validator.comprehensive_validation(config, monte_carlo_samples=2000, seed=3)
+        assert result['monte_carlo']['samples'] == 2000
+
+
+class TestRevenueValidationBatch:
+    """RevenueValidator 일괄 검증 테스트"""
+
+    def _configs(self):
+        return [
+            {'name': 'A', 'type': 'saas', 'scale': 'small', 'revenue_model': 'subscription',
+             'pricing': {'monthly': 29000}, 'target_market_size': 10000},
+            {'name': 'B', 'type': 'agency', 'scale': 'small', 'revenue_model': 'one_time',
+             'pricing': {'one_time': 3000000}, 'target_market_size': 100},
+            {'name': 'C', 'type': 'marketplace', 'scale': 'medium', 'revenue_model': 'commission',
+             'pricing': {'avg_transaction': 500000, 'commission_rate': 0.15, 'transactions_per_month': 3},
+             'target_market_size': 5000},
+            {'name': 'D', 'type': 'saas', 'scale': 'small', 'revenue_model': 'commission',
+             'pricing': {'avg_transaction': 70000, 'commission_rate': 0.1}, 'target_market_size': 123457},
+            {'name': 'E', 'type': 'saas', 'revenue_model': 'subscription',
+             'pricing': {'monthly': 9900}, 'target_market_size': 50},
+        ]
+
+    def test_matches_single_validation(self):
+        """설정별 결과가 comprehensive_validation과 동일 (입력 순서 유지)"""
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        configs = self._configs()
+
+        batch = validator.comprehensive_validation_batch(configs)
+        singles = [validator.comprehensive_validation(config) for config in configs]
+
+        assert [r['business_name'] for r in batch] == ['A', 'B', 'C', 'D', 'E']
+        for batch_result, single_result in zip(batch, singles):
+            batch_result.pop('analysis_date')
+            single_result.pop('analysis_date')
+            assert batch_result == single_result
+
+    def test_cost_tables_computed_once_per_group(self):
+        """(유형, 규모) 그룹별 비용 테이블 1회 계산"""
+        from revenue_validator import RevenueValidator, NUMPY_AVAILABLE
+        if not NUMPY_AVAILABLE:
+            pytest.skip('numpy not installed')
+        validator = RevenueValidator()
+        with patch.object(validator, 'calculate_startup_costs', wraps=validator.calculate_startup_costs) as startup, \
+                patch.object(validator, 'calculate_monthly_costs', wraps=validator.calculate_monthly_costs) as monthly:
+            validator.comprehensive_validation_batch(self._configs() * 20)
+
+        assert startup.call_count == 3
+        assert monthly.call_count == 3
+
+    def test_zero_startup_cost_type_returns_error(self):
+        """초기 비용 0인 유형은 오류 결과 (다른 설정은 정상)"""
+        from revenue_validator import RevenueValidator
+        validator = RevenueValidator()
+        configs = self._configs()[:1] + [{
+            'name': 'X', 'type': 'unknown_type', 'scale': 'small', 'revenue_model': 'subscription',
+            'pricing': {'monthly': 10000}, 'target_market_size': 1000
+        }]
+
+        batch = validator.comprehensive_validation_batch(configs)
+
+        assert 'scenarios' in batch[0]
+        assert batch[1]['business_name'] == 'X'
+        assert 'error' in batch[1]
+
+
 class TestRevenueScenarios:
     """수익 시나리오별 테스트"""
 
@@ -607,3 +766,242 @@ class TestEdgeCases:
         assert result['roi_percentage'] == -50.0
         assert result['payback_period_years'] is None  # 음수 수익이면 None
 
+
+
+class TestDiscoveryBatchWriter:
+    """DiscoveryBatchWriter / 배치 쓰기 API 테스트"""
+
+    def _history_fields(self, name, score=75):
+        return dict(
+            business_name=name, business_type='saas', category='IT', keyword=name,
+            total_score=score, market_score=score, revenue_score=score,
+            market_analysis={}, revenue_analysis={}, action_plan=None,
+            discovery_batch='2026-01-01-09', saved_to_db=score >= 70,
+            analysis_duration_ms=10, full_analysis={}
+        )
+
+    def _plan_fields(self, name, score):
+        return dict(plan_name=name, plan_type='IT Service', feasibility_score=score / 10,
+                    status='approved', created_by='test', details={})
+
+    def test_batch_mode_defers_commit(self):
+        """배치 모드에서는 record_analysis가 커밋하지 않음"""
+        mock_session = MagicMock()
+        with patch('business_discovery_history.Session', return_value=mock_session):
+            from business_discovery_history import BusinessHistoryTracker
+            tracker = BusinessHistoryTracker()
+            writer = tracker.begin_batch('2026-01-01-09')
+
+            assert tracker.record_analysis(**self._history_fields('A')) is None
+            assert writer.pending_count() == 1
+            mock_session.commit.assert_not_called()
+
+    def test_flush_single_transaction(self, sqlite_session):
+        """히스토리/저점수/사업계획 일괄 저장 후 1회 커밋"""
+        from database_setup import BusinessPlan
+        from business_discovery_history import (
+            BusinessHistoryTracker, BusinessDiscoveryHistory, LowScoreBusiness
+        )
+        with patch('business_discovery_history.Session', return_value=sqlite_session):
+            tracker = BusinessHistoryTracker()
+        writer = tracker.begin_batch('2026-01-01-09')
+        tracker.record_analysis(**self._history_fields('A'))
+        tracker.record_analysis(**self._history_fields('B', score=40))
+        tracker.save_low_score_business(
+            business_name='B', business_type='saas', category='IT', keyword='B',
+            total_score=40, market_score=40, revenue_score=40, failure_reason='both',
+            market_analysis={}, revenue_analysis={}, discovery_batch='2026-01-01-09',
+            analysis_duration_ms=10, full_data={}
+        )
+        writer.add_business_plan(**self._plan_fields('A', 75))
+
+        with patch.object(sqlite_session, 'commit', wraps=sqlite_session.commit) as mock_commit:
+            counts = tracker.flush_batch()
+
+        assert counts == {'history': 2, 'low_score': 1, 'business_plans': 1}
+        assert mock_commit.call_count == 1
+        assert sqlite_session.query(BusinessDiscoveryHistory).count() == 2
+        assert sqlite_session.query(LowScoreBusiness).count() == 1
+        assert sqlite_session.query(BusinessPlan).count() == 1
+        assert tracker.batch_writer is None
+
+    def test_reflush_same_batch_is_idempotent(self, sqlite_session):
+        """같은 배치 재실행 시 중복 행 없음, 기존 사업계획은 점수만 갱신"""
+        from database_setup import BusinessPlan
+        from business_discovery_history import BusinessHistoryTracker, BusinessDiscoveryHistory
+        with patch('business_discovery_history.Session', return_value=sqlite_session):
+            tracker = BusinessHistoryTracker()
+
+        for score in (75, 80):
+            writer = tracker.begin_batch('2026-01-01-09')
+            tracker.record_analysis(**self._history_fields('A', score=score))
+            writer.add_business_plan(**self._plan_fields('A', score))
+            tracker.flush_batch()
+
+        assert sqlite_session.query(BusinessDiscoveryHistory).count() == 1
+        plan = sqlite_session.query(BusinessPlan).one()
+        assert plan.feasibility_score == 8.0
+
+    def test_failed_flush_leaves_no_rows(self, sqlite_session):
+        """flush 중 오류 시 롤백되어 부분 기록 없음"""
+        from business_discovery_history import BusinessHistoryTracker, BusinessDiscoveryHistory
+        with patch('business_discovery_history.Session', return_value=sqlite_session):
+            tracker = BusinessHistoryTracker()
+        writer = tracker.begin_batch('2026-01-01-09')
+        tracker.record_analysis(**self._history_fields('A'))
+        writer.add_business_plan(plan_name=None)  # NOT NULL 위반
+
+        with patch('time.sleep'), patch.object(tracker, 'refresh_session', side_effect=sqlite_session.rollback):
+            assert tracker.flush_batch(max_retries=2) is None
+
+        assert sqlite_session.query(BusinessDiscoveryHistory).count() == 0
+
+
+class TestBusinessLatest:
+    """사업명별 최신 분석 테이블 테스트"""
+
+    FIELDS = dict(
+        business_type='saas', category='IT', keyword='k', market_score=70, revenue_score=70,
+        market_analysis={}, revenue_analysis={}, action_plan=None, discovery_batch='2026-01-01-09',
+        saved_to_db=True, analysis_duration_ms=10, full_analysis={}
+    )
+
+    def _latest(self, session):
+        from business_discovery_history import BusinessLatest
+        return {row.business_name: (row.history_id, row.total_score) for row in session.query(BusinessLatest)}
+
+    def test_record_analysis_keeps_latest_per_name(self, sqlite_session):
+        """즉시/배치 기록 모두 사업명당 최신 히스토리 1행 유지"""
+        from business_discovery_history import BusinessHistoryTracker, BusinessDiscoveryHistory
+        with patch('business_discovery_history.Session', return_value=sqlite_session):
+            tracker = BusinessHistoryTracker()
+        tracker.record_analysis(business_name='A', total_score=60, **self.FIELDS)
+        tracker.record_analysis(business_name='A', total_score=75, **self.FIELDS)
+
+        tracker.begin_batch('2026-01-01-10')
+        tracker.record_analysis(business_name='B', total_score=80, **self.FIELDS)
+        tracker.record_analysis(business_name='A', total_score=90, **self.FIELDS)
+        tracker.flush_batch()
+
+        from sqlalchemy import func
+        max_ids = dict(sqlite_session.query(
+            BusinessDiscoveryHistory.business_name, func.max(BusinessDiscoveryHistory.id)
+        ).group_by(BusinessDiscoveryHistory.business_name).all())
+        assert self._latest(sqlite_session) == {'A': (max_ids['A'], 90), 'B': (max_ids['B'], 80)}
+
+    def test_reflush_replaces_latest(self, sqlite_session):
+        """같은 배치 재실행 시 최신 분석 행도 새 히스토리 행으로 교체 (사업명당 1행)"""
+        from business_discovery_history import BusinessHistoryTracker, BusinessDiscoveryHistory
+        with patch('business_discovery_history.Session', return_value=sqlite_session):
+            tracker = BusinessHistoryTracker()
+
+        for score in (75, 80):
+            tracker.begin_batch('2026-01-01-09')
+            tracker.record_analysis(business_name='A', total_score=score, **self.FIELDS)
+            tracker.record_analysis(business_name='B', total_score=score - 10, **self.FIELDS)
+            tracker.flush_batch()
+
+        ids = dict(sqlite_session.query(BusinessDiscoveryHistory.business_name, BusinessDiscoveryHistory.id).all())
+        assert self._latest(sqlite_session) == {'A': (ids['A'], 80), 'B': (ids['B'], 70)}
+
+    def test_older_row_does_not_replace_latest(self, sqlite_session):
+        """늦게 도착한 과거 행은 최신 행을 덮어쓰지 않음"""
+        from business_discovery_history import upsert_business_latest
+        row = dict(business_name='A', discovered_at=datetime(2026, 1, 1), total_score=70)
+        upsert_business_latest(sqlite_session, [dict(row, history_id=5)])
+        upsert_business_latest(sqlite_session, [dict(row, history_id=3, total_score=10)])
+        sqlite_session.commit()
+
+        assert self._latest(sqlite_session) == {'A': (5, 70)}
+
+    def test_backfill_from_history(self, sqlite_session):
+        """비어 있으면 기존 히스토리의 사업명별 max(id)로 채우고, 이후에는 건너뜀"""
+        from business_discovery_history import BusinessDiscoveryHistory, backfill_business_latest
+        for name, score in (('A', 60), ('B', 70), ('A', 80)):
+            sqlite_session.add(BusinessDiscoveryHistory(
+                business_name=name, total_score=score, discovered_at=datetime(2026, 1, 1)
+            ))
+        sqlite_session.commit()
+
+        assert backfill_business_latest(sqlite_session) == 2
+        assert {name: score for name, (_, score) in self._latest(sqlite_session).items()} == {'A': 80, 'B': 70}
+        assert backfill_business_latest(sqlite_session) == 0
+
+
+class TestBusinessNameIndex:
+    """사업명 중복 인덱스 테스트"""
+
+    def _history(self, name, discovered_at=None):
+        from business_discovery_history import BusinessDiscoveryHistory
+        return BusinessDiscoveryHistory(
+            business_name=name, business_type='saas', category='IT', keyword=name,
+            total_score=70, discovery_batch='2026-01-01-09', discovered_at=discovered_at or datetime(2026, 1, 1)
+        )
+
+    def test_name_normalization(self):
+        """공백 차이는 같은 이름으로 취급"""
+        from business_discovery_history import business_name_hash
+        assert business_name_hash('AI  헬스케어 앱 ') == business_name_hash('AI 헬스케어 앱')
+        assert business_name_hash('AI 헬스케어 앱') != business_name_hash('AI 헬스케어 봇')
+
+    def test_insert_ignores_existing_names(self, sqlite_session):
+        """이미 있는 이름은 무시하고 새 이름만 추가"""
+        from business_discovery_history import insert_business_names, DiscoveredBusinessName
+        insert_business_names(sqlite_session, ['A', 'B'])
+        insert_business_names(sqlite_session, ['B', 'C', ' C '])
+        sqlite_session.commit()
+        assert sqlite_session.query(DiscoveredBusinessName).count() == 3
+
+    def test_first_sync_backfills_full_history(self, sqlite_session):
+        """인덱스가 비어 있으면 기간 제한 없이 전체 이력으로 백필"""
+        from database_setup import BusinessPlan
+        from business_discovery_history import BusinessNameIndex, DiscoveredBusinessName
+        sqlite_session.add_all([self._history(f'오래된 사업 {i}', datetime(2024, 1, 1)) for i in range(600)])
+        sqlite_session.add(BusinessPlan(plan_name='저장된 사업', plan_type='사업계획'))
+        sqlite_session.commit()
+
+        index = BusinessNameIndex()
+        assert index.sync(sqlite_session) == 601
+        assert '오래된 사업 0' in index
+        assert '저장된 사업' in index
+        assert '새 사업' not in index
+        assert sqlite_session.query(DiscoveredBusinessName).count() == 601
+
+    def test_incremental_sync_reads_new_rows_only(self, sqlite_session):
+        """두 번째 동기화부터는 마지막 동기화 이후 행만 조회"""
+        from business_discovery_history import BusinessNameIndex, insert_business_names
+        insert_business_names(sqlite_session, ['A'])
+        sqlite_session.commit()
+        index = BusinessNameIndex()
+        index.sync(sqlite_session)
+
+        insert_business_names(sqlite_session, ['B'])
+        sqlite_session.commit()
+        with patch.object(sqlite_session, 'execute', wraps=sqlite_session.execute) as mock_execute:
+            index.sync(sqlite_session)
+        assert 'B' in index
+        assert 'first_seen_at >=' in str(mock_execute.call_args_list[0][0][0])
+
+    def test_record_analysis_updates_index(self, sqlite_session):
+        """record_analysis 기록 시 DB 인덱스와 메모리 인덱스 모두 갱신 (배치/즉시 모드)"""
+        from business_discovery_history import BusinessHistoryTracker, BusinessNameIndex, DiscoveredBusinessName
+        index = BusinessNameIndex()
+        fields = dict(
+            business_type='saas', category='IT', keyword='k', total_score=70,
+            market_score=70, revenue_score=70, market_analysis={}, revenue_analysis={},
+            action_plan=None, discovery_batch='2026-01-01-09', saved_to_db=True,
+            analysis_duration_ms=10, full_analysis={}
+        )
+        with patch('business_discovery_history.Session', return_value=sqlite_session), \
+                patch('business_discovery_history._business_name_index', index):
+            tracker = BusinessHistoryTracker()
+            tracker.record_analysis(business_name='즉시 저장', **fields)
+
+            tracker.begin_batch('2026-01-01-09')
+            tracker.record_analysis(business_name='배치 저장', **fields)
+            assert '배치 저장' not in index
+            tracker.flush_batch()
+
+        assert '즉시 저장' in index
+        assert '배치 저장' in index
+        assert sqlite_session.query(DiscoveredBusinessName).count() == 2
@@ -0,0 +1,134 @@
+"""
+사업 목록 파생 뷰 테스트
+- business_views.py
+"""
+import os
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+FIELDS = dict(
+    business_type='매칭 플랫폼', category='IT', keyword='k', market_score=70, revenue_score=65,
+    market_analysis={}, revenue_analysis={}, action_plan=None, discovery_batch='2026-01-01-09',
+    saved_to_db=True, analysis_duration_ms=10, full_analysis={'raw': 1}
+)
+
+
+def _tracker(session):
+    from business_discovery_history import BusinessHistoryTracker
+    with patch('business_discovery_history.Session', return_value=session):
+        return BusinessHistoryTracker()
+
+
+def _stored(session):
+    from business_discovery_history import BusinessDerivedView
+    return {row.history_id: row for row in session.query(BusinessDerivedView)}
+
+
+class TestBuildBusinessView:
+    """build_business_view 함수 테스트"""
+
+    def test_fills_defaults_and_it_type(self):
+        """빈 분석은 기본값으로 채우고 business_type으로 IT 유형 결정"""
+        from business_views import build_business_view
+        full_analysis = {'raw': 1}
+        view = build_business_view(dict(
+            FIELDS, id=1, business_name='A', total_score=82, full_analysis=full_analysis,
+            discovered_at=datetime(2026, 1, 1, 9, 5)
+        ))
+
+        assert view['id'] == 1
+        assert view['created_at'] == '2026-01-01 09:05'
+        assert view['risk'] == 'low'
+        assert view['details']['market_analysis']['market_info']
+        assert view['details']['action_plan']['week_1']
+        assert view['details']['startup_guide']
+        assert view['details']['full_analysis']['business']['it_type'] == 'platform'
+        assert full_analysis == {'raw': 1}
+
+
+class TestBusinessViews:
+    """파생 뷰 저장/조회/백필 테스트"""
+
+    def test_written_with_history(self, sqlite_session):
+        """즉시/배치 기록 모두 히스토리와 함께 현재 버전 뷰 저장"""
+        from business_views import VIEW_VERSION
+        tracker = _tracker(sqlite_session)
+        history_id = tracker.record_analysis(business_name='A', total_score=70, **FIELDS)
+
+        tracker.begin_batch('2026-01-01-10')
+        tracker.record_analysis(business_name='B', total_score=80, **FIELDS)
+        tracker.record_analysis(business_name='C', total_score=90, **FIELDS)
+        tracker.flush_batch()
+
+        stored = _stored(sqlite_session)
+        assert len(stored) == 3
+        assert stored[history_id].view['name'] == 'A'
+        assert {row.view['name']: row.view['score'] for row in stored.values()} == {'A': 70, 'B': 80, 'C': 90}
+        assert {row.version for row in stored.values()} == {VIEW_VERSION}
+
+    def test_reflush_replaces_views(self, sqlite_session):
+        """같은 배치 재실행 시 교체된 히스토리의 뷰는 남지 않음 (사업명당 1행)"""
+        from business_discovery_history import BusinessDiscoveryHistory
+        from business_views import get_business_views
+        tracker = _tracker(sqlite_session)
+        for score in (70, 80):
+            tracker.begin_batch('2026-01-01-10')
+            tracker.record_analysis(business_name='A', total_score=score, **FIELDS)
+            tracker.record_analysis(business_name='B', total_score=score + 5, **FIELDS)
+            tracker.flush_batch()
+            tracker.record_analysis(business_name=f'C{score}', total_score=60, **FIELDS)  # 재실행 행이 새 id를 받도록
+
+        ids = [history_id for history_id, in sqlite_session.query(BusinessDiscoveryHistory.id).order_by(
+            BusinessDiscoveryHistory.id
+        )]
+        stored = _stored(sqlite_session)
+        assert sorted(stored) == ids
+        assert {row.view['name']: row.view['score'] for row in stored.values()} == {
+            'A': 80, 'B': 85, 'C70': 60, 'C80': 60
+        }
+        assert len(get_business_views(sqlite_session, list(range(1, max(ids) + 1)))) == 4
+
+    def test_read_is_pure_select_when_current(self, sqlite_session):
+        """현재 버전 뷰가 있으면 SELECT 1회로 순서대로 반환"""
+        from sqlalchemy import event
+        from business_views import get_business_views
+        tracker = _tracker(sqlite_session)
+        ids = [tracker.record_analysis(business_name=name, total_score=70, **FIELDS) for name in ('A', 'B')]
+
+        statements = []
+        event.listen(sqlite_session.get_bind(), 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        views = get_business_views(sqlite_session, list(reversed(ids)))
+
+        assert [view['name'] for view in views] == ['B', 'A']
+        assert len(statements) == 1
+
+    def test_missing_view_built_on_read(self, sqlite_session):
+        """뷰가 없는 행은 조회 시 계산해 저장"""
+        from business_discovery_history import BusinessDiscoveryHistory
+        from business_views import get_business_views
+        sqlite_session.add(BusinessDiscoveryHistory(id=7, business_name='A', total_score=75, **FIELDS))
+        sqlite_session.commit()
+
+        assert get_business_views(sqlite_session, [7])[0]['name'] == 'A'
+        assert 7 in _stored(sqlite_session)
+
+    def test_version_bump_backfills_latest(self, sqlite_session):
+        """생성 로직 버전이 바뀌면 사업별 최신 분석의 뷰만 다시 계산"""
+        from business_views import backfill_business_views
+        tracker = _tracker(sqlite_session)
+        old_id = tracker.record_analysis(business_name='A', total_score=60, **FIELDS)
+        latest_ids = {tracker.record_analysis(business_name=name, total_score=70, **FIELDS) for name in ('A', 'B')}
+
+        assert backfill_business_views(sqlite_session) == 0
+        with patch('business_views.VIEW_VERSION', 2):
+            assert backfill_business_views(sqlite_session, chunk_size=1) == 2
+            assert backfill_business_views(sqlite_session) == 0
+
+        stored = _stored(sqlite_session)
+        assert {history_id for history_id, row in stored.items() if row.version == 2} == latest_ids
+        assert stored[old_id].version == 1
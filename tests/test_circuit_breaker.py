@@ -0,0 +1,173 @@
+"""
+회로 차단 모듈 테스트
+- circuit_breaker.py
+- multi_source_trend_analyzer.py (collect_all_trends)
+"""
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _breaker(clock, **kwargs):
+    from circuit_breaker import CircuitBreaker
+    kwargs.setdefault('error_rate', 0.5)
+    kwargs.setdefault('p95_ms', 1000)
+    kwargs.setdefault('cooldown_seconds', 60)
+    return CircuitBreaker('test', window=10, min_calls=4, clock=clock, **kwargs)
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 클래스 테스트"""
+
+    def test_opens_on_error_rate(self, clock):
+        """오류율이 기준 이상이면 차단"""
+        breaker = _breaker(clock)
+        for success in (True, False, True, False):
+            assert breaker.allow()
+            breaker.record(success, 100)
+
+        assert breaker.state == breaker.OPEN
+        assert breaker.allow() is False
+        assert breaker.snapshot()['skipped'] == 1
+
+    def test_opens_on_p95_latency(self, clock):
+        """성공이어도 p95 지연이 기준을 넘으면 차단"""
+        breaker = _breaker(clock)
+        for latency in (100, 100, 100, 5000):
+            breaker.record(True, latency)
+
+        assert breaker.state == breaker.OPEN
+
+    def test_needs_min_calls(self, clock):
+        """표본이 부족하면 차단하지 않음"""
+        breaker = _breaker(clock)
+        for _ in range(3):
+            breaker.record(False, 100)
+
+        assert breaker.state == breaker.CLOSED
+
+    def test_half_open_single_probe_recovers(self, clock):
+        """쿨다운 후 시험 호출 1건만 허용, 성공하면 복구"""
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record(False, 100)
+
+        clock.now = 61
+        assert breaker.allow() is True
+        assert breaker.state == breaker.HALF_OPEN
+        assert breaker.allow() is False  # 시험 호출 진행 중
+
+        breaker.record(True, 100)
+        assert breaker.state == breaker.CLOSED
+        assert breaker.allow() is True
+
+    def test_failed_probe_reopens(self, clock):
+        """시험 호출이 실패하거나 느리면 다시 쿨다운"""
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record(False, 100)
+
+        clock.now = 61
+        breaker.allow()
+        breaker.record(True, 5000)
+        assert breaker.state == breaker.OPEN
+        clock.now = 100
+        assert breaker.allow() is False
+
+
+class TestCircuitBreakerRegistry:
+    """CircuitBreakerRegistry 클래스 테스트"""
+
+    def test_sources_are_independent(self, clock):
+        """소스별 차단기는 독립"""
+        from circuit_breaker import CircuitBreakerRegistry
+        registry = CircuitBreakerRegistry(enabled=True, error_rate=0.5, p95_ms=0, cooldown_seconds=60, clock=clock)
+        for _ in range(5):
+            registry.record('market.wishket', False, 100)
+
+        assert registry.allow('market.wishket') is False
+        assert registry.allow('market.naver') is True
+        assert registry.stats()['market.wishket']['state'] == 'open'
+
+    def test_disabled_always_allows(self):
+        """비활성화 시 항상 호출"""
+        from circuit_breaker import CircuitBreakerRegistry
+        registry = CircuitBreakerRegistry(enabled=False)
+        for _ in range(10):
+            registry.record('market.wishket', False, 100)
+
+        assert registry.allow('market.wishket') is True
+
+
+class TestTrendCollection:
+    """MultiSourceTrendAnalyzer 회로 차단 테스트"""
+
+    def test_open_source_is_skipped(self):
+        """차단된 트렌드 소스는 건너뛰고 skipped_sources에 표시"""
+        from circuit_breaker import CircuitBreakerRegistry
+        from multi_source_trend_analyzer import MultiSourceTrendAnalyzer
+
+        analyzer = MultiSourceTrendAnalyzer()
+        analyzer.circuit_breakers = CircuitBreakerRegistry(enabled=True, error_rate=0.5, p95_ms=0, cooldown_seconds=60)
+        for _ in range(5):
+            analyzer.circuit_breakers.record('trend.hacker_news', False, 5000)
+
+        trend = {'source': 'GitHub Trending', 'keyword': 'repo', 'category': 'tech', 'type': 'repository'}
+        with patch.object(analyzer, 'fetch_github_trending', return_value=[trend] * 3), \
+                patch.object(analyzer, 'fetch_naver_datalab', return_value=[]), \
+                patch.object(analyzer, 'fetch_hacker_news') as hacker_news:
+            trends = analyzer.collect_all_trends()
+
+        hacker_news.assert_not_called()
+        assert analyzer.skipped_sources == ['Hacker News']
+        assert trends == [trend] * 3
+
+    def test_fallback_data_counts_as_failure(self):
+        """수집 함수가 대체 데이터를 반환하면 데이터는 사용하되 회로 차단기에는 실패로 기록"""
+        from circuit_breaker import CircuitBreakerRegistry
+        from multi_source_trend_analyzer import MultiSourceTrendAnalyzer
+
+        analyzer = MultiSourceTrendAnalyzer()
+        analyzer.circuit_breakers = CircuitBreakerRegistry(enabled=True, error_rate=0.5, p95_ms=0, cooldown_seconds=60)
+        trend = {'source': 'GitHub Trending', 'keyword': 'repo', 'category': 'tech', 'type': 'repository'}
+
+        with patch('multi_source_trend_analyzer.cached_get', side_effect=ConnectionError('down')), \
+                patch.object(analyzer, 'fetch_github_trending', return_value=[trend] * 3), \
+                patch.object(analyzer, 'fetch_naver_datalab', return_value=[]):
+            for _ in range(5):
+                trends = analyzer.collect_all_trends(use_async=False, all_sources=False)
+            assert any(t['keyword'] == 'AI Startup Trends' for t in trends)
+
+            analyzer.collect_all_trends(use_async=False, all_sources=False)
+
+        assert analyzer.skipped_sources == ['Hacker News']
+
+    def test_async_fallback_counts_as_failure(self):
+        """비동기 수집기의 대체 데이터도 실패로 기록"""
+        from circuit_breaker import CircuitBreakerRegistry
+        from multi_source_trend_analyzer import MultiSourceTrendAnalyzer
+
+        analyzer = MultiSourceTrendAnalyzer()
+        analyzer.circuit_breakers = CircuitBreakerRegistry(enabled=False)
+        with patch('multi_source_trend_analyzer.cached_get', side_effect=ConnectionError('down')), \
+                patch.object(analyzer.circuit_breakers, 'record') as record:
+            analyzer.collect_all_trends(use_async=True, all_sources=False)
+
+        outcomes = {call.args[0]: call.args[1] for call in record.call_args_list}
+        assert outcomes == {'trend.github_trending': False, 'trend.hacker_news': False, 'trend.naver_datalab': False}
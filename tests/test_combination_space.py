@@ -0,0 +1,193 @@
+"""
+조합 공간 인덱스 테스트
+- combination_space.py
+- realistic_business_generator.py (동적 조합 아이디어)
+"""
+import os
+import sys
+import time
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestFeistelPermutation:
+    """FeistelPermutation 클래스 테스트"""
+
+    @pytest.mark.parametrize('size', [1, 2, 7, 100, 1023, 1025])
+    def test_is_bijection(self, size):
+        """[0, size) 전체를 정확히 한 번씩 방문"""
+        from combination_space import FeistelPermutation
+        permutation = FeistelPermutation(size, seed=42)
+        assert sorted(permutation[i] for i in range(size)) == list(range(size))
+
+    def test_seed_changes_order(self):
+        """시드별로 다른 순서, 같은 시드는 동일 순서"""
+        from combination_space import FeistelPermutation
+        first = [FeistelPermutation(1000, seed=1)[i] for i in range(20)]
+        again = [FeistelPermutation(1000, seed=1)[i] for i in range(20)]
+        other = [FeistelPermutation(1000, seed=2)[i] for i in range(20)]
+        assert first == again
+        assert first != other
+
+    def test_out_of_range(self):
+        """범위 밖 위치는 IndexError"""
+        from combination_space import FeistelPermutation
+        with pytest.raises(IndexError):
+            FeistelPermutation(10, seed=1)[10]
+
+
+class TestCombinationSpace:
+    """CombinationSpace 클래스 테스트"""
+
+    def test_cursor_persists_across_instances(self, tmp_path):
+        """저장된 커서 이후 조합만 반환 (실행 간 중복 없음)"""
+        from combination_space import CombinationSpace
+        path = str(tmp_path / 'space.sqlite3')
+
+        space = CombinationSpace(500, state_path=path, seed=7)
+        first = [space.next_index() for _ in range(100)]
+
+        resumed = CombinationSpace(500, state_path=path)
+        assert resumed.seed == 7
+        assert resumed.cursor == 100
+        rest = [resumed.next_index() for _ in range(400)]
+        assert sorted(first + rest) == list(range(500))
+
+    def test_size_change_resets_state(self, tmp_path):
+        """공간 크기가 바뀌면 새로 시작"""
+        from combination_space import CombinationSpace
+        path = str(tmp_path / 'space.sqlite3')
+        space = CombinationSpace(500, state_path=path, seed=7)
+        space.next_index()
+
+        assert CombinationSpace(600, state_path=path, seed=8).cursor == 0
+
+    def test_exhaustion_starts_new_cycle(self):
+        """소진 후 새 시드로 재순회"""
+        from combination_space import CombinationSpace
+        space = CombinationSpace(5, seed=3)
+        assert sorted(space.next_index() for _ in range(5)) == list(range(5))
+        assert space.remaining == 0
+        assert 0 <= space.next_index() < 5
+        assert space.remaining == 4
+
+    def test_corrupt_state_file(self, tmp_path):
+        """손상된 상태 파일은 무시"""
+        from combination_space import CombinationSpace
+        path = tmp_path / 'space.sqlite3'
+        path.write_text('{broken', encoding='utf-8')
+        space = CombinationSpace(10, state_path=str(path), seed=1)
+        assert space.cursor == 0
+        assert sorted(space.next_index() for _ in range(10)) == list(range(10))
+
+    def test_concurrent_draws_never_overlap(self, tmp_path):
+        """같은 상태 파일을 쓰는 워커들이 동시에 뽑아도 겹치는 조합 없음"""
+        import threading
+        from combination_space import CombinationSpace
+        path = str(tmp_path / 'space.sqlite3')
+        workers = [CombinationSpace(1000, state_path=path, seed=5) for _ in range(4)]
+        drawn = [[] for _ in workers]
+
+        def draw(space, out):
+            for _ in range(200):
+                out.append(space.next_index())
+
+        threads = [threading.Thread(target=draw, args=pair) for pair in zip(workers, drawn)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        indices = [index for out in drawn for index in out]
+        assert len(indices) == 800
+        assert len(set(indices)) == 800
+        assert CombinationSpace(1000, state_path=path).cursor == 800
+        for space in workers:
+            space.close()
+
+
+class TestDynamicCombinationIdeas:
+    """RealisticBusinessGenerator 동적 조합 아이디어 테스트"""
+
+    def _generator(self, tmp_path, seed=11):
+        from realistic_business_generator import RealisticBusinessGenerator
+        return RealisticBusinessGenerator(
+            combination_state_path=str(tmp_path / 'space.sqlite3'), combination_seed=seed
+        )
+
+    def test_index_covers_semantic_dimensions_only(self, tmp_path):
+        """인덱스는 도메인 x IT 유형 x 대상 x 핵심 기능 조합과 1:1 (표기 요소는 공간에 없음)"""
+        generator = self._generator(tmp_path)
+        features = min(len(f) for f in generator.core_features_by_domain.values())
+        assert generator.combination_size == (
+            len(generator.business_domains) * len(generator.it_types) * len(generator.target_audiences) * features
+        )
+        decoded = {tuple(sorted(generator._decode_combination(i).items())) for i in range(generator.combination_size)}
+        assert len(decoded) == generator.combination_size
+
+    def test_name_matches_it_type(self, tmp_path):
+        """이름에 쓰는 업종/패턴이 조합의 IT 유형과 일치"""
+        generator = self._generator(tmp_path)
+        defaults = dict(generator.name_patterns)
+        for it_type in generator.it_types:
+            assert generator._name_patterns_by_it_type[it_type]
+            for template in generator._name_patterns_by_it_type[it_type]:
+                assert defaults[template] == it_type or '{biz_type}' in template
+            for biz_type in generator._biz_types_by_it_type[it_type]:
+                assert generator._classify_it_type(biz_type) == it_type
+
+            name = generator._compose_name({'domain': '교육', 'it_type': it_type, 'target': '대학생', 'feature_slot': 0})
+            assert '교육' in name
+
+    def test_generates_unique_names(self, tmp_path):
+        """요청 수만큼 중복 없는 이름 생성"""
+        generator = self._generator(tmp_path)
+        ideas = generator.generate_dynamic_combination_ideas(count=200)
+        names = [idea['business']['name'] for idea in ideas]
+        assert len(names) == 200
+        assert len(set(names)) == 200
+        for idea in ideas:
+            business = idea['business']
+            assert business['it_type'] in ('saas', 'marketplace', 'agency', 'tools', 'platform')
+            assert business['domain'] in generator.business_domains
+            assert business['target_audience'] in generator.target_audiences
+            assert business['target_audience'] in business['description']
+
+    def test_next_run_skips_used_combinations(self, tmp_path):
+        """새 인스턴스도 이전 실행에서 사용한 조합을 다시 쓰지 않음"""
+        first = self._generator(tmp_path).generate_dynamic_combination_ideas()
+        second = self._generator(tmp_path).generate_dynamic_combination_ideas()
+        first_names = {idea['business']['name'] for idea in first}
+        second_names = {idea['business']['name'] for idea in second}
+        assert len(second_names) == 30
+        assert first_names.isdisjoint(second_names)
+
+    def test_large_exclude_set_stays_flat(self, tmp_path):
+        """대량 exclude_names가 있어도 생성 시간/시도 횟수가 늘지 않음"""
+        generator = self._generator(tmp_path)
+        history = {idea['business']['name'] for idea in generator.generate_dynamic_combination_ideas(count=1000)}
+        assert len(history) == 1000
+        history.update(f'기존 사업 {i}' for i in range(100000))
+        cursor_before = generator.combination_space.cursor
+
+        start = time.perf_counter()
+        ideas = generator.generate_dynamic_combination_ideas(exclude_names=set(history))
+        elapsed = time.perf_counter() - start
+
+        assert len(ideas) == 30
+        assert generator.combination_space.cursor - cursor_before < 40
+        assert elapsed < 1.0
+
+    def test_all_names_taken_stops_after_one_pass(self, tmp_path):
+        """모든 조합의 이름이 겹치면 전체 조합 수만큼만 뽑고 중단 (뽑은 조합은 소비됨)"""
+        from combination_space import CombinationSpace
+        generator = self._generator(tmp_path)
+        generator.combination_space = CombinationSpace(20, seed=3)
+
+        with patch.object(generator, '_compose_name', return_value='이미 있는 사업'):
+            ideas = generator.generate_dynamic_combination_ideas(exclude_names={'이미 있는 사업'})
+
+        assert ideas == []
+        assert generator.combination_space.cursor == 20
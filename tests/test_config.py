@@ -14,7 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import (
     DatabaseConfig, MarketConfig, MarketAnalysisMode,
-    DiscoveryConfig, APIConfig, NotificationConfig, LogConfig, EnvKeys
+    DiscoveryConfig, APIConfig, NotificationConfig, LogConfig, EnvKeys,
+    RateLimitConfig
 )
 
 
@@ -156,6 +157,41 @@ class TestMarketConfig:
             mode = MarketConfig.get_mode()
             assert mode == MarketAnalysisMode.LIGHTWEIGHT
 
+    def test_get_max_workers(self):
+        """병렬 워커 수 환경변수 반영"""
+        with patch.dict(os.environ, {'MARKET_MAX_WORKERS': '8'}):
+            assert MarketConfig.get_max_workers() == 8
+
+    def test_get_max_workers_invalid(self):
+        """잘못된 워커 수는 기본값"""
+        with patch.dict(os.environ, {'MARKET_MAX_WORKERS': 'abc'}):
+            assert MarketConfig.get_max_workers() == MarketConfig.DEFAULT_MAX_WORKERS
+
+    def test_is_concurrent_disabled(self):
+        """병렬 수집 비활성화"""
+        with patch.dict(os.environ, {'MARKET_CONCURRENT': 'false'}):
+            assert MarketConfig.is_concurrent() is False
+
+
+class TestRateLimitConfig:
+    """속도 제한 설정 테스트"""
+
+    def test_known_domain_limit(self):
+        """도메인별 지정값 반환"""
+        assert RateLimitConfig.get_limit('reddit.com') == RateLimitConfig.DOMAIN_LIMITS['reddit.com']
+
+    def test_default_limit_follows_api_delay(self):
+        """미지정 도메인은 MARKET_API_DELAY 간격"""
+        with patch.dict(os.environ, {'MARKET_API_DELAY': '4'}):
+            assert RateLimitConfig.get_limit('example.com') == (0.25, RateLimitConfig.DEFAULT_BURST)
+        with patch.dict(os.environ, {'MARKET_API_DELAY': '0'}):
+            assert RateLimitConfig.get_limit('example.com')[0] == 0
+
+    def test_is_enabled_disabled(self):
+        """속도 제한 비활성화"""
+        with patch.dict(os.environ, {'RATE_LIMIT_ENABLED': 'false'}):
+            assert RateLimitConfig.is_enabled() is False
+
 
 class TestDiscoveryConfig:
     """사업 발굴 설정 테스트"""
@@ -193,6 +229,13 @@ class TestDiscoveryConfig:
             assert hours == DiscoveryConfig.DEFAULT_SCHEDULE_HOURS
             assert isinstance(hours, list)
 
+    def test_near_duplicate_mode_defaults_to_skip(self):
+        """유사 아이디어는 기본적으로 분석 제외 (알 수 없는 값도 기본값)"""
+        with patch.dict(os.environ, {'DISCOVERY_NEAR_DUPLICATE_MODE': 'unknown'}):
+            assert DiscoveryConfig.get_near_duplicate_mode() == 'skip'
+        with patch.dict(os.environ, {'DISCOVERY_NEAR_DUPLICATE_MODE': 'FLAG'}):
+            assert DiscoveryConfig.get_near_duplicate_mode() == 'flag'
+
 
 class TestAPIConfig:
     """API 설정 테스트"""
@@ -0,0 +1,406 @@
+"""
+사업 발굴 모듈 테스트
+- continuous_business_discovery.py
+"""
+import os
+import sys
+import time
+import random
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def discovery():
+    """DB/분석 의존성을 모킹한 발굴 시스템"""
+    with patch('continuous_business_discovery.SmartBusinessSystem'), \
+            patch('continuous_business_discovery.RealisticBusinessGenerator'), \
+            patch('continuous_business_discovery.Session', side_effect=lambda: MagicMock()), \
+            patch('continuous_business_discovery.BusinessHistoryTracker', side_effect=lambda: MagicMock()), \
+            patch('continuous_business_discovery.initialize_history_tables'), \
+            patch('continuous_business_discovery.notify_discovery_complete'), \
+            patch('continuous_business_discovery.notify_high_score_idea'), \
+            patch.dict(os.environ, {'DISCOVERY_PROGRESS_PATH': ''}):
+        from continuous_business_discovery import ContinuousBusinessDiscovery
+        yield ContinuousBusinessDiscovery()
+
+
+def _ideas(count):
+    return [{'business': {'name': f'아이디어 {i}'}} for i in range(count)]
+
+
+class TestParallelDiscovery:
+    """병렬 발굴 모드 테스트"""
+
+    def test_results_keep_input_order(self, discovery):
+        """병렬 실행 결과는 입력 순서 유지"""
+        seen_sessions = {}
+
+        def fake_analyze(opportunity, batch):
+            time.sleep(random.uniform(0, 0.05))
+            seen_sessions[opportunity['business']['name']] = (id(discovery.session), batch)
+            return {'saved': True, 'name': opportunity['business']['name'], 'score': 75}
+
+        discovery.max_workers = 4
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(8))
+        discovery.analyze_and_save = fake_analyze
+
+        result = discovery.run_hourly_discovery(parallel=True)
+
+        assert [r['name'] for r in result['results']] == [f'아이디어 {i}' for i in range(8)]
+        assert result['saved'] == 8
+        assert {batch for _, batch in seen_sessions.values()} == {result['batch_id']}
+
+    def test_workers_use_own_sessions(self, discovery):
+        """워커마다 별도 세션 사용 (메인 세션과 분리)"""
+        main_session = discovery.session
+        worker_sessions = []
+        lock = threading.Lock()
+
+        def fake_analyze(opportunity, batch):
+            with lock:
+                worker_sessions.append(discovery.session)
+            return {'saved': False, 'name': opportunity['business']['name']}
+
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(3))
+        discovery.analyze_and_save = fake_analyze
+        discovery.run_hourly_discovery(parallel=True)
+
+        assert main_session not in worker_sessions
+        assert len({id(s) for s in worker_sessions}) == 3
+        assert all(s.close.called for s in worker_sessions)
+        assert discovery.session is main_session
+
+    def test_worker_exception_becomes_error_result(self, discovery):
+        """워커 예외는 오류 결과로 기록"""
+        def fake_analyze(opportunity, batch):
+            raise RuntimeError('boom')
+
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(2))
+        discovery.analyze_and_save = fake_analyze
+        result = discovery.run_hourly_discovery(parallel=True)
+
+        assert all(r['error'] == 'boom' for r in result['results'])
+        assert result['saved'] == 0
+
+
+class TestNearDuplicateSelection:
+    """유사 아이디어 제외 테스트"""
+
+    def _run(self, discovery, names, mode='skip'):
+        from near_duplicate import NearDuplicateIndex
+        from business_discovery_history import BusinessNameIndex
+        index = NearDuplicateIndex()
+        index.add('AI 반려동물 건강 기록 SaaS', 'AI 반려동물 건강 기록 SaaS', history_id=7, total_score=72.0)
+
+        discovery.near_duplicate_mode = mode
+        discovery.cascade = False
+        discovery.ideas_per_run = 5
+        discovery.idea_generator.generate_monthly_opportunities.return_value = [
+            {'business': {'name': name}} for name in names
+        ]
+        with patch('continuous_business_discovery.get_near_duplicate_index', return_value=index), \
+                patch('continuous_business_discovery.get_business_name_index', return_value=BusinessNameIndex()), \
+                patch('continuous_business_discovery.insert_business_names') as mock_insert, \
+                patch('random.shuffle'), \
+                patch.object(discovery, 'sync_near_duplicate_index'):
+            ideas = discovery.get_it_business_ideas()
+        return [idea['business']['name'] for idea in ideas], mock_insert
+
+    def test_skips_variant_of_existing_record(self, discovery):
+        """기존 기록의 변형은 분석 대상에서 제외하고 가장 가까운 기록을 노출"""
+        selected, mock_insert = self._run(discovery, ['반려동물 건강 기록 AI 플랫폼', '직장인 세무 매칭 서비스'])
+
+        assert selected == ['직장인 세무 매칭 서비스']
+        skipped = discovery.near_duplicates[0]
+        assert skipped['name'] == '반려동물 건강 기록 AI 플랫폼'
+        assert skipped['nearest_name'] == 'AI 반려동물 건강 기록 SaaS'
+        assert skipped['nearest_history_id'] == 7
+        assert skipped['similarity'] >= 0.5
+        mock_insert.assert_not_called()
+
+    def test_skips_variants_within_same_run(self, discovery):
+        """같은 실행에서 먼저 선택된 후보의 변형도 제외"""
+        selected, _ = self._run(discovery, ['시니어 명상 코칭 앱', '명상 코칭 시니어 플랫폼'])
+        assert selected == ['시니어 명상 코칭 앱']
+
+    def test_merge_mode_records_variant_names(self, discovery):
+        """merge 모드는 제외한 변형 이름을 사업명 인덱스에 기록"""
+        _, mock_insert = self._run(discovery, ['반려동물 건강 기록 AI 플랫폼'], mode='merge')
+        assert mock_insert.call_args[0][1] == ['반려동물 건강 기록 AI 플랫폼']
+        assert discovery.near_duplicates[0]['merged'] is True
+
+    def test_flag_mode_records_but_keeps_candidates(self, discovery):
+        """flag 모드는 유사 후보를 기록만 하고 분석 대상에 유지"""
+        names = ['반려동물 건강 기록 AI 플랫폼', '직장인 세무 매칭 서비스']
+        selected, mock_insert = self._run(discovery, names, mode='flag')
+        assert selected == names
+        assert discovery.near_duplicates[0]['name'] == '반려동물 건강 기록 AI 플랫폼'
+        assert discovery.near_duplicates[0]['skipped'] is False
+        mock_insert.assert_not_called()
+
+    def test_same_template_other_domain_kept(self, discovery):
+        """같은 템플릿의 다른 도메인 아이디어는 유사 아이디어로 보지 않음"""
+        discovery.idea_generator.business_domains = ['교육', '재테크']
+        selected, _ = self._run(discovery, ['직장인 전용 교육 플랫폼', '직장인 전용 재테크 플랫폼'])
+        assert selected == ['직장인 전용 교육 플랫폼', '직장인 전용 재테크 플랫폼']
+        assert discovery.near_duplicates == []
+
+    def test_off_mode_keeps_all_candidates(self, discovery):
+        """off 모드는 유사 검사 없음"""
+        names = ['반려동물 건강 기록 AI 플랫폼', '직장인 세무 매칭 서비스']
+        selected, _ = self._run(discovery, names, mode='off')
+        assert selected == names
+
+
+class TestQuickGate:
+    """SmartBusinessSystem quick_score 게이트 테스트"""
+
+    SCORES = {'A': 90, 'B': 62, 'C': 75, 'D': 55, 'E': 81}
+
+    def _system(self):
+        from smart_business_system import SmartBusinessSystem
+        system = SmartBusinessSystem()
+        system.lightweight_analyzer.quick_score = lambda name, it_type, domain: self.SCORES[name]
+        return system
+
+    def _candidates(self):
+        return [{'business_idea': name, 'keyword': name, 'config': {'type': 'saas'}} for name in self.SCORES]
+
+    def test_top_k_and_margin(self):
+        """마진 기준 미달은 탈락, 통과분은 점수 내림차순 상위 top_k"""
+        system = self._system()
+        passed, pruned = system.quick_gate(self._candidates(), top_k=2, margin=10, min_score=70)
+
+        assert [c['business_idea'] for c in passed] == ['A', 'E']
+        assert sorted(c['business_idea'] for c in pruned) == ['B', 'C', 'D']
+        assert system.get_stage_counters()['quick_score'] == {'evaluated': 5, 'pruned': 3}
+
+    def test_margin_only(self):
+        """top_k 없으면 마진 기준만 적용"""
+        passed, _ = self._system().quick_gate(self._candidates(), margin=0, min_score=70)
+        assert [c['business_idea'] for c in passed] == ['A', 'E', 'C']
+
+    def test_cascade_counts_each_stage(self):
+        """통과분만 전체 분석하고 단계별 카운터 집계"""
+        system = self._system()
+        analyzed = []
+
+        def fake_analyze(name, keyword, config):
+            analyzed.append(name)
+            system._count_stage('market_analysis', evaluated=1)
+            return {'total_score': 80}
+
+        system.analyze_business_idea = fake_analyze
+        result = system.analyze_cascade(self._candidates(), top_k=3, margin=10)
+
+        assert analyzed == ['A', 'E', 'C']
+        assert len(result['pruned']) == 2
+        assert result['stage_counters']['quick_score'] == {'evaluated': 5, 'pruned': 2}
+        assert result['stage_counters']['market_analysis']['evaluated'] == 3
+
+        system.reset_stage_counters()
+        assert system.get_stage_counters()['quick_score'] == {'evaluated': 0, 'pruned': 0}
+
+
+class TestCascadeSelection:
+    """단계별 분석 후보 풀 선택 테스트"""
+
+    def test_pool_is_gated_to_ideas_per_run(self, discovery):
+        """실행당 개수 x 배수 후보를 quick_score 게이트에 넘기고 통과분만 반환"""
+        from business_discovery_history import BusinessNameIndex
+        discovery.near_duplicate_mode = 'off'
+        discovery.cascade = True
+        discovery.cascade_pool_factor = 3
+        discovery.ideas_per_run = 2
+        discovery.idea_generator.generate_monthly_opportunities.return_value = [
+            {'business': {'name': f'아이디어 {i}', 'it_type': 'saas', 'domain': '교육'}} for i in range(10)
+        ]
+
+        def fake_gate(candidates, top_k):
+            for candidate in candidates:
+                candidate['quick_score'] = int(candidate['business_idea'].split()[-1])
+            ranked = sorted(candidates, key=lambda c: c['quick_score'], reverse=True)
+            return ranked[:top_k], ranked[top_k:]
+
+        discovery.smart_system.quick_gate.side_effect = fake_gate
+        with patch('continuous_business_discovery.get_business_name_index', return_value=BusinessNameIndex()), \
+                patch('random.shuffle'):
+            ideas = discovery.get_it_business_ideas()
+
+        candidates = discovery.smart_system.quick_gate.call_args[0][0]
+        assert len(candidates) == 6
+        assert candidates[0]['config'] == {'type': 'saas', 'domain': '교육'}
+        assert [idea['business']['name'] for idea in ideas] == ['아이디어 5', '아이디어 4']
+        assert ideas[0]['quick_score'] == 5
+
+
+class RecordingConsumer:
+    """훅 호출 기록용 소비자"""
+
+    def __init__(self):
+        self.events = []
+
+    def on_start(self, batch_id, total):
+        self.events.append(('start', total))
+
+    def on_result(self, result):
+        self.events.append(('result', result['name']))
+
+    def on_commit(self, results):
+        self.events.append(('commit', [r['name'] for r in results]))
+
+    def on_complete(self, summary):
+        self.events.append(('complete', summary['saved']))
+
+
+class TestStreamingDiscovery:
+    """stream_discovery 제너레이터 테스트"""
+
+    def test_yields_each_result_before_batch_ends(self, discovery):
+        """결과는 아이디어마다 즉시 전달되고 배치 후처리는 마지막에 실행"""
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(3))
+        discovery.analyze_and_save = lambda opp, batch: {'saved': True, 'name': opp['business']['name'], 'score': 70}
+        consumer = RecordingConsumer()
+
+        with patch('time.sleep'):
+            stream = discovery.stream_discovery(parallel=False, consumers=[consumer])
+            first = next(stream)
+            assert first['name'] == '아이디어 0'
+            assert consumer.events == [('start', 3), ('result', '아이디어 0')]
+            discovery.history_tracker.create_snapshot.assert_not_called()
+            rest = list(stream)
+
+        assert [r['name'] for r in rest] == ['아이디어 1', '아이디어 2']
+        assert consumer.events[-1] == ('complete', 3)
+        assert discovery.last_summary['saved'] == 3
+        discovery.history_tracker.create_snapshot.assert_called_once_with(snapshot_type='hourly')
+
+    def test_batch_mode_commits_before_confirming(self, discovery):
+        """배치 쓰기 모드는 커밋 후 on_commit으로 저장 확정, 실패 시 saved=False"""
+        discovery.batch_writes = True
+        discovery.history_tracker.flush_batch.return_value = None  # 커밋 실패
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(2))
+        discovery.analyze_and_save = lambda opp, batch: {'saved': True, 'name': opp['business']['name'], 'score': 90}
+        consumer = RecordingConsumer()
+
+        with patch('time.sleep'):
+            results = list(discovery.stream_discovery(parallel=False, consumers=[consumer]))
+
+        assert ('commit', ['아이디어 0', '아이디어 1']) in consumer.events
+        assert all(r['saved'] is False and 'pending_commit' not in r for r in results)
+        assert discovery.last_summary['saved'] == 0
+
+    def test_closing_stream_early_still_commits(self, discovery):
+        """스트림을 중간에 닫아도 분석된 결과는 커밋"""
+        discovery.batch_writes = True
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(5))
+        discovery.analyze_and_save = lambda opp, batch: {'saved': True, 'name': opp['business']['name'], 'score': 70}
+
+        with patch('time.sleep'):
+            stream = discovery.stream_discovery(parallel=False, consumers=[])
+            next(stream)
+            stream.close()
+
+        discovery.history_tracker.flush_batch.assert_called_once()
+
+    def test_consumer_error_does_not_stop_discovery(self, discovery):
+        """소비자 오류는 경고만 남기고 계속 진행"""
+        broken = MagicMock()
+        broken.on_result.side_effect = RuntimeError('boom')
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(2))
+        discovery.analyze_and_save = lambda opp, batch: {'saved': False, 'name': opp['business']['name']}
+
+        result = discovery.run_hourly_discovery(parallel=True, consumers=[broken])
+        assert len(result['results']) == 2
+        broken.on_complete.assert_called_once()
+
+
+class TestTimeBudgetDiscovery:
+    """시간 예산 모드 테스트"""
+
+    def test_stops_at_deadline_and_keeps_results(self, discovery):
+        """마감 이후 아이디어는 분석하지 않고 완료분만 요약"""
+        discovery.time_budget_minutes = 1
+        discovery.plan_time_budget = MagicMock(return_value={
+            'depth': 'lightweight', 'ideas': 4, 'cost_ms': 500, 'budget_seconds': 60
+        })
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(4))
+        analyzed = []
+
+        def fake_analyze(opp, batch):
+            analyzed.append(opp['analysis_depth'])
+            return {'saved': True, 'name': opp['business']['name'], 'score': 70}
+
+        discovery.analyze_and_save = fake_analyze
+        deadline = MagicMock()
+        deadline.allows.side_effect = [True, True, False]
+
+        with patch('continuous_business_discovery.Deadline', return_value=deadline), patch('time.sleep'):
+            result = discovery.run_hourly_discovery(parallel=False, consumers=[])
+
+        discovery.get_it_business_ideas.assert_called_once_with(count=4)
+        assert analyzed == ['lightweight', 'lightweight']
+        assert result['analyzed'] == 2
+        assert result['saved'] == 2
+        assert result['time_budget']['deferred'] == 2
+        assert discovery._deadline is None
+
+
+class TestDiscoveryConsumers:
+    """discovery_consumers 모듈 테스트"""
+
+    def test_high_score_notifier(self):
+        """저장 확정된 고득점 결과만 알림 (커밋 대기 결과는 on_commit 시점)"""
+        from discovery_consumers import HighScoreNotifier
+        notify = MagicMock()
+        notifier = HighScoreNotifier(notify, threshold=85)
+
+        notifier.on_result({'saved': True, 'name': 'A', 'score': 90})
+        notifier.on_result({'saved': True, 'name': 'B', 'score': 70})
+        notifier.on_result({'saved': True, 'name': 'C', 'score': 95, 'pending_commit': True})
+        assert [c[0][0]['name'] for c in notify.call_args_list] == ['A']
+
+        notifier.on_commit([{'saved': True, 'name': 'C', 'score': 95}, {'saved': False, 'name': 'D', 'score': 99}])
+        assert [c[0][0]['name'] for c in notify.call_args_list] == ['A', 'C']
+
+    def test_progress_file(self, tmp_path):
+        """진행 상황 파일은 결과마다 갱신"""
+        from discovery_consumers import ProgressFileConsumer, read_discovery_progress
+        path = str(tmp_path / 'progress.json')
+        consumer = ProgressFileConsumer(path)
+
+        consumer.on_start('2026-01-01-09', 3)
+        consumer.on_result({'saved': True, 'name': 'A'})
+        consumer.on_result({'saved': False, 'name': 'B', 'error': 'x'})
+        progress = read_discovery_progress(path)
+        assert (progress['status'], progress['processed'], progress['saved'], progress['errors']) == ('running', 2, 1, 1)
+        assert progress['last_name'] == 'B'
+
+        consumer.on_complete({'saved': 1})
+        assert read_discovery_progress(path)['status'] == 'completed'
+        assert read_discovery_progress(str(tmp_path / 'missing.json')) is None
+
+    def test_rolling_snapshot_keeps_bounded_state(self):
+        """누적 통계와 상위 N개만 유지, every개마다 저장"""
+        from discovery_consumers import RollingSnapshotConsumer
+        session = MagicMock()
+        session.get.return_value = None
+        consumer = RollingSnapshotConsumer(MagicMock(return_value=session), every=5, top_n=3)
+
+        consumer.on_start('2026-01-01-09', 10)
+        for i in range(10):
+            consumer.on_result({'saved': i % 2 == 0, 'name': f'아이디어 {i}', 'score': 50 + i * 5,
+                                'market_score': 60, 'revenue_score': 70})
+
+        snapshot = consumer.snapshot()
+        assert snapshot['total_analyzed'] == 10
+        assert snapshot['total_saved'] == 5
+        assert snapshot['avg_total_score'] == 72.5
+        assert [b['name'] for b in snapshot['top_businesses']] == ['아이디어 9', '아이디어 8', '아이디어 7']
+        assert snapshot['score_distribution'] == {'0-60': 2, '60-70': 2, '70-80': 2, '80-90': 2, '90-100': 2}
+        assert session.commit.call_count == 2
+        assert len(consumer._top) == 3
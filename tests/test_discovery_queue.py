@@ -0,0 +1,378 @@
+"""
+사업 발굴 작업 큐 테스트
+- discovery_queue.py
+- continuous_business_discovery.py (work_queue)
+"""
+import os
+import sys
+import pytest
+from datetime import timedelta
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _queue(session_factory, worker_id='w1', **kwargs):
+    from discovery_queue import DiscoveryJobQueue
+    kwargs.setdefault('lease_minutes', 30)
+    kwargs.setdefault('max_attempts', 2)
+    return DiscoveryJobQueue(session_factory, worker_id=worker_id, **kwargs)
+
+
+def _ideas(count):
+    return [{'business': {'name': f'아이디어 {i}'}} for i in range(count)]
+
+
+class TestDiscoveryJobQueue:
+    """DiscoveryJobQueue 클래스 테스트"""
+
+    def test_request_batch_is_idempotent(self, session_factory):
+        """같은 배치 ID 요청은 한 번만 등록되고 아이디어 생성도 한 워커만 점유"""
+        queue = _queue(session_factory)
+        assert queue.request_batch('2026-01-01-09') is True
+        assert queue.request_batch('2026-01-01-09') is False
+
+        assert queue.claim_batch() == '2026-01-01-09'
+        assert _queue(session_factory, 'w2').claim_batch() is None
+        assert queue.batch_status('2026-01-01-09')['status'] == 'expanding'
+
+    def test_add_jobs_ignores_duplicates(self, session_factory):
+        """재등록해도 같은 이름의 작업은 하나"""
+        queue = _queue(session_factory)
+        queue.request_batch('b1')
+        queue.claim_batch()
+        assert queue.add_jobs('b1', _ideas(3)) == 3
+        assert queue.add_jobs('b1', _ideas(4)) == 4
+
+        status = queue.batch_status('b1')
+        assert status['status'] == 'queued'
+        assert status['jobs']['pending'] == 4
+
+    def test_workers_claim_distinct_jobs(self, session_factory):
+        """점유한 작업은 다른 워커가 다시 가져가지 않음"""
+        queue = _queue(session_factory)
+        queue.request_batch('b1')
+        queue.claim_batch()
+        queue.add_jobs('b1', _ideas(2))
+
+        first = queue.claim()
+        second = _queue(session_factory, 'w2').claim()
+        assert first[0] != second[0]
+        assert first[2] == {'business': {'name': '아이디어 0'}}
+        assert _queue(session_factory, 'w3').claim() is None
+
+    def test_expired_lease_is_resumed(self, session_factory):
+        """점유 기한이 지난 작업은 다른 워커가 재개, 늦은 완료 기록은 무시"""
+        from database_setup import get_kst_now
+        crashed = _queue(session_factory, 'crashed')
+        crashed.request_batch('b1')
+        crashed.claim_batch()
+        crashed.add_jobs('b1', _ideas(1))
+        job_id = crashed.claim()[0]
+
+        later = get_kst_now() + timedelta(minutes=31)
+        with patch('discovery_queue.get_kst_now', return_value=later):
+            resumed = _queue(session_factory, 'w2')
+            assert resumed.claim()[0] == job_id
+            crashed.complete(job_id, {'saved': True, 'name': 'stale'})
+            resumed.complete(job_id, {'saved': True, 'name': '아이디어 0'})
+
+        assert crashed.batch_results('b1') == [{'saved': True, 'name': '아이디어 0'}]
+
+    def test_fail_retries_then_gives_up(self, session_factory):
+        """실패 작업은 최대 시도 횟수까지 재시도 후 failed"""
+        queue = _queue(session_factory, max_attempts=2)
+        queue.request_batch('b1')
+        queue.claim_batch()
+        queue.add_jobs('b1', _ideas(1))
+
+        job_id = queue.claim()[0]
+        queue.fail(job_id, 'boom')
+        assert queue.batch_status('b1')['jobs']['pending'] == 1
+
+        assert queue.claim()[0] == job_id
+        queue.fail(job_id, 'boom')
+        assert queue.batch_status('b1')['jobs']['failed'] == 1
+        assert queue.claim() is None
+        assert queue.batch_results('b1')[0]['error'] == 'boom'
+
+    def test_finish_batch_once(self, session_factory):
+        """남은 작업이 없을 때 한 워커만 완료 처리"""
+        queue = _queue(session_factory)
+        queue.request_batch('b1')
+        queue.claim_batch()
+        queue.add_jobs('b1', _ideas(1))
+        assert queue.finish_batch('b1') is False
+
+        job_id = queue.claim()[0]
+        queue.complete(job_id, {'saved': False, 'name': '아이디어 0'})
+        assert queue.finish_batch('b1') is True
+        assert _queue(session_factory, 'w2').finish_batch('b1') is False
+        assert queue.batch_status('b1')['status'] == 'completed'
+        assert queue.has_work() is False
+
+    def test_claim_many_up_to_limit(self, session_factory):
+        """여러 작업을 한 번에 점유 (등록 순서, 남은 작업만큼)"""
+        queue = _queue(session_factory)
+        queue.request_batch('b1')
+        queue.claim_batch()
+        queue.add_jobs('b1', _ideas(3))
+
+        jobs = queue.claim_many(2)
+        assert [job[2]['business']['name'] for job in jobs] == ['아이디어 0', '아이디어 1']
+        assert len(_queue(session_factory, 'w2').claim_many(5)) == 1
+        assert queue.claim_many(5) == []
+
+    def test_has_work_ignores_jobs_leased_by_others(self, session_factory):
+        """다른 워커가 기한 내 점유 중인 작업만 남으면 할 일 없음, 기한 만료 후 재시도 소진이면 후처리 필요"""
+        from database_setup import get_kst_now
+        owner = _queue(session_factory, 'owner', max_attempts=1)
+        owner.request_batch('b1')
+        owner.claim_batch()
+        owner.add_jobs('b1', _ideas(1))
+        other = _queue(session_factory, 'w2', max_attempts=1)
+        assert other.has_work() is True
+
+        owner.claim()
+        assert other.has_work() is False
+
+        later = get_kst_now() + timedelta(minutes=31)
+        with patch('discovery_queue.get_kst_now', return_value=later):
+            assert other.claim() is None
+            assert other.has_work() is True
+
+
+def _tracker(session_factory):
+    """배치 커밋 시 on_flush(작업 완료 표시)만 SQLite 트랜잭션으로 실행하는 히스토리 트래커"""
+    tracker = MagicMock()
+
+    def flush_batch(max_retries=3, on_flush=None):
+        session = session_factory()
+        try:
+            if on_flush is not None:
+                on_flush(session)
+            session.commit()
+            return {'history': 0, 'low_score': 0, 'business_plans': 0}
+        finally:
+            session.close()
+
+    tracker.flush_batch.side_effect = flush_batch
+    return tracker
+
+
+@pytest.fixture
+def discovery(session_factory):
+    """작업 큐만 SQLite를 사용하는 발굴 시스템"""
+    with patch('continuous_business_discovery.SmartBusinessSystem'), \
+            patch('continuous_business_discovery.RealisticBusinessGenerator'), \
+            patch('continuous_business_discovery.Session', side_effect=lambda: MagicMock()), \
+            patch('continuous_business_discovery.BusinessHistoryTracker', side_effect=lambda: _tracker(session_factory)), \
+            patch('continuous_business_discovery.initialize_history_tables'), \
+            patch('continuous_business_discovery.notify_discovery_complete'), \
+            patch('continuous_business_discovery.notify_high_score_idea'), \
+            patch.dict(os.environ, {'DISCOVERY_PROGRESS_PATH': ''}):
+        from continuous_business_discovery import ContinuousBusinessDiscovery
+        instance = ContinuousBusinessDiscovery()
+        instance.job_queue = _queue(session_factory)
+        instance.generate_discovery_meeting = MagicMock()
+        yield instance
+
+
+class TestQueuedDiscovery:
+    """ContinuousBusinessDiscovery 작업 큐 처리 테스트"""
+
+    def test_run_queued_discovery(self, discovery):
+        """배치 요청 -> 아이디어 등록 -> 작업 처리 -> 1회 후처리"""
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(3))
+        discovery.analyze_and_save = lambda opp, batch: {
+            'saved': True, 'name': opp['business']['name'], 'score': 80
+        }
+
+        summary = discovery.run_queued_discovery('b1', consumers=[])
+
+        assert summary['analyzed'] == 3
+        assert summary['saved'] == 3
+        assert [r['name'] for r in summary['results']] == ['아이디어 0', '아이디어 1', '아이디어 2']
+        discovery.generate_discovery_meeting.assert_called_once()
+        discovery.history_tracker.create_snapshot.assert_called_once_with(snapshot_type='hourly')
+
+        # 같은 배치 재실행은 아무 작업도 다시 하지 않음
+        discovery.get_it_business_ideas.reset_mock()
+        assert discovery.run_queued_discovery('b1', consumers=[])['status'] == 'completed'
+        discovery.get_it_business_ideas.assert_not_called()
+
+    def test_resume_after_interruption(self, discovery):
+        """중간에 멈춘 배치는 남은 작업만 이어서 처리"""
+        analyzed = []
+
+        def fake_analyze(opp, batch):
+            analyzed.append(opp['business']['name'])
+            return {'saved': False, 'name': opp['business']['name'], 'score': 40}
+
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(4))
+        discovery.analyze_and_save = fake_analyze
+        discovery.request_discovery('b1')
+
+        assert discovery.work_queue(consumers=[], max_jobs=2) == []
+        assert discovery.job_queue.batch_status('b1')['jobs'] == {'pending': 2, 'running': 0, 'done': 2, 'failed': 0, 'skipped': 0}
+
+        finished = discovery.work_queue(consumers=[])
+        assert analyzed == [f'아이디어 {i}' for i in range(4)]
+        assert finished[0]['batch_id'] == 'b1'
+        discovery.get_it_business_ideas.assert_called_once()
+
+    def test_unexpected_error_is_retried(self, discovery):
+        """분석 중 예외는 작업 실패로 기록하고 재시도"""
+        calls = []
+
+        def flaky(opp, batch):
+            calls.append(opp['business']['name'])
+            if len(calls) == 1:
+                raise RuntimeError('connection lost')
+            return {'saved': False, 'name': opp['business']['name']}
+
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(1))
+        discovery.analyze_and_save = flaky
+
+        summary = discovery.run_queued_discovery('b1', consumers=[])
+        assert calls == ['아이디어 0', '아이디어 0']
+        assert summary['analyzed'] == 1
+
+    def test_overdue_batch_skips_pending_jobs(self, discovery):
+        """시간 예산이 지난 배치는 남은 작업을 건너뛰고 완료 처리"""
+        from database_setup import get_kst_now
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(3))
+        discovery.analyze_and_save = lambda opp, batch: {'saved': True, 'name': opp['business']['name'], 'score': 70}
+        discovery.request_discovery('b1')
+        discovery.work_queue(consumers=[], max_jobs=1)
+
+        discovery.time_budget_minutes = 10
+        later = get_kst_now() + timedelta(minutes=11)
+        with patch('continuous_business_discovery.get_kst_now', return_value=later):
+            finished = discovery.work_queue(consumers=[])
+
+        assert finished[0]['analyzed'] == 1
+        assert finished[0]['skipped'] == 2
+        assert discovery.job_queue.batch_status('b1')['status'] == 'completed'
+
+    def test_error_result_is_retried(self, discovery):
+        """오류 결과를 반환한 작업은 완료가 아니라 실패로 기록해 재시도"""
+        calls = []
+
+        def flaky(opp, batch):
+            calls.append(opp['business']['name'])
+            if len(calls) == 1:
+                return {'saved': False, 'name': opp['business']['name'], 'error': 'timeout'}
+            return {'saved': True, 'name': opp['business']['name'], 'score': 80}
+
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(1))
+        discovery.analyze_and_save = flaky
+
+        summary = discovery.run_queued_discovery('b1', consumers=[])
+        assert calls == ['아이디어 0', '아이디어 0']
+        assert summary['results'] == [{'saved': True, 'name': '아이디어 0', 'score': 80}]
+
+    def test_error_result_gives_up_after_max_attempts(self, discovery):
+        """계속 오류면 최대 시도 횟수 후 failed로 확정하고 배치 완료"""
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(1))
+        discovery.analyze_and_save = lambda opp, batch: {
+            'saved': False, 'name': opp['business']['name'], 'error': 'timeout'
+        }
+
+        summary = discovery.run_queued_discovery('b1', consumers=[])
+        assert summary['results'] == [{'saved': False, 'name': '아이디어 0', 'error': 'timeout'}]
+        assert discovery.job_queue.batch_status('b1')['jobs']['failed'] == 1
+
+    def test_parallel_jobs_use_worker_pool_and_batch_writer(self, discovery):
+        """병렬 모드는 워커 수만큼 점유해 워커 풀로 분석하고 묶음당 1회 커밋"""
+        import threading
+        threads = set()
+
+        def fake_analyze(opp, batch):
+            threads.add(threading.current_thread().name)
+            return {'saved': True, 'name': opp['business']['name'], 'score': 80}
+
+        discovery.parallel = True
+        discovery.max_workers = 3
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(3))
+        discovery.analyze_and_save = fake_analyze
+        consumer = MagicMock()
+
+        summary = discovery.run_queued_discovery('b1', consumers=[consumer])
+
+        assert summary['saved'] == 3
+        assert all(name.startswith('discovery') for name in threads)
+        discovery.history_tracker.begin_batch.assert_called_once_with('b1')
+        discovery.history_tracker.flush_batch.assert_called_once()
+        committed = consumer.on_commit.call_args[0][0]
+        assert len(committed) == 3
+        assert all('pending_commit' not in result for result in committed)
+
+    def test_job_completion_commits_with_results(self, discovery, sqlite_session, session_factory):
+        """완료 표시가 실패하면 분석 결과도 남지 않고, 재점유 후 한 번만 기록"""
+        from business_discovery_history import BusinessHistoryTracker, BusinessDiscoveryHistory
+
+        def record(opp, batch):
+            name = opp['business']['name']
+            discovery.history_tracker.record_analysis(
+                business_name=name, business_type='saas', category='IT', keyword=name,
+                total_score=60, market_score=60, revenue_score=60, market_analysis={},
+                revenue_analysis={}, action_plan=None, discovery_batch=batch, saved_to_db=False,
+                analysis_duration_ms=10, full_analysis={}
+            )
+            return {'saved': False, 'name': name, 'score': 60}
+
+        complete = discovery.job_queue.complete
+        failures = []
+
+        def crash_before_commit(job_id, result, session=None):
+            if len(failures) < 3:  # flush_batch 재시도 3회 모두 실패
+                failures.append(job_id)
+                raise RuntimeError('connection lost')
+            return complete(job_id, result, session=session)
+
+        discovery.get_it_business_ideas = MagicMock(return_value=_ideas(1))
+        discovery.analyze_and_save = record
+        discovery.job_queue.complete = crash_before_commit
+        with patch('business_discovery_history.Session', session_factory), patch('time.sleep'):
+            discovery.history_tracker = BusinessHistoryTracker()
+            summary = discovery.run_queued_discovery('b1', consumers=[])
+
+        assert len(failures) == 3
+        assert summary['results'] == [{'saved': False, 'name': '아이디어 0', 'score': 60}]
+        assert sqlite_session.query(BusinessDiscoveryHistory).count() == 1
+
+
+class TestDiscoveryWorker:
+    """discovery_worker 폴링 테스트"""
+
+    def _poll(self, queue):
+        from discovery_worker import main
+        with patch('discovery_worker.DiscoveryJobQueue', return_value=queue), \
+                patch('continuous_business_discovery.ContinuousBusinessDiscovery') as factory:
+            factory.return_value.work_queue.return_value = []
+            main(['--once'])
+        return factory
+
+    def test_no_discovery_while_others_hold_jobs(self, session_factory):
+        """다른 워커가 모든 작업을 점유 중이면 발굴 시스템을 만들지 않음"""
+        owner = _queue(session_factory, 'owner')
+        owner.request_batch('b1')
+        owner.claim_batch()
+        owner.add_jobs('b1', _ideas(1))
+        owner.claim()
+
+        factory = self._poll(_queue(session_factory, 'w2'))
+        factory.assert_not_called()
+
+    def test_discovery_gets_claimed_jobs(self, session_factory):
+        """점유한 작업을 넘겨 발굴 시스템 생성"""
+        queue = _queue(session_factory, 'w2')
+        queue.request_batch('b1')
+        queue.claim_batch()
+        queue.add_jobs('b1', _ideas(1))
+
+        factory = self._poll(queue)
+        factory.assert_called_once_with(job_queue=queue)
+        claimed = factory.return_value.work_queue.call_args.kwargs['claimed']
+        assert [job[2] for job in claimed] == _ideas(1)
@@ -0,0 +1,85 @@
+"""
+시간 예산 스케줄러 테스트
+- discovery_scheduler.py
+"""
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline:
+    """Deadline 클래스 테스트"""
+
+    def test_allows_until_cost_exceeds_remaining(self):
+        """남은 시간이 예상 소요 시간보다 클 때만 시작 허용"""
+        from discovery_scheduler import Deadline
+        clock = FakeClock()
+        deadline = Deadline(10, clock=clock)
+
+        assert deadline.allows(5000)
+        clock.now = 6
+        assert deadline.remaining_ms() == pytest.approx(4000)
+        assert not deadline.allows(5000)
+        assert not deadline.expired
+        clock.now = 11
+        assert deadline.expired
+        assert deadline.remaining_ms() == 0
+
+
+class TestTimeBudgetScheduler:
+    """TimeBudgetScheduler 클래스 테스트"""
+
+    def _session(self, rows):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = rows
+        return session
+
+    def test_estimate_costs_uses_percentile_per_depth(self):
+        """깊이별 75 백분위수, 표본이 부족하면 기본값"""
+        from discovery_scheduler import TimeBudgetScheduler
+        rows = [(ms, 'full') for ms in (1000, 2000, 3000, 4000, 5000)] + [(100, 'lightweight')]
+        costs = TimeBudgetScheduler(60, 10).estimate_costs(self._session(rows))
+
+        assert costs['full'] == 4000
+        assert costs['lightweight'] == TimeBudgetScheduler.DEFAULT_COSTS_MS['lightweight']
+
+    def test_estimate_costs_falls_back_on_error(self):
+        """조회 실패 시 기본값"""
+        from discovery_scheduler import TimeBudgetScheduler
+        session = MagicMock()
+        session.execute.side_effect = RuntimeError('db down')
+
+        assert TimeBudgetScheduler(60, 10).estimate_costs(session) == TimeBudgetScheduler.DEFAULT_COSTS_MS
+
+    def test_plan_prefers_full_when_budget_allows(self):
+        """전체 분석이 최소 개수 이상 들어가면 full, 아이디어 수는 상한 적용"""
+        from discovery_scheduler import TimeBudgetScheduler
+        scheduler = TimeBudgetScheduler(600, max_ideas=5, min_full_ideas=3, workers=2)
+        plan = scheduler.plan({'full': 60000, 'lightweight': 500})
+
+        assert plan['depth'] == 'full'
+        assert plan['ideas'] == 5  # 용량 18개 -> 상한 5개
+        assert plan['cost_ms'] == 60000
+
+    def test_plan_degrades_to_lightweight(self):
+        """예산이 부족하거나 전체 분석이 꺼져 있으면 lightweight"""
+        from discovery_scheduler import TimeBudgetScheduler
+        costs = {'full': 60000, 'lightweight': 500}
+
+        short = TimeBudgetScheduler(120, max_ideas=100, min_full_ideas=3).plan(costs)
+        assert short['depth'] == 'lightweight'
+        assert short['ideas'] == 100
+
+        disabled = TimeBudgetScheduler(600, max_ideas=100, allow_full=False).plan(costs)
+        assert disabled['depth'] == 'lightweight'
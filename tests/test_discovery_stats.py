@@ -0,0 +1,137 @@
+"""
+대시보드 통계 테스트
+- discovery_stats.py
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _seed(session):
+    from database_setup import get_kst_now
+    from business_discovery_history import (
+        BusinessDiscoveryHistory, LowScoreBusiness, backfill_business_latest
+    )
+    now = get_kst_now()
+    rows = [
+        ('A', 90, 'IT', True, now),
+        ('B', 70, 'IT', False, now - timedelta(days=3)),
+        ('A', 86, 'Finance', True, now - timedelta(days=10)),
+        ('C', 40, None, False, now - timedelta(days=40)),
+    ]
+    for name, score, category, saved, discovered_at in rows:
+        session.add(BusinessDiscoveryHistory(
+            business_name=name, total_score=score, category=category,
+            saved_to_db=saved, discovered_at=discovered_at
+        ))
+    session.add(LowScoreBusiness(business_name='L1', total_score=30, created_at=datetime.utcnow()))
+    session.add(LowScoreBusiness(business_name='L2', total_score=20, created_at=datetime.utcnow() - timedelta(days=2)))
+    session.commit()
+    backfill_business_latest(session)
+
+
+class TestComputeDashboardStats:
+    """compute_dashboard_stats 함수 테스트"""
+
+    def test_counts_in_single_query(self, sqlite_session):
+        """모든 카운터를 SELECT 1회로 계산"""
+        from sqlalchemy import event
+        from discovery_stats import compute_dashboard_stats
+        _seed(sqlite_session)
+
+        statements = []
+        event.listen(sqlite_session.get_bind(), 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        stats = compute_dashboard_stats(sqlite_session, days=7)
+
+        assert len(statements) == 1
+        assert 'FILTER (WHERE' in statements[0]
+        assert stats['total'] == 4
+        assert stats['this_week'] == 2
+        assert stats['high_score'] == 2
+        assert stats['distinct'] == 3
+        assert stats['window_analyzed'] == 2
+        assert stats['window_saved'] == 1
+        assert stats['window_avg_score'] == 80
+        assert stats['window_categories'] == 1
+        assert stats['low_score_total'] == 2
+
+    def test_case_fallback_matches_filter(self, sqlite_session):
+        """FILTER 미지원 DB용 CASE 식도 같은 결과"""
+        from discovery_stats import compute_dashboard_stats
+        _seed(sqlite_session)
+        expected = compute_dashboard_stats(sqlite_session)
+
+        with patch('discovery_stats._FILTER_DIALECTS', set()):
+            fallback = compute_dashboard_stats(sqlite_session)
+
+        expected.pop('window_start')
+        fallback.pop('window_start')
+        assert fallback == expected
+
+    def test_empty_tables(self, sqlite_session):
+        """데이터가 없으면 0"""
+        from discovery_stats import compute_dashboard_stats
+        stats = compute_dashboard_stats(sqlite_session)
+        assert stats['total'] == 0
+        assert stats['window_avg_score'] == 0
+        assert stats['distinct'] == 0
+
+
+class TestDiscoveryStatsService:
+    """DiscoveryStatsService 캐시 테스트"""
+
+    def test_cache_hit_until_ttl(self):
+        """TTL 안에서는 재계산하지 않음"""
+        from discovery_stats import DiscoveryStatsService
+        now = [0.0]
+        service = DiscoveryStatsService(ttl_seconds=30, clock=lambda: now[0])
+
+        with patch('discovery_stats.compute_dashboard_stats', return_value={'total': 1}) as compute:
+            service.get(None)
+            service.get(None)
+            assert compute.call_count == 1
+
+            now[0] = 31
+            service.get(None)
+            assert compute.call_count == 2
+
+            service.get(None, days=30)
+            assert compute.call_count == 3
+
+    def test_invalidate_forces_recompute(self):
+        """무효화 후에는 바로 재계산"""
+        from discovery_stats import DiscoveryStatsService
+        service = DiscoveryStatsService(ttl_seconds=30, clock=lambda: 0.0)
+
+        with patch('discovery_stats.compute_dashboard_stats', side_effect=[{'total': 1}, {'total': 2}]):
+            assert service.get(None)['total'] == 1
+            service.invalidate()
+            assert service.get(None)['total'] == 2
+
+    def test_batch_commit_invalidates(self, sqlite_session):
+        """발굴 배치 커밋 시 싱글톤 캐시 무효화"""
+        import discovery_stats
+        from business_discovery_history import BusinessHistoryTracker
+        service = discovery_stats.DiscoveryStatsService(ttl_seconds=300)
+
+        with patch.object(discovery_stats, '_discovery_stats', service):
+            assert service.get(sqlite_session)['total'] == 0
+
+            with patch('business_discovery_history.Session', return_value=sqlite_session):
+                tracker = BusinessHistoryTracker()
+            tracker.begin_batch('2026-01-01-09')
+            tracker.record_analysis(
+                business_name='A', business_type='saas', category='IT', keyword='k',
+                total_score=88, market_score=80, revenue_score=80, market_analysis={},
+                revenue_analysis={}, action_plan=None, discovery_batch='2026-01-01-09',
+                saved_to_db=True, analysis_duration_ms=10, full_analysis={}
+            )
+            tracker.flush_batch()
+
+            stats = service.get(sqlite_session)
+            assert stats['total'] == 1
+            assert stats['high_score'] == 1
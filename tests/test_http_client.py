@@ -0,0 +1,113 @@
+"""
+HTTP 클라이언트 모듈 테스트
+- http_client.py
+"""
+import os
+import sys
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """keep-alive 지원 로컬 HTTP 서버"""
+    server = HTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        time.sleep(2)
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def slow_server():
+    """응답 전에 2초 멈추는 로컬 HTTP 서버"""
+    _SlowHandler.hits = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpClient:
+    """HttpClient 클래스 테스트"""
+
+    def test_config_applied(self):
+        """풀 설정 반영"""
+        from http_client import HttpClient
+        with patch.dict(os.environ, {'HTTP_POOL_MAXSIZE': '3', 'HTTP_MAX_RETRIES': '0'}):
+            client = HttpClient()
+        assert client.pool_maxsize == 3
+        assert client.max_retries == 0
+        client.close()
+
+    def test_connection_reused(self, local_server):
+        """같은 호스트 요청은 연결 재사용"""
+        from http_client import HttpClient
+        client = HttpClient(max_retries=0)
+        for _ in range(3):
+            assert client.get(local_server + '/ping', timeout=5).status_code == 200
+
+        stats = client.stats()
+        host = stats['hosts']['127.0.0.1']
+        assert stats['total_requests'] == 3
+        assert host['connections'] == 1
+        assert host['reused'] == 2
+        client.close()
+
+    def test_read_timeout_not_retried(self, slow_server):
+        """읽기 타임아웃은 재시도 없이 호출자 timeout 안에 실패"""
+        import requests
+        from http_client import HttpClient
+        client = HttpClient(max_retries=2)
+
+        started = time.monotonic()
+        with pytest.raises(requests.RequestException):
+            client.get(slow_server + '/slow', timeout=0.5)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 1.0
+        assert _SlowHandler.hits == 1
+        assert client.stats()['failed_requests'] == 1
+        client.close()
+
+    def test_singleton(self):
+        """싱글톤 인스턴스"""
+        from http_client import get_http_client
+        assert get_http_client() is get_http_client()
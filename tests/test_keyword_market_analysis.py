@@ -0,0 +1,124 @@
+"""
+키워드별 시장 분석 저장소 테스트
+- keyword_market_analysis.py
+- smart_business_system.py (전체 모드 키워드 분석 재사용)
+"""
+import os
+import sys
+import pytest
+from datetime import timedelta
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def session_factory(sqlite_engine, session_factory):
+    """키워드 분석 테이블을 만든 세션 팩토리"""
+    from keyword_market_analysis import KeywordMarketAnalysis
+    KeywordMarketAnalysis.__table__.create(sqlite_engine)
+    return session_factory
+
+
+class TestKeywordAnalysisStore:
+    """KeywordAnalysisStore 클래스 테스트"""
+
+    def test_normalize_keyword(self):
+        """대소문자/공백 차이는 같은 키"""
+        from keyword_market_analysis import normalize_keyword
+        assert normalize_keyword('  AI   세무 ') == normalize_keyword('ai 세무')
+        assert normalize_keyword(None) == ''
+
+    def test_put_then_get_shares_across_instances(self, session_factory):
+        """저장한 결과는 다른 프로세스(인스턴스)에서도 DB로 재사용"""
+        from keyword_market_analysis import KeywordAnalysisStore
+        KeywordAnalysisStore(24, session_factory).put('AI 세무', 'full', {'market_score': 77})
+
+        store = KeywordAnalysisStore(24, session_factory)
+        result = store.get('ai  세무', 'full')
+        assert result['market_score'] == 77
+        assert 'keyword_cached_at' in result
+        assert store.get('ai 세무', 'lightweight') is None
+        assert (store.hits, store.misses) == (1, 1)
+
+    def test_put_updates_existing_row(self, session_factory):
+        """같은 키는 1행으로 갱신"""
+        from keyword_market_analysis import KeywordAnalysisStore, KeywordMarketAnalysis
+        store = KeywordAnalysisStore(24, session_factory)
+        store.put('AI 세무', 'full', {'market_score': 60})
+        store.put('AI 세무', 'full', {'market_score': 80})
+
+        session = session_factory()
+        assert session.query(KeywordMarketAnalysis).count() == 1
+        session.close()
+        assert KeywordAnalysisStore(24, session_factory).get('AI 세무', 'full')['market_score'] == 80
+
+    def test_expired_result_is_ignored(self, session_factory):
+        """재사용 기간이 지난 결과는 반환하지 않음"""
+        from keyword_market_analysis import KeywordAnalysisStore
+        from database_setup import get_kst_now
+        store = KeywordAnalysisStore(1, session_factory)
+        store.put('AI 세무', 'full', {'market_score': 60})
+
+        with patch('keyword_market_analysis.get_kst_now', return_value=get_kst_now() + timedelta(hours=2)):
+            assert store.get('AI 세무', 'full') is None
+
+    def test_disabled_and_db_failure(self):
+        """0시간이면 미사용, DB 오류 시 메모리 캐시만 사용"""
+        from keyword_market_analysis import KeywordAnalysisStore
+        assert KeywordAnalysisStore(0, MagicMock()).get('AI', 'full') is None
+
+        broken_session = MagicMock()
+        broken_session.execute.side_effect = Exception('db down')
+        store = KeywordAnalysisStore(24, MagicMock(return_value=broken_session))
+        store.put('AI 세무', 'full', {'market_score': 70})
+        assert store.get('AI 세무', 'full')['market_score'] == 70
+
+    def test_returned_result_is_a_copy(self, session_factory):
+        """반환값 수정이 캐시에 영향 없음"""
+        from keyword_market_analysis import KeywordAnalysisStore
+        store = KeywordAnalysisStore(24, session_factory)
+        store.put('AI 세무', 'full', {'data_sources': {'naver': {'total': 3}}})
+        store.get('AI 세무', 'full')['data_sources']['naver']['total'] = 99
+        assert store.get('AI 세무', 'full')['data_sources']['naver']['total'] == 3
+
+
+class TestSmartSystemKeywordReuse:
+    """SmartBusinessSystem 전체 모드 키워드 분석 재사용 테스트"""
+
+    def test_same_keyword_crawled_once(self, session_factory):
+        """같은 키워드의 두 아이디어는 크롤링 1회, 아이디어별 결과는 각각 계산"""
+        from smart_business_system import SmartBusinessSystem
+        from keyword_market_analysis import KeywordAnalysisStore
+
+        system = SmartBusinessSystem(use_lightweight=False)
+        system.keyword_store = KeywordAnalysisStore(24, session_factory)
+        system.market_analyzer = MagicMock()
+        system.market_analyzer.comprehensive_analysis.return_value = {
+            'data_sources': {'kmong': {'avg_price': 150000}},
+            'market_score': 70,
+            'recommendation': {'verdict': 'GO'}
+        }
+        config = {'type': 'saas', 'revenue_model': 'subscription', 'pricing': {'monthly': 9900}}
+
+        first = system.analyze_business_idea('AI 세무 앱', 'AI 세무', config)
+        second = system.analyze_business_idea('AI 세무 플랫폼', 'ai 세무', config)
+
+        assert system.market_analyzer.comprehensive_analysis.call_count == 1
+        assert second['business_idea'] == 'AI 세무 플랫폼'
+        assert second['market_data']['business_idea'] == 'AI 세무 플랫폼'
+        assert 'keyword_cached_at' in second['market_data']
+        assert 'keyword_cached_at' not in first['market_data']
+
+    def test_failed_crawl_is_not_stored(self, session_factory):
+        """크롤링 실패 결과는 저장하지 않음"""
+        from smart_business_system import SmartBusinessSystem
+        from keyword_market_analysis import KeywordAnalysisStore
+
+        system = SmartBusinessSystem(use_lightweight=False)
+        system.keyword_store = KeywordAnalysisStore(24, session_factory)
+        system.market_analyzer = MagicMock()
+        system.market_analyzer.comprehensive_analysis.side_effect = Exception('timeout')
+
+        system.analyze_business_idea('AI 세무 앱', 'AI 세무', {'type': 'saas'})
+        assert system.keyword_store.get('AI 세무', 'full') is None
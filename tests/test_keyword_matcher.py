@@ -0,0 +1,57 @@
+"""
+키워드 매칭 모듈 테스트
+- keyword_matcher.py
+"""
+import os
+import sys
+import random
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher 클래스 테스트"""
+
+    def test_overlapping_keywords(self):
+        """겹치는 키워드 모두 검출"""
+        from keyword_matcher import KeywordMatcher
+        matcher = KeywordMatcher({'hot': ['AI', '생성AI'], 'rising': ['헬스케어']})
+        assert matcher.find_all('생성ai 헬스케어 앱') == [
+            ('hot', 'AI'), ('hot', '생성AI'), ('rising', '헬스케어')
+        ]
+
+    def test_first_group_follows_definition_order(self):
+        """정의 순서상 첫 그룹 반환 (if/elif 분류와 동일)"""
+        from keyword_matcher import KeywordMatcher
+        matcher = KeywordMatcher({'platform': ['플랫폼'], 'marketplace': ['매칭']})
+        assert matcher.first_group('매칭 플랫폼') == 'platform'
+        assert matcher.first_group('매칭 서비스') == 'marketplace'
+        assert matcher.first_group('') is None
+        assert matcher.first_group(None) is None
+
+    def test_first_related_both_directions(self):
+        """키워드⊂텍스트, 텍스트⊂키워드 모두 검사"""
+        from keyword_matcher import KeywordMatcher
+        matcher = KeywordMatcher({'d': ['헬스케어', '시니어', 'AI']}, case_sensitive=True)
+        assert matcher.first_related('시니어층') == '시니어'
+        assert matcher.first_related('헬스') == '헬스케어'
+        assert matcher.first_related('ai') is None
+        assert matcher.first_related('우주') is None
+
+    def test_matches_naive_substring_search(self):
+        """무작위 입력에서 단순 부분 문자열 검사와 결과 일치"""
+        from keyword_matcher import KeywordMatcher
+        rng = random.Random(0)
+        alphabet = 'ab가나AI'
+        for _ in range(500):
+            groups = {
+                f'g{i}': [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                          for _ in range(rng.randint(1, 5))]
+                for i in range(rng.randint(1, 4))
+            }
+            text = ''.join(rng.choice(alphabet + ' ') for _ in range(rng.randint(0, 15)))
+            matcher = KeywordMatcher(groups)
+
+            expected = [(g, k) for g, ks in groups.items() for k in ks if k.lower() in text.lower()]
+            assert matcher.find_all(text) == expected
@@ -0,0 +1,78 @@
+"""
+경량 시장 분석 모듈 테스트
+- lightweight_market_analyzer.py
+"""
+import os
+import sys
+import random
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _candidates(analyzer, count, seed=7):
+    """테이블 값 + 미등록 값을 섞은 후보 생성"""
+    rng = random.Random(seed)
+    it_types = list(analyzer.it_type_scores) + ['unknown']
+    domains = list(analyzer.domain_market_data) + ['시니어케어', '', '우주여행']
+    targets = list(analyzer.target_audience_data) + ['시니어층', '외계인']
+    revenues = list(analyzer.revenue_model_scores) + ['구독', '기부']
+    words = ['AI', '자동화', '반려동물', 'NFT', '헬스케어', '교육', '플랫폼', '매칭']
+
+    return [{
+        'name': f"{rng.choice(words)} {rng.choice(words)} 서비스 {i}",
+        'it_type': rng.choice(it_types),
+        'domain': rng.choice(domains),
+        'target_audience': rng.choice(targets),
+        'revenue_models': rng.sample(revenues, rng.randint(0, 3)),
+        'description': f"{rng.choice(words)} 기반 서비스"
+    } for i in range(count)]
+
+
+def _strip_date(result):
+    result = dict(result)
+    result.pop('analysis_date')
+    return result
+
+
+class TestAnalyzeBatch:
+    """LightweightMarketAnalyzer.analyze_batch 테스트"""
+
+    def test_matches_single_analyze(self):
+        """동일 시드에서 analyze와 결과 일치"""
+        from lightweight_market_analyzer import LightweightMarketAnalyzer
+        analyzer = LightweightMarketAnalyzer()
+        candidates = _candidates(analyzer, 300)
+
+        random.seed(42)
+        single = [_strip_date(analyzer.analyze(c)) for c in candidates]
+        random.seed(42)
+        batch = [_strip_date(r) for r in analyzer.analyze_batch(candidates)]
+
+        assert batch == single
+
+    def test_score_batch_matches_raw_score(self):
+        """score_batch는 단건 raw_score와 일치"""
+        from lightweight_market_analyzer import LightweightMarketAnalyzer
+        analyzer = LightweightMarketAnalyzer()
+        candidates = _candidates(analyzer, 200, seed=3)
+
+        scores = analyzer.score_batch(candidates)
+        assert list(scores) == [analyzer._raw_score(c) for c in candidates]
+
+    def test_results_are_independent(self):
+        """같은 도메인 후보끼리 결과 객체 공유 안함"""
+        from lightweight_market_analyzer import LightweightMarketAnalyzer
+        analyzer = LightweightMarketAnalyzer()
+        idea = {'name': 'AI 헬스케어', 'it_type': 'saas', 'domain': 'AI', 'target_audience': '직장인'}
+        first, second = analyzer.analyze_batch([idea, dict(idea)])
+
+        first['market_analysis']['domain']['score_bonus'] = -1
+        assert second['market_analysis']['domain']['score_bonus'] != -1
+
+    def test_empty_batch(self):
+        """빈 입력"""
+        from lightweight_market_analyzer import LightweightMarketAnalyzer
+        analyzer = LightweightMarketAnalyzer()
+        assert analyzer.analyze_batch([]) == []
+        assert len(analyzer.score_batch([])) == 0
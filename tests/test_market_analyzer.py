@@ -0,0 +1,87 @@
+"""
+시장 분석 모듈 테스트
+- real_market_analyzer.py
+"""
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _fake_source(name):
+    """분석 메서드 대체용 (네트워크 호출 없음)"""
+    def _analyze(keyword):
+        return {'source': name, 'keyword': keyword, 'competition_level': 'medium'}
+    return _analyze
+
+
+class TestComprehensiveAnalysis:
+    """RealMarketAnalyzer.comprehensive_analysis 테스트"""
+
+    def _make_analyzer(self):
+        from real_market_analyzer import RealMarketAnalyzer
+        from circuit_breaker import CircuitBreakerRegistry
+        analyzer = RealMarketAnalyzer()
+        analyzer.circuit_breakers = CircuitBreakerRegistry(enabled=True, error_rate=0.5, p95_ms=0, cooldown_seconds=60)
+        for key, _, method_name in analyzer.DATA_SOURCES + analyzer.BLOCKCHAIN_SOURCES:
+            setattr(analyzer, method_name, _fake_source(key))
+        return analyzer
+
+    def test_concurrent_matches_sequential(self):
+        """병렬/순차 결과의 data_sources 동일"""
+        analyzer = self._make_analyzer()
+        sequential = analyzer.comprehensive_analysis('테스트 앱', '테스트', concurrent=False)
+        parallel = analyzer.comprehensive_analysis('테스트 앱', '테스트', concurrent=True)
+
+        assert parallel['data_sources'] == sequential['data_sources']
+        assert list(parallel['data_sources']) == list(sequential['data_sources'])
+        assert parallel['market_score'] == sequential['market_score']
+
+    def test_source_timings_reported(self):
+        """소스별 소요 시간 포함"""
+        analyzer = self._make_analyzer()
+        result = analyzer.comprehensive_analysis('테스트 앱', '테스트')
+
+        assert set(result['source_timings']) == set(result['data_sources'])
+        assert 'total_duration_ms' in result
+
+    def test_blockchain_sources_added(self):
+        """블록체인 키워드면 추가 소스 포함"""
+        analyzer = self._make_analyzer()
+        result = analyzer.comprehensive_analysis('NFT 마켓', 'NFT')
+
+        assert result['is_blockchain'] is True
+        assert 'upbit' in result['data_sources']
+        assert 'blockchain_jobs' in result['data_sources']
+
+    def test_source_exception_becomes_error(self):
+        """분석 메서드 예외는 error 항목으로 기록"""
+        analyzer = self._make_analyzer()
+
+        def _broken(keyword):
+            raise RuntimeError('boom')
+        analyzer.analyze_competitors_google = _broken
+
+        result = analyzer.comprehensive_analysis('테스트 앱', '테스트')
+        assert result['data_sources']['google']['error'] == 'boom'
+
+    def test_open_circuit_skips_source(self):
+        """회로 차단된 소스는 호출하지 않고 skipped_sources에 표시"""
+        analyzer = self._make_analyzer()
+        calls = []
+
+        def _wishket(keyword):
+            calls.append(keyword)
+            return {'platform': '위시켓', 'error': 'timeout'}
+        analyzer.analyze_wishket_market = _wishket
+
+        for _ in range(5):
+            analyzer.comprehensive_analysis('테스트 앱', '테스트', concurrent=False)
+        result = analyzer.comprehensive_analysis('테스트 앱', '테스트', concurrent=False)
+
+        assert len(calls) == 5
+        assert result['skipped_sources'] == ['wishket']
+        assert result['data_sources']['wishket']['skipped'] is True
+        assert 'naver' in result['data_sources']
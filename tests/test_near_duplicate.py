@@ -0,0 +1,117 @@
+"""
+유사 아이디어 검출 모듈 테스트
+- near_duplicate.py
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestCharNgrams:
+    """char_ngrams 함수 테스트"""
+
+    def test_word_order_independent(self):
+        """단어 순서가 달라도 같은 n-gram 집합"""
+        from near_duplicate import char_ngrams
+        assert char_ngrams('AI 반려동물 기록') == char_ngrams('기록 반려동물 ai')
+
+    def test_short_tokens_kept(self):
+        """n보다 짧은 단어는 그대로 포함"""
+        from near_duplicate import char_ngrams
+        assert char_ngrams('펫 반려동물') == {'펫', '반려', '려동', '동물'}
+        assert char_ngrams('') == set()
+
+    def test_template_tokens_ignored(self):
+        """유형/수식어/버전 단어는 제외, 모두 템플릿 단어면 그대로 사용"""
+        from near_duplicate import char_ngrams
+        assert char_ngrams('AI 교육 어시스턴트 Pro') == char_ngrams('교육')
+        assert char_ngrams('스마트 플랫폼') == {'스마', '마트', '플랫', '랫폼'}
+
+
+class TestNearDuplicateIndex:
+    """NearDuplicateIndex 클래스 테스트"""
+
+    def test_nearest_returns_closest_record(self):
+        """가장 유사한 기록과 payload 반환"""
+        from near_duplicate import NearDuplicateIndex
+        index = NearDuplicateIndex(threshold=0.5)
+        index.add(1, 'AI 반려동물 건강 기록 SaaS', total_score=72)
+        index.add(2, 'AI 반려동물 산책 대행', total_score=60)
+        index.add(3, '직장인 세무 상담 봇', total_score=80)
+
+        match = index.nearest('반려동물 건강 기록 AI 플랫폼')
+        assert match['key'] == 1
+        assert match['total_score'] == 72
+        assert 0.5 <= match['similarity'] <= 1.0
+        assert 'signature' not in match
+
+    def test_below_threshold_returns_none(self):
+        """임계값 미만이면 None"""
+        from near_duplicate import NearDuplicateIndex
+        index = NearDuplicateIndex(threshold=0.5)
+        index.add(1, 'AI 반려동물 건강 기록 SaaS')
+        assert index.nearest('시니어 여행 일정 플래너') is None
+        assert index.nearest('') is None
+
+    @pytest.mark.parametrize('first, second', [
+        ('직장인 전용 교육 플랫폼', '직장인 전용 금융 플랫폼'),
+        ('AI 교육 어시스턴트 Pro', 'AI 금융 어시스턴트 Pro'),
+        ('올인원 교육 서비스 2.0', '올인원 금융 서비스 2.0'),
+        ('대학생 교육 매칭 서비스', '대학생 금융 매칭 서비스'),
+    ])
+    def test_same_template_different_domain_not_flagged(self, first, second):
+        """같은 템플릿이라도 도메인이 다르면 유사 아이디어가 아님"""
+        from near_duplicate import NearDuplicateIndex
+        index = NearDuplicateIndex()
+        index.add(1, first, domain='교육')
+        assert index.nearest(second, domain='금융') is None
+
+        plain = NearDuplicateIndex()
+        plain.add(1, first)
+        assert plain.nearest(second) is None
+
+    def test_domain_weight_lowers_cross_domain_similarity(self):
+        """도메인 가중 시 다른 도메인 쌍의 유사도가 더 낮아짐"""
+        from near_duplicate import NearDuplicateIndex
+        index = NearDuplicateIndex(bands=64, rows=4)
+        a, b = '직장인 전용 교육 플랫폼', '직장인 전용 금융 플랫폼'
+        plain = index.similarity(index.signature(a), index.signature(b))
+        weighted = index.similarity(index.signature(a, domain='교육'), index.signature(b, domain='금융'))
+        assert weighted < plain
+
+    def test_similarity_estimates_jaccard(self):
+        """시그니처 일치율은 실제 Jaccard와 근사"""
+        from near_duplicate import NearDuplicateIndex, char_ngrams
+        index = NearDuplicateIndex(bands=64, rows=4)
+        a, b = '스마트 헬스케어 구독 플랫폼 서비스', '스마트 헬스케어 구독 매칭 서비스'
+        grams_a, grams_b = char_ngrams(a), char_ngrams(b)
+        exact = len(grams_a & grams_b) / len(grams_a | grams_b)
+        estimate = index.similarity(index.signature(a), index.signature(b))
+        assert abs(estimate - exact) < 0.15
+
+    def test_readd_and_remove(self):
+        """같은 key 재등록은 덮어쓰기, 삭제 후 검색 안 됨"""
+        from near_duplicate import NearDuplicateIndex
+        index = NearDuplicateIndex(threshold=0.5)
+        index.add('k', '시니어 명상 코칭 앱')
+        index.add('k', '직장인 세무 상담 봇')
+        assert len(index) == 1
+        assert index.nearest('시니어 명상 코칭 앱') is None
+        index.remove('k')
+        assert 'k' not in index
+        assert index.nearest('직장인 세무 상담 봇') is None
+
+    def test_numpy_and_python_signatures_match(self):
+        """numpy 유무와 관계없이 같은 시그니처"""
+        import near_duplicate
+        if not near_duplicate.NUMPY_AVAILABLE:
+            pytest.skip('numpy not installed')
+        index = near_duplicate.NearDuplicateIndex()
+        with_numpy = index.signature('AI 반려동물 건강 기록 SaaS')
+        near_duplicate.NUMPY_AVAILABLE = False
+        try:
+            assert index.signature('AI 반려동물 건강 기록 SaaS') == with_numpy
+        finally:
+            near_duplicate.NUMPY_AVAILABLE = True
@@ -73,10 +73,10 @@ class TestNotificationService:
                 mock_config.is_slack_configured.return_value = True
                 mock_config.is_email_configured.return_value = False
 
-                with patch('notifications.requests') as mock_requests:
+                with patch('notifications.http_post') as mock_post:
                     mock_response = MagicMock()
                     mock_response.status_code = 200
-                    mock_requests.post.return_value = mock_response
+                    mock_post.return_value = mock_response
 
                     service = NotificationService()
                     result = service.send_slack("Test", "Message", "info")
@@ -91,11 +91,11 @@ class TestNotificationService:
                 mock_config.is_slack_configured.return_value = True
                 mock_config.is_email_configured.return_value = False
 
-                with patch('notifications.requests') as mock_requests:
+                with patch('notifications.http_post') as mock_post:
                     mock_response = MagicMock()
                     mock_response.status_code = 500
                     mock_response.text = "Error"
-                    mock_requests.post.return_value = mock_response
+                    mock_post.return_value = mock_response
 
                     service = NotificationService()
                     result = service.send_slack("Test", "Message")
@@ -107,10 +107,10 @@ class TestNotificationService:
             with patch('notifications.NotificationConfig') as mock_config:
                 mock_config.get_slack_webhook.return_value = "https://hooks.slack.com/test"
 
-                with patch('notifications.requests') as mock_requests:
+                with patch('notifications.http_post') as mock_post:
                     mock_response = MagicMock()
                     mock_response.status_code = 200
-                    mock_requests.post.return_value = mock_response
+                    mock_post.return_value = mock_response
 
                     service = NotificationService()
                     result = service.send_slack(
@@ -120,7 +120,7 @@ class TestNotificationService:
                     assert result is True
 
                     # 전송된 데이터 확인
-                    call_args = mock_requests.post.call_args
+                    call_args = mock_post.call_args
                     payload = call_args.kwargs.get('json') or call_args[1].get('json')
                     assert 'attachments' in payload
 
@@ -144,10 +144,10 @@ class TestNotificationService:
             with patch('notifications.NotificationConfig') as mock_config:
                 mock_config.get_slack_webhook.return_value = "https://hooks.slack.com/test"
 
-                with patch('notifications.requests') as mock_requests:
+                with patch('notifications.http_post') as mock_post:
                     mock_response = MagicMock()
                     mock_response.status_code = 200
-                    mock_requests.post.return_value = mock_response
+                    mock_post.return_value = mock_response
 
                     service = NotificationService()
 
@@ -0,0 +1,77 @@
+"""
+키셋 페이지네이션 테스트
+- services/pagination.py
+"""
+import os
+import sys
+import pytest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def sqlite_session(sqlite_session):
+    """같은 시각 행을 포함한 히스토리 7건"""
+    from business_discovery_history import BusinessDiscoveryHistory
+    base = datetime(2026, 1, 1, 9)
+    for i, hours in enumerate([0, 1, 1, 1, 2, 3, 3]):
+        sqlite_session.add(BusinessDiscoveryHistory(
+            business_name=f'사업 {i}', total_score=50 + i, discovered_at=base + timedelta(hours=hours)
+        ))
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def _page(session, **kwargs):
+    from business_discovery_history import BusinessDiscoveryHistory
+    from services.pagination import keyset_page
+    return keyset_page(
+        session.query(BusinessDiscoveryHistory),
+        BusinessDiscoveryHistory.discovered_at, BusinessDiscoveryHistory.id, **kwargs
+    )
+
+
+class TestKeysetPage:
+    """keyset_page 함수 테스트"""
+
+    def test_cursor_walks_all_rows_once(self, sqlite_session):
+        """같은 시각 행이 페이지 경계에 걸려도 누락/중복 없이 최신순 순회"""
+        from business_discovery_history import BusinessDiscoveryHistory
+        expected = [row.id for row in sqlite_session.query(BusinessDiscoveryHistory).order_by(
+            BusinessDiscoveryHistory.discovered_at.desc(), BusinessDiscoveryHistory.id.desc()
+        )]
+
+        seen, cursor = [], None
+        while True:
+            rows, cursor = _page(sqlite_session, cursor=cursor, limit=2)
+            seen.extend(row.id for row in rows)
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    def test_offset_matches_legacy_page(self, sqlite_session):
+        """cursor가 없으면 기존 page(offset) 방식과 같은 결과"""
+        first, cursor = _page(sqlite_session, limit=3)
+        second, _ = _page(sqlite_session, limit=3, offset=3)
+        by_cursor, _ = _page(sqlite_session, limit=3, cursor=cursor)
+        assert [row.id for row in second] == [row.id for row in by_cursor]
+        assert len(first) == 3
+
+    def test_last_page_has_no_cursor(self, sqlite_session):
+        """남은 행이 없으면 next_cursor 없음"""
+        rows, cursor = _page(sqlite_session, limit=7)
+        assert len(rows) == 7
+        assert cursor is None
+
+    def test_invalid_cursor(self, sqlite_session):
+        """잘못된 토큰은 ValueError"""
+        with pytest.raises(ValueError):
+            _page(sqlite_session, cursor='not-a-cursor')
+
+    def test_cursor_roundtrip(self):
+        """토큰은 (시각, id)를 그대로 복원"""
+        from services.pagination import encode_cursor, decode_cursor
+        at = datetime(2026, 1, 1, 9, 30, 15, 123)
+        assert decode_cursor(encode_cursor(at, 42)) == (at, 42)
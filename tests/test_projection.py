@@ -0,0 +1,74 @@
+"""
+목록 API 컬럼 프로젝션 테스트
+- services/projection.py
+"""
+import os
+import sys
+import pytest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def sqlite_session(sqlite_session):
+    """JSON 분석이 채워진 히스토리 1건"""
+    from business_discovery_history import BusinessDiscoveryHistory
+    sqlite_session.add(BusinessDiscoveryHistory(
+        business_name='A', total_score=70, discovered_at=datetime(2026, 1, 1),
+        market_analysis={'naver': 1}, revenue_analysis={'roi': 2}, full_analysis={'raw': 'x' * 100}
+    ))
+    sqlite_session.commit()
+    sqlite_session.expunge_all()
+    return sqlite_session
+
+
+def _select_sql(session, query):
+    """쿼리 실행 시 발생한 SELECT 문"""
+    from sqlalchemy import event
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(session.get_bind(), 'before_cursor_execute', listener)
+    try:
+        rows = query.all()
+    finally:
+        event.remove(session.get_bind(), 'before_cursor_execute', listener)
+    return rows, statements
+
+
+class TestHistoryProjection:
+    """history_summary / parse_include 테스트"""
+
+    def test_summary_skips_json_columns(self, sqlite_session):
+        """기본 목록 쿼리는 JSON 컬럼을 SELECT하지 않음"""
+        from business_discovery_history import BusinessDiscoveryHistory
+        from services.projection import history_summary
+        rows, statements = _select_sql(
+            sqlite_session, sqlite_session.query(BusinessDiscoveryHistory).options(history_summary())
+        )
+
+        assert rows[0].business_name == 'A'
+        assert len(statements) == 1
+        for column in ('market_analysis', 'revenue_analysis', 'action_plan', 'full_analysis'):
+            assert column not in statements[0]
+
+    def test_included_columns_are_loaded(self, sqlite_session):
+        """include로 요청한 JSON 컬럼만 함께 로드"""
+        from business_discovery_history import BusinessDiscoveryHistory
+        from services.projection import history_summary
+        rows, statements = _select_sql(
+            sqlite_session,
+            sqlite_session.query(BusinessDiscoveryHistory).options(history_summary('market_analysis'))
+        )
+
+        assert 'market_analysis' in statements[0]
+        assert 'full_analysis' not in statements[0]
+        assert rows[0].market_analysis == {'naver': 1}
+
+    def test_parse_include(self):
+        """허용 목록 밖의 이름은 무시, all은 허용 목록 전체"""
+        from services.projection import parse_include
+        allowed = ('market_analysis', 'revenue_analysis')
+        assert parse_include(None, allowed) == ()
+        assert parse_include('revenue_analysis, full_analysis,market_analysis', allowed) == allowed
+        assert parse_include('all', allowed) == allowed
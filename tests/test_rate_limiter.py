@@ -0,0 +1,100 @@
+"""
+속도 제한 모듈 테스트
+- rate_limiter.py
+"""
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeClock:
+    """sleep 호출 시 시간이 흐르는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _limiter(tmp_path, clock, **kwargs):
+    from rate_limiter import TokenBucketLimiter
+    return TokenBucketLimiter(path=str(tmp_path / 'rate.sqlite3'), enabled=True,
+                              clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestDomainOf:
+    """도메인 추출 테스트"""
+
+    def test_subdomains_share_bucket(self):
+        """서브도메인과 URL은 같은 도메인으로 묶임"""
+        from rate_limiter import domain_of
+        assert domain_of('https://www.reddit.com/r/startups/hot.json') == 'reddit.com'
+        assert domain_of('ac.search.naver.com') == 'naver.com'
+        assert domain_of('https://www.saramin.co.kr/zf_user') == 'saramin.co.kr'
+
+
+class TestTokenBucketLimiter:
+    """TokenBucketLimiter 클래스 테스트"""
+
+    def test_burst_then_spaced_at_rate(self, tmp_path, clock):
+        """버스트만큼은 즉시, 이후는 초당 요청 수에 맞춰 대기"""
+        limiter = _limiter(tmp_path, clock)
+        with patch('config.RateLimitConfig.get_limit', return_value=(2.0, 2)):
+            waits = [limiter.acquire('https://a.com/x') for _ in range(4)]
+
+        assert waits == [0.0, 0.0, pytest.approx(0.5), pytest.approx(0.5)]
+        assert limiter.stats()['acquired'] == 4
+
+    def test_idle_time_refills_bucket(self, tmp_path, clock):
+        """한동안 호출이 없으면 대기 없이 바로 호출"""
+        limiter = _limiter(tmp_path, clock)
+        with patch('config.RateLimitConfig.get_limit', return_value=(1.0, 1)):
+            limiter.acquire('a.com')
+            clock.now += 5
+            assert limiter.acquire('a.com') == 0.0
+
+    def test_domains_are_independent(self, tmp_path, clock):
+        """서로 다른 도메인은 독립 버킷"""
+        limiter = _limiter(tmp_path, clock)
+        with patch('config.RateLimitConfig.get_limit', return_value=(0.2, 1)):
+            limiter.acquire('naver.com')
+            assert limiter.acquire('google.com') == 0.0
+
+    def test_bucket_shared_across_instances(self, tmp_path, clock):
+        """같은 파일을 쓰는 다른 인스턴스(프로세스)와 버킷 공유"""
+        first = _limiter(tmp_path, clock)
+        second = _limiter(tmp_path, clock)
+        with patch('config.RateLimitConfig.get_limit', return_value=(1.0, 1)):
+            first.reserve('a.com')
+            assert second.reserve('a.com') == pytest.approx(1.0)
+            assert first.reserve('a.com') == pytest.approx(2.0)
+
+    def test_disabled_never_waits(self, tmp_path, clock):
+        """비활성화 시 대기 없음"""
+        from rate_limiter import TokenBucketLimiter
+        limiter = TokenBucketLimiter(path=str(tmp_path / 'rate.sqlite3'), enabled=False, clock=clock)
+        assert [limiter.reserve('a.com') for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_falls_back_to_local_bucket(self, tmp_path, clock):
+        """공유 저장소를 열 수 없으면 프로세스 내부 버킷 사용"""
+        from rate_limiter import TokenBucketLimiter
+        limiter = TokenBucketLimiter(path=str(tmp_path), enabled=True, clock=clock)  # 디렉토리 경로
+
+        with patch('config.RateLimitConfig.get_limit', return_value=(1.0, 1)):
+            assert limiter.reserve('a.com') == 0.0
+            assert limiter.reserve('a.com') == pytest.approx(1.0)
+        assert limiter.stats()['shared'] is False
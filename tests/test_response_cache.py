@@ -0,0 +1,163 @@
+"""
+응답 캐시 모듈 테스트
+- response_cache.py
+"""
+import os
+import sys
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """임시 디렉토리 캐시"""
+    from response_cache import ResponseCache
+    cache = ResponseCache(path=str(tmp_path / 'cache.sqlite3'), max_entries=3, bypass=False)
+    yield cache
+    cache.close()
+
+
+def _response(url, body=b'ok', status=200):
+    from response_cache import CachedResponse
+    return CachedResponse(url, status, body, 'utf-8')
+
+
+class TestCacheKey:
+    """캐시 키 정규화 테스트"""
+
+    def test_param_order_ignored(self):
+        """파라미터 순서와 무관하게 같은 키"""
+        from response_cache import make_cache_key
+        assert make_cache_key('https://a.com/s?b=2&a=1') == make_cache_key('https://a.com/s?a=1&b=2')
+
+    def test_params_merged_with_query(self):
+        """params 인자와 쿼리스트링 동일 취급"""
+        from response_cache import make_cache_key
+        assert make_cache_key('https://a.com/s', {'q': 'x'}) == make_cache_key('https://A.com/s?q=x')
+
+    def test_different_params_different_key(self):
+        """다른 파라미터는 다른 키"""
+        from response_cache import make_cache_key
+        assert make_cache_key('https://a.com/s?q=x') != make_cache_key('https://a.com/s?q=y')
+
+
+class TestResponseCache:
+    """ResponseCache 클래스 테스트"""
+
+    def test_miss_then_hit(self, cache):
+        """저장 후 조회 시 적중"""
+        url = 'https://a.com/s?q=x'
+        assert cache.get(url) is None
+        cache.set(url, _response(url, '한글'.encode('utf-8')), source='naver')
+
+        cached = cache.get(url)
+        assert cached.from_cache is True
+        assert cached.text == '한글'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_expired_entry_is_miss(self, cache):
+        """TTL 만료 항목은 미스"""
+        url = 'https://a.com/s'
+        cache.set(url, _response(url), ttl=-1)
+        assert cache.get(url) is None
+        assert cache.stats()['entries'] == 0
+
+    def test_lru_eviction(self, cache):
+        """상한 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        urls = [f'https://a.com/{i}' for i in range(4)]
+        now = time.time()
+        with patch('response_cache.time.time', side_effect=[now + i * 100 for i in range(5)]):
+            for url in urls[:3]:
+                cache.set(url, _response(url), ttl=1000)
+            cache.get(urls[0])  # 0번 최근 사용
+            cache.set(urls[3], _response(urls[3]), ttl=1000)
+
+        assert cache.stats()['entries'] == 3
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[0]) is not None
+
+    def test_hit_touch_throttled(self, cache):
+        """TOUCH_INTERVAL 안의 연속 적중은 last_access를 다시 쓰지 않음"""
+        from config import CacheConfig
+        url = 'https://a.com/s'
+        now = time.time()
+        with patch('response_cache.time.time', return_value=now):
+            cache.set(url, _response(url), ttl=1000)
+
+        def last_access():
+            return cache._conn.execute("SELECT last_access FROM response_cache").fetchone()[0]
+
+        with patch('response_cache.time.time', return_value=now + 1):
+            assert cache.get(url) is not None
+            assert cache.get(url) is not None
+        assert last_access() == now
+
+        with patch('response_cache.time.time', return_value=now + CacheConfig.TOUCH_INTERVAL):
+            assert cache.get(url) is not None
+        assert last_access() == now + CacheConfig.TOUCH_INTERVAL
+        assert cache.stats()['hits'] == 3
+
+    def test_bypass_skips_cache(self, tmp_path):
+        """우회 모드에서는 저장/조회 안함"""
+        from response_cache import ResponseCache
+        cache = ResponseCache(path=str(tmp_path / 'c.sqlite3'), bypass=True)
+        url = 'https://a.com/s'
+        cache.set(url, _response(url))
+        assert cache.get(url) is None
+        cache.close()
+
+
+class TestCachedGet:
+    """cached_get 함수 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def limiter(self):
+        with patch('response_cache.get_rate_limiter') as get_limiter:
+            yield get_limiter.return_value
+
+    def _mock_response(self):
+        response = MagicMock()
+        response.url = 'https://a.com/s'
+        response.status_code = 200
+        response.content = b'{"items": [1]}'
+        response.encoding = 'utf-8'
+        return response
+
+    def test_second_call_uses_cache(self, cache, limiter):
+        """두번째 호출은 네트워크/속도 제한 토큰 미사용"""
+        from response_cache import cached_get
+        with patch('response_cache.get_response_cache', return_value=cache), \
+                patch('response_cache.http_get', return_value=self._mock_response()) as mock_get:
+            first = cached_get('https://a.com/s', source='naver', timeout=5)
+            second = cached_get('https://a.com/s', source='naver', timeout=5)
+
+        assert mock_get.call_count == 1
+        limiter.acquire.assert_called_once_with('https://a.com/s')
+        assert first.from_cache is False
+        assert second.from_cache is True
+        assert second.json() == {'items': [1]}
+
+    def test_bypass_argument_refetches(self, cache):
+        """bypass=True면 항상 네트워크 호출"""
+        from response_cache import cached_get
+        with patch('response_cache.get_response_cache', return_value=cache), \
+                patch('response_cache.http_get', return_value=self._mock_response()) as mock_get:
+            cached_get('https://a.com/s')
+            cached_get('https://a.com/s', bypass=True)
+
+        assert mock_get.call_count == 2
+
+    def test_error_status_not_cached(self, cache):
+        """200 이외 응답은 저장하지 않음"""
+        from response_cache import cached_get
+        response = self._mock_response()
+        response.status_code = 503
+        with patch('response_cache.get_response_cache', return_value=cache), \
+                patch('response_cache.http_get', return_value=response):
+            cached_get('https://a.com/s')
+
+        assert cache.stats()['entries'] == 0
@@ -0,0 +1,115 @@
+"""
+다중 소스 트렌드 수집 테스트
+- multi_source_trend_analyzer.py (collect_all_trends 비동기 모드)
+"""
+import os
+import sys
+import json
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _fake_get(url, source='default', **kwargs):
+    """URL별 고정 응답 (네트워크 호출 없음)"""
+    response = MagicMock()
+    response.status_code = 200
+    if url.endswith('topstories.json'):
+        body = list(range(1, 13))
+    elif '/item/' in url:
+        story_id = int(url.rsplit('/', 1)[1].split('.')[0])
+        body = {'title': f'Story {story_id}', 'score': story_id * 10}
+    else:
+        body = {}
+    response.json.return_value = body
+    response.content = b'<html><h2>Sample Product</h2></html>'
+    response.text = json.dumps(body)
+    return response
+
+
+@pytest.fixture
+def analyzer():
+    from circuit_breaker import CircuitBreakerRegistry
+    from multi_source_trend_analyzer import MultiSourceTrendAnalyzer
+    analyzer = MultiSourceTrendAnalyzer()
+    analyzer.circuit_breakers = CircuitBreakerRegistry(enabled=False)
+    with patch('multi_source_trend_analyzer.cached_get', side_effect=_fake_get), \
+            patch.dict(os.environ, {'OPENAI_API_KEY': ''}):
+        yield analyzer
+
+
+class TestAsyncCollection:
+    """비동기 수집 모드 테스트"""
+
+    @pytest.mark.parametrize('all_sources', [False, True])
+    def test_async_matches_sync(self, analyzer, all_sources):
+        """비동기/순차 수집 결과가 동일 (순서 포함)"""
+        sequential = analyzer.collect_all_trends(use_async=False, all_sources=all_sources)
+        concurrent = analyzer.collect_all_trends(use_async=True, all_sources=all_sources)
+
+        assert concurrent == sequential
+        hacker_news = [t for t in concurrent if t['source'] == 'Hacker News']
+        assert [t['keyword'] for t in hacker_news] == [f'Story {i}' for i in range(1, 11)]
+
+    def test_hacker_news_fan_out_is_bounded(self, analyzer):
+        """스토리 항목은 동시 요청 한도 내에서 병렬 수집"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_get(url, source='default', **kwargs):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(url)
+            return _fake_get(url, source, **kwargs)
+
+        with patch('multi_source_trend_analyzer.cached_get', side_effect=slow_get), \
+                patch.dict(os.environ, {'TREND_MAX_CONCURRENCY': '3'}):
+            trends = analyzer.collect_all_trends(use_async=True, all_sources=False)
+
+        assert len([t for t in trends if t['source'] == 'Hacker News']) == 10
+        assert 1 < max(peak) <= 3 + 2  # 스토리 3개 + 다른 소스 2개
+
+    def test_slow_source_times_out(self, analyzer):
+        """시간 상한을 넘긴 소스는 실패 처리하고 나머지 결과는 유지"""
+        release = threading.Event()
+
+        def hanging():
+            release.wait(5)
+            return [{'source': 'late'}]
+
+        analyzer.fetch_naver_datalab = hanging
+        started = time.time()
+        with patch.dict(os.environ, {'TREND_SOURCE_TIMEOUT': '1'}):
+            trends = analyzer.collect_all_trends(use_async=True, all_sources=False)
+        elapsed = time.time() - started
+        release.set()
+
+        assert elapsed < 3
+        assert {'source': 'late'} not in trends
+        assert any(t['source'] == 'Hacker News' for t in trends)
+
+    def test_stalled_async_fetcher_times_out(self, analyzer):
+        """비동기 수집기 요청이 멈춰도 시간 상한에 맞춰 반환 (종료 시 멈춘 스레드를 기다리지 않음)"""
+        release = threading.Event()
+
+        def stalled_get(url, source='default', **kwargs):
+            if source == 'hacker_news':
+                release.wait(4)
+            return _fake_get(url, source, **kwargs)
+
+        started = time.time()
+        with patch('multi_source_trend_analyzer.cached_get', side_effect=stalled_get), \
+                patch.dict(os.environ, {'TREND_SOURCE_TIMEOUT': '1'}):
+            trends = analyzer.collect_all_trends(use_async=True, all_sources=False)
+        elapsed = time.time() - started
+        release.set()
+
+        assert elapsed < 2
+        assert not any(t['source'] == 'Hacker News' for t in trends)
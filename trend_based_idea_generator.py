@@ -5,14 +5,14 @@
 - 실제 수요가 검증된 사업 아이디어 생성
 """
 
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import random
 from urllib.parse import quote
-import time
 from pytrends.request import TrendReq
 
+from rate_limiter import get_rate_limiter, limited_get
+
 class TrendBasedIdeaGenerator:
     def __init__(self):
         self.headers = {
@@ -35,7 +35,7 @@ class TrendBasedIdeaGenerator:
         try:
             # 크몽 메인 페이지에서 인기 서비스 수집
             url = "https://kmong.com"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = limited_get(url, headers=self.headers, timeout=10)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             # 서비스 카드들 찾기
@@ -84,7 +84,7 @@ class TrendBasedIdeaGenerator:
 
         try:
             url = "https://taling.me"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = limited_get(url, headers=self.headers, timeout=10)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             # 클래스 카드들 찾기
@@ -128,7 +128,7 @@ class TrendBasedIdeaGenerator:
 
             for keyword in test_keywords:
                 url = f"https://ac.search.naver.com/nx/ac?q={quote(keyword)}&con=0&frm=nv&ans=2&r_format=json"
-                response = requests.get(url, timeout=5)
+                response = limited_get(url, timeout=5)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -142,8 +142,6 @@ class TrendBasedIdeaGenerator:
                             'base_keyword': keyword
                         })
 
-                time.sleep(0.5)  # API 호출 간격
-
             print(f"[OK] Collected {len(keywords)} trend keywords from Naver")
 
         except Exception as e:
@@ -171,6 +169,7 @@ class TrendBasedIdeaGenerator:
         for country_code, country_name in countries.items():
             try:
                 print(f"   [{country_name}] 트렌드 수집 중...")
+                get_rate_limiter().acquire('trends.google.com')
                 trending_searches = self.pytrends.trending_searches(pn=country_code)
 
                 for keyword in trending_searches[0][:10]:  # 국가당 상위 10개
@@ -206,8 +205,6 @@ class TrendBasedIdeaGenerator:
                             'timestamp': datetime.now().isoformat()
                         })
 
-                time.sleep(2)  # 국가별 API 호출 간격
-
             except Exception as e:
                 print(f"   [WARNING] {country_name} trend collection failed: {e}")
                 continue
@@ -220,7 +217,7 @@ class TrendBasedIdeaGenerator:
         """네이버 검색 수요 분석"""
         try:
             url = f"https://search.naver.com/search.naver?query={quote(keyword)}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = limited_get(url, headers=self.headers, timeout=10)
             soup = BeautifulSoup(response.content, 'html.parser')
 
             # 검색 결과 개수로 수요 추정
@@ -264,8 +261,6 @@ class TrendBasedIdeaGenerator:
             if idea:
                 all_ideas.append(idea)
 
-        time.sleep(2)
-
         # 2. 탈잉 인기 클래스
         taling_classes = self.scrape_taling_trending()
         for taling_class in taling_classes[:10]:
@@ -273,8 +268,6 @@ class TrendBasedIdeaGenerator:
             if idea:
                 all_ideas.append(idea)
 
-        time.sleep(2)
-
         # 3. Google Trends 키워드
         google_keywords = self.get_google_trends()
         for kw in google_keywords[:10]:
@@ -282,8 +275,6 @@ class TrendBasedIdeaGenerator:
             if idea:
                 all_ideas.append(idea)
 
-        time.sleep(2)
-
         # 4. 네이버 트렌드 키워드
         keywords = self.get_naver_realtime_keywords()
         for kw in keywords[:15]: